@@ -0,0 +1,192 @@
+"""
+Kütüphane Yönetim Sistemi - Sütunsal Katalog Analitiği
+
+Bu modül kitapların yayın yılı, sayfa sayısı ve konu bilgilerini NumPy
+dizilerinden oluşan sütunsal bir yan depoda tutar ve dağılımları (on yıla
+göre kitap sayısı, sayfa sayısı yüzdelikleri, en sık konular) Book
+nesneleri üzerinde Python döngüsü kurmadan vektörel işlemlerle hesaplar.
+
+Depo bir katalog snapshot'ına bağlıdır: snapshot değişmez olduğu için ilk
+analitik isteğinde bir kez oluşturulur ve snapshot'ın kendisinde saklanır.
+Depo oluşturulduktan sonraki yazmalar onu baştan kurmaz; Library yeni
+snapshot'ın deposunu eskisinden yalnızca değişen kitapları çıkarıp ekleyerek
+türetir (bkz. ColumnStore.updated). Çok sayıda değişiklikte ya da katalog
+baştan yüklendiğinde depo yine ilk istekte oluşturulur.
+"""
+
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, Iterable, List, Sequence
+
+import numpy as np
+
+from book import Book
+
+if TYPE_CHECKING:
+    from library import CatalogSnapshot
+
+
+# Yanıtta raporlanan sayfa sayısı yüzdelikleri
+PAGE_PERCENTILES = (10, 25, 50, 75, 90, 99)
+
+# Yıl ve sayfa sütunlarında bilinmeyen değer
+MISSING = 0
+
+
+class ColumnStore:
+    """
+    Kataloğun analitikte kullanılan alanlarının sütunsal, değişmez kopyası.
+    """
+
+    __slots__ = ("size", "years", "pages", "subject_codes", "subject_names")
+
+    def __init__(self, size: int, years: np.ndarray, pages: np.ndarray,
+                 subject_codes: np.ndarray, subject_names: List[str]):
+        """
+        ColumnStore sınıfının constructor'ı. Genellikle build ile oluşturulur.
+
+        Args:
+            size (int): Kitap sayısı
+            years (np.ndarray): Kitap başına yayın yılı (bilinmiyorsa MISSING)
+            pages (np.ndarray): Kitap başına sayfa sayısı (bilinmiyorsa MISSING)
+            subject_codes (np.ndarray): Tüm kitapların konu kodları, art arda
+            subject_names (List[str]): Kod -> konu adı
+        """
+        self.size = size
+        self.years = years
+        self.pages = pages
+        self.subject_codes = subject_codes
+        self.subject_names = subject_names
+
+    @classmethod
+    def build(cls, books: Sequence[Book]) -> 'ColumnStore':
+        """
+        Kitaplardan sütunları oluşturur. Konular sözlük kodlamasıyla tamsayı
+        koduna çevrilir; bir kitapta tekrar eden konu bir kez sayılır.
+
+        Args:
+            books (Sequence[Book]): Kitaplar
+
+        Returns:
+            ColumnStore: Oluşturulan depo
+        """
+        count = len(books)
+        years = np.fromiter((book.publish_year or MISSING for book in books),
+                            dtype=np.int32, count=count)
+        pages = np.fromiter((book.pages or MISSING for book in books), dtype=np.int32, count=count)
+        vocabulary: Dict[str, int] = {}
+        codes = np.fromiter((vocabulary.setdefault(subject, len(vocabulary))
+                             for book in books for subject in dict.fromkeys(book.subjects)),
+                            dtype=np.int32)
+        return cls(count, years, pages, codes, list(vocabulary))
+
+    def updated(self, added: Sequence[Book], removed: Sequence[Book]) -> 'ColumnStore':
+        """
+        Değişiklikler uygulanmış yeni depo. Dağılımlar kitap sırasına bağlı
+        olmadığından silinen her kitabın değerlerinden birer örnek çıkarılır,
+        eklenenlerinkiler sona eklenir. Yeni konular sözlüğün sonuna eklenir;
+        hiçbir kitapta kalmayan konular raporlanmaz. Eşit sayılı konuların
+        sırası baştan oluşturulan depodakinden farklı olabilir.
+
+        Args:
+            added (Sequence[Book]): Eklenen kitaplar
+            removed (Sequence[Book]): Silinen kitaplar (depoda bulunmalıdır)
+
+        Returns:
+            ColumnStore: Yeni depo; bu depo değiştirilmez
+        """
+        vocabulary = {subject: code for code, subject in enumerate(self.subject_names)}
+        names = list(self.subject_names)
+
+        def code(subject: str) -> int:
+            if subject not in vocabulary:
+                vocabulary[subject] = len(names)
+                names.append(subject)
+            return vocabulary[subject]
+
+        years = _replaced(self.years, (book.publish_year or MISSING for book in removed),
+                          [book.publish_year or MISSING for book in added])
+        pages = _replaced(self.pages, (book.pages or MISSING for book in removed),
+                          [book.pages or MISSING for book in added])
+        codes = _replaced(self.subject_codes,
+                          (vocabulary[subject] for book in removed
+                           for subject in dict.fromkeys(book.subjects)),
+                          [code(subject) for book in added
+                           for subject in dict.fromkeys(book.subjects)])
+        return ColumnStore(self.size + len(added) - len(removed), years, pages, codes, names)
+
+    def books_per_decade(self) -> List[dict]:
+        """Yayın yılı bilinen kitapların on yıllara göre sayısı (artan sırada)."""
+        years = self.years[self.years != MISSING]
+        decades, counts = np.unique(years // 10 * 10, return_counts=True)
+        return [{"decade": int(decade), "books": int(count)}
+                for decade, count in zip(decades, counts)]
+
+    def page_distribution(self) -> dict:
+        """Sayfa sayısı bilinen kitapların ortalaması ve yüzdelikleri."""
+        pages = self.pages[self.pages != MISSING]
+        if not pages.size:
+            return {"books": 0, "mean": None, "percentiles": {}}
+        values = np.percentile(pages, PAGE_PERCENTILES)
+        return {
+            "books": int(pages.size),
+            "mean": round(float(pages.mean()), 2),
+            "percentiles": {f"p{p}": round(float(v), 2) for p, v in zip(PAGE_PERCENTILES, values)},
+        }
+
+    def top_subjects(self, limit: int = 10) -> List[dict]:
+        """En çok kitapta geçen konular (çoktan aza)."""
+        if not self.subject_codes.size:
+            return []
+        counts = np.bincount(self.subject_codes, minlength=len(self.subject_names))
+        limit = min(limit, np.count_nonzero(counts))
+        # Tam sıralama yerine yalnızca ilk limit kod seçilir, sonra onlar sıralanır
+        top = np.argpartition(-counts, limit - 1)[:limit]
+        top = top[np.lexsort((top, -counts[top]))]
+        return [{"subject": self.subject_names[code], "books": int(counts[code])} for code in top]
+
+
+def _replaced(values: np.ndarray, removed: Iterable[int], added: List[int]) -> np.ndarray:
+    """values'tan removed'daki her değerin bir örneği çıkarılmış, added eklenmiş kopya."""
+    keep = np.ones(values.size, dtype=bool)
+    for value, count in Counter(removed).items():
+        keep[np.flatnonzero(values == value)[:count]] = False
+    return np.concatenate((values[keep], np.array(added, dtype=values.dtype)))
+
+
+def column_store(snapshot: "CatalogSnapshot") -> ColumnStore:
+    """
+    Snapshot'ın sütunsal deposunu döndürür; ilk çağrıda oluşturur.
+
+    Args:
+        snapshot (CatalogSnapshot): Katalog snapshot'ı
+
+    Returns:
+        ColumnStore: Snapshot'taki kitapların sütunları
+    """
+    store = snapshot.columns
+    if store is None:
+        # Eşzamanlı iki istek aynı depoyu oluşturabilir; sonuç aynıdır
+        store = snapshot.columns = ColumnStore.build(snapshot.books)
+    return store
+
+
+def analyze(snapshot: "CatalogSnapshot", top_subjects: int = 10) -> dict:
+    """
+    Katalog dağılımlarını hesaplar.
+
+    Args:
+        snapshot (CatalogSnapshot): Katalog snapshot'ı
+        top_subjects (int): Raporlanacak konu sayısı
+
+    Returns:
+        dict: Kitap sayısı, on yıla göre dağılım, sayfa yüzdelikleri ve en sık konular
+    """
+    store = column_store(snapshot)
+    return {
+        "total_books": store.size,
+        "books_with_year": int(np.count_nonzero(store.years != MISSING)),
+        "books_per_decade": store.books_per_decade(),
+        "pages": store.page_distribution(),
+        "top_subjects": store.top_subjects(top_subjects),
+        "seq": snapshot.seq,
+    }
@@ -7,14 +7,43 @@ Bu modül kütüphane yönetim sisteminin web API'sini sağlar.
 REST API endpoint'leri ile kitap ekleme, silme ve listeleme işlemleri yapılabilir.
 """
 
-from fastapi import FastAPI, HTTPException, status
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
-from typing import List
+import gc
+import json
+import secrets
+import time
+from contextlib import asynccontextmanager
+import anyio
+import httpx
+from fastapi import (APIRouter, Depends, FastAPI, Header, HTTPException, Path, Query, Request,
+                     Response, status)
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, Field, field_validator
+from typing import AsyncIterator, Dict, Iterator, List, Literal, Optional
 import uvicorn
 
-from library import Library
+from library import IndexNotReady, Library, ReadOnlyError
 from book import Book
+from settings import Settings
+import metrics
+import tracing
+import profiling
+from profiling import run_in_threadpool
+import memory_debug
+import export
+import analytics
+from covers import CoverCache, CoverNotFound
+from indexes import INDEXED_FIELDS
+from isbn import validate_isbn
+from jobs import JobQueue, JobQueueBusy
+from replication import Follower, journal_filename
+from tenancy import LIBRARY_ID_PATTERN, LibraryRegistry
+from openlibrary import OpenLibraryClient, client_from_settings
+from providers import ProviderChain, chain_from_settings
+from resilience import UpstreamUnavailable
+
+
+# POST /books/lookup isteğinde en fazla ISBN sayısı
+LOOKUP_MAX_ISBNS = 1000
 
 
 # Pydantic modelleri
@@ -23,6 +52,11 @@ class BookResponse(BaseModel):
     title: str = Field(..., description="Kitabın başlığı")
     author: str = Field(..., description="Kitabın yazarı")
     isbn: str = Field(..., description="Kitabın ISBN numarası")
+    publish_year: Optional[int] = Field(None, description="Yayın yılı")
+    pages: Optional[int] = Field(None, description="Sayfa sayısı")
+    publishers: Optional[List[str]] = Field(None, description="Yayınevleri")
+    subjects: Optional[List[str]] = Field(None, description="Konular")
+    author_keys: Optional[List[str]] = Field(None, description="Tüm yazarların Open Library anahtarları")
     
     class Config:
         schema_extra = {
@@ -39,6 +73,18 @@ class ISBNRequest(BaseModel):
     isbn: str = Field(..., min_length=10, max_length=17, 
                       description="Kitabın ISBN numarası (10-17 karakter)")
     
+    @field_validator("isbn")
+    @classmethod
+    def check_isbn(cls, value: str) -> str:
+        """
+        Kontrol hanesi hatalı ISBN'leri Open Library'ye gitmeden reddeder.
+        Kitap kullanıcının yazımıyla saklanır; tekrar denetimi kanonik biçimle yapılır.
+        """
+        value = value.strip()
+        if validate_isbn(value) is None:
+            raise ValueError("Geçersiz ISBN: uzunluk ya da kontrol hanesi hatalı.")
+        return value
+    
     class Config:
         schema_extra = {
             "example": {
@@ -47,33 +93,182 @@ class ISBNRequest(BaseModel):
         }
 
 
+class BatchOperation(BaseModel):
+    """Toplu işlemdeki tek bir ekleme ya da silme."""
+    op: Literal["add", "remove"] = Field(..., description="İşlem türü")
+    isbn: str = Field(..., min_length=1, max_length=17, description="Kitabın ISBN numarası")
+    title: Optional[str] = Field(None, description="Eklemede başlık (author ile verilirse Open Library'ye gidilmez)")
+    author: Optional[str] = Field(None, description="Eklemede yazar")
+    publish_year: Optional[int] = Field(None, description="Eklemede yayın yılı")
+    pages: Optional[int] = Field(None, ge=1, description="Eklemede sayfa sayısı")
+    publishers: Optional[List[str]] = Field(None, description="Eklemede yayınevleri")
+    subjects: Optional[List[str]] = Field(None, description="Eklemede konular")
+    author_keys: Optional[List[str]] = Field(None, description="Eklemede yazar anahtarları")
+
+
+class BatchRequest(BaseModel):
+    """POST /books/batch isteğinin gövdesi."""
+    operations: List[BatchOperation] = Field(..., min_length=1, max_length=100_000,
+                                             description="Sırayla uygulanacak işlemler")
+
+
+class LookupRequest(BaseModel):
+    """POST /books/lookup isteğinin gövdesi."""
+    isbns: List[str] = Field(..., min_length=1, max_length=LOOKUP_MAX_ISBNS,
+                             description="Aranacak ISBN'ler (tireli, tiresiz ya da ISBN-10)")
+
+
+class LookupResponse(BaseModel):
+    """POST /books/lookup yanıtı."""
+    books: Dict[str, BookResponse] = Field(..., description="İstenen ISBN -> bulunan kitap (istek sırasıyla)")
+    missing: List[str] = Field(..., description="Katalogda bulunamayan ISBN'ler")
+
+
+class BatchResult(BaseModel):
+    """Toplu işlemdeki tek bir işlemin sonucu."""
+    index: int = Field(..., description="İşlemin istekteki sırası")
+    op: str = Field(..., description="İşlem türü")
+    isbn: str = Field(..., description="Kitabın ISBN numarası")
+    success: bool = Field(..., description="İşlem uygulandı mı")
+    status: str = Field(..., description="added, removed, exists, not_found, invalid veya error")
+    detail: Optional[str] = Field(None, description="Başarısız işlemin açıklaması")
+    book: Optional[BookResponse] = Field(None, description="Eklenen kitap")
+
+
+class BatchResponse(BaseModel):
+    """POST /books/batch yanıtı."""
+    applied: int = Field(..., description="Uygulanan işlem sayısı")
+    failed: int = Field(..., description="Uygulanamayan işlem sayısı")
+    results: List[BatchResult] = Field(..., description="İşlem sırasıyla sonuçlar")
+
+
+class JobResponse(BaseModel):
+    """Asenkron kitap ekleme işinin durum modeli."""
+    id: str = Field(..., description="İş kimliği")
+    isbn: str = Field(..., description="Eklenecek kitabın ISBN numarası")
+    status: str = Field(..., description="pending, running, succeeded veya failed")
+    attempts: int = Field(..., description="Yapılan deneme sayısı")
+    error: Optional[str] = Field(None, description="Başarısız işin hata mesajı")
+    book: Optional[BookResponse] = Field(None, description="Başarılı işte eklenen kitap")
+    created_at: float = Field(..., description="Oluşturulma zamanı (epoch saniye)")
+    updated_at: float = Field(..., description="Son güncelleme zamanı (epoch saniye)")
+
+
+class ChangeEvent(BaseModel):
+    """Değişiklik akışındaki tek bir ekleme ya da silme olayı."""
+    seq: int = Field(..., description="Olayın sıra numarası (monoton artan)")
+    op: str = Field(..., description="add veya remove")
+    isbn: str = Field(..., description="Kitabın ISBN numarası")
+    time: float = Field(..., description="Olay zamanı (epoch saniye)")
+    book: Optional[BookResponse] = Field(None, description="Eklenen kitap (yalnızca add)")
+
+
+class ChangesResponse(BaseModel):
+    """GET /changes yanıtı."""
+    resync_required: bool = Field(..., description="since saklanan pencerenin dışındaysa True; "
+                                                   "katalog baştan indirilmelidir")
+    last_seq: int = Field(..., description="Kaydedilen son olayın sıra numarası")
+    next: int = Field(..., description="Bir sonraki istekte since olarak kullanılacak değer")
+    changes: List[ChangeEvent] = Field(..., description="since'ten sonraki olaylar (sırasıyla)")
+
+
 class MessageResponse(BaseModel):
     """API'nin döndüreceği mesaj modeli."""
     message: str = Field(..., description="İşlem sonucu mesajı")
     success: bool = Field(..., description="İşlem başarı durumu")
 
 
-# FastAPI uygulaması
-app = FastAPI(
-    title="Kütüphane Yönetim Sistemi API",
-    description="Python 202 Bootcamp bitirme projesi - Kütüphane yönetimi için REST API",
-    version="1.0.0",
-    contact={
-        "name": "Python 202 Bootcamp Projesi",
-        "url": "https://github.com/username/library-management-system",
-    },
-    license_info={
-        "name": "MIT",
-        "url": "https://opensource.org/licenses/MIT",
-    },
-)
+def library_id_param(library_id: str = Path(..., pattern=LIBRARY_ID_PATTERN,
+                                              description="Şube kimliği")) -> str:
+    """Şube route'larındaki kütüphane kimliğini doğrular."""
+    return library_id
+
 
-# Library instance'ı oluştur
-library = Library("library.json")
+def get_library(request: Request) -> Iterator[Library]:
+    """
+    İsteği işleyen Library instance'ını döndürür.
+    Endpoint'lere FastAPI dependency olarak enjekte edilir. Şube
+    route'larında (/libraries/{library_id}/...) şubenin kataloğu kayıt
+    defterinden alınır ve istek bitene kadar sabitlenir (LRU ile bellekten
+    çıkarılmaz); diğer route'larda uygulamanın varsayılan kataloğu
+    kullanılır.
 
+    Args:
+        request (Request): Gelen HTTP isteği
 
-@app.get("/", response_model=MessageResponse)
-async def root():
+    Yields:
+        Library: İsteğin ait olduğu Library instance'ı
+        
+    Raises:
+        HTTPException: Şube kimliği geçersizse 404 hatası döner
+    """
+    library_id = request.path_params.get("library_id")
+    if library_id is None:
+        yield request.app.state.library
+        return
+    libraries = request.app.state.libraries
+    try:
+        libraries.filename(library_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    with libraries.acquire(library_id) as library:
+        yield library
+
+
+def get_jobs(request: Request) -> Optional[JobQueue]:
+    """
+    İsteği işleyen uygulamanın zenginleştirme iş kuyruğunu döndürür.
+    İş kuyruğu yalnızca varsayılan kataloğa bağlıdır; şube route'larında
+    ve takipçi modunda None döner.
+
+    Args:
+        request (Request): Gelen HTTP isteği
+
+    Returns:
+        Optional[JobQueue]: Uygulamaya bağlı iş kuyruğu
+    """
+    if "library_id" in request.path_params:
+        return None
+    return request.app.state.jobs
+
+
+def require_admin(request: Request,
+                  x_admin_token: Optional[str] = Header(None)) -> None:
+    """
+    Yönetici endpoint'leri için X-Admin-Token başlığını doğrular.
+    
+    Raises:
+        HTTPException: Token yapılandırılmamışsa veya eşleşmiyorsa 403 hatası döner
+    """
+    expected = request.app.state.settings.admin_token
+    if not expected or not x_admin_token or not secrets.compare_digest(x_admin_token, expected):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Bu işlem için yönetici yetkisi gerekiyor."
+        )
+
+
+# GET /changes'te long-poll/SSE için en fazla bekleme süresi (saniye)
+CHANGES_MAX_WAIT = 300.0
+# SSE bağlantısında olay yokken gönderilen canlı tutma yorumu aralığı (saniye)
+CHANGES_KEEPALIVE = 15.0
+# Kitap listesi ve dışa aktarımın hangi değişikliğe kadar güncel olduğu
+CHANGE_SEQ_HEADER = "X-Change-Seq"
+# Filtrelenmiş listede eşleşen toplam kitap sayısı (sayfalama için)
+TOTAL_COUNT_HEADER = "X-Total-Count"
+# Kapak görselleri içerik adreslidir (ETag = SHA-256); istemciler uzun süre saklayabilir
+COVER_CACHE_CONTROL = "public, max-age=2592000, immutable"
+
+
+# Katalog endpoint'leri hem kökte (varsayılan katalog) hem de
+# /libraries/{library_id} altında (şube katalogları) sunulur
+router = APIRouter()
+# Süreç düzeyindeki endpoint'ler yalnızca kökte sunulur
+service_router = APIRouter()
+
+
+@router.get("/", response_model=MessageResponse)
+async def root(library: Library = Depends(get_library)):
     """API'nin ana endpoint'i - sistem durumu döndürür."""
     return MessageResponse(
         message=f"Kütüphane Yönetim Sistemi API'sine hoş geldiniz! "
@@ -82,59 +277,147 @@ async def root():
     )
 
 
-@app.get("/books", 
+@router.get("/ready",
+            response_model=dict,
+            summary="Hazır olma durumu",
+            description="Katalog yüklendiyse ISBN aramaları hazırdır. İkincil indekslerin (sıralı, "
+                        "kanonik ISBN, analitik sütunları) durumu ve oluşturulma süreleri de döner; "
+                        "full=true ile indeksler hazır olana kadar 503 döner.")
+async def get_ready(response: Response,
+                    full: bool = Query(False, description="İkincil indeksler de hazır olmalı mı"),
+                    library: Library = Depends(get_library)):
+    """
+    Kataloğun ve ikincil indekslerin hazır olma durumunu döndürür. Katalog
+    lifespan içinde yüklendiği için bu endpoint yanıt veriyorsa ISBN
+    aramaları hazırdır.
+    
+    Args:
+        full (bool): İkincil indeksler oluşturulurken 503 dönülsün mü
+        
+    Returns:
+        dict: ready, kitap sayısı ve indeks başına {"ready", "seconds"}
+    """
+    readiness = library.index_status()
+    if full and not readiness["ready"]:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return readiness
+
+
+@router.get("/books", 
          response_model=List[BookResponse],
+         response_model_exclude_none=True,
          summary="Tüm kitapları listele",
-         description="Kütüphanedeki tüm kitapların listesini JSON formatında döndürür.")
-async def get_books():
+         description="Kütüphanedeki kitapların listesini JSON formatında döndürür. author ve "
+                     "title_prefix ile filtrelenir, sort/order ile sıralanır, offset/limit ile "
+                     "sayfalanır; from/to sıralama alanında aralık seçer. Sıralama ve filtreleme "
+                     "sıralı indekslerle yapılır; indeksler açılışta henüz oluşturulurken büyük "
+                     "kataloglarda 503 döner. X-Total-Count eşleşen toplam kitap sayısını, "
+                     "X-Change-Seq listenin hangi değişikliğe kadar güncel olduğunu gösterir; "
+                     "GET /changes?since=<değer> ile devam edilebilir.")
+async def get_books(response: Response,
+                    author: Optional[str] = Query(None, description="Yazar (büyük/küçük harf duyarsız)"),
+                    title_prefix: Optional[str] = Query(None, description="Başlığın başlangıcı"),
+                    sort: Optional[str] = Query(None, pattern=f"^({'|'.join(INDEXED_FIELDS)})$",
+                                                description="Sıralama alanı"),
+                    order: str = Query("asc", pattern="^(asc|desc)$"),
+                    start: Optional[str] = Query(None, alias="from",
+                                                 description="Sıralama alanının alt sınırı (dahil)"),
+                    end: Optional[str] = Query(None, alias="to",
+                                               description="Sıralama alanının üst sınırı (dahil)"),
+                    offset: int = Query(0, ge=0),
+                    limit: Optional[int] = Query(None, ge=1, le=10_000),
+                    library: Library = Depends(get_library)):
     """
-    Kütüphanedeki tüm kitapları listeler.
+    Kütüphanedeki kitapları listeler.
+    
+    Args:
+        author (Optional[str]): Yalnızca bu yazarın kitapları
+        title_prefix (Optional[str]): Yalnızca başlığı bununla başlayan kitaplar
+        sort (Optional[str]): title veya author; verilmezse katalog sırası
+        order (str): asc veya desc
+        start (Optional[str]): Sıralama alanının alt sınırı
+        end (Optional[str]): Sıralama alanının üst sınırı
+        offset (int): Atlanacak kitap sayısı
+        limit (Optional[int]): Sayfadaki en fazla kitap sayısı
     
     Returns:
-        List[BookResponse]: Kütüphanedeki tüm kitapların listesi
+        List[BookResponse]: İstenen sayfadaki kitaplar
+    
+    Raises:
+        HTTPException: Aralık sıralama alanı olmadan verilirse 400 hatası döner
     """
-    books = library.list_books()
-    return [
-        BookResponse(
-            title=book.title,
-            author=book.author, 
-            isbn=book.isbn
-        ) for book in books
-    ]
+    snapshot = library.snapshot()
+    try:
+        total, books = library.query_books(author, title_prefix, sort, order == "desc",
+                                           start, end, offset, limit, snapshot=snapshot)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    response.headers[CHANGE_SEQ_HEADER] = str(snapshot.seq)
+    response.headers[TOTAL_COUNT_HEADER] = str(total)
+    return [BookResponse(**book.to_dict()) for book in books]
 
 
-@app.post("/books",
+@router.post("/books",
           response_model=BookResponse,
+          response_model_exclude_none=True,
           status_code=status.HTTP_201_CREATED,
+          responses={status.HTTP_202_ACCEPTED: {"model": JobResponse,
+                                                "description": "Kitap ekleme işi kuyruğa alındı"}},
           summary="Yeni kitap ekle",
-          description="ISBN numarası kullanarak Open Library API'sinden kitap bilgilerini çeker ve kütüphaneye ekler.")
-async def add_book(isbn_request: ISBNRequest):
+          description="ISBN numarası kullanarak Open Library API'sinden kitap bilgilerini çeker ve kütüphaneye ekler. "
+                      "`Prefer: respond-async` başlığıyla (ya da LIBRARY_ASYNC_ENRICHMENT ile) istek "
+                      "beklemeden 202 ve iş kimliği döner; durum GET /jobs/{id} ile izlenir.")
+async def add_book(isbn_request: ISBNRequest,
+                   request: Request,
+                   prefer: Optional[str] = Header(None),
+                   library: Library = Depends(get_library)):
     """
     Yeni bir kitap ekler.
     
     Args:
         isbn_request (ISBNRequest): ISBN numarası içeren request body
+        prefer (Optional[str]): "respond-async" içeriyorsa kitap arka planda eklenir
         
     Returns:
-        BookResponse: Eklenen kitabın bilgileri
+        BookResponse: Eklenen kitabın bilgileri (asenkron modda 202 ve iş durumu)
         
     Raises:
         HTTPException: Kitap eklenemezse 400 veya 404 hatası döner
     """
     isbn = isbn_request.isbn.strip()
     
-    # Kitabın zaten var olup olmadığını kontrol et
-    existing_book = library.find_book(isbn)
+    # Kitabın (tireli, tiresiz ya da ISBN-10 yazımıyla) zaten var olup olmadığını kontrol et
+    existing_book = library.find_equivalent(isbn)
     if existing_book:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"ISBN {isbn} numaralı kitap zaten kütüphanede mevcut."
         )
     
-    # Kitabı ekle
-    success = library.add_book(isbn)
+    # Şube route'larında ve kuyruğu başka süreçte olan worker'larda iş kuyruğu
+    # yoktur; tercih yok sayılır (RFC 7240)
+    jobs = get_jobs(request)
+    respond_async = jobs is not None and (request.app.state.settings.async_enrichment or (
+        prefer is not None and "respond-async" in prefer.lower()))
+    if respond_async:
+        job = jobs.submit(isbn)
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=job.to_dict(),
+            headers={"Location": f"/jobs/{job.id}", "Preference-Applied": "respond-async"}
+        )
+    
+    # Kitabı ekle; hız sınırı beklemesi, yeniden denemeler ve kaydetme event loop'u bloklamasın
+    success = await run_in_threadpool(library.add_book, isbn)
     
     if not success:
+        retry_after = library.upstream.breaker.retry_after()
+        if retry_after > 0:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Open Library şu anda kullanılamıyor, lütfen daha sonra tekrar deneyin.",
+                headers={"Retry-After": str(int(retry_after) + 1)}
+            )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ISBN {isbn} ile kitap bulunamadı veya API hatası oluştu."
@@ -148,18 +431,88 @@ async def add_book(isbn_request: ISBNRequest):
             detail="Kitap eklendi ancak tekrar bulunamadı."
         )
     
-    return BookResponse(
-        title=added_book.title,
-        author=added_book.author,
-        isbn=added_book.isbn
+    return BookResponse(**added_book.to_dict())
+
+
+@router.post("/books/batch",
+          response_model=BatchResponse,
+          summary="Toplu kitap ekle/sil",
+          description="Ekleme ve silme işlemlerini tek kilit altında sırayla uygular, kataloğu "
+                      "bir kez kaydeder ve her işlem için ayrı sonuç döndürür.")
+async def apply_batch(batch: BatchRequest, library: Library = Depends(get_library)):
+    """
+    Toplu ekleme/silme işlemlerini uygular.
+    
+    Args:
+        batch (BatchRequest): Sırayla uygulanacak işlemler
+        
+    Returns:
+        BatchResponse: Uygulanan/başarısız işlem sayıları ve işlem başına sonuçlar
+    """
+    operations = [operation.model_dump(exclude_none=True) for operation in batch.operations]
+    # Open Library çağrıları ve kaydetme event loop'u bloklamasın
+    results = await run_in_threadpool(library.apply_batch, operations)
+    applied = sum(1 for result in results if result["success"])
+    return BatchResponse(applied=applied, failed=len(results) - applied, results=results)
+
+
+@router.post("/books/lookup",
+          response_model=LookupResponse,
+          summary="Birden çok kitabı ISBN ile getir",
+          description="ISBN listesini tek istekte ve tek snapshot üzerinden çözer. ISBN'ler "
+                      "kanonik biçimle (tiresiz ISBN-13) de eşlenir. Bulunan kitaplar istenen "
+                      "ISBN'e göre, bulunamayanlar missing listesinde döner.")
+async def lookup_books(lookup: LookupRequest, library: Library = Depends(get_library)):
+    """
+    Birden çok ISBN'i tek seferde arar.
+    
+    Args:
+        lookup (LookupRequest): Aranacak ISBN'ler
+        
+    Returns:
+        JSONResponse: {"books": {isbn: kitap}, "missing": [isbn]}; X-Change-Seq
+            yanıtın hangi değişikliğe kadar güncel olduğunu gösterir
+    """
+    snapshot = library.snapshot()
+    found, missing = library.get_many(lookup.isbns, snapshot=snapshot)
+    # Kitap başına model doğrulaması yapılmadan yanıt tek seferde serileştirilir
+    return JSONResponse(
+        {"books": {isbn: book.to_dict() for isbn, book in found.items()}, "missing": missing},
+        headers={CHANGE_SEQ_HEADER: str(snapshot.seq)}
     )
 
 
-@app.delete("/books/{isbn}",
+@service_router.get("/jobs/{job_id}",
+            response_model=JobResponse,
+            summary="Kitap ekleme işinin durumu",
+            description="Asenkron POST /books isteğiyle oluşturulan işin durumunu döndürür.")
+async def get_job(job_id: str, jobs: JobQueue = Depends(get_jobs)):
+    """
+    Belirtilen işin durumunu döndürür.
+    
+    Args:
+        job_id (str): İş kimliği
+        
+    Returns:
+        JobResponse: İşin durumu; başarılıysa eklenen kitap
+        
+    Raises:
+        HTTPException: İş bulunamazsa 404 hatası döner
+    """
+    job = jobs.get(job_id) if jobs is not None else None
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{job_id} kimlikli iş bulunamadı."
+        )
+    return job.to_dict()
+
+
+@router.delete("/books/{isbn}",
            response_model=MessageResponse,
            summary="Kitap sil",
            description="Belirtilen ISBN'e sahip kitabı kütüphaneden siler.")
-async def delete_book(isbn: str):
+async def delete_book(isbn: str, library: Library = Depends(get_library)):
     """
     Belirtilen ISBN'e sahip kitabı siler.
     
@@ -182,8 +535,8 @@ async def delete_book(isbn: str):
             detail=f"ISBN {isbn} numaralı kitap bulunamadı."
         )
     
-    # Kitabı sil
-    success = library.remove_book(isbn)
+    # Kitabı sil; yazma kilidi ve dosya yazımı event loop'u bloklamasın
+    success = await run_in_threadpool(library.remove_book, isbn)
     
     if success:
         return MessageResponse(
@@ -197,11 +550,12 @@ async def delete_book(isbn: str):
         )
 
 
-@app.get("/books/{isbn}",
+@router.get("/books/{isbn}",
          response_model=BookResponse,
+         response_model_exclude_none=True,
          summary="Belirli bir kitabı getir",
          description="ISBN numarası ile belirli bir kitabın bilgilerini getirir.")
-async def get_book(isbn: str):
+async def get_book(isbn: str, library: Library = Depends(get_library)):
     """
     Belirtilen ISBN'e sahip kitabı getirir.
     
@@ -223,18 +577,68 @@ async def get_book(isbn: str):
             detail=f"ISBN {isbn} numaralı kitap bulunamadı."
         )
     
-    return BookResponse(
-        title=book.title,
-        author=book.author,
-        isbn=book.isbn
-    )
+    return BookResponse(**book.to_dict())
+
+
+@router.get("/books/{isbn}/cover",
+         response_class=FileResponse,
+         responses={status.HTTP_200_OK: {"content": {"image/jpeg": {}}},
+                    status.HTTP_304_NOT_MODIFIED: {"description": "If-None-Match ile eşleşti"}},
+         summary="Kitap kapağını getir",
+         description="Kapak görselini covers.openlibrary.org'dan bir kez çeker ve diskteki "
+                     "içerik adresli önbellekten sunar. ETag görselin SHA-256 özetidir.")
+async def get_cover(request: Request,
+                    isbn: str,
+                    size: str = Query("M", pattern="^[SML]$"),
+                    if_none_match: Optional[str] = Header(None),
+                    library: Library = Depends(get_library)):
+    """
+    Kitabın kapak görselini döndürür.
+    
+    Args:
+        isbn (str): Kitabın ISBN numarası
+        size (str): S, M veya L
+        if_none_match (Optional[str]): Önceki yanıtın ETag'i; eşleşirse 304 döner
+        
+    Returns:
+        FileResponse: Görsel dosyası (sunucu destekliyorsa sendfile ile gönderilir)
+        
+    Raises:
+        HTTPException: Kitap ya da kapağı yoksa 404, kapak sunucusuna ulaşılamazsa 503 hatası döner
+    """
+    isbn = isbn.strip()
+    if library.find_book(isbn) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"ISBN {isbn} numaralı kitap bulunamadı."
+        )
+    
+    covers: CoverCache = request.app.state.covers
+    try:
+        entry = await run_in_threadpool(covers.get, isbn, size)
+    except (ValueError, CoverNotFound):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"ISBN {isbn} numaralı kitabın kapağı bulunamadı."
+        )
+    except (UpstreamUnavailable, httpx.HTTPError):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Kapak sunucusu şu anda kullanılamıyor, lütfen daha sonra tekrar deneyin."
+        )
+    
+    etag = f'"{entry.digest}"'
+    headers = {"ETag": etag, "Cache-Control": COVER_CACHE_CONTROL}
+    if if_none_match is not None and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return FileResponse(covers.path(entry.digest), media_type=entry.content_type, headers=headers)
 
 
-@app.get("/stats",
+@router.get("/stats",
          response_model=dict,
          summary="Kütüphane istatistikleri",
          description="Kütüphane hakkında genel istatistik bilgilerini döndürür.")
-async def get_stats():
+async def get_stats(library: Library = Depends(get_library)):
     """
     Kütüphane istatistiklerini döndürür.
     
@@ -251,6 +655,438 @@ async def get_stats():
     }
 
 
+@router.get("/stats/analytics",
+         response_model=dict,
+         summary="Katalog analitiği",
+         description="On yıla göre kitap sayısı, sayfa sayısı yüzdelikleri ve en sık konuları "
+                     "sütunsal (NumPy) bir depo üzerinde vektörel olarak hesaplar.")
+async def get_analytics(top: int = Query(10, ge=1, le=100, description="Raporlanacak konu sayısı"),
+                        library: Library = Depends(get_library)):
+    """
+    Katalog dağılımlarını döndürür.
+    
+    Args:
+        top (int): En sık konulardan kaç tanesinin raporlanacağı
+        
+    Returns:
+        dict: Kitap sayısı, on yıla göre dağılım, sayfa yüzdelikleri ve en sık konular
+    """
+    # Sütunlar yeni bir snapshot için ilk kez oluşturulabilir; event loop'u bloklamasın
+    return await run_in_threadpool(analytics.analyze, library.snapshot(), top)
+
+
+@router.get("/export",
+            response_class=StreamingResponse,
+            summary="Kataloğu dışa aktar",
+            description="Kataloğu CSV veya NDJSON olarak akış halinde döndürür; "
+                        "gzip=true ile çıktı sıkıştırılır.")
+async def export_catalog(fmt: str = Query("ndjson", alias="format", pattern="^(csv|ndjson)$"),
+                         compress: bool = Query(False, alias="gzip"),
+                         library: Library = Depends(get_library)):
+    """
+    Kataloğu dosya olarak indirilebilecek biçimde akış halinde döndürür.
+    
+    Args:
+        fmt (str): csv veya ndjson (format parametresi)
+        compress (bool): Çıktı gzip ile sıkıştırılsın mı (gzip parametresi)
+        
+    Returns:
+        StreamingResponse: Parça parça gönderilen katalog
+    """
+    snapshot = library.snapshot()
+    return StreamingResponse(
+        export.export_books(snapshot.books, fmt, compress=compress),
+        media_type=export.content_type(fmt, compress),
+        headers={"Content-Disposition":
+                 f'attachment; filename="{export.filename(fmt, compress)}"',
+                 CHANGE_SEQ_HEADER: str(snapshot.seq)}
+    )
+
+
+@router.get("/changes",
+            response_model=ChangesResponse,
+            responses={status.HTTP_410_GONE: {"model": ChangesResponse,
+                                              "description": "since saklanan pencerenin dışında; "
+                                                             "katalog baştan indirilmelidir"}},
+            summary="Değişiklik akışı",
+            description="since sıra numarasından sonraki ekleme/silme olaylarını döndürür. "
+                        "wait ile yeni olay gelene kadar beklenir (long-poll). "
+                        "`Accept: text/event-stream` ile olaylar Server-Sent Events olarak "
+                        "akıtılır; Last-Event-ID başlığı since yerine geçer.")
+async def get_changes(request: Request,
+                      since: int = Query(..., ge=0, description="Uygulanan son olayın sıra numarası"),
+                      wait: float = Query(0, ge=0, le=CHANGES_MAX_WAIT,
+                                          description="Olay yoksa beklenecek süre; SSE'de bağlantı süresi"),
+                      limit: int = Query(1000, ge=1, le=10_000, description="En fazla olay sayısı"),
+                      last_event_id: Optional[int] = Header(None, ge=0),
+                      library: Library = Depends(get_library)):
+    """
+    Kataloğun değişikliklerini artımlı olarak döndürür.
+    
+    Args:
+        since (int): Tüketicinin uyguladığı son olayın sıra numarası
+        wait (float): Yeni olay yoksa beklenecek en fazla süre (saniye)
+        limit (int): Tek yanıttaki en fazla olay sayısı
+        last_event_id (Optional[int]): SSE yeniden bağlanmasında since yerine geçer
+        
+    Returns:
+        ChangesResponse: Olaylar ve bir sonraki since değeri; SSE isteğinde akış
+    """
+    if last_event_id is not None:
+        since = last_event_id
+    limiter = request.app.state.change_waiters
+    if "text/event-stream" in request.headers.get("accept", ""):
+        return StreamingResponse(
+            _change_stream(library, since, wait or CHANGES_MAX_WAIT, limit, limiter),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"}
+        )
+    
+    result = library.changes(since, limit)
+    if not result["changes"] and not result["resync_required"] and wait > 0:
+        # Bekleyen istekler varsayılan thread havuzunu tüketmesin
+        await anyio.to_thread.run_sync(library.wait_for_changes, since, wait, limiter=limiter)
+        result = library.changes(since, limit)
+    if result["resync_required"]:
+        return JSONResponse(status_code=status.HTTP_410_GONE, content=result)
+    return result
+
+
+async def _change_stream(library: Library, since: int, duration: float, limit: int,
+                         limiter: anyio.CapacityLimiter) -> AsyncIterator[str]:
+    """
+    Değişiklikleri Server-Sent Events olarak akıtır. Bağlantı duration
+    saniye sonra kapanır; istemci Last-Event-ID ile yeniden bağlanır.
+    """
+    deadline = time.monotonic() + duration
+    while True:
+        result = library.changes(since, limit)
+        if result["resync_required"]:
+            yield f"event: resync\ndata: {json.dumps({'last_seq': result['last_seq']})}\n\n"
+            return
+        for event in result["changes"]:
+            yield (f"id: {event['seq']}\nevent: {event['op']}\n"
+                   f"data: {json.dumps(event, ensure_ascii=False)}\n\n")
+        since = result["next"]
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        if not result["changes"]:
+            changed = await anyio.to_thread.run_sync(
+                library.wait_for_changes, since, min(remaining, CHANGES_KEEPALIVE),
+                limiter=limiter)
+            if not changed:
+                yield ": keep-alive\n\n"
+
+
+@service_router.get("/metrics",
+            response_class=PlainTextResponse,
+            include_in_schema=False)
+async def get_metrics(request: Request,
+                      library: Library = Depends(get_library),
+                      jobs: JobQueue = Depends(get_jobs)):
+    """
+    Prometheus metin biçiminde metrikleri döndürür.
+    
+    Returns:
+        PlainTextResponse: İstek, Open Library, kalıcılık, katalog ve önbellek metrikleri
+    """
+    metrics.CATALOG_BOOKS.set(library.get_book_count())
+    circuit_state = library.upstream.breaker.state
+    metrics.UPSTREAM_CIRCUIT_STATE.set({"closed": 0, "half_open": 1, "open": 2}[circuit_state])
+    if jobs is not None:
+        for job_status, count in jobs.stats().items():
+            metrics.JOBS.labels(job_status).set(count)
+    follower = request.app.state.follower
+    if follower is not None:
+        replication = follower.status()
+        metrics.REPLICATION_LAG.set(replication["lag_seconds"])
+        metrics.REPLICATION_SEQ.set(replication["applied_seq"])
+    metrics.update_cache_ratios()
+    return PlainTextResponse(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
+
+@service_router.get("/upstream",
+            response_model=dict,
+            summary="Open Library bağlantı durumu",
+            description="Devre kesici, hız sınırlayıcı ve tekrar deneme ayarlarının anlık durumunu döndürür.")
+async def get_upstream(library: Library = Depends(get_library)):
+    """
+    Open Library istemcisinin anlık durumunu döndürür.
+    
+    Returns:
+        dict: Devre kesici durumu, kalan token sayısı ve tekrar deneme ayarları
+    """
+    return library.upstream.state()
+
+
+@service_router.get("/providers",
+                    response_model=dict,
+                    summary="Kitap bilgisi sağlayıcıları",
+                    description="Sağlayıcı zincirinin sırasını, zaman aşımlarını ve sağlayıcı başına "
+                                "çağrı sayıları, hedge'ler ve gecikme yüzdeliklerini döndürür.")
+async def get_providers(library: Library = Depends(get_library)):
+    """
+    Sağlayıcı zincirinin istatistiklerini döndürür.
+    
+    Returns:
+        dict: Hedge süresi ve sağlayıcı başına bulunan/bulunamayan/hata/zaman aşımı
+            sayıları ile gecikme yüzdelikleri
+    """
+    return library.providers.stats()
+
+
+@service_router.get("/replication",
+                    response_model=dict,
+                    summary="Çoğaltma durumu",
+                    description="Takipçi modunda birincil sürecin günlüğüne göre gecikmeyi "
+                                "(lag_seconds, pending_bytes) ve uygulanan son sıra numarasını döndürür.")
+async def get_replication(request: Request, library: Library = Depends(get_library)):
+    """
+    Sürecin çoğaltmadaki rolünü ve durumunu döndürür.
+    
+    Returns:
+        dict: Takipçide gecikme bilgileri; birincil süreçte son sıra numarası ve günlük dosyası
+    """
+    follower = request.app.state.follower
+    if follower is not None:
+        return follower.status()
+    settings = request.app.state.settings
+    return {
+        "role": "primary",
+        "last_seq": library.last_seq,
+        "journal": journal_filename(settings.library_file) if settings.journal else None,
+    }
+
+
+@service_router.get("/libraries",
+                    response_model=dict,
+                    summary="Bellekteki şube katalogları",
+                    description="Bellekte tutulan şube kataloglarının kitap sayısı, tahmini bellek "
+                                "kullanımı ve yükleme sürelerini döndürür.")
+async def get_libraries(request: Request):
+    """
+    Şube kayıt defterinin durumunu döndürür.
+    
+    Returns:
+        dict: Şube bazında kitap sayısı, tahmini bellek, yükleme süresi; toplamlar ve sınırlar
+    """
+    return request.app.state.libraries.stats()
+
+
+@service_router.get("/debug/memory",
+            response_model=dict,
+            dependencies=[Depends(require_admin)],
+            summary="Bellek durumu",
+            description="tracemalloc durumunu ve Book gibi türlerin canlı nesne sayılarını döndürür.")
+async def get_memory(request: Request):
+    """
+    Bellek izleme durumunu ve nesne sayılarını döndürür.
+    
+    Returns:
+        dict: tracemalloc durumu ve tür bazında nesne sayıları
+    """
+    inspector = request.app.state.memory_inspector
+    return {
+        "status": inspector.status(),
+        "objects": memory_debug.object_counts(),
+    }
+
+
+@service_router.post("/debug/memory",
+             response_model=dict,
+             dependencies=[Depends(require_admin)],
+             summary="Bellek izleme işlemi",
+             description="tracemalloc'u başlatır/durdurur, snapshot alır veya son snapshot ile karşılaştırır.")
+async def post_memory(request: Request,
+                      action: str = Query(..., pattern="^(start|stop|snapshot|diff)$"),
+                      limit: int = Query(20, ge=1, le=500),
+                      group_by: str = Query("lineno", pattern="^(lineno|filename|traceback)$")):
+    """
+    Bellek izleme işlemini uygular.
+    
+    Args:
+        action (str): start, stop, snapshot veya diff
+        limit (int): Listelenecek tahsis yeri sayısı
+        group_by (str): Tahsis yerlerinin gruplanma biçimi (satır veya dosya)
+        
+    Returns:
+        dict: İşlemin sonucu
+        
+    Raises:
+        HTTPException: tracemalloc başlatılmamışsa veya temel snapshot yoksa 409 hatası döner
+    """
+    inspector = request.app.state.memory_inspector
+    try:
+        if action == "start":
+            return inspector.start()
+        if action == "stop":
+            return inspector.stop()
+        if action == "snapshot":
+            result = inspector.snapshot(limit, group_by)
+        else:
+            result = inspector.diff(limit, group_by)
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    result["objects"] = memory_debug.object_counts()
+    return result
+
+
+def preload_library(settings: Settings,
+                    upstream: Optional[OpenLibraryClient] = None,
+                    providers: Optional[ProviderChain] = None) -> Library:
+    """
+    Kataloğu worker süreçleri fork edilmeden önce ana süreçte yükler.
+
+    Yükleme sonrası gc.freeze() çağrılır; böylece çöp toplayıcı paylaşılan
+    nesnelere dokunmaz ve sayfalar worker'lar arasında copy-on-write olarak
+    paylaşılmaya devam eder. Thread'ler fork'ta kopyalanmadığı için ikincil
+    indeksler arka planda değil yükleme sırasında oluşturulur.
+
+    Args:
+        settings (Settings): Uygulama ayarları
+        upstream (Optional[OpenLibraryClient]): Paylaşılan Open Library istemcisi
+        providers (Optional[ProviderChain]): Paylaşılan sağlayıcı zinciri
+            (varsayılan: ayarlardan oluşturulur)
+
+    Returns:
+        Library: Yüklenmiş Library instance'ı
+    """
+    upstream = upstream or client_from_settings(settings)
+    library = Library(settings.library_file, upstream=upstream,
+                      read_only=settings.follower, journal=settings.journal,
+                      providers=providers or chain_from_settings(settings, upstream))
+    gc.freeze()
+    return library
+
+
+async def read_only_error(request: Request, exc: ReadOnlyError) -> JSONResponse:
+    """Takipçi moddaki değişiklik isteklerini 403 ile reddeder."""
+    return JSONResponse(status_code=status.HTTP_403_FORBIDDEN, content={"detail": str(exc)})
+
+
+async def index_not_ready(request: Request, exc: IndexNotReady) -> JSONResponse:
+    """Henüz oluşturulan bir indeksi gerektiren istekleri 503 ile reddeder."""
+    return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                        content={"detail": str(exc), "index": exc.index},
+                        headers={"Retry-After": "1"})
+
+
+def create_app(settings: Optional[Settings] = None,
+               library: Optional[Library] = None) -> FastAPI:
+    """
+    FastAPI uygulamasını oluşturur.
+
+    Library instance'ı verilmezse ve ayarlarda preload açık değilse,
+    katalog her worker'da uygulamanın lifespan'i içinde yüklenir; ayarlarda
+    background_indexes açıksa ikincil indeksler arka planda oluşturulurken
+    istekler kabul edilir (bkz. GET /ready). Zenginleştirme iş kuyruğu ve
+    worker thread'leri de lifespan içinde başlatılır; kapanışta bekleyen
+    işler dosyada kalır. Takipçi modunda iş kuyruğu yerine birincil sürecin
+    günlüğünü izleyen Follower başlatılır.
+
+    Args:
+        settings (Optional[Settings]): Uygulama ayarları (varsayılan: ortam değişkenleri)
+        library (Optional[Library]): Önceden yüklenmiş Library instance'ı
+
+    Returns:
+        FastAPI: Yapılandırılmış uygulama
+    """
+    if settings is None:
+        settings = Settings.from_env()
+    upstream = library.upstream if library is not None else client_from_settings(settings)
+    providers = library.providers if library is not None else chain_from_settings(settings, upstream)
+    if library is None and settings.preload:
+        library = preload_library(settings, upstream, providers)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        owns_library = app.state.library is None
+        if owns_library:
+            app.state.library = Library(settings.library_file, upstream=upstream,
+                                        read_only=settings.follower, journal=settings.journal,
+                                        providers=providers,
+                                        background_indexes=settings.background_indexes)
+        if settings.prefetch_covers and not settings.follower:
+            app.state.library.covers = app.state.covers
+        if settings.follower:
+            app.state.follower = Follower(app.state.library, interval=settings.follow_interval)
+            app.state.follower.start()
+        else:
+            jobs_file = settings.jobs_file or f"{settings.library_file}.jobs.json"
+            try:
+                app.state.jobs = JobQueue(app.state.library, jobs_file, workers=settings.job_workers)
+                app.state.jobs.start()
+            except JobQueueBusy as e:
+                # Çok worker'lı kurulum: kuyruk dosyası tek sürece aittir, diğerleri eşzamanlı ekler
+                print(f"{e}; bu süreçte asenkron kitap ekleme kapalı.")
+        yield
+        if app.state.follower is not None:
+            app.state.follower.stop()
+            app.state.follower = None
+        if app.state.jobs is not None:
+            app.state.jobs.stop()
+            app.state.jobs = None
+        app.state.libraries.close()
+        app.state.covers.close()
+        providers.close()
+        if owns_library:
+            app.state.library = None
+
+    app = FastAPI(
+        title="Kütüphane Yönetim Sistemi API",
+        description="Python 202 Bootcamp bitirme projesi - Kütüphane yönetimi için REST API",
+        version="1.0.0",
+        contact={
+            "name": "Python 202 Bootcamp Projesi",
+            "url": "https://github.com/username/library-management-system",
+        },
+        license_info={
+            "name": "MIT",
+            "url": "https://opensource.org/licenses/MIT",
+        },
+        lifespan=lifespan,
+    )
+    app.state.settings = settings
+    app.state.library = library
+    app.state.jobs = None
+    app.state.follower = None
+    max_bytes = int(settings.max_libraries_mb * 1024 * 1024) if settings.max_libraries_mb else None
+    app.state.libraries = LibraryRegistry(settings.libraries_dir, upstream,
+                                          max_libraries=settings.max_libraries,
+                                          max_bytes=max_bytes,
+                                          read_only=settings.follower,
+                                          journal=settings.journal,
+                                          follow_interval=settings.follow_interval,
+                                          providers=providers)
+    app.state.covers = CoverCache(settings.covers_dir,
+                                  client_from_settings(settings, base_url=settings.covers_url),
+                                  max_bytes=int(settings.covers_max_mb * 1024 * 1024))
+    app.state.memory_inspector = memory_debug.MemoryInspector()
+    app.state.change_waiters = anyio.CapacityLimiter(settings.max_change_waiters)
+    app.include_router(router)
+    app.include_router(router, prefix="/libraries/{library_id}",
+                       dependencies=[Depends(library_id_param)])
+    app.include_router(service_router)
+    app.add_exception_handler(ReadOnlyError, read_only_error)
+    app.add_exception_handler(IndexNotReady, index_not_ready)
+    if settings.metrics_enabled:
+        app.add_middleware(metrics.MetricsMiddleware)
+    if settings.tracing_exporter:
+        tracing.configure(tracing.exporter_from_settings(settings.tracing_exporter,
+                                                         settings.tracing_file))
+        app.add_middleware(tracing.TracingMiddleware)
+    if settings.profiling_enabled:
+        app.add_middleware(profiling.ProfilingMiddleware,
+                           directory=settings.profiles_dir,
+                           top_n=settings.profile_top_n)
+    return app
+
+
+# FastAPI uygulaması (uvicorn api:app / gunicorn --preload api:app)
+app = create_app()
+
+
 # Uygulama çalıştırma
 if __name__ == "__main__":
     uvicorn.run(
@@ -259,4 +1095,4 @@ if __name__ == "__main__":
         port=8000,
         reload=True,
         log_level="info"
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,6 @@
+"""
+Kütüphane Yönetim Sistemi - Performans ölçüm betikleri.
+
+Betikler proje kök dizininden modül olarak çalıştırılır:
+    python -m benchmarks.library_bench --sizes 1000,10000
+"""
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Toplu silme benchmark'ı: tek tek remove_book çağrıları ile tek bir
+Library.apply_batch çağrısını karşılaştırır.
+
+Her remove_book çağrısı kitabı listede doğrusal olarak arar ve tüm
+kataloğu yeniden kaydeder; apply_batch tüm işlemleri tek kilit altında
+uygulayıp dosyayı bir kez yazar.
+
+Kullanım:
+    python -m benchmarks.batch_bench --catalog 20000 --deletes 10000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.common import quiet, synthetic_catalog, write_catalog, write_results
+from library import Library
+
+
+def bench_remove_book(filename: str, isbns: list) -> float:
+    """Kitapları tek tek remove_book ile siler; toplam süreyi döndürür."""
+    with quiet():
+        library = Library(filename)
+        start = time.perf_counter()
+        for isbn in isbns:
+            library.remove_book(isbn)
+        return time.perf_counter() - start
+
+
+def bench_apply_batch(filename: str, isbns: list) -> float:
+    """Kitapları tek bir apply_batch çağrısıyla siler; toplam süreyi döndürür."""
+    with quiet():
+        library = Library(filename)
+        operations = [{"op": "remove", "isbn": isbn} for isbn in isbns]
+        start = time.perf_counter()
+        library.apply_batch(operations)
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    """Komut satırı argümanlarını okuyup benchmark'ı çalıştırır."""
+    parser = argparse.ArgumentParser(description="Toplu silme benchmark'ı")
+    parser.add_argument("--catalog", type=int, default=20_000, help="Katalog büyüklüğü")
+    parser.add_argument("--deletes", type=int, default=10_000, help="Silinecek kitap sayısı")
+    parser.add_argument("--skip-single", action="store_true",
+                        help="Uzun süren tek tek silme ölçümünü atla")
+    parser.add_argument("--output", default="bench_batch.json", help="Sonuç dosyası")
+    args = parser.parse_args()
+
+    records = synthetic_catalog(args.catalog)
+    # Silinecekler katalog boyunca dağılsın
+    step = max(1, args.catalog // args.deletes)
+    isbns = [record["isbn"] for record in records[::step][:args.deletes]]
+
+    results = {"catalog": args.catalog, "deletes": len(isbns)}
+    with tempfile.TemporaryDirectory() as workdir:
+        filename = os.path.join(workdir, "library.json")
+        runs = [("apply_batch", bench_apply_batch)]
+        if not args.skip_single:
+            runs.insert(0, ("remove_book", bench_remove_book))
+        for name, bench in runs:
+            write_catalog(filename, records)
+            elapsed = bench(filename, isbns)
+            results[name] = {"total_s": elapsed, "per_delete_s": elapsed / len(isbns)}
+            print(f"{name:<12} {len(isbns):,} silme: {elapsed:8.2f} sn "
+                  f"({elapsed / len(isbns) * 1e3:.3f} ms/silme)")
+
+    if "remove_book" in results:
+        speedup = results["remove_book"]["total_s"] / results["apply_batch"]["total_s"]
+        results["speedup"] = speedup
+        print(f"Hızlanma: {speedup:,.0f}x")
+    write_results(args.output, "batch", results)
+
+
+if __name__ == "__main__":
+    main()
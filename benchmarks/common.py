@@ -0,0 +1,172 @@
+"""
+Benchmark betiklerinin ortak yardımcıları.
+
+Sentetik katalog üretimi, zamanlama, sessiz çalıştırma ve sonuçların
+makine tarafından okunabilir JSON dosyasına yazılması burada toplanır.
+"""
+
+import contextlib
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterator, List, Optional
+
+
+def isbn13_check_digit(first12: str) -> str:
+    """
+    ISBN-13'ün ilk 12 hanesi için kontrol hanesini hesaplar.
+
+    Args:
+        first12 (str): ISBN-13'ün ilk 12 hanesi
+
+    Returns:
+        str: Kontrol hanesi
+    """
+    total = sum(int(d) * (3 if i % 2 else 1) for i, d in enumerate(first12))
+    return str((10 - total % 10) % 10)
+
+
+def synthetic_isbn(n: int) -> str:
+    """
+    n sıra numarası için geçerli ve tekil bir ISBN-13 üretir.
+
+    Args:
+        n (int): Sıra numarası
+
+    Returns:
+        str: Kontrol hanesi doğru ISBN-13
+    """
+    first12 = f"978{n:09d}"
+    return first12 + isbn13_check_digit(first12)
+
+
+def synthetic_catalog(size: int, seed: int = 42) -> List[dict]:
+    """
+    Belirtilen büyüklükte sentetik bir katalog üretir.
+    Yazar sayısı kitap sayısının yaklaşık onda biridir.
+
+    Args:
+        size (int): Kitap sayısı
+        seed (int): Tekrarlanabilirlik için rastgele tohum
+
+    Returns:
+        List[dict]: Book.to_dict() biçiminde kitap kayıtları
+    """
+    rng = random.Random(seed)
+    author_count = max(1, size // 10)
+    return [
+        {
+            "title": f"Kitap {i} - {rng.randrange(10 ** 6)}",
+            "author": f"Yazar {rng.randrange(author_count)}",
+            "isbn": synthetic_isbn(i),
+        }
+        for i in range(size)
+    ]
+
+
+def write_catalog(filename: str, records: List[dict]) -> None:
+    """
+    Sentetik kataloğu Library'nin kullandığı JSON biçiminde diske yazar.
+
+    Args:
+        filename (str): Hedef dosya
+        records (List[dict]): Kitap kayıtları
+    """
+    with open(filename, 'w', encoding='utf-8') as file:
+        json.dump(records, file, ensure_ascii=False, indent=2)
+
+
+@contextlib.contextmanager
+def quiet() -> Iterator[None]:
+    """Library'nin konsol çıktılarını ölçüm süresince bastırır."""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def measure(func: Callable[[], object], repeat: int = 5, number: int = 1) -> Dict[str, float]:
+    """
+    Bir fonksiyonu tekrar tekrar çalıştırıp işlem başına süreleri ölçer.
+
+    Args:
+        func (Callable): Ölçülecek fonksiyon
+        repeat (int): Ölçüm tekrarı sayısı
+        number (int): Her tekrarda fonksiyonun kaç kez çağrılacağı
+
+    Returns:
+        Dict[str, float]: İşlem başına min/ortalama/maks süre (saniye)
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return {
+        "min_s": min(samples),
+        "mean_s": sum(samples) / len(samples),
+        "max_s": max(samples),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def git_revision() -> Optional[str]:
+    """Ölçümün yapıldığı commit'i döndürür (git yoksa None)."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(filename: str, suite: str, results: dict) -> None:
+    """
+    Ölçüm sonuçlarını ortam bilgisiyle birlikte JSON dosyasına yazar.
+
+    Args:
+        filename (str): Hedef dosya
+        suite (str): Benchmark grubunun adı
+        results (dict): Ölçüm sonuçları
+    """
+    payload = {
+        "suite": suite,
+        "commit": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(filename, 'w', encoding='utf-8') as file:
+        json.dump(payload, file, ensure_ascii=False, indent=2)
+    print(f"Sonuçlar yazıldı: {filename}")
+
+
+def compare_results(baseline_file: str, results: dict, key: str = "mean_s") -> None:
+    """
+    Güncel sonuçları önceki bir ölçüm dosyasıyla karşılaştırıp oranları yazdırır.
+
+    Args:
+        baseline_file (str): Karşılaştırılacak önceki sonuç dosyası
+        results (dict): Güncel sonuçlar ({boyut: {işlem: ölçüm}})
+        key (str): Karşılaştırmada kullanılacak ölçüm alanı
+    """
+    with open(baseline_file, 'r', encoding='utf-8') as file:
+        baseline = json.load(file)
+    print(f"\n=== KARŞILAŞTIRMA (temel: {baseline.get('commit')}) ===")
+    for size, operations in results.items():
+        old_operations = baseline["results"].get(size, {})
+        for name, measurement in operations.items():
+            old = old_operations.get(name)
+            if not isinstance(measurement, dict) or not isinstance(old, dict):
+                continue
+            if key not in measurement or not old.get(key):
+                continue
+            ratio = measurement[key] / old[key]
+            print(f"{size:>8} {name:<24} {ratio:6.2f}x")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Toplu ISBN doğrulama benchmark'ı: validate_isbn'i her ISBN için tek tek
+çağırmak ile vektörel validate_isbns'i ve tekrarları da atan
+normalize_isbns'i karşılaştırır.
+
+Girdi gerçek toplu yüklemelere benzer bir karışımdır: tiresiz ve tireli
+ISBN-13'ler, ISBN-10'lar, kontrol hanesi hatalı değerler ve tekrarlar.
+
+Kullanım:
+    python -m benchmarks.isbn_bench --count 1000000 --repeat 3
+"""
+
+import argparse
+import random
+
+from benchmarks.common import measure, synthetic_isbn, write_results
+from isbn import normalize_isbns, validate_isbn, validate_isbns
+
+
+def mixed_isbns(count: int, seed: int = 42) -> list:
+    """
+    Farklı yazımlarda, bir kısmı hatalı ve tekrarlı ISBN listesi üretir.
+
+    Args:
+        count (int): ISBN sayısı
+        seed (int): Tekrarlanabilirlik için rastgele tohum
+
+    Returns:
+        list: Ham ISBN'ler
+    """
+    rng = random.Random(seed)
+    values = []
+    for position in range(count):
+        # Yaklaşık onda biri daha önceki bir kitabın (başka yazımla olabilir) tekrarı
+        repeat = position and rng.random() < 0.1
+        isbn = synthetic_isbn(rng.randrange(position) if repeat else position)
+        kind = rng.randrange(10)
+        if kind < 4:
+            values.append(isbn)
+        elif kind < 7:
+            values.append(f"{isbn[:3]}-{isbn[3]}-{isbn[4:7]}-{isbn[7:12]}-{isbn[12]}")
+        elif kind < 9:
+            total = sum((10 - position) * int(digit) for position, digit in enumerate(isbn[3:12]))
+            check = -total % 11
+            values.append(isbn[3:12] + ("X" if check == 10 else str(check)))
+        else:
+            values.append(isbn[:12] + str((int(isbn[12]) + 1) % 10))
+    return values
+
+
+def main() -> None:
+    """Komut satırı argümanlarını okuyup benchmark'ı çalıştırır."""
+    parser = argparse.ArgumentParser(description="Toplu ISBN doğrulama benchmark'ı")
+    parser.add_argument("--count", type=int, default=1_000_000, help="ISBN sayısı")
+    parser.add_argument("--repeat", type=int, default=3, help="Ölçüm tekrarı")
+    parser.add_argument("--output", default="bench_isbn.json", help="Sonuç dosyası")
+    args = parser.parse_args()
+
+    isbns = mixed_isbns(args.count)
+    unique, invalid = normalize_isbns(isbns)
+    # Ölçmeden önce iki yolun aynı sonucu verdiğini denetle
+    assert validate_isbns(isbns) == [validate_isbn(isbn) for isbn in isbns]
+
+    results = {"count": args.count, "unique": len(unique), "invalid": len(invalid)}
+    runs = (
+        ("scalar", lambda: [validate_isbn(isbn) for isbn in isbns]),
+        ("vectorized", lambda: validate_isbns(isbns)),
+        ("normalize", lambda: normalize_isbns(isbns)),
+    )
+    for name, func in runs:
+        results[name] = measure(func, repeat=args.repeat)
+        mean = results[name]["mean_s"]
+        print(f"{name:<11} {args.count:,} ISBN: {mean:6.2f} sn ({args.count / mean:,.0f} ISBN/sn)")
+    results["speedup"] = results["scalar"]["mean_s"] / results["vectorized"]["mean_s"]
+    print(f"Hızlanma: {results['speedup']:.1f}x  (tekil: {len(unique):,}, geçersiz: {len(invalid):,})")
+    write_results(args.output, "isbn", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Library işlemleri için mikro-benchmark.
+
+1k, 10k, 100k ve 1M kitaplık sentetik kataloglar üretir; find_book,
+add_book_manual, remove_book, load_books, save_books, Book.to_dict/from_dict
+ve get_book_count sürelerini, yükleme/kaydetme sırasındaki en yüksek bellek
+kullanımıyla birlikte ölçer. Sonuçlar commit'ler arası karşılaştırma için
+JSON dosyasına yazılır.
+
+Kullanım:
+    python -m benchmarks.library_bench --sizes 1000,10000 --output bench.json
+    python -m benchmarks.library_bench --compare eski.json
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import tracemalloc
+from typing import Callable, Dict, List
+
+from benchmarks.common import (
+    compare_results, measure, quiet, synthetic_catalog, synthetic_isbn,
+    write_catalog, write_results,
+)
+from book import Book
+from library import Library
+
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+
+def measure_each(func: Callable[[str], object], keys: List[str], repeat: int) -> Dict[str, float]:
+    """
+    Verilen anahtarların her biri için fonksiyonu çağırıp işlem başına süreyi ölçer.
+
+    Args:
+        func (Callable): Tek anahtar alan fonksiyon
+        keys (List[str]): Fonksiyona sırayla verilecek anahtarlar
+        repeat (int): Ölçüm tekrarı sayısı
+
+    Returns:
+        Dict[str, float]: İşlem başına süre istatistikleri
+    """
+    def run():
+        for key in keys:
+            func(key)
+
+    result = measure(run, repeat=repeat)
+    for field in ("min_s", "mean_s", "max_s"):
+        result[field] /= len(keys)
+    result["number"] = len(keys)
+    return result
+
+
+def peak_memory(func: Callable[[], object]) -> int:
+    """
+    Fonksiyon çalışırken tracemalloc ile ölçülen en yüksek bellek kullanımı.
+
+    Args:
+        func (Callable): Ölçülecek fonksiyon
+
+    Returns:
+        int: En yüksek ek bellek kullanımı (byte)
+    """
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def bench_size(size: int, workdir: str, lookups: int, repeat: int) -> dict:
+    """
+    Tek bir katalog büyüklüğü için tüm ölçümleri yapar.
+
+    Args:
+        size (int): Katalog büyüklüğü
+        workdir (str): Geçici dosyaların yazılacağı dizin
+        lookups (int): find_book ölçümünde kullanılacak arama sayısı
+        repeat (int): Ölçüm tekrarı sayısı
+
+    Returns:
+        dict: İşlem adına göre ölçüm sonuçları
+    """
+    records = synthetic_catalog(size)
+    filename = os.path.join(workdir, f"library_{size}.json")
+    write_catalog(filename, records)
+    rng = random.Random(size)
+    results = {"file_bytes": os.path.getsize(filename)}
+
+    with quiet():
+        library = Library(filename)
+        results["load_books"] = measure(library.load_books, repeat=repeat)
+        results["save_books"] = measure(library.save_books, repeat=repeat)
+
+        hits = [records[rng.randrange(size)]["isbn"] for _ in range(min(lookups, size))]
+        misses = [synthetic_isbn(size + i) for i in range(min(lookups, size))]
+        results["find_book_hit"] = measure_each(library.find_book, hits, repeat)
+        results["find_book_miss"] = measure_each(library.find_book, misses, repeat)
+        results["get_book_count"] = measure(library.get_book_count, repeat=repeat, number=10_000)
+
+        books = library.books
+        results["to_dict"] = measure_each(lambda book: book.to_dict(), books, repeat)
+        results["from_dict"] = measure_each(Book.from_dict, records, repeat)
+
+        # add/remove her çağrıda tüm kataloğu kaydeder; tekrar sayısı düşük tutulur
+        extra = [Book(f"Ek Kitap {i}", "Ek Yazar", synthetic_isbn(size + lookups + i))
+                 for i in range(repeat)]
+        added = iter(extra)
+        results["add_book_manual"] = measure(lambda: library.add_book_manual(next(added)),
+                                             repeat=repeat)
+        removed = iter(extra)
+        results["remove_book"] = measure(lambda: library.remove_book(next(removed).isbn),
+                                         repeat=repeat)
+
+        results["peak_memory_bytes"] = {
+            "load_books": peak_memory(library.load_books),
+            "save_books": peak_memory(library.save_books),
+        }
+
+    os.unlink(filename)
+    return results
+
+
+def print_summary(size: int, results: dict) -> None:
+    """Bir katalog büyüklüğüne ait sonuçları okunaklı biçimde yazdırır."""
+    print(f"\n=== {size:,} kitap ({results['file_bytes'] / 1e6:.1f} MB) ===")
+    for name, value in results.items():
+        if isinstance(value, dict) and "mean_s" in value:
+            print(f"  {name:<18} {value['mean_s'] * 1e6:>14.2f} µs/işlem")
+    for name, peak in results["peak_memory_bytes"].items():
+        print(f"  {name + ' bellek':<18} {peak / 1e6:>14.2f} MB (tepe)")
+
+
+def main() -> None:
+    """Komut satırı argümanlarını okuyup benchmark'ı çalıştırır."""
+    parser = argparse.ArgumentParser(description="Library mikro-benchmark'ı")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="Virgülle ayrılmış katalog büyüklükleri")
+    parser.add_argument("--lookups", type=int, default=200,
+                        help="find_book ölçümündeki arama sayısı")
+    parser.add_argument("--repeat", type=int, default=3, help="Ölçüm tekrarı sayısı")
+    parser.add_argument("--output", default="bench_library.json", help="Sonuç dosyası")
+    parser.add_argument("--compare", help="Karşılaştırılacak önceki sonuç dosyası")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            results[str(size)] = bench_size(size, workdir, args.lookups, args.repeat)
+            print_summary(size, results[str(size)])
+
+    write_results(args.output, "library", results)
+    if args.compare:
+        compare_results(args.compare, results)
+
+
+if __name__ == "__main__":
+    main()
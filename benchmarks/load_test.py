@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+FastAPI uygulaması için uçtan uca yük testi.
+
+Yerel Open Library taklidini (openlibrary_stub) sentetik bir korpusla
+başlatır, API'yi ona yönlendirilmiş şekilde uvicorn ile ayağa kaldırır ve
+eşzamanlı istemcilerle karışık bir okuma/yazma yükü uygular. Her endpoint
+için p50/p95/p99 gecikme ve saniyedeki istek sayısını raporlar.
+
+Kullanım:
+    python -m benchmarks.load_test --duration 20 --concurrency 16 --latency-ms 80
+    python -m benchmarks.load_test --target http://localhost:8000 --stub-url http://localhost:8081
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import httpx
+import uvicorn
+
+from api import create_app
+from benchmarks.common import quiet, synthetic_isbn, write_catalog, write_results
+from openlibrary_stub import OpenLibraryStub
+from settings import Settings
+
+
+# (endpoint etiketi, ağırlık)
+DEFAULT_MIX = {
+    "GET /books/{isbn}": 55,
+    "GET /books": 5,
+    "GET /stats": 5,
+    "GET /": 5,
+    "POST /books": 20,
+    "DELETE /books/{isbn}": 10,
+}
+
+
+def synthetic_corpus(size: int) -> dict:
+    """
+    Taklit sunucu için sentetik bir edition/yazar korpusu üretir.
+
+    Args:
+        size (int): Edition sayısı
+
+    Returns:
+        dict: OpenLibraryStub korpus biçimi
+    """
+    author_count = max(1, size // 10)
+    editions = {
+        synthetic_isbn(i): {
+            "title": f"Kitap {i}",
+            "authors": [{"key": f"/authors/OL{i % author_count}A"}],
+        }
+        for i in range(size)
+    }
+    authors = {f"OL{i}A": {"name": f"Yazar {i}"} for i in range(author_count)}
+    return {"editions": editions, "authors": authors}
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """
+    Sıralı bir listenin yüzdelik değerini döndürür (en yakın sıra yöntemi).
+
+    Args:
+        sorted_values (List[float]): Sıralı değerler
+        fraction (float): 0-1 arası yüzdelik
+
+    Returns:
+        float: Yüzdelik değeri
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+class LoadGenerator:
+    """Eşzamanlı istemcilerle API'ye karışık okuma/yazma yükü uygulayan sınıf."""
+
+    def __init__(self, target: str, isbns: List[str], mix: Dict[str, int],
+                 concurrency: int, present: Optional[List[str]] = None, seed: int = 1):
+        """
+        LoadGenerator sınıfının constructor'ı.
+
+        Args:
+            target (str): API'nin kök adresi
+            isbns (List[str]): POST için kullanılabilecek, korpusta bulunan ISBN'ler
+            mix (Dict[str, int]): Endpoint etiketine göre istek ağırlıkları
+            concurrency (int): Eşzamanlı istemci sayısı
+            present (Optional[List[str]]): Katalogda zaten bulunan ISBN'ler
+            seed (int): Rastgele tohum
+        """
+        self.target = target
+        self.mix = mix
+        self.concurrency = concurrency
+        self.seed = seed
+        self._pending = list(isbns)
+        self._present: List[str] = list(present or [])
+        self._lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+
+    def _next_request(self, rng: random.Random) -> tuple:
+        """Bir sonraki isteğin (etiket, metot, yol, gövde) bilgisini seçer."""
+        label = rng.choices(list(self.mix), weights=list(self.mix.values()))[0]
+        with self._lock:
+            if label == "POST /books" and self._pending:
+                isbn = self._pending.pop(rng.randrange(len(self._pending)))
+                self._present.append(isbn)
+                return label, "POST", "/books", {"isbn": isbn}
+            if label == "DELETE /books/{isbn}" and self._present:
+                isbn = self._present.pop(rng.randrange(len(self._present)))
+                self._pending.append(isbn)
+                return label, "DELETE", f"/books/{isbn}", None
+            if label == "GET /books/{isbn}" and self._present:
+                isbn = self._present[rng.randrange(len(self._present))]
+                return label, "GET", f"/books/{isbn}", None
+        if label in ("GET /books", "GET /stats", "GET /"):
+            return label, "GET", label.split(" ", 1)[1], None
+        return "GET /books/{isbn}", "GET", f"/books/{synthetic_isbn(10 ** 8)}", None
+
+    def _worker(self, index: int, deadline: float) -> None:
+        """Süre dolana kadar istek gönderen tek bir istemci."""
+        rng = random.Random(self.seed * 1000 + index)
+        with httpx.Client(base_url=self.target, timeout=60.0) as client:
+            while time.perf_counter() < deadline:
+                label, method, path, body = self._next_request(rng)
+                start = time.perf_counter()
+                try:
+                    response = client.request(method, path, json=body)
+                    status_code = response.status_code
+                except httpx.HTTPError:
+                    status_code = 0
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    self.latencies[label].append(elapsed)
+                    self.statuses[label][status_code] += 1
+
+    def run(self, duration: float) -> dict:
+        """
+        Yükü belirtilen süre boyunca uygular.
+
+        Args:
+            duration (float): Test süresi (saniye)
+
+        Returns:
+            dict: Endpoint başına gecikme yüzdelikleri ve throughput
+        """
+        deadline = time.perf_counter() + duration
+        threads = [threading.Thread(target=self._worker, args=(i, deadline))
+                   for i in range(self.concurrency)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        report = {}
+        for label, values in sorted(self.latencies.items()):
+            values.sort()
+            report[label] = {
+                "count": len(values),
+                "throughput_rps": len(values) / elapsed,
+                "p50_ms": percentile(values, 0.50) * 1000,
+                "p95_ms": percentile(values, 0.95) * 1000,
+                "p99_ms": percentile(values, 0.99) * 1000,
+                "max_ms": values[-1] * 1000,
+                "statuses": {str(code): count for code, count in self.statuses[label].items()},
+            }
+        total = sum(len(v) for v in self.latencies.values())
+        report["_total"] = {"count": total, "throughput_rps": total / elapsed, "duration_s": elapsed}
+        return report
+
+
+def start_api(settings: Settings, port: int) -> tuple:
+    """
+    API'yi uvicorn ile arka plan thread'inde başlatır.
+
+    Args:
+        settings (Settings): Uygulama ayarları
+        port (int): Dinlenecek port
+
+    Returns:
+        tuple: (uvicorn.Server, API kök adresi)
+    """
+    config = uvicorn.Config(create_app(settings), host="127.0.0.1", port=port,
+                            log_level="warning", access_log=False)
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, f"http://127.0.0.1:{port}"
+
+
+def print_report(report: dict) -> None:
+    """Yük testi raporunu tablo olarak yazdırır."""
+    print(f"\n{'endpoint':<24}{'adet':>8}{'rps':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for label, row in report.items():
+        if label.startswith("_"):
+            continue
+        print(f"{label:<24}{row['count']:>8}{row['throughput_rps']:>9.1f}"
+              f"{row['p50_ms']:>10.1f}{row['p95_ms']:>10.1f}{row['p99_ms']:>10.1f}")
+    total = report["_total"]
+    print(f"\nToplam {total['count']} istek, {total['throughput_rps']:.1f} istek/sn")
+
+
+def main() -> None:
+    """Komut satırı argümanlarını okuyup yük testini çalıştırır."""
+    parser = argparse.ArgumentParser(description="API uçtan uca yük testi")
+    parser.add_argument("--target", help="Çalışan bir API'nin adresi (verilmezse yerelde başlatılır)")
+    parser.add_argument("--stub-url", help="Çalışan bir taklit sunucunun adresi")
+    parser.add_argument("--port", type=int, default=8765, help="Yerel API portu")
+    parser.add_argument("--corpus-size", type=int, default=5_000)
+    parser.add_argument("--initial-books", type=int, default=1_000,
+                        help="Başlangıç kataloğundaki kitap sayısı")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--not-found-rate", type=float, default=0.0)
+    parser.add_argument("--output", default="bench_load.json")
+    args = parser.parse_args()
+
+    corpus = synthetic_corpus(args.corpus_size)
+    isbns = list(corpus["editions"])
+    stub: Optional[OpenLibraryStub] = None
+    server = None
+    with tempfile.TemporaryDirectory() as workdir:
+        if args.stub_url:
+            stub_url = args.stub_url
+        else:
+            stub = OpenLibraryStub(corpus, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                                   error_rate=args.error_rate,
+                                   not_found_rate=args.not_found_rate, seed=7)
+            stub_url = stub.start()
+
+        initial = isbns[:args.initial_books]
+        if args.target:
+            target = args.target
+        else:
+            filename = os.path.join(workdir, "library.json")
+            write_catalog(filename, [
+                {"title": corpus["editions"][isbn]["title"], "author": "Yazar", "isbn": isbn}
+                for isbn in initial
+            ])
+            server, target = start_api(Settings(library_file=filename, openlibrary_url=stub_url),
+                                       args.port)
+
+        generator = LoadGenerator(target, isbns[args.initial_books:], DEFAULT_MIX,
+                                  args.concurrency, present=initial)
+        print(f"Yük testi: {target} (upstream {stub_url}), {args.concurrency} istemci, "
+              f"{args.duration:.0f} sn")
+        with quiet():
+            report = generator.run(args.duration)
+
+        if server is not None:
+            server.should_exit = True
+        if stub is not None:
+            stub.stop()
+
+    print_report(report)
+    write_results(args.output, "load", {
+        "config": vars(args),
+        "endpoints": report,
+    })
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Metrik enstrümantasyonunun sıcak yoldaki ek yükünü ölçer.
+
+İki ölçüm yapılır:
+1. Histogram.observe ve Counter.inc çağrılarının tek başına maliyeti.
+2. GET /books/{isbn} isteğinin ASGI uygulamasında metrikler açık ve
+   kapalıyken uçtan uca süresi (HTTP sunucusu ve ağ hariç).
+
+Kullanım:
+    python -m benchmarks.metrics_overhead --requests 20000
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+import metrics
+from api import create_app
+from benchmarks.common import measure, quiet, synthetic_catalog, write_catalog, write_results
+from library import Library
+from settings import Settings
+
+
+async def _drive(app, path: str, count: int) -> float:
+    """
+    ASGI uygulamasına doğrudan istek gönderip istek başına süreyi döndürür.
+
+    Args:
+        app: ASGI uygulaması
+        path (str): İstek yolu
+        count (int): İstek sayısı
+
+    Returns:
+        float: İstek başına ortalama süre (saniye)
+    """
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    scope_template = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "root_path": "", "query_string": b"", "headers": [],
+        "client": ("127.0.0.1", 1), "server": ("127.0.0.1", 80),
+    }
+    start = time.perf_counter()
+    for _ in range(count):
+        await app(dict(scope_template), receive, send)
+    return (time.perf_counter() - start) / count
+
+
+def request_cost(library: Library, enabled: bool, path: str, count: int) -> float:
+    """Metrikler açık/kapalı bir uygulamada istek başına süreyi ölçer."""
+    app = create_app(Settings(library_file=library.filename, metrics_enabled=enabled),
+                     library=library)
+    asyncio.run(_drive(app, path, count // 10))  # ısınma
+    return asyncio.run(_drive(app, path, count))
+
+
+def main() -> None:
+    """Komut satırı argümanlarını okuyup ölçümü çalıştırır."""
+    parser = argparse.ArgumentParser(description="Metrik ek yükü ölçümü")
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--catalog-size", type=int, default=1_000)
+    parser.add_argument("--output", default="bench_metrics.json")
+    args = parser.parse_args()
+
+    histogram = metrics.Histogram("bench_seconds", "benchmark", ("route",))
+    counter = metrics.Counter("bench_total", "benchmark", ("route",))
+    results = {
+        "histogram_observe": measure(lambda: histogram.labels("/books").observe(0.01),
+                                     repeat=5, number=100_000),
+        "counter_inc": measure(lambda: counter.labels("/books").inc(), repeat=5, number=100_000),
+    }
+
+    with tempfile.TemporaryDirectory() as workdir:
+        records = synthetic_catalog(args.catalog_size)
+        filename = os.path.join(workdir, "library.json")
+        write_catalog(filename, records)
+        with quiet():
+            library = Library(filename)
+        path = f"/books/{records[len(records) // 2]['isbn']}"
+        disabled = request_cost(library, False, path, args.requests)
+        enabled = request_cost(library, True, path, args.requests)
+
+    results["request_without_metrics_s"] = disabled
+    results["request_with_metrics_s"] = enabled
+    results["request_overhead_s"] = enabled - disabled
+    results["request_overhead_ratio"] = (enabled - disabled) / disabled
+
+    print(f"Histogram.observe:     {results['histogram_observe']['mean_s'] * 1e9:8.0f} ns")
+    print(f"Counter.inc:           {results['counter_inc']['mean_s'] * 1e9:8.0f} ns")
+    print(f"İstek (metrik kapalı): {disabled * 1e6:8.1f} µs")
+    print(f"İstek (metrik açık):   {enabled * 1e6:8.1f} µs")
+    print(f"Ek yük:                {(enabled - disabled) * 1e6:8.1f} µs "
+          f"(%{results['request_overhead_ratio'] * 100:.1f})")
+    write_results(args.output, "metrics_overhead", results)
+
+
+if __name__ == "__main__":
+    main()
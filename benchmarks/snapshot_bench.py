@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Eşzamanlı okuma/yazma stres testi: okuyucu thread'ler kilit almadan
+find_book ve snapshot okumaları yaparken bir yazar thread sürekli toplu
+işlem uygular.
+
+Her okumada snapshot'ın tutarlılığı (kitap sayısı ve ISBN indeksi)
+denetlenir; yarım kalmış bir durum görülürse sayılır. Kaydetme ölçüme
+katılmaz, böylece yalnızca snapshot yayınlama maliyeti görünür.
+
+Kullanım:
+    python -m benchmarks.snapshot_bench --catalog 20000 --readers 4 --duration 3
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+
+from benchmarks.common import quiet, synthetic_catalog, synthetic_isbn, write_catalog, write_results
+from library import Library
+
+# Yazarın eklediği ISBN'lerin sıra numarası başlangıcı (sentetik katalogdan uzak)
+STRESS_BASE = 500_000_000
+
+
+def run(library: Library, isbns: list, readers: int, duration: float, write: bool) -> dict:
+    """
+    Okuyucuları (ve istenirse yazarı) duration saniye çalıştırır.
+
+    Returns:
+        dict: Saniyedeki okuma ve toplu yazma sayıları ile tutarsız okuma sayısı
+    """
+    expected = library.get_book_count()
+    stop = threading.Event()
+    reads = [0] * readers
+    torn = [0] * readers
+    writes = [0]
+
+    def reader(slot: int) -> None:
+        rng = random.Random(slot)
+        while not stop.is_set():
+            snapshot = library.snapshot()
+            if len(snapshot.books) != expected or len(snapshot.by_isbn) != expected:
+                torn[slot] += 1
+            library.find_book(rng.choice(isbns))
+            reads[slot] += 1
+
+    def writer() -> None:
+        # Her toplu işlem bir kitap silip yenisini ekler; sayı sabit kalır
+        for i in range(len(isbns) * 2):
+            if stop.is_set():
+                return
+            # Eklenenler katalogdaki ISBN'lerle çakışmayan geçerli ISBN'lerdir
+            victim = isbns[i] if i < len(isbns) else synthetic_isbn(STRESS_BASE + i - len(isbns))
+            library.apply_batch([
+                {"op": "remove", "isbn": victim},
+                {"op": "add", "isbn": synthetic_isbn(STRESS_BASE + i), "title": "Stres", "author": "Yazar"},
+            ])
+            writes[0] += 1
+
+    threads = [threading.Thread(target=reader, args=(slot,)) for slot in range(readers)]
+    if write:
+        threads.append(threading.Thread(target=writer))
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return {
+        "reads_per_s": sum(reads) / elapsed,
+        "writes_per_s": writes[0] / elapsed,
+        "torn_reads": sum(torn),
+    }
+
+
+def main() -> None:
+    """Komut satırı argümanlarını okuyup benchmark'ı çalıştırır."""
+    parser = argparse.ArgumentParser(description="Eşzamanlı okuma/yazma stres testi")
+    parser.add_argument("--catalog", type=int, default=20_000, help="Katalog büyüklüğü")
+    parser.add_argument("--readers", type=int, default=4, help="Okuyucu thread sayısı")
+    parser.add_argument("--duration", type=float, default=3.0, help="Her koşunun süresi (sn)")
+    parser.add_argument("--output", default="bench_snapshot.json", help="Sonuç dosyası")
+    args = parser.parse_args()
+
+    records = synthetic_catalog(args.catalog)
+    isbns = [record["isbn"] for record in records]
+    results = {"catalog": args.catalog, "readers": args.readers}
+    with tempfile.TemporaryDirectory() as workdir:
+        filename = os.path.join(workdir, "library.json")
+        for name, write in (("read_only", False), ("read_write", True)):
+            write_catalog(filename, records)
+            with quiet():
+                library = Library(filename)
+                with patch.object(library, "save_books"):
+                    results[name] = run(library, isbns, args.readers, args.duration, write)
+            r = results[name]
+            print(f"{name:<10} {r['reads_per_s']:>12,.0f} okuma/sn "
+                  f"{r['writes_per_s']:>8,.0f} toplu yazma/sn  tutarsız okuma: {r['torn_reads']}")
+    write_results(args.output, "snapshot", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,19 @@
+from typing import Iterable, Optional
+
+
+# Baskı bilgisinden gelen, verilmeyebilen alanlar (to_dict boş olanları yazmaz)
+OPTIONAL_FIELDS = ("publish_year", "pages", "publishers", "subjects", "author_keys")
+
+
 class Book:
     """
     Bir kitabı temsil eden sınıf.
     """
     
-    def __init__(self, title: str, author: str, isbn: str):
+    def __init__(self, title: str, author: str, isbn: str,
+                 publish_year: Optional[int] = None, pages: Optional[int] = None,
+                 publishers: Iterable[str] = (), subjects: Iterable[str] = (),
+                 author_keys: Iterable[str] = ()):
         """
         Book sınıfının constructor'ı.
         
@@ -11,10 +21,20 @@ class Book:
             title (str): Kitabın başlığı
             author (str): Kitabın yazarı
             isbn (str): Kitabın ISBN numarası (benzersiz kimlik)
+            publish_year (Optional[int]): Yayın yılı
+            pages (Optional[int]): Sayfa sayısı
+            publishers (Iterable[str]): Yayınevleri
+            subjects (Iterable[str]): Konular
+            author_keys (Iterable[str]): Tüm yazarların Open Library anahtarları
         """
         self.title = title
         self.author = author
         self.isbn = isbn
+        self.publish_year = publish_year
+        self.pages = pages
+        self.publishers = tuple(publishers)
+        self.subjects = tuple(subjects)
+        self.author_keys = tuple(author_keys)
     
     def __str__(self) -> str:
         """
@@ -46,13 +66,18 @@ class Book:
         JSON serialization için kullanılır.
         
         Returns:
-            dict: Kitap bilgilerini içeren dictionary
+            dict: Kitap bilgilerini içeren dictionary (boş isteğe bağlı alanlar hariç)
         """
-        return {
+        data = {
             "title": self.title,
             "author": self.author,
             "isbn": self.isbn
         }
+        for field in OPTIONAL_FIELDS:
+            value = getattr(self, field)
+            if value is not None and value != ():
+                data[field] = list(value) if isinstance(value, tuple) else value
+        return data
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Book':
@@ -69,5 +94,10 @@ class Book:
         return cls(
             title=data["title"],
             author=data["author"],
-            isbn=data["isbn"]
+            isbn=data["isbn"],
+            publish_year=data.get("publish_year"),
+            pages=data.get("pages"),
+            publishers=data.get("publishers") or (),
+            subjects=data.get("subjects") or (),
+            author_keys=data.get("author_keys") or ()
         )
\ No newline at end of file
@@ -0,0 +1,232 @@
+"""
+Kütüphane Yönetim Sistemi - Katalog Karşılaştırma ve Birleştirme
+
+Bu modül iki katalogu kanonik ISBN'lere göre karşılaştırır: yalnızca
+birinde bulunan kitapları ve başlığı, yazarı ya da edition alanları (bkz.
+book.OPTIONAL_FIELDS) farklı olanları bulur.
+Karşılaştırma hash tabanlıdır; sağ katalog ISBN -> kayıt sözlüğüne
+yüklenir, sol katalog akış halinde okunup her kayıt bu sözlükte aranır.
+Toplam süre iki katalogun boyutuyla doğrusaldır.
+
+Katalog dosyaları bütünüyle belleğe alınmaz, JSON dizisi kayıt kayıt
+okunur. Sağ katalog PARTITION_BYTES'tan büyükse iki taraf da kanonik
+ISBN'in hash'ine göre geçici (pickle) dosyalara bölünür ve her bölüm ayrı ayrı
+karşılaştırılır; bellekte aynı anda yalnızca bir bölümün sözlüğü bulunur.
+Bölünmüş karşılaştırmada sonuçların sırası katalog sırası değildir.
+"""
+
+import json
+import math
+import os
+import pickle
+import re
+import tempfile
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from book import OPTIONAL_FIELDS
+from isbn import canonical_isbn
+
+
+# Karşılaştırılan alanlar; bunlardan biri farklıysa kayıt "changed" sayılır.
+# Eksik edition alanları boş listeyle aynı sayılır
+DIFF_FIELDS = ("title", "author") + OPTIONAL_FIELDS
+
+# Birleştirme politikaları: ours farklı kayıtlarda yerel kaydı, theirs diğerini tutar
+MERGE_POLICIES = ("ours", "theirs")
+
+# Sağ katalogun tek bölümde belleğe alınabilecek en büyük dosya boyutu
+PARTITION_BYTES = 64 * 1024 * 1024
+
+# Bölüm dosyalarına tek seferde yazılan kayıt sayısı
+SPILL_BATCH = 10_000
+
+# Katalog dosyası okunurken bir seferde okunan karakter sayısı
+READ_CHUNK = 1024 * 1024
+
+# JSON dizisinde kayıtlar arasındaki boşluklar ve virgüller
+_SEPARATORS = re.compile(r"[\s,]*")
+
+
+def read_catalog(path: str) -> Iterator[dict]:
+    """
+    Library JSON dosyasındaki kitap kayıtlarını tek tek üretir; dosya
+    belleğe bütünüyle okunmaz.
+
+    Args:
+        path (str): Katalog dosyası (kitap sözlüklerinden oluşan JSON dizisi)
+
+    Yields:
+        dict: Kitap kaydı
+
+    Raises:
+        ValueError: Dosya bir JSON dizisi değilse ya da yarım kalmışsa
+    """
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as file:
+        buffer = file.read(READ_CHUNK).lstrip()
+        if not buffer.startswith("["):
+            raise ValueError(f"{path} bir katalog dosyası (JSON dizisi) değil.")
+        position = 1
+        eof = False
+        while True:
+            # Boşlukları ve ayırıcı virgülleri atla
+            position = _SEPARATORS.match(buffer, position).end()
+            if position < len(buffer) and buffer[position] == "]":
+                return
+            try:
+                record, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise ValueError(f"{path} beklenmedik biçimde sona erdi.") from None
+                # Kayıt parçanın sonunda bölünmüş; tüketilen kısmı at ve devamını oku
+                chunk = file.read(READ_CHUNK)
+                eof = not chunk
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+            yield record
+            position = end
+
+
+def _keyed(records: Iterable[dict]) -> Iterator[Tuple[str, dict]]:
+    """Kayıtları kanonik ISBN'leriyle eşler; ISBN'i olmayanları atlar."""
+    for record in records:
+        key = canonical_isbn(str(record.get("isbn") or ""))
+        if key:
+            yield key, record
+
+
+def _compare(left: Iterable[Tuple[str, dict]],
+             right: Iterable[Tuple[str, dict]]) -> Iterator[dict]:
+    """Sağ tarafı sözlüğe alıp sol tarafı akış halinde karşılaştırır."""
+    pending: Dict[str, dict] = {}
+    for key, record in right:
+        pending.setdefault(key, record)
+    seen = set()
+    for key, record in left:
+        if key in seen:
+            continue
+        seen.add(key)
+        other = pending.pop(key, None)
+        if other is None:
+            yield {"isbn": key, "status": "left_only", "left": record, "right": None}
+            continue
+        fields = [field for field in DIFF_FIELDS
+                  if (record.get(field) or None) != (other.get(field) or None)]
+        if fields:
+            yield {"isbn": key, "status": "changed", "fields": fields,
+                   "left": record, "right": other}
+    for key, record in pending.items():
+        yield {"isbn": key, "status": "right_only", "left": None, "right": record}
+
+
+def _spill(records: Iterable[Tuple[str, dict]], directory: str, side: str,
+           partitions: int) -> List[str]:
+    """
+    Kayıtları kanonik ISBN'in hash'ine göre bölüm dosyalarına yazar. Her
+    bölümde SPILL_BATCH kayıt biriktikçe tek bir pickle olarak eklenir.
+    """
+    paths = [os.path.join(directory, f"{side}-{index}.pickle") for index in range(partitions)]
+    files: List[IO] = [open(path, 'wb') for path in paths]
+    pending: List[list] = [[] for _ in paths]
+    try:
+        for key, record in records:
+            index = hash(key) % partitions
+            batch = pending[index]
+            batch.append((key, record))
+            if len(batch) >= SPILL_BATCH:
+                pickle.dump(batch, files[index], pickle.HIGHEST_PROTOCOL)
+                batch.clear()
+        for file, batch in zip(files, pending):
+            if batch:
+                pickle.dump(batch, file, pickle.HIGHEST_PROTOCOL)
+    finally:
+        for file in files:
+            file.close()
+    return paths
+
+
+def _read_spilled(path: str) -> Iterator[Tuple[str, dict]]:
+    with open(path, 'rb') as file:
+        while True:
+            try:
+                yield from pickle.load(file)
+            except EOFError:
+                return
+
+
+def diff_records(left: Iterable[dict], right: Iterable[dict],
+                 partitions: int = 1) -> Iterator[dict]:
+    """
+    İki kayıt akışını kanonik ISBN'lere göre karşılaştırır.
+
+    Args:
+        left (Iterable[dict]): Sol katalogun kayıtları
+        right (Iterable[dict]): Sağ katalogun kayıtları
+        partitions (int): Bölüm sayısı; 1'den büyükse iki taraf geçici
+            dosyalara bölünerek karşılaştırılır
+
+    Yields:
+        dict: {"isbn", "status": "left_only" | "right_only" | "changed",
+            "left", "right"} ve değişen kayıtlarda "fields". Bir tarafta aynı
+            kanonik ISBN birden çok kez geçiyorsa ilki kullanılır.
+    """
+    if partitions <= 1:
+        yield from _compare(_keyed(left), _keyed(right))
+        return
+    with tempfile.TemporaryDirectory(prefix="catalog-diff-") as directory:
+        left_paths = _spill(_keyed(left), directory, "left", partitions)
+        right_paths = _spill(_keyed(right), directory, "right", partitions)
+        for left_path, right_path in zip(left_paths, right_paths):
+            yield from _compare(_read_spilled(left_path), _read_spilled(right_path))
+
+
+def partitions_for(path: str) -> int:
+    """Sağ taraftaki katalog dosyası için gereken bölüm sayısı."""
+    return max(1, math.ceil(os.path.getsize(path) / PARTITION_BYTES))
+
+
+def diff_files(left_path: str, right_path: str,
+               partitions: Optional[int] = None) -> Iterator[dict]:
+    """
+    İki katalog dosyasını Library nesnesi oluşturmadan akış halinde karşılaştırır.
+
+    Args:
+        left_path (str): Sol katalog dosyası
+        right_path (str): Sağ katalog dosyası
+        partitions (Optional[int]): Bölüm sayısı (varsayılan: sağ dosyanın boyutundan)
+
+    Yields:
+        dict: diff_records ile aynı biçimde farklar
+    """
+    if partitions is None:
+        partitions = partitions_for(right_path)
+    return diff_records(read_catalog(left_path), read_catalog(right_path), partitions)
+
+
+def merge_operations(differences: Iterable[dict], policy: str = "ours") -> List[dict]:
+    """
+    Farkları sol kataloga uygulanacak apply_batch işlemlerine çevirir.
+    Yalnızca sağda bulunan kitaplar eklenir; theirs politikasında farklı
+    kayıtlar sağdaki haliyle değiştirilir. Yalnızca solda bulunanlar korunur.
+
+    Args:
+        differences (Iterable[dict]): diff_records çıktısı
+        policy (str): MERGE_POLICIES'ten biri
+
+    Returns:
+        List[dict]: {"op": "add" | "remove", ...} işlemleri
+
+    Raises:
+        ValueError: Politika desteklenmiyorsa
+    """
+    if policy not in MERGE_POLICIES:
+        raise ValueError(f"Desteklenmeyen birleştirme politikası: {policy}")
+    operations: List[dict] = []
+    for difference in differences:
+        if difference["status"] == "right_only":
+            operations.append(dict(difference["right"], op="add"))
+        elif difference["status"] == "changed" and policy == "theirs":
+            operations.append({"op": "remove", "isbn": difference["left"]["isbn"]})
+            operations.append(dict(difference["right"], op="add"))
+    return operations
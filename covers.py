@@ -0,0 +1,246 @@
+"""
+Kütüphane Yönetim Sistemi - Kapak Görseli Önbelleği
+
+Bu modül kitap kapaklarını covers.openlibrary.org'dan (veya yerel
+taklidinden) bir kez çekip diskte içerik adresli olarak saklar. Görseller
+SHA-256 özetleriyle `<dizin>/objects/ab/cdef...` yoluna yazılır; aynı
+görseli paylaşan kapaklar tek kopya tutar. `<dizin>/index.json` ISBN ve
+boyuttan özete eşlemeyi saklar.
+
+Toplam boyut `max_bytes`'ı aştığında en uzun süredir istenmeyen görseller
+silinir (LRU). Kapağı olmayan kitaplar bir süre hatırlanır ve tekrar
+sorulmaz. Aynı kapak için eşzamanlı istekler tek bir indirmeyi bekler.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+
+import httpx
+
+from openlibrary import OpenLibraryClient
+from resilience import UpstreamUnavailable
+import metrics
+
+
+COVERS_URL = "https://covers.openlibrary.org"
+COVER_SIZES = ("S", "M", "L")
+
+# Varsayılan disk önbelleği sınırı
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Kapağı olmayan ISBN'lerin tekrar sorulmadan önce bekleneceği süre (saniye)
+MISSING_TTL = 3600.0
+MISSING_LIMIT = 100_000
+# add_book sonrası arka planda kapak çeken thread sayısı
+PREFETCH_WORKERS = 2
+
+_ISBN = re.compile(r"^[0-9Xx-]{1,17}$")
+
+
+class CoverNotFound(Exception):
+    """Kitabın istenen boyutta kapağı yoksa fırlatılır."""
+
+
+class CoverEntry:
+    """Önbellekteki bir kapak görseli."""
+
+    __slots__ = ("digest", "content_type", "size")
+
+    def __init__(self, digest: str, content_type: str, size: int):
+        self.digest = digest
+        self.content_type = content_type
+        self.size = size
+
+    def to_dict(self) -> dict:
+        """Kaydı dictionary'ye dönüştürür."""
+        return {"digest": self.digest, "content_type": self.content_type, "size": self.size}
+
+
+class CoverCache:
+    """
+    Kapak görsellerini içerik adresli disk önbelleğinde tutan sınıf.
+    """
+
+    def __init__(self, directory: str, upstream: Optional[OpenLibraryClient] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        CoverCache sınıfının constructor'ı.
+
+        Args:
+            directory (str): Önbellek dizini
+            upstream (Optional[OpenLibraryClient]): Kapak sunucusunun istemcisi
+                (varsayılan: covers.openlibrary.org)
+            max_bytes (int): Diskteki görsellerin toplam boyut sınırı
+        """
+        self.directory = directory
+        self.upstream = upstream or OpenLibraryClient(COVERS_URL)
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        # "isbn-boyut" -> CoverEntry; ekleme sırası LRU sırasıdır
+        self._index: "OrderedDict[str, CoverEntry]" = OrderedDict()
+        self._missing: Dict[str, float] = {}
+        self._inflight: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._prefetcher: Optional[ThreadPoolExecutor] = None
+        # Dizin ilk görsel yazılırken oluşturulur
+        self._load_index()
+
+    @property
+    def index_file(self) -> str:
+        """Eşleme dosyasının yolu."""
+        return os.path.join(self.directory, "index.json")
+
+    def path(self, digest: str) -> str:
+        """Özete ait görsel dosyasının yolu."""
+        return os.path.join(self.directory, "objects", digest[:2], digest[2:])
+
+    def get(self, isbn: str, size: str = "M") -> CoverEntry:
+        """
+        Kapağı önbellekten döndürür; yoksa kapak sunucusundan çekip saklar.
+
+        Args:
+            isbn (str): Kitabın ISBN numarası
+            size (str): S, M veya L
+
+        Returns:
+            CoverEntry: Görselin özeti, türü ve boyutu (dosya: path(entry.digest))
+
+        Raises:
+            ValueError: ISBN ya da boyut geçersizse
+            CoverNotFound: Kitabın bu boyutta kapağı yoksa
+            UpstreamUnavailable, httpx.HTTPError: Kapak sunucusuna ulaşılamazsa
+        """
+        if not _ISBN.match(isbn) or size not in COVER_SIZES:
+            raise ValueError(f"Geçersiz kapak isteği: {isbn}-{size}")
+        key = f"{isbn}-{size}"
+        while True:
+            with self._lock:
+                entry = self._index.get(key)
+                if entry is not None and os.path.exists(self.path(entry.digest)):
+                    self._index.move_to_end(key)
+                    metrics.CACHE_REQUESTS.labels("cover", "hit").inc()
+                    return entry
+                missing_until = self._missing.get(key)
+                if missing_until is not None and missing_until > time.time():
+                    metrics.CACHE_REQUESTS.labels("cover", "hit").inc()
+                    raise CoverNotFound(key)
+                waiter = self._inflight.get(key)
+                if waiter is None:
+                    # Bu thread indirir; diğerleri bitmesini bekler
+                    self._inflight[key] = threading.Event()
+                    break
+            waiter.wait()
+
+        metrics.CACHE_REQUESTS.labels("cover", "miss").inc()
+        try:
+            return self._fetch(key, isbn, size)
+        finally:
+            with self._lock:
+                self._inflight.pop(key).set()
+
+    def _fetch(self, key: str, isbn: str, size: str) -> CoverEntry:
+        with self.upstream.http_client() as client:
+            response = self.upstream.get(client, f"/b/isbn/{isbn}-{size}.jpg?default=false", "cover")
+        if response.status_code == 404:
+            with self._lock:
+                now = time.time()
+                if len(self._missing) >= MISSING_LIMIT:
+                    self._missing = {k: until for k, until in self._missing.items() if until > now}
+                self._missing[key] = now + MISSING_TTL
+            raise CoverNotFound(key)
+        response.raise_for_status()
+
+        data = response.content
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp, 'wb') as file:
+                file.write(data)
+            os.replace(tmp, path)
+        entry = CoverEntry(digest, response.headers.get("Content-Type", "image/jpeg"), len(data))
+        with self._lock:
+            self._index[key] = entry
+            self._missing.pop(key, None)
+            self._evict()
+            self._save_index()
+        return entry
+
+    def _evict(self) -> None:
+        """Toplam boyut sınırı aşıldıkça en eski görselleri siler (kilit altında)."""
+        total = self._total_bytes()
+        while total > self.max_bytes and len(self._index) > 1:
+            key, entry = self._index.popitem(last=False)
+            # Görsel başka bir kapak tarafından da kullanılıyorsa dosya kalır
+            if any(other.digest == entry.digest for other in self._index.values()):
+                continue
+            try:
+                os.unlink(self.path(entry.digest))
+            except FileNotFoundError:
+                pass
+            total -= entry.size
+            self.evictions += 1
+
+    def _total_bytes(self) -> int:
+        """Diskteki benzersiz görsellerin toplam boyutu."""
+        return sum({entry.digest: entry.size for entry in self._index.values()}.values())
+
+    def _load_index(self) -> None:
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return
+        for key, value in data.items():
+            self._index[key] = CoverEntry(value["digest"], value["content_type"], value["size"])
+
+    def _save_index(self) -> None:
+        tmp = f"{self.index_file}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as file:
+            json.dump({key: entry.to_dict() for key, entry in self._index.items()}, file)
+        os.replace(tmp, self.index_file)
+
+    def prefetch(self, isbn: str, sizes: Iterable[str] = ("M",)) -> None:
+        """
+        Kapakları arka planda önbelleğe çeker; hatalar yok sayılır.
+
+        Args:
+            isbn (str): Kitabın ISBN numarası
+            sizes (Iterable[str]): Çekilecek boyutlar
+        """
+        with self._lock:
+            if self._prefetcher is None:
+                self._prefetcher = ThreadPoolExecutor(PREFETCH_WORKERS,
+                                                      thread_name_prefix="cover-prefetch")
+        for size in sizes:
+            self._prefetcher.submit(self._prefetch_one, isbn, size)
+
+    def _prefetch_one(self, isbn: str, size: str) -> None:
+        try:
+            self.get(isbn, size)
+        except (ValueError, CoverNotFound, UpstreamUnavailable, httpx.HTTPError, OSError):
+            pass
+
+    def stats(self) -> dict:
+        """Önbellekteki kapak sayısı, toplam boyut ve sınırlar."""
+        with self._lock:
+            return {
+                "covers": len(self._index),
+                "bytes": self._total_bytes(),
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+                "missing": len(self._missing),
+            }
+
+    def close(self) -> None:
+        """Arka planda süren kapak çekme işlerinin bitmesini bekler."""
+        if self._prefetcher is not None:
+            self._prefetcher.shutdown(wait=True)
+            self._prefetcher = None
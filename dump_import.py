@@ -0,0 +1,422 @@
+"""
+Kütüphane Yönetim Sistemi - Open Library Döküm Dosyası İçe Aktarımı
+
+Bu modül büyük toplu yüklemeler için canlı API'ye hiç gitmeden, yerel
+Open Library döküm dosyalarından (editions ve authors) kitap aktarır.
+
+Desteklenen biçimler (gzip'li ya da düz):
+- Open Library'nin resmi TSV dökümü: tür, anahtar, revizyon, tarih, JSON
+- Her satırda bir JSON kaydı olan JSONL
+
+Dosyalar satır satır okunur ve sabit boyutlu parçalar halinde bir süreç
+havuzunda ayrıştırılır. Havuzda aynı anda en fazla `workers * 2` parça
+bekler; böylece bellek kullanımı döküm boyutundan bağımsız kalır.
+Aktarım iki geçişte yapılır: önce edition'lar taranıp gereken yazar
+anahtarları toplanır, ardından authors dökümünden yalnızca bu yazarların
+adları alınır. Filtresiz (tam döküm) aktarımda edition'lar bellekte
+tutulmaz; kanonik ISBN'in hash'ine göre geçici (pickle) bölüm dosyalarına
+yazılır ve kitaplar bölüm bölüm okunarak tek bir add_books çağrısıyla
+akış halinde eklenir. Bellekte aynı anda yalnızca bir bölüm, gereken
+yazarların adları ve eklenen kitaplar bulunur. Birden çok bölümde
+kitapların katalogdaki sırası döküm sırası değildir.
+
+ISBN'ler kanonik biçimde (tiresiz ISBN-13, bkz. isbn.canonical_isbn)
+eşlenir; ISBN-10'lu bir edition katalogdaki ISBN-13'lü kitapla aynı kabul
+edilir. ISBN alanı boş (null) ya da kontrol hanesi hatalı olan edition'lar
+atlanıp sayılır.
+"""
+
+import gzip
+import json
+import math
+import os
+import pickle
+import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from book import Book
+from isbn import canonical_isbn, validate_isbns
+from library import Library
+
+
+DEFAULT_CHUNK_SIZE = 20_000
+UNKNOWN_AUTHOR = "Bilinmeyen Yazar"
+UNKNOWN_TITLE = "Bilinmeyen Başlık"
+
+# Filtresiz aktarımda editions dökümünün bu kadar byte'ı için bir bölüm dosyası açılır
+PARTITION_BYTES = 64 * 1024 * 1024
+
+# Bölüm dosyalarına tek seferde yazılan kayıt sayısı
+SPILL_BATCH = 10_000
+
+# Worker süreçlerinde filtre kümesi (ISBN'ler ya da yazar anahtarları).
+# Her parçayla yeniden gönderilmemesi için havuz başlatılırken bir kez atanır.
+_filter: Optional[FrozenSet[str]] = None
+
+
+def _init_worker(keys: Optional[FrozenSet[str]]) -> None:
+    """Worker sürecinin filtre kümesini ayarlar."""
+    global _filter
+    _filter = keys
+
+
+def _record(line: bytes) -> Optional[dict]:
+    """Döküm satırındaki JSON kaydını çözer; TSV'de son sütun kullanılır."""
+    line = line.strip()
+    if not line:
+        return None
+    if not line.startswith(b"{"):
+        line = line.rsplit(b"\t", 1)[-1]
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def _isbn_values(value) -> List[str]:
+    """Döküm kaydındaki isbn_13/isbn_10 alanının metin değerleri (null ve liste dışı değerler atlanır)."""
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list):
+        return [item for item in value if isinstance(item, str)]
+    return []
+
+
+def parse_editions(lines: List[bytes]) -> Tuple[List[Tuple[str, str, str]], int, int]:
+    """
+    Edition satırlarını ayrıştırır (worker sürecinde çalışır).
+
+    Filtre varsa yalnızca ISBN'lerinden biri filtrede olan edition'lar,
+    yoksa geçerli ISBN'i olan tüm edition'lar döndürülür. Parçadaki tüm
+    ISBN'ler tek seferde doğrulanır (bkz. isbn.validate_isbns).
+
+    Args:
+        lines (List[bytes]): Döküm satırları
+
+    Returns:
+        Tuple: (kanonik ISBN, başlık, yazar anahtarı) kayıtları, hatalı satır
+            sayısı ve ISBN alanı olup geçerli ISBN'i olmayan edition sayısı
+    """
+    editions = []
+    values: List[str] = []
+    errors = 0
+    for line in lines:
+        edition = _record(line)
+        if edition is None:
+            errors += 1
+            continue
+        if "isbn_13" not in edition and "isbn_10" not in edition:
+            continue
+        raw = _isbn_values(edition.get("isbn_13")) + _isbn_values(edition.get("isbn_10"))
+        editions.append((edition, len(values), len(values) + len(raw)))
+        values.extend(raw)
+    canonical = validate_isbns(values)
+
+    records = []
+    skipped = 0
+    for edition, start, end in editions:
+        # ISBN-13 ve ISBN-10 aynı kanonik değere inebilir; sıra korunarak tekilleştirilir
+        isbns = list(dict.fromkeys(isbn for isbn in canonical[start:end] if isbn is not None))
+        if not isbns:
+            skipped += 1
+            continue
+        if _filter is not None:
+            isbns = [isbn for isbn in isbns if isbn in _filter]
+            if not isbns:
+                continue
+        authors = edition.get("authors") or []
+        first_author = authors[0] if authors else None
+        author_key = first_author.get("key", "") if isinstance(first_author, dict) else ""
+        title = edition.get("title") or UNKNOWN_TITLE
+        if _filter is not None:
+            records.extend((isbn, title, author_key) for isbn in isbns)
+        else:
+            records.append((isbns[0], title, author_key))
+    return records, errors, skipped
+
+
+def parse_authors(lines: List[bytes]) -> Tuple[List[Tuple[str, str]], int]:
+    """
+    Author satırlarını ayrıştırır (worker sürecinde çalışır).
+    Filtre varsa yalnızca filtredeki yazar anahtarları döndürülür.
+
+    Args:
+        lines (List[bytes]): Döküm satırları
+
+    Returns:
+        Tuple: (yazar anahtarı, ad) kayıtları ve hatalı satır sayısı
+    """
+    records = []
+    errors = 0
+    for line in lines:
+        author = _record(line)
+        if author is None:
+            errors += 1
+            continue
+        key = author.get("key", "")
+        name = author.get("name")
+        if not key or not name:
+            continue
+        if _filter is not None and key not in _filter:
+            continue
+        records.append((key, name))
+    return records, errors
+
+
+class Progress:
+    """Okunan satır ve byte sayısını belirli aralıklarla raporlayan yardımcı."""
+
+    def __init__(self, label: str, total_bytes: int, stream: Optional[IO] = None,
+                 interval: float = 2.0):
+        """
+        Progress sınıfının constructor'ı.
+
+        Args:
+            label (str): Rapor satırının başındaki etiket
+            total_bytes (int): Dosyanın (sıkıştırılmış) boyutu
+            stream (Optional[IO]): Raporun yazılacağı akış (None: sessiz)
+            interval (float): Raporlar arası en az süre (saniye)
+        """
+        self.label = label
+        self.total_bytes = total_bytes
+        self.stream = stream
+        self.interval = interval
+        self.lines = 0
+        self.bytes_read = 0
+        self.started = time.perf_counter()
+        self._last_report = self.started
+
+    def update(self, lines: int, bytes_read: int) -> None:
+        """Sayaçları günceller; aralık dolduysa bir rapor satırı yazar."""
+        self.lines += lines
+        self.bytes_read = bytes_read
+        now = time.perf_counter()
+        if self.stream is not None and now - self._last_report >= self.interval:
+            self._last_report = now
+            self.report(final=False)
+
+    def report(self, final: bool = True) -> None:
+        """Anlık ilerleme ve işlem hızını yazar."""
+        if self.stream is None:
+            return
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        percent = 100.0 * self.bytes_read / self.total_bytes if self.total_bytes else 100.0
+        state = "tamamlandı" if final else f"%{percent:.1f}"
+        print(f"[{self.label}] {state}: {self.lines:,} satır, "
+              f"{self.lines / elapsed:,.0f} satır/sn, "
+              f"{self.bytes_read / elapsed / 1024 / 1024:.1f} MiB/sn",
+              file=self.stream, flush=True)
+
+
+def _read_chunks(path: str, chunk_size: int, progress: Progress) -> Iterator[List[bytes]]:
+    """
+    Döküm dosyasını satır parçaları halinde okur; gzip otomatik algılanır.
+
+    Args:
+        path (str): Döküm dosyası
+        chunk_size (int): Parça başına satır sayısı
+        progress (Progress): İlerleme sayacı
+
+    Yields:
+        List[bytes]: Satır parçası
+    """
+    with open(path, 'rb') as raw:
+        compressed = raw.read(2) == b"\x1f\x8b"
+        raw.seek(0)
+        stream = gzip.GzipFile(fileobj=raw) if compressed else raw
+        chunk: List[bytes] = []
+        for line in stream:
+            chunk.append(line)
+            if len(chunk) >= chunk_size:
+                progress.update(len(chunk), raw.tell())
+                yield chunk
+                chunk = []
+        if chunk:
+            progress.update(len(chunk), raw.tell())
+            yield chunk
+
+
+def _map_chunks(func: Callable, chunks: Iterable[List[bytes]], workers: int,
+                keys: Optional[FrozenSet[str]]) -> Iterator[tuple]:
+    """
+    Parçaları sırayla ayrıştırır; workers > 1 ise süreç havuzu kullanılır.
+    Havuzda en fazla workers * 2 parça bekler.
+
+    Args:
+        func (Callable): parse_editions ya da parse_authors
+        chunks (Iterable[List[bytes]]): Satır parçaları
+        workers (int): Süreç sayısı (1: aynı süreçte çalış)
+        keys (Optional[FrozenSet[str]]): Worker'lara verilecek filtre kümesi
+
+    Yields:
+        tuple: Her parça için func'ın sonucu
+    """
+    if workers <= 1:
+        _init_worker(keys)
+        try:
+            for chunk in chunks:
+                yield func(chunk)
+        finally:
+            _init_worker(None)
+        return
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(keys,)) as pool:
+        pending: deque = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(func, chunk))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _spill(records: Iterable[Tuple[str, str, str]], directory: str,
+           partitions: int) -> List[str]:
+    """
+    Edition kayıtlarını kanonik ISBN'in hash'ine göre bölüm dosyalarına
+    yazar; aynı ISBN'in tüm kayıtları aynı bölüme düşer. Her bölümde
+    SPILL_BATCH kayıt biriktikçe tek bir pickle olarak eklenir.
+    """
+    paths = [os.path.join(directory, f"editions-{index}.pickle") for index in range(partitions)]
+    files: List[IO] = [open(path, 'wb') for path in paths]
+    pending: List[list] = [[] for _ in paths]
+    try:
+        for record in records:
+            index = hash(record[0]) % partitions
+            batch = pending[index]
+            batch.append(record)
+            if len(batch) >= SPILL_BATCH:
+                pickle.dump(batch, files[index], pickle.HIGHEST_PROTOCOL)
+                batch.clear()
+        for file, batch in zip(files, pending):
+            if batch:
+                pickle.dump(batch, file, pickle.HIGHEST_PROTOCOL)
+    finally:
+        for file in files:
+            file.close()
+    return paths
+
+
+def _read_partition(path: str) -> Dict[str, Tuple[str, str]]:
+    """Bölüm dosyasını ISBN -> (başlık, yazar anahtarı) sözlüğüne okur; ilk kayıt kazanır."""
+    editions: Dict[str, Tuple[str, str]] = {}
+    with open(path, 'rb') as file:
+        while True:
+            try:
+                batch = pickle.load(file)
+            except EOFError:
+                return editions
+            for isbn, title, author_key in batch:
+                editions.setdefault(isbn, (title, author_key))
+
+
+def import_dump(library: Library, editions_path: str,
+                authors_path: Optional[str] = None,
+                isbns: Optional[Iterable[str]] = None,
+                workers: Optional[int] = None,
+                chunk_size: int = DEFAULT_CHUNK_SIZE,
+                progress_stream: Optional[IO] = sys.stderr) -> dict:
+    """
+    Döküm dosyalarındaki kitapları kütüphaneye aktarır. Filtresiz aktarımda
+    edition'lar geçici bölüm dosyaları üzerinden akış halinde eklenir.
+
+    Args:
+        library (Library): Kitapların ekleneceği Library
+        editions_path (str): Editions dökümü
+        authors_path (Optional[str]): Authors dökümü (yoksa yazarlar "Bilinmeyen Yazar" olur)
+        isbns (Optional[Iterable[str]]): Yalnızca bu ISBN'leri aktar (None: tümü)
+        workers (Optional[int]): Ayrıştırma süreci sayısı (varsayılan: CPU sayısı)
+        chunk_size (int): Parça başına satır sayısı
+        progress_stream (Optional[IO]): İlerleme raporlarının yazılacağı akış
+
+    Returns:
+        dict: Okunan satır, eşleşen, eklenen kitap sayıları ve işlem hızı
+    """
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+
+    # Filtre: kanonik ISBN -> kullanıcının verdiği biçim
+    wanted: Optional[Dict[str, str]] = None
+    if isbns is not None:
+        wanted = {canonical_isbn(isbn): isbn.strip() for isbn in isbns if isbn.strip()}
+
+    # 1. geçiş: edition'lar bölüm dosyalarına yazılır, yazar anahtarları toplanır
+    progress = Progress("editions", os.path.getsize(editions_path), progress_stream)
+    counts = {"errors": 0, "skipped_invalid": 0}
+    author_keys = set()
+    keys = frozenset(wanted) if wanted is not None else None
+
+    def parsed() -> Iterator[Tuple[str, str, str]]:
+        chunks = _read_chunks(editions_path, chunk_size, progress)
+        for records, chunk_errors, chunk_skipped in _map_chunks(parse_editions, chunks,
+                                                                workers, keys):
+            counts["errors"] += chunk_errors
+            counts["skipped_invalid"] += chunk_skipped
+            for record in records:
+                if record[2]:
+                    author_keys.add(record[2])
+                yield record
+
+    # Filtreli aktarımda kayıtlar filtreyle sınırlıdır; tek bölüm yeterlidir
+    partitions = 1 if wanted is not None else \
+        max(1, math.ceil(os.path.getsize(editions_path) / PARTITION_BYTES))
+    with tempfile.TemporaryDirectory(prefix="dump-import-") as directory:
+        paths = _spill(parsed(), directory, partitions)
+        progress.report()
+        edition_lines = progress.lines
+        errors = counts["errors"]
+
+        # 2. geçiş: yalnızca gereken yazarlar
+        author_names: Dict[str, str] = {}
+        author_lines = 0
+        if authors_path and author_keys:
+            progress = Progress("authors", os.path.getsize(authors_path), progress_stream)
+            chunks = _read_chunks(authors_path, chunk_size, progress)
+            for records, chunk_errors in _map_chunks(parse_authors, chunks, workers,
+                                                     frozenset(author_keys)):
+                errors += chunk_errors
+                author_names.update(records)
+            progress.report()
+            author_lines = progress.lines
+        author_keys.clear()
+
+        # Kitaplar bölüm bölüm üretilip tek seferde eklenir (tek snapshot, tek kayıt)
+        matched = set() if wanted is not None else None
+        totals = {"matched": 0}
+
+        def books() -> Iterator[Book]:
+            for path in paths:
+                editions = _read_partition(path)
+                totals["matched"] += len(editions)
+                if matched is not None:
+                    matched.update(editions)
+                # Katalogda başka bir yazımla (tireli, ISBN-10) bulunan kitaplar da atlanır
+                existing, _ = library.get_many(list(editions))
+                for isbn, (title, author_key) in editions.items():
+                    if isbn not in existing:
+                        yield Book(title=title,
+                                   author=author_names.get(author_key, UNKNOWN_AUTHOR),
+                                   isbn=wanted[isbn] if wanted is not None else isbn)
+
+        added = library.add_books(books())
+
+    elapsed = time.perf_counter() - started
+    lines = edition_lines + author_lines
+    return {
+        "edition_lines": edition_lines,
+        "author_lines": author_lines,
+        "invalid_lines": errors,
+        "matched": totals["matched"],
+        "missing": sorted(wanted[isbn] for isbn in set(wanted) - matched) if wanted else [],
+        "authors_resolved": len(author_names),
+        "added": added,
+        "skipped_existing": totals["matched"] - added,
+        "skipped_invalid_isbn": counts["skipped_invalid"],
+        "elapsed_seconds": round(elapsed, 3),
+        "lines_per_second": round(lines / elapsed) if elapsed else 0,
+    }
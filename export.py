@@ -0,0 +1,215 @@
+"""
+Kütüphane Yönetim Sistemi - Katalog Dışa Aktarımı
+
+Bu modül kataloğu CSV veya NDJSON (her satırda bir JSON nesnesi) olarak
+dışa aktarır. Çıktı, satırları belirli sayıda kitaplık parçalar halinde
+üreten generator'larla oluşturulur ve istenirse akış halinde gzip ile
+sıkıştırılır. Böylece milyonlarca kitaplık bir katalog sabit bellekle
+aktarılır ve ilk byte'lar hemen gönderilmeye başlar.
+
+read_records aynı biçimlerdeki dosyaları (gzip'li olabilir) satır satır
+geri okur; komut satırındaki `import` komutu bunu kullanır. CSV'de edition
+alanları da (bkz. book.OPTIONAL_FIELDS) birer sütundur; liste alanlarının
+değerleri LIST_SEPARATOR ile birleştirilir, bilinmeyen değerler boş kalır.
+"""
+
+import csv
+import gzip
+import io
+import json
+import zlib
+from typing import Iterable, Iterator, Optional
+
+from book import OPTIONAL_FIELDS, Book
+from library import Library
+
+
+FORMATS = ("csv", "ndjson")
+
+CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+GZIP_CONTENT_TYPE = "application/gzip"
+
+CSV_COLUMNS = ("title", "author", "isbn") + OPTIONAL_FIELDS
+
+# CSV'de tamsayı olarak okunan sütunlar; diğer edition sütunları listedir
+CSV_INT_COLUMNS = ("publish_year", "pages")
+
+# CSV'de liste alanlarının (yayınevleri, konular, yazar anahtarları) ayırıcısı
+LIST_SEPARATOR = "; "
+
+# Tek seferde kodlanıp gönderilen kitap sayısı
+DEFAULT_BATCH_SIZE = 1000
+
+
+def _csv_rows(books: Iterable[Book], batch_size: int) -> Iterator[bytes]:
+    """Başlık satırı ve kitapları CSV parçaları olarak üretir."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(CSV_COLUMNS)
+    count = 0
+    for book in books:
+        writer.writerow(_csv_row(book))
+        count += 1
+        if count % batch_size == 0:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _csv_row(book: Book) -> tuple:
+    """Kitabın CSV_COLUMNS sırasıyla değerleri."""
+    row = [book.title, book.author, book.isbn]
+    for field in OPTIONAL_FIELDS:
+        value = getattr(book, field)
+        if isinstance(value, tuple):
+            value = LIST_SEPARATOR.join(value)
+        row.append("" if value is None else value)
+    return tuple(row)
+
+
+def _csv_record(row: dict) -> dict:
+    """CSV satırını Book.from_dict'in beklediği kayda çevirir (boş alanlar atlanır)."""
+    record = {field: row.get(field) for field in ("title", "author", "isbn")}
+    for field in OPTIONAL_FIELDS:
+        value = row.get(field)
+        if not value:
+            continue
+        record[field] = int(value) if field in CSV_INT_COLUMNS else value.split(LIST_SEPARATOR)
+    return record
+
+
+def _ndjson_rows(books: Iterable[Book], batch_size: int) -> Iterator[bytes]:
+    """Kitapları NDJSON parçaları olarak üretir."""
+    lines = []
+    for book in books:
+        lines.append(json.dumps(book.to_dict(), ensure_ascii=False))
+        if len(lines) >= batch_size:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """
+    Byte parçalarını akış halinde gzip biçiminde sıkıştırır.
+
+    Args:
+        chunks (Iterable[bytes]): Sıkıştırılacak parçalar
+        level (int): Sıkıştırma seviyesi (1-9)
+
+    Yields:
+        bytes: Sıkıştırılmış parçalar (boş parçalar atlanır)
+    """
+    # wbits=31: zlib yerine gzip başlığı ve CRC'si yazılır
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def export_books(books: Iterable[Book], fmt: str, compress: bool = False,
+                 batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[bytes]:
+    """
+    Kitapları istenen biçimde dışa aktaran generator döndürür.
+
+    Args:
+        books (Iterable[Book]): Aktarılacak kitaplar
+        fmt (str): "csv" veya "ndjson"
+        compress (bool): Çıktı gzip ile sıkıştırılsın mı
+        batch_size (int): Parça başına kitap sayısı
+
+    Returns:
+        Iterator[bytes]: Çıktı parçaları
+
+    Raises:
+        ValueError: Biçim desteklenmiyorsa
+    """
+    if fmt == "csv":
+        chunks = _csv_rows(books, batch_size)
+    elif fmt == "ndjson":
+        chunks = _ndjson_rows(books, batch_size)
+    else:
+        raise ValueError(f"Desteklenmeyen dışa aktarım biçimi: {fmt}")
+    return gzip_chunks(chunks) if compress else chunks
+
+
+def export_catalog(library: Library, fmt: str, compress: bool = False,
+                   batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[bytes]:
+    """
+    Library'deki kataloğu dışa aktarır.
+
+    Aktarım başladığı andaki katalog snapshot'ı üzerinde çalışır; snapshot
+    değişmez olduğu için kopyalanmaz ve aktarım sürerken yapılan
+    ekleme/silmelerden etkilenmez.
+
+    Args:
+        library (Library): Aktarılacak kütüphane
+        fmt (str): "csv" veya "ndjson"
+        compress (bool): Çıktı gzip ile sıkıştırılsın mı
+        batch_size (int): Parça başına kitap sayısı
+
+    Returns:
+        Iterator[bytes]: Çıktı parçaları
+    """
+    return export_books(library.snapshot().books, fmt, compress, batch_size)
+
+
+def detect_format(path: str) -> str:
+    """Dosya adından biçimi tahmin eder (.csv ya da .csv.gz ise csv, aksi halde ndjson)."""
+    name = path[:-3] if path.endswith(".gz") else path
+    return "csv" if name.endswith(".csv") else "ndjson"
+
+
+def read_records(path: str, fmt: Optional[str] = None) -> Iterator[dict]:
+    """
+    Dışa aktarılmış bir CSV/NDJSON dosyasındaki kitap kayıtlarını akış
+    halinde okur. .gz uzantılı dosyalar açılırken çözülür.
+
+    Args:
+        path (str): Okunacak dosya
+        fmt (Optional[str]): "csv" veya "ndjson" (varsayılan: uzantıdan)
+
+    Returns:
+        Iterator[dict]: {"title", "author", "isbn"} ve bilinen edition alanlarını
+            içeren kayıtlar
+
+    Raises:
+        ValueError: Biçim desteklenmiyorsa ya da bir satır okunamazsa
+    """
+    fmt = fmt or detect_format(path)
+    if fmt not in FORMATS:
+        raise ValueError(f"Desteklenmeyen içe aktarım biçimi: {fmt}")
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, 'rt', encoding='utf-8', newline='') as file:
+        if fmt == "csv":
+            for number, row in enumerate(csv.DictReader(file), 2):
+                try:
+                    yield _csv_record(row)
+                except ValueError as e:
+                    raise ValueError(f"{path}:{number}: {e}") from e
+            return
+        for number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{number}: {e}") from e
+
+
+def content_type(fmt: str, compress: bool = False) -> str:
+    """Biçime uygun Content-Type değerini döndürür."""
+    return GZIP_CONTENT_TYPE if compress else CONTENT_TYPES[fmt]
+
+
+def filename(fmt: str, compress: bool = False) -> str:
+    """Biçime uygun dosya adını döndürür (örn. library.csv.gz)."""
+    return f"library.{fmt}" + (".gz" if compress else "")
@@ -0,0 +1,258 @@
+"""
+Kütüphane Yönetim Sistemi - Sıralı İkincil İndeksler
+
+Bu modül kataloğu başlık ve yazar gibi alanlara göre sıralı tutan
+indeksleri sağlar. Her indeks (anahtar, ISBN, Book) üçlülerinden oluşan
+sıralı bir listedir; anahtar alanın büyük/küçük harf duyarsız halidir ve
+eşit anahtarlar ISBN'e göre sıralanır. Böylece filtreleme, aralık sorguları
+ve sıralı sayfalama `bisect` ile istek başına sıralama yapılmadan yanıtlanır.
+
+İndeksler de snapshot'lar gibi değişmezdir: bir yazma işlemi listenin
+kopyası üzerinde yalnızca değişen kitapları `bisect` ile çıkarıp ekler ve
+yeni snapshot'la birlikte yayınlar. Çok sayıda değişiklikte ya da yüklemede
+liste baştan sıralanır.
+"""
+
+import gc
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from book import Book
+
+
+# İndekslenen alanlar; sıralama ve filtreleme yalnızca bunlarla yapılır
+INDEXED_FIELDS = ("title", "author")
+
+# Bu sayıdan fazla değişiklikte (ya da indeksin 1/16'sından fazlasında)
+# tek tek bisect yerine liste baştan sıralanır
+INCREMENTAL_LIMIT = 64
+
+# Aralığın üst sınırında aynı anahtarlı tüm kayıtları kapsamak için ISBN
+# yerine kullanılan, her ISBN'den büyük değer
+_AFTER_ALL = "\U0010ffff"
+
+
+def sort_key(value: Any) -> Any:
+    """Alan değerinin sıralama anahtarı (metinler büyük/küçük harf duyarsız)."""
+    return value.casefold() if isinstance(value, str) else value
+
+
+def prefix_bounds(prefix: str) -> Tuple[str, str]:
+    """prefix ile başlayan anahtarları kapsayan dahil (alt, üst) sınırlar."""
+    return prefix, sort_key(prefix) + _AFTER_ALL
+
+
+class SortedIndex:
+    """
+    Bir alana göre sıralı, değişmez ikincil indeks.
+    """
+
+    __slots__ = ("field", "entries")
+
+    def __init__(self, field: str, entries: List[tuple]):
+        """
+        SortedIndex sınıfının constructor'ı. Genellikle build ile oluşturulur.
+
+        Args:
+            field (str): İndekslenen Book alanı
+            entries (List[tuple]): Sıralı (anahtar, ISBN, Book) üçlüleri
+        """
+        self.field = field
+        self.entries = entries
+
+    @classmethod
+    def build(cls, field: str, books: Iterable[Book]) -> 'SortedIndex':
+        """
+        Kitaplardan indeksi baştan oluşturur. Değeri olmayan kitaplar
+        indekse girmez.
+
+        Args:
+            field (str): İndekslenecek Book alanı
+            books (Iterable[Book]): Kitaplar
+
+        Returns:
+            SortedIndex: Oluşturulan indeks
+        """
+        entries = []
+        for book in books:
+            value = getattr(book, field, None)
+            if value is not None:
+                entries.append((sort_key(value), book.isbn, book))
+        entries.sort()
+        return cls(field, entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _entry(self, book: Book) -> Optional[tuple]:
+        value = getattr(book, self.field, None)
+        return None if value is None else (sort_key(value), book.isbn, book)
+
+    def updated(self, removed: Sequence[Book], added: Sequence[Book]) -> 'SortedIndex':
+        """
+        Önce removed kitapları çıkarıp sonra added kitapları ekleyen yeni bir
+        indeks döndürür; bu indeks değişmez.
+
+        Args:
+            removed (Sequence[Book]): Çıkarılacak kitaplar (indekse eklenmiş nesnelerin kendisi)
+            added (Sequence[Book]): Eklenecek kitaplar
+
+        Returns:
+            SortedIndex: Güncellenmiş indeks
+        """
+        if not removed and not added:
+            return self
+        changed = len(removed) + len(added)
+        if changed > INCREMENTAL_LIMIT and changed > len(self.entries) // 16:
+            gone = {id(book) for book in removed}
+            entries = [entry for entry in self.entries if id(entry[2]) not in gone]
+            entries.extend(entry for entry in map(self._entry, added) if entry is not None)
+            # Liste büyük ölçüde sıralı olduğu için timsort doğrusala yakın çalışır
+            entries.sort()
+            return SortedIndex(self.field, entries)
+
+        entries = self.entries.copy()
+        for book in removed:
+            entry = self._entry(book)
+            if entry is None:
+                continue
+            position = bisect_left(entries, entry[:2])
+            if position < len(entries) and entries[position][2] is book:
+                del entries[position]
+        for book in added:
+            entry = self._entry(book)
+            if entry is not None:
+                insort(entries, entry)
+        return SortedIndex(self.field, entries)
+
+    def range(self, low: Any = None, high: Any = None) -> Tuple[int, int]:
+        """
+        Anahtarı [low, high] aralığındaki kayıtların konumlarını bulur.
+
+        Args:
+            low (Any): Alt sınır (dahil; None ise baştan)
+            high (Any): Üst sınır (dahil; None ise sona kadar)
+
+        Returns:
+            Tuple[int, int]: entries[start:stop] aralığı
+        """
+        start = 0 if low is None else bisect_left(self.entries, (sort_key(low),))
+        stop = len(self.entries) if high is None else \
+            bisect_left(self.entries, (sort_key(high), _AFTER_ALL), start)
+        return start, max(start, stop)
+
+    def prefix_range(self, prefix: str) -> Tuple[int, int]:
+        """Anahtarı prefix ile başlayan kayıtların konumlarını bulur."""
+        return self.range(*prefix_bounds(prefix))
+
+    def books(self, start: int, stop: int, descending: bool = False,
+              offset: int = 0, limit: Optional[int] = None) -> List[Book]:
+        """
+        entries[start:stop] aralığının istenen sayfasını döndürür.
+
+        Args:
+            start (int): Aralığın başı
+            stop (int): Aralığın sonu
+            descending (bool): Aralık sondan başa doğru mu okunsun
+            offset (int): Atlanacak kayıt sayısı
+            limit (Optional[int]): En fazla kayıt sayısı
+
+        Returns:
+            List[Book]: Sayfadaki kitaplar
+        """
+        count = stop - start if limit is None else min(limit, stop - start)
+        if descending:
+            first = stop - offset
+            last = max(first - count, start)
+            return [entry[2] for entry in reversed(self.entries[last:max(first, start)])]
+        first = start + offset
+        return [entry[2] for entry in self.entries[first:min(first + count, stop)]]
+
+
+def build_indexes(books: Sequence[Book]) -> Dict[str, SortedIndex]:
+    """
+    Tüm INDEXED_FIELDS için indeksleri baştan oluşturur.
+
+    Oluşturma sırasında çöp toplayıcı duraklatılır: milyonlarca yeni üçlü
+    aksi halde defalarca tam toplama tetikler ve süreyi neredeyse ikiye katlar.
+    """
+    paused = gc.isenabled()
+    if paused:
+        gc.disable()
+    try:
+        return {field: SortedIndex.build(field, books) for field in INDEXED_FIELDS}
+    finally:
+        if paused:
+            gc.enable()
+
+
+def update_indexes(indexes: Dict[str, SortedIndex], removed: Sequence[Book],
+                   added: Sequence[Book]) -> Dict[str, SortedIndex]:
+    """Tüm indeksleri değişikliklerle güncelleyen yeni bir sözlük döndürür."""
+    return {field: index.updated(removed, added) for field, index in indexes.items()}
+
+
+def query(books: Sequence[Book], indexes: Dict[str, SortedIndex],
+          conditions: Dict[str, Tuple[Any, Any]], sort: Optional[str] = None,
+          descending: bool = False, offset: int = 0,
+          limit: Optional[int] = None) -> Tuple[int, List[Book]]:
+    """
+    Koşullara uyan kitapların istenen sayfasını ve toplam sayısını döndürür.
+
+    Koşulların en seçicisi indeksten bisect ile aralık olarak alınır; diğer
+    koşullar bu aralıkta denetlenir. Sıralama alanı seçilen indeksle aynıysa
+    sonuç zaten sıralıdır; değilse yalnızca eşleşen kayıtlar sıralanır.
+    Koşul ve sıralama yoksa katalog sırası kullanılır.
+
+    Args:
+        books (Sequence[Book]): Kataloğun kitapları (katalog sırasıyla)
+        indexes (Dict[str, SortedIndex]): Alan -> indeks
+        conditions (Dict[str, Tuple[Any, Any]]): Alan -> dahil (alt, üst) sınırlar;
+            None sınır o yönde açık demektir
+        sort (Optional[str]): Sıralama alanı; verilmezse ilk koşulun alanı
+        descending (bool): Azalan sıralama
+        offset (int): Atlanacak kayıt sayısı
+        limit (Optional[int]): Sayfadaki en fazla kayıt sayısı
+
+    Returns:
+        Tuple[int, List[Book]]: Eşleşen toplam kayıt sayısı ve sayfa
+
+    Raises:
+        KeyError: Alan indekslenmemişse
+    """
+    if not conditions and sort is None:
+        total = len(books)
+        ordered = books[::-1] if descending else books
+        stop = total if limit is None else offset + limit
+        return total, list(ordered[offset:stop])
+
+    ranges = {field: indexes[field].range(low, high) for field, (low, high) in conditions.items()}
+    if sort is not None:
+        ranges.setdefault(sort, (0, len(indexes[sort])))
+    # En az kayıt içeren aralıktan başla
+    field = min(ranges, key=lambda name: ranges[name][1] - ranges[name][0])
+    start, stop = ranges[field]
+    others = [(name, sort_key(low), sort_key(high)) for name, (low, high) in conditions.items()
+              if name != field]
+    sort = sort or field
+
+    if not others and sort == field:
+        return stop - start, indexes[field].books(start, stop, descending, offset, limit)
+
+    matched = [entry[2] for entry in indexes[field].entries[start:stop]
+               if all(_matches(entry[2], name, low, high) for name, low, high in others)]
+    if sort != field:
+        matched = [book for book in matched if getattr(book, sort, None) is not None]
+        matched.sort(key=lambda book: (sort_key(getattr(book, sort)), book.isbn))
+    if descending:
+        matched.reverse()
+    end = len(matched) if limit is None else offset + limit
+    return len(matched), matched[offset:end]
+
+
+def _matches(book: Book, field: str, low: Any, high: Any) -> bool:
+    value = getattr(book, field, None)
+    if value is None:
+        return False
+    key = sort_key(value)
+    return (low is None or key >= low) and (high is None or key <= high)
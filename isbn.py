@@ -0,0 +1,165 @@
+"""
+Kütüphane Yönetim Sistemi - ISBN Yardımcıları
+
+Bu modül farklı yazımlardaki ISBN'lerin karşılaştırılabilmesi için
+kanonik biçimi üretir: tire ve boşluklar atılır, ISBN-10'lar 978 önekiyle
+ISBN-13'e çevrilir. Böylece "0-451-52493-4" ile "978-0451524935" aynı
+kitap olarak eşleşir.
+
+Toplu girdiler Open Library'ye gitmeden önce doğrulanır: validate_isbns
+büyük listelerde ayraçları attıktan sonra ISBN-10/13 kontrol hanelerini
+karakter kodlarından oluşan bir NumPy matrisi üzerinde, ISBN başına Python
+aritmetiği yapmadan denetler.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Bu sayıdan kısa listeler NumPy dizisine çevrilmeden tek tek doğrulanır
+VECTOR_MIN = 64
+
+_ISBN13_WEIGHTS = np.array([1, 3] * 6 + [1], dtype=np.int64)
+_ISBN10_WEIGHTS = np.arange(10, 0, -1, dtype=np.int64)
+_BOOKLAND = np.array([ord(ch) for ch in "978"], dtype=np.uint8)
+
+
+def _compact(isbn: str) -> str:
+    """Baştaki/sondaki boşlukları, tireleri ve aradaki boşlukları atar."""
+    return isbn.strip().replace("-", "").replace(" ", "")
+
+
+def isbn13_check_digit(first12: str) -> str:
+    """
+    ISBN-13'ün ilk 12 hanesinden kontrol hanesini hesaplar.
+
+    Args:
+        first12 (str): 12 haneli rakam dizisi
+
+    Returns:
+        str: Kontrol hanesi
+    """
+    total = sum(int(digit) * (3 if position % 2 else 1) for position, digit in enumerate(first12))
+    return str(-total % 10)
+
+
+def canonical_isbn(isbn: str) -> str:
+    """
+    ISBN'in karşılaştırma için kanonik biçimini döndürür. Geçerliliği
+    denetlemez; ISBN-10 gibi görünmeyen değerler yalnızca arındırılır.
+
+    Args:
+        isbn (str): Ham ISBN
+
+    Returns:
+        str: Tiresiz ISBN-13 (ya da arındırılmış değer)
+    """
+    # Çoğu ISBN yalnızca tire ve boşluk içerir; karakter karakter tarama son çaredir
+    compact = isbn.replace("-", "").replace(" ", "").upper()
+    if not compact.isalnum():
+        compact = "".join(ch for ch in compact if ch.isalnum())
+    if len(compact) == 10 and compact[:9].isdigit():
+        first12 = "978" + compact[:9]
+        return first12 + isbn13_check_digit(first12)
+    return compact
+
+
+def validate_isbn(isbn: str) -> Optional[str]:
+    """
+    ISBN'in uzunluğunu ve kontrol hanesini denetler.
+
+    Args:
+        isbn (str): Ham ISBN (tire ve boşluk içerebilir)
+
+    Returns:
+        Optional[str]: Geçerliyse tiresiz ISBN-13, değilse None
+    """
+    compact = _compact(isbn).upper()
+    if not compact.isascii():
+        return None
+    if len(compact) == 13 and compact.isdigit():
+        if compact[:3] in ("978", "979") and isbn13_check_digit(compact[:12]) == compact[12]:
+            return compact
+    elif len(compact) == 10 and compact[:9].isdigit() and (compact[9].isdigit() or compact[9] == "X"):
+        total = sum((10 - position) * (10 if ch == "X" else int(ch))
+                    for position, ch in enumerate(compact))
+        if total % 11 == 0:
+            first12 = "978" + compact[:9]
+            return first12 + isbn13_check_digit(first12)
+    return None
+
+
+def validate_isbns(isbns: Sequence[str]) -> List[Optional[str]]:
+    """
+    validate_isbn'in toplu girdiler için vektörel karşılığı. Ayraçlar
+    atıldıktan sonra ISBN'ler (n, 13) boyutlu bir karakter kodu matrisine
+    çevrilir; rakam denetimi, kontrol haneleri ve ISBN-10'dan ISBN-13'e
+    çevirme tüm satırlarda birlikte hesaplanır.
+
+    Args:
+        isbns (Sequence[str]): Ham ISBN'ler
+
+    Returns:
+        List[Optional[str]]: Sırasıyla tiresiz ISBN-13 ya da geçersizse None
+    """
+    count = len(isbns)
+    if count < VECTOR_MIN:
+        return [validate_isbn(isbn) for isbn in isbns]
+    compact = [_compact(isbn) for isbn in isbns]
+    sizes = np.fromiter(map(len, compact), dtype=np.int64, count=count)
+    if (sizes > 13).any():
+        # Sabit genişlikli dizi uzun değerleri sessizce keserdi; zaten geçersizler
+        compact = [isbn if size <= 13 else "" for isbn, size in zip(compact, sizes.tolist())]
+    codes = np.array(compact, dtype="U13").view(np.uint32).reshape(count, 13)
+
+    digits = codes.astype(np.int64) - ord("0")
+    is_digit = (digits >= 0) & (digits <= 9)
+    check_x = (codes[:, 9] == ord("X")) | (codes[:, 9] == ord("x"))
+
+    prefix = (codes[:, 0] == ord("9")) & (codes[:, 1] == ord("7")) & \
+        ((codes[:, 2] == ord("8")) | (codes[:, 2] == ord("9")))
+    valid13 = (sizes == 13) & is_digit.all(axis=1) & prefix & \
+        (digits @ _ISBN13_WEIGHTS % 10 == 0)
+
+    digits10 = np.where(is_digit[:, :10], digits[:, :10], 0)
+    digits10[:, 9] = np.where(check_x, 10, digits10[:, 9])
+    valid10 = (sizes == 10) & is_digit[:, :9].all(axis=1) & (is_digit[:, 9] | check_x) & \
+        (digits10 @ _ISBN10_WEIGHTS % 11 == 0)
+
+    # ISBN-13'ler zaten kanonik; yalnızca ISBN-10'lar için yeni metin üretilir
+    converted: Iterable[str] = ()
+    if valid10.any():
+        canonical = np.empty((int(valid10.sum()), 13), dtype=np.uint8)
+        canonical[:, :3] = _BOOKLAND
+        canonical[:, 3:12] = codes[valid10, :9]
+        # 978 önekinin ağırlıklı toplamı 9 + 7*3 + 8 = 38
+        total = 38 + digits[valid10, :9] @ _ISBN13_WEIGHTS[3:12]
+        canonical[:, 12] = ord("0") + (-total % 10)
+        converted = canonical.view("S13").ravel().astype("U13").tolist()
+    converted = iter(converted)
+    kinds = (valid13 + 2 * valid10.astype(np.int8)).tolist()
+    return [isbn if kind == 1 else next(converted) if kind == 2 else None
+            for isbn, kind in zip(compact, kinds)]
+
+
+def normalize_isbns(isbns: Iterable[str]) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Toplu girdiyi doğrular, kanonik ISBN-13'e çevirir ve tekrarları atar.
+
+    Args:
+        isbns (Iterable[str]): Ham ISBN'ler
+
+    Returns:
+        Tuple[Dict[str, str], List[str]]: Girdi sırasıyla kanonik ISBN -> ilk
+            yazımı ve geçersiz yazımlar
+    """
+    isbns = list(isbns)
+    unique: Dict[str, str] = {}
+    invalid: List[str] = []
+    for isbn, canonical in zip(isbns, validate_isbns(isbns)):
+        if canonical is None:
+            invalid.append(isbn)
+        else:
+            unique.setdefault(canonical, isbn)
+    return unique, invalid
@@ -0,0 +1,401 @@
+"""
+Kütüphane Yönetim Sistemi - Arka Plan Zenginleştirme İşleri
+
+Bu modül `POST /books` isteklerinin asenkron modunda kullanılan kalıcı iş
+kuyruğunu sağlar. İstek yalnızca ISBN'i doğrulayıp kuyruğa bir iş ekler ve
+hemen 202 döner; arka plandaki worker thread'leri Open Library'den bilgileri
+çekip kitabı ekler.
+
+Her durum değişikliği dosyaya tek bir JSON satırı olarak eklenir; dosya
+canlı iş sayısının birkaç katına ulaşınca atomik olarak yeniden yazılır
+(sıkıştırma). Uygulama yeniden başladığında bekleyen ve yarıda kalan işler
+tekrar kuyruğa alınır. Kuyruk tek bir sürece aittir: dosya bir kilitle
+korunur ve aynı dosyayı açmaya çalışan ikinci süreç JobQueueBusy alır.
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: süreçler arası kilit yok
+    fcntl = None
+
+from isbn import canonical_isbn
+from library import Library
+
+
+PENDING = "pending"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+FINAL_STATES = (SUCCEEDED, FAILED)
+
+# Günlükteki kayıt sayısı canlı işlerin bu katını aşınca dosya sıkıştırılır
+COMPACT_FACTOR = 2
+# Bu sayıdan az kayıt içeren günlük sıkıştırılmaz
+COMPACT_MIN_RECORDS = 1000
+
+
+class JobQueueBusy(RuntimeError):
+    """İş kuyruğu dosyası başka bir sürecin kuyruğu tarafından kullanılıyor."""
+
+
+class Job:
+    """Tek bir kitap ekleme işini temsil eden sınıf."""
+
+    def __init__(self, isbn: str, job_id: Optional[str] = None, status: str = PENDING,
+                 attempts: int = 0, error: Optional[str] = None, book: Optional[dict] = None,
+                 created_at: Optional[float] = None, updated_at: Optional[float] = None):
+        """
+        Job sınıfının constructor'ı.
+
+        Args:
+            isbn (str): Eklenecek kitabın ISBN numarası
+            job_id (Optional[str]): İş kimliği (verilmezse üretilir)
+            status (str): pending, running, succeeded veya failed
+            attempts (int): Yapılan deneme sayısı
+            error (Optional[str]): Başarısız işin hata mesajı
+            book (Optional[dict]): Başarılı işte eklenen kitap
+            created_at (Optional[float]): Oluşturulma zamanı (epoch saniye)
+            updated_at (Optional[float]): Son güncelleme zamanı (epoch saniye)
+        """
+        now = time.time()
+        self.id = job_id or uuid.uuid4().hex
+        self.isbn = isbn
+        self.status = status
+        self.attempts = attempts
+        self.error = error
+        self.book = book
+        self.created_at = created_at or now
+        self.updated_at = updated_at or now
+
+    def to_dict(self) -> dict:
+        """İşi dictionary'ye dönüştürür."""
+        return {
+            "id": self.id,
+            "isbn": self.isbn,
+            "status": self.status,
+            "attempts": self.attempts,
+            "error": self.error,
+            "book": self.book,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Job':
+        """Dictionary'den Job nesnesi oluşturur."""
+        return cls(
+            isbn=data["isbn"],
+            job_id=data["id"],
+            status=data.get("status", PENDING),
+            attempts=data.get("attempts", 0),
+            error=data.get("error"),
+            book=data.get("book"),
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
+        )
+
+
+class JobQueue:
+    """
+    Kalıcı, thread tabanlı iş kuyruğu.
+    Worker'lar işleri sırayla alıp Library.add_book ile işler.
+    """
+
+    def __init__(self, library: Library, filename: str, workers: int = 2,
+                 max_attempts: int = 3, retention: int = 1000):
+        """
+        JobQueue sınıfının constructor'ı.
+
+        Args:
+            library (Library): Kitapların ekleneceği Library
+            filename (str): Kuyruğun saklandığı dosya (her satır bir iş kaydı)
+            workers (int): Worker thread sayısı
+            max_attempts (int): Open Library kesintisinde bir işin en fazla deneme sayısı
+            retention (int): Durumu sorgulanabilsin diye saklanan tamamlanmış iş sayısı
+
+        Raises:
+            JobQueueBusy: Dosya başka bir sürecin kuyruğu tarafından kullanılıyorsa
+        """
+        self.library = library
+        self.filename = filename
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retention = retention
+        self.jobs: Dict[str, Job] = {}
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._threads: List[threading.Thread] = []
+        # Yeniden deneme zamanlayıcıları; çalışınca ya da iptal edilince çıkarılır
+        self._timers: Dict[str, threading.Timer] = {}
+        # Tamamlanma sırasıyla tamamlanmış işler (retention için)
+        self._finished: "deque[str]" = deque()
+        self._file = None
+        self._records = 0
+        self._stopping = False
+        self._lock_file = self._acquire_file_lock()
+        self._load()
+
+    def _acquire_file_lock(self):
+        """
+        Kuyruk dosyasını bu sürece ayırır. Kilit süreç başınadır (fcntl.lockf);
+        fork edilen worker'lara geçmez.
+        """
+        if fcntl is None:
+            return None
+        lock_file = open(f"{self.filename}.lock", 'a')
+        try:
+            fcntl.lockf(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            raise JobQueueBusy(f"İş kuyruğu dosyası başka bir süreç tarafından kullanılıyor: "
+                               f"{self.filename}")
+        return lock_file
+
+    def _load(self) -> None:
+        """
+        Kuyruğu dosyadan yükler; her iş için son kayıt geçerlidir. Yarıda kalan
+        işler yeniden bekleyen yapılır ve dosya sıkıştırılarak yeniden yazılır.
+        """
+        if not os.path.exists(self.filename):
+            return
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as file:
+                text = file.read()
+            if text.lstrip().startswith("["):
+                # Eski biçim: tek bir JSON dizisi
+                records = json.loads(text)
+            else:
+                records = []
+                for line in text.splitlines():
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        # Yazılırken yarıda kalmış son satır
+                        continue
+        except Exception as e:
+            print(f"İş kuyruğu yüklenirken hata oluştu: {e}")
+            return
+        for job_data in records:
+            job = Job.from_dict(job_data)
+            self.jobs[job.id] = job
+        finished = []
+        for job in self.jobs.values():
+            if job.status == RUNNING:
+                job.status = PENDING
+            if job.status == PENDING:
+                self._queue.put(job.id)
+            elif job.status in FINAL_STATES:
+                finished.append(job)
+        finished.sort(key=lambda job: job.updated_at)
+        self._finished.extend(job.id for job in finished)
+        self._trim()
+        with self._lock:
+            self._compact()
+        pending = self._queue.qsize()
+        if pending:
+            print(f"{pending} bekleyen iş kuyruğa yeniden alındı.")
+
+    def _trim(self) -> None:
+        """Saklama sınırını aşan en eski tamamlanmış işleri bırakır (kilit altında)."""
+        while len(self._finished) > self.retention:
+            self.jobs.pop(self._finished.popleft(), None)
+
+    def _write(self, job: Job) -> None:
+        """
+        İşin son durumunu dosyaya bir satır olarak ekler (kilit altında çağrılır).
+        Günlük canlı işlere göre çok büyüdüyse dosyayı sıkıştırır.
+        """
+        try:
+            if self._file is None:
+                self._file = open(self.filename, 'a', encoding='utf-8')
+            self._file.write(json.dumps(job.to_dict(), ensure_ascii=False) + "\n")
+            self._file.flush()
+            self._records += 1
+            if self._records > max(COMPACT_MIN_RECORDS, COMPACT_FACTOR * len(self.jobs)):
+                self._compact()
+        except Exception as e:
+            print(f"İş kuyruğu kaydedilirken hata oluştu: {e}")
+
+    def _compact(self) -> None:
+        """Dosyayı yalnızca canlı işlerin son durumlarıyla atomik olarak yeniden yazar."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        temp_filename = f"{self.filename}.tmp"
+        try:
+            with open(temp_filename, 'w', encoding='utf-8') as file:
+                file.writelines(json.dumps(job.to_dict(), ensure_ascii=False) + "\n"
+                                for job in self.jobs.values())
+            os.replace(temp_filename, self.filename)
+            self._records = len(self.jobs)
+        except Exception as e:
+            print(f"İş kuyruğu kaydedilirken hata oluştu: {e}")
+
+    def _update(self, job: Job, **changes) -> None:
+        """İşin alanlarını günceller, kaydını ekler ve bekleyenleri uyandırır."""
+        with self._lock:
+            was_final = job.status in FINAL_STATES
+            for key, value in changes.items():
+                setattr(job, key, value)
+            job.updated_at = time.time()
+            if job.status in FINAL_STATES and not was_final:
+                self._finished.append(job.id)
+                self._trim()
+            self._write(job)
+            self._changed.notify_all()
+
+    def submit(self, isbn: str) -> Job:
+        """
+        Yeni bir ekleme işi oluşturur. Aynı kitap için (başka bir yazımla da
+        olsa) bekleyen ya da çalışan bir iş varsa yenisi açılmaz, mevcut iş
+        döndürülür. Katalogda zaten bulunan kitaplar için iş sağlayıcılara
+        gitmeden başarısız olur (bkz. Library.add_book).
+
+        Args:
+            isbn (str): Eklenecek kitabın ISBN numarası
+
+        Returns:
+            Job: Kuyruktaki iş
+        """
+        key = canonical_isbn(isbn)
+        with self._lock:
+            for job in self.jobs.values():
+                if job.status not in FINAL_STATES and canonical_isbn(job.isbn) == key:
+                    return job
+            job = Job(isbn)
+            self.jobs[job.id] = job
+            self._write(job)
+        self._queue.put(job.id)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Kimliği verilen işi döndürür."""
+        return self.jobs.get(job_id)
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Job]:
+        """
+        İş tamamlanana kadar bekler.
+
+        Args:
+            job_id (str): İş kimliği
+            timeout (Optional[float]): En fazla bekleme süresi (saniye)
+
+        Returns:
+            Optional[Job]: İş (süre dolduysa son durumuyla), bilinmiyorsa None
+        """
+        with self._changed:
+            self._changed.wait_for(
+                lambda: job_id not in self.jobs or self.jobs[job_id].status in FINAL_STATES,
+                timeout=timeout,
+            )
+            return self.jobs.get(job_id)
+
+    def stats(self) -> dict:
+        """Duruma göre iş sayılarını döndürür."""
+        with self._lock:
+            counts = {state: 0 for state in (PENDING, RUNNING, SUCCEEDED, FAILED)}
+            for job in self.jobs.values():
+                counts[job.status] += 1
+        return counts
+
+    def _process(self, job: Job) -> None:
+        """Tek bir işi çalıştırır."""
+        self._update(job, status=RUNNING, attempts=job.attempts + 1)
+        try:
+            success = self.library.add_book(job.isbn)
+        except Exception as e:
+            self._update(job, status=FAILED, error=f"Beklenmeyen hata: {e}")
+            return
+
+        if success:
+            book = self.library.find_book(job.isbn)
+            self._update(job, status=SUCCEEDED, error=None,
+                         book=book.to_dict() if book else None)
+            return
+
+        retry_after = self.library.upstream.breaker.retry_after()
+        if retry_after > 0 and job.attempts < self.max_attempts and not self._stopping:
+            # Open Library kesintisi: devre kapanmaya aday olunca tekrar dene
+            self._update(job, status=PENDING,
+                         error="Open Library kullanılamıyor, tekrar denenecek.")
+            timer = threading.Timer(retry_after, self._retry, args=(job.id,))
+            timer.daemon = True
+            with self._lock:
+                self._timers[job.id] = timer
+            timer.start()
+            return
+
+        if self.library.find_equivalent(job.isbn):
+            error = f"ISBN {job.isbn} numaralı kitap zaten kütüphanede mevcut."
+        else:
+            error = f"ISBN {job.isbn} ile kitap bulunamadı veya API hatası oluştu."
+        self._update(job, status=FAILED, error=error)
+
+    def _retry(self, job_id: str) -> None:
+        """Zamanlayıcı dolunca işi yeniden kuyruğa alır ve zamanlayıcıyı bırakır."""
+        with self._lock:
+            self._timers.pop(job_id, None)
+        self._queue.put(job_id)
+
+    def _worker(self) -> None:
+        """Kuyruktan iş alıp işleyen worker döngüsü."""
+        while True:
+            job_id = self._queue.get()
+            if job_id is None:
+                return
+            job = self.jobs.get(job_id)
+            if job is not None and job.status == PENDING:
+                self._process(job)
+
+    def start(self) -> None:
+        """Worker thread'lerini başlatır."""
+        self._stopping = False
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"job-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Worker'ları durdurur. Çalışan işler tamamlanır; bekleyen işler dosyada
+        kalır ve bir sonraki başlatmada işlenir. Dosya kilidi bırakılır.
+
+        Args:
+            timeout (float): Her worker için en fazla bekleme süresi (saniye)
+        """
+        self._stopping = True
+        with self._lock:
+            timers = list(self._timers.values())
+            self._timers.clear()
+        for timer in timers:
+            timer.cancel()
+        # Bekleyen işleri kuyruktan boşalt; dosyada pending olarak kalırlar
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        if self._lock_file is not None:
+            # Kilidi bırak; dosya başka bir sürecin kuyruğu tarafından açılabilir
+            self._lock_file.close()
+            self._lock_file = None
@@ -1,8 +1,175 @@
 import json
 import os
-from typing import List, Optional
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 import httpx
+import analytics
 from book import Book
+import catalog_diff
+import indexes
+from isbn import canonical_isbn, validate_isbn, validate_isbns
+from openlibrary import OPENLIBRARY_URL, OpenLibraryClient
+from providers import OpenLibraryProvider, ProviderChain
+from replication import ChangeJournal, journal_filename
+from resilience import UpstreamUnavailable
+import metrics
+import tracing
+
+if TYPE_CHECKING:
+    from covers import CoverCache
+
+
+# apply_batch'te Open Library'den aynı anda bilgi çekilen kitap sayısı
+BATCH_FETCH_WORKERS = 8
+
+BATCH_OPERATIONS = ("add", "remove")
+
+# Değişiklik akışında (GET /changes) bellekte tutulan en fazla olay sayısı
+CHANGE_LOG_SIZE = 10_000
+
+# Katalog yüklendikten sonra oluşturulan ikincil yapılar: sıralı indeksler,
+# kanonik ISBN indeksi ve analitik sütunları
+SECONDARY_INDEXES = ("sorted", "canonical", "columns")
+
+# İkincil indeks arka planda oluşturulurken bu boyuta kadar kataloglarda
+# sorgu için gereken indeks istek içinde geçici olarak oluşturulur
+INDEX_FALLBACK_LIMIT = 50_000
+
+
+class ReadOnlyError(RuntimeError):
+    """Salt okunur (takipçi) bir kütüphanede değişiklik denendiğinde fırlatılır."""
+
+
+class IndexNotReady(RuntimeError):
+    """
+    Sorgunun gerektirdiği ikincil indeks arka planda oluşturulurken ve
+    katalog istek içinde taranamayacak kadar büyükken fırlatılır.
+    """
+    
+    def __init__(self, index: str):
+        super().__init__(f"'{index}' indeksi henüz hazır değil; katalog açılışta indeksleniyor.")
+        self.index = index
+
+
+class FrozenBookList(list):
+    """
+    Değiştirilemeyen kitap listesi. Snapshot'ların okuyuculara açtığı
+    görünümdür; değiştiren her list metodu TypeError fırlatır.
+    """
+    
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Katalog snapshot'ı değiştirilemez; Library metotlarını kullanın.")
+    
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+
+
+class CatalogSnapshot:
+    """
+    Kataloğun belirli bir andaki değişmez görüntüsü: kitap listesi, ISBN
+    indeksi ve sıralı ikincil indeksler. Yazarlar yeni bir snapshot
+    oluşturup tek atamayla yayınlar; okuyucular kilit almadan her zaman
+    birbiriyle tutarlı bir liste ve indeksler görür. Sıralı indeksler arka
+    planda oluşturuluyorsa indexes hazır olana kadar None'dır.
+    """
+    
+    __slots__ = ("books", "by_isbn", "seq", "indexes", "columns", "by_canonical")
+    
+    def __init__(self, books: Iterable[Book], by_isbn: Optional[Dict[str, Book]] = None,
+                 seq: int = 0, sorted_indexes: Optional[Dict[str, "indexes.SortedIndex"]] = None,
+                 defer_indexes: bool = False):
+        """
+        CatalogSnapshot sınıfının constructor'ı.
+        
+        Args:
+            books (Iterable[Book]): Snapshot'taki kitaplar (sırasıyla)
+            by_isbn (Optional[Dict[str, Book]]): ISBN -> Book indeksi; verilmezse
+                kitaplardan oluşturulur. Snapshot'a devredilir, sonradan değiştirilmemelidir
+            seq (int): Snapshot'a dahil son değişiklik olayının sıra numarası
+            sorted_indexes (Optional[Dict[str, SortedIndex]]): Alan -> sıralı indeks;
+                verilmezse kitaplardan oluşturulur
+            defer_indexes (bool): Sıralı indeksler oluşturulmaz; Library'nin arka
+                plan thread'i hazır olunca ekler
+        """
+        self.books = FrozenBookList(books)
+        if by_isbn is None:
+            by_isbn = {book.isbn: book for book in self.books}
+        self.by_isbn: Mapping[str, Book] = MappingProxyType(by_isbn)
+        self.seq = seq
+        self.indexes: Optional[Mapping[str, indexes.SortedIndex]] = None
+        if not defer_indexes:
+            if sorted_indexes is None:
+                sorted_indexes = indexes.build_indexes(self.books)
+            self.indexes = MappingProxyType(sorted_indexes)
+        # Analitik için sütunsal depo; ilk istekte oluşturulur (bkz. analytics.column_store),
+        # sonraki snapshot'lara Library tarafından artımlı taşınır
+        self.columns = None
+        # Kanonik ISBN -> Book; get_many'de ilk kez gerektiğinde oluşturulur
+        self.by_canonical: Optional[Dict[str, Book]] = None
+
+
+def _canonical_index(snapshot: CatalogSnapshot) -> Dict[str, Book]:
+    """Snapshot'ın kanonik ISBN indeksini döndürür; ilk çağrıda oluşturur."""
+    by_canonical = snapshot.by_canonical
+    if by_canonical is None:
+        by_canonical = {}
+        for book in snapshot.books:
+            by_canonical.setdefault(canonical_isbn(book.isbn), book)
+        # Eşzamanlı iki istek aynı indeksi oluşturabilir; sonuç aynıdır
+        snapshot.by_canonical = by_canonical
+    return by_canonical
+
+
+def _net_changes(changes: List[tuple]) -> Tuple[List[Book], List[Book]]:
+    """
+    Değişikliklerin net (silinen, eklenen) kitapları. Aynı değişiklik
+    listesinde eklenip silinen kitaplar ikisinde de yer almaz.
+    """
+    added: Dict[int, Book] = {}
+    removed: List[Book] = []
+    for op, book in changes:
+        if op == "add":
+            added[id(book)] = book
+        elif added.pop(id(book), None) is None:
+            removed.append(book)
+    return removed, list(added.values())
+
+
+def _updated_sorted(sorted_indexes: Mapping[str, "indexes.SortedIndex"],
+                    changes: List[tuple]) -> Dict[str, "indexes.SortedIndex"]:
+    """Sıralı indekslerin değişiklikler uygulanmış kopyası."""
+    removed, added = _net_changes(changes)
+    return indexes.update_indexes(dict(sorted_indexes), removed, added)
+
+
+def _updated_columns(columns: Optional[analytics.ColumnStore],
+                     changes: List[tuple]) -> Optional[analytics.ColumnStore]:
+    """
+    Analitik sütunlarının değişiklikler uygulanmış kopyası. Sütunlar henüz
+    oluşturulmadıysa ya da değişiklik sayısı indexes.INCREMENTAL_LIMIT'i
+    aşıyorsa None döner; depo ilk analitik isteğinde baştan oluşturulur.
+    """
+    if columns is None or len(changes) > indexes.INCREMENTAL_LIMIT:
+        return None
+    removed, added = _net_changes(changes)
+    return columns.updated(added, removed)
+
+
+def _updated_canonical(by_canonical: Dict[str, Book], changes: List[tuple]) -> Dict[str, Book]:
+    """Kanonik ISBN indeksinin değişiklikler uygulanmış kopyası."""
+    by_canonical = by_canonical.copy()
+    for op, book in changes:
+        key = canonical_isbn(book.isbn)
+        if op == "add":
+            by_canonical.setdefault(key, book)
+        elif by_canonical.get(key) is book:
+            del by_canonical[key]
+    return by_canonical
 
 
 class Library:
@@ -11,20 +178,86 @@ class Library:
     Kitap ekleme, silme, listeleme ve dosya işlemlerini yönetir.
     """
     
-    def __init__(self, filename: str = "library.json"):
+    def __init__(self, filename: str = "library.json",
+                 base_url: str = OPENLIBRARY_URL,
+                 upstream: Optional[OpenLibraryClient] = None,
+                 read_only: bool = False, journal: bool = False,
+                 covers: Optional["CoverCache"] = None,
+                 providers: Optional[ProviderChain] = None,
+                 background_indexes: bool = False):
         """
         Library sınıfının constructor'ı.
         
         Args:
             filename (str): Verilerin saklanacağı JSON dosyasının adı
+            base_url (str): Open Library API'sinin (veya yerel taklidinin) kök adresi
+            upstream (Optional[OpenLibraryClient]): Paylaşılan Open Library istemcisi;
+                verilirse base_url yerine onun adresi kullanılır
+            read_only (bool): Takipçi modu; değişiklikler ReadOnlyError fırlatır,
+                dosyaya yazılmaz
+            journal (bool): Değişiklikler takipçiler için <filename>.journal
+                dosyasına da yazılsın mı
+            covers (Optional[CoverCache]): Verilirse add_book eklenen kitabın
+                kapağını arka planda önbelleğe çeker
+            providers (Optional[ProviderChain]): Kitap bilgisi sağlayıcı zinciri;
+                verilmezse yalnızca upstream üzerinden Open Library kullanılır
+            background_indexes (bool): Katalog yüklenince ikincil yapılar
+                (SECONDARY_INDEXES) arka plan thread'inde oluşturulur; bu sırada
+                ISBN aramaları hemen yanıtlanır
         """
         self.filename = filename
-        self.books: List[Book] = []
+        self.upstream = upstream or OpenLibraryClient(base_url)
+        self.read_only = read_only
+        self.covers = covers
+        self.providers = providers or ProviderChain([OpenLibraryProvider(self.upstream)])
+        self._journal = (ChangeJournal(journal_filename(filename))
+                         if journal and not read_only else None)
+        # Kitaplar ve ISBN indeksi; her değişiklikte yenisi yayınlanır
+        self._snapshot = CatalogSnapshot([])
+        # Yazarları (değişiklikleri) sıralar; okuyucular kilit almaz
+        self._lock = threading.RLock()
+        # Ekleme/silme olayları; seq her olayda bir artar
+        self._seq = 0
+        self._changes: deque = deque(maxlen=CHANGE_LOG_SIZE)
+        self._changed = threading.Condition()
+        self.background_indexes = background_indexes
+        # İkincil yapıların son tam oluşturulma süreleri (saniye)
+        self._index_seconds: Dict[str, float] = {}
+        self._warm_up: Optional[threading.Thread] = None
+        # İndeksler arka planda oluşturulurken yayınlanan değişiklikler; katalog
+        # baştan yüklenince yeni bir listeyle değiştirilir
+        self._deferred: List[tuple] = []
         self.load_books()
     
+    @property
+    def books(self) -> List[Book]:
+        """Güncel snapshot'taki kitaplar (değiştirilemez liste)."""
+        return self._snapshot.books
+    
+    def snapshot(self) -> CatalogSnapshot:
+        """
+        Kataloğun güncel snapshot'ını döndürür. Birden çok okuma aynı
+        snapshot üzerinden yapılırsa arada yapılan değişiklikler görülmez.
+        
+        Returns:
+            CatalogSnapshot: Kitaplar ve ISBN indeksi
+        """
+        return self._snapshot
+    
+    @property
+    def base_url(self) -> str:
+        """Open Library API'sinin kök adresi."""
+        return self.upstream.base_url
+    
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        self.upstream.base_url = value.rstrip("/")
+    
     def add_book(self, isbn: str) -> bool:
         """
-        ISBN numarası kullanarak Open Library API'sinden kitap bilgilerini çeker ve kütüphaneye ekler.
+        ISBN numarası kullanarak kitap bilgilerini sağlayıcı zincirinden (varsayılan:
+        Open Library API'si) çeker ve kütüphaneye ekler. Uzunluğu ya da kontrol
+        hanesi hatalı ISBN'ler için sağlayıcılara gidilmez.
         
         Args:
             isbn (str): Eklenecek kitabın ISBN numarası
@@ -32,64 +265,240 @@ class Library:
         Returns:
             bool: İşlem başarılıysa True, başarısızsa False
         """
-        try:
-            # Önce kitabın zaten kütüphanede olup olmadığını kontrol et
-            if self.find_book(isbn):
-                print(f"ISBN {isbn} numaralı kitap zaten kütüphanede mevcut.")
+        self._check_writable()
+        with tracing.span("library.add_book", isbn=isbn):
+            if validate_isbn(isbn) is None:
+                print(f"Geçersiz ISBN: {isbn} (uzunluk ya da kontrol hanesi hatalı).")
                 return False
+            try:
+                # Önce kitabın (başka bir yazımla da olsa) kütüphanede olup olmadığını kontrol et
+                if self.find_equivalent(isbn):
+                    print(f"ISBN {isbn} numaralı kitap zaten kütüphanede mevcut.")
+                    return False
             
-            # Open Library API'sinden kitap bilgilerini çek
-            url = f"https://openlibrary.org/isbn/{isbn}.json"
-            
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(url)
-                
-                if response.status_code == 404:
+                # Kitap bilgilerini sağlayıcı zincirinden (önbellek, döküm, Open Library) çek
+                book = self.providers.lookup(isbn)
+                if book is None:
                     print(f"ISBN {isbn} ile kitap bulunamadı.")
                     return False
                 
-                response.raise_for_status()
-                book_data = response.json()
-                
-                # Kitap bilgilerini ayıkla
-                title = book_data.get("title", "Bilinmeyen Başlık")
-                
-                # Yazar bilgisini al
-                authors = book_data.get("authors", [])
-                if authors:
-                    # İlk yazarın bilgilerini al
-                    author_key = authors[0].get("key", "")
-                    if author_key:
-                        # Yazarın tam adını al
-                        author_url = f"https://openlibrary.org{author_key}.json"
-                        author_response = client.get(author_url)
-                        if author_response.status_code == 200:
-                            author_data = author_response.json()
-                            author = author_data.get("name", "Bilinmeyen Yazar")
-                        else:
-                            author = "Bilinmeyen Yazar"
-                    else:
-                        author = "Bilinmeyen Yazar"
-                else:
-                    author = "Bilinmeyen Yazar"
-                
-                # Yeni kitap nesnesi oluştur ve ekle
-                book = Book(title=title, author=author, isbn=isbn)
-                self.books.append(book)
-                self.save_books()
+                # Yeni kitabı ekle; istek sürerken başka bir thread aynı
+                # kitabı eklemiş olabilir
+                with self._lock:
+                    if self.find_equivalent(isbn):
+                        print(f"ISBN {isbn} numaralı kitap zaten kütüphanede mevcut.")
+                        return False
+                    self._append(book)
+                    self.save_books()
                 
                 print(f"Kitap başarıyla eklendi: {book}")
+                if self.covers is not None:
+                    self.covers.prefetch(isbn)
                 return True
                 
-        except httpx.RequestError as e:
-            print(f"API isteğinde hata oluştu: {e}")
-            return False
-        except httpx.HTTPStatusError as e:
-            print(f"HTTP hatası: {e}")
-            return False
+            except UpstreamUnavailable as e:
+                print(f"Open Library şu anda kullanılamıyor: {e}")
+                return False
+            except httpx.RequestError as e:
+                print(f"API isteğinde hata oluştu: {e}")
+                return False
+            except httpx.HTTPStatusError as e:
+                print(f"HTTP hatası: {e}")
+                return False
+            except Exception as e:
+                print(f"Beklenmeyen hata oluştu: {e}")
+                return False
+    
+    def _publish(self, books: Iterable[Book], by_isbn: Dict[str, Book],
+                 changes: Iterable[tuple] = (), rebuild: bool = False) -> None:
+        """
+        Yeni snapshot'ı tek atamayla yayınlar ve değişiklikleri olay olarak
+        kaydeder (kilit altında çağrılır). Okuyucular ya eski ya yeni
+        snapshot'ı görür, ikisinin karışımını değil. Sıralı indeksler
+        önceki snapshot'ınkilerden değişikliklerle güncellenir; kanonik ISBN
+        indeksi ve analitik sütunları da önceki snapshot'ta oluşturulmuşsa
+        aynı şekilde taşınır.
+        İndeksler arka planda oluşturuluyorsa yeni snapshot da onları bekler;
+        değişiklikler oluşturma bitince uygulanmak üzere biriktirilir.
+        
+        Args:
+            books (Iterable[Book]): Yeni snapshot'ın kitapları
+            by_isbn (Dict[str, Book]): Yeni snapshot'ın ISBN indeksi
+            changes (Iterable[tuple]): Sırayla ("add" | "remove", Book) çiftleri
+            rebuild (bool): Katalog bütünüyle değiştiyse indeksler baştan oluşturulur
+                (books bu durumda liste olmalıdır)
+        """
+        now = time.time()
+        changes = list(changes)
+        columns = None
+        if rebuild:
+            sorted_indexes = self._fresh_indexes(books)
+        else:
+            sorted_indexes = self._updated_indexes(changes)
+            columns = _updated_columns(self._snapshot.columns, changes)
+        with self._changed:
+            events = []
+            for op, book in changes:
+                self._seq += 1
+                event = {"seq": self._seq, "op": op, "isbn": book.isbn, "time": now}
+                if op == "add":
+                    event["book"] = book.to_dict()
+                events.append(event)
+            self._changes.extend(events)
+            by_canonical = self._snapshot.by_canonical
+            self._snapshot = CatalogSnapshot(books, by_isbn, self._seq, sorted_indexes,
+                                             defer_indexes=sorted_indexes is None)
+            if by_canonical is not None and not rebuild:
+                self._snapshot.by_canonical = _updated_canonical(by_canonical, changes)
+            self._snapshot.columns = columns
+            self._changed.notify_all()
+        if sorted_indexes is None:
+            if rebuild:
+                self._deferred = []
+            else:
+                self._deferred.extend(changes)
+            self._start_warm_up()
+        if self._journal is not None:
+            self._journal.append(events)
+    
+    def _fresh_indexes(self, books: List[Book]) -> Optional[Dict[str, "indexes.SortedIndex"]]:
+        """
+        Baştan yüklenen katalog için sıralı indeksleri oluşturur; arka planda
+        oluşturulacaklarsa None döner.
+        """
+        if self.background_indexes:
+            return None
+        return self._build_index("sorted", indexes.build_indexes, books)
+    
+    def _build_index(self, name: str, build, *args) -> Any:
+        """build(*args) ile bir ikincil yapıyı oluşturur ve süresini kaydeder."""
+        start = time.perf_counter()
+        result = build(*args)
+        seconds = time.perf_counter() - start
+        self._index_seconds[name] = seconds
+        metrics.INDEX_BUILD_DURATION.labels(name).observe(seconds)
+        return result
+    
+    def _start_warm_up(self) -> None:
+        """İkincil yapıları oluşturan arka plan thread'ini başlatır (kilit altında çağrılır)."""
+        if self._warm_up is None:
+            self._warm_up = threading.Thread(target=self._warm_indexes, name="index-warm-up",
+                                             daemon=True)
+            self._warm_up.start()
+    
+    def _warm_indexes(self) -> None:
+        """
+        Güncel snapshot'ın ikincil yapılarını oluşturur. Oluşturma sırasında
+        yayınlanan değişiklikler iş atılmadan sonradan uygulanır: birikenler
+        önce kilitsiz, son INCREMENTAL_LIMIT kadarı kilit altında işlenir ve
+        indeksler o anki snapshot'a eklenir; sonraki yazmalar onları artımlı
+        günceller. Yalnızca katalog baştan yüklenirse oluşturma yeniden başlar.
+        """
+        try:
+            while True:
+                with self._lock:
+                    snapshot = self._snapshot
+                    deferred = self._deferred = []
+                sorted_indexes = self._build_index("sorted", indexes.build_indexes, snapshot.books)
+                by_canonical = self._build_index("canonical", _canonical_index, snapshot)
+                columns = self._build_index("columns", analytics.column_store, snapshot)
+                applied = 0
+                while True:
+                    with self._lock:
+                        if self._deferred is not deferred:
+                            break
+                        pending = deferred[applied:]
+                        if len(pending) <= indexes.INCREMENTAL_LIMIT:
+                            current = self._snapshot
+                            current.indexes = MappingProxyType(
+                                _updated_sorted(sorted_indexes, pending))
+                            if current.by_canonical is None:
+                                current.by_canonical = _updated_canonical(by_canonical, pending)
+                            if current.columns is None:
+                                current.columns = _updated_columns(columns, pending)
+                            self._deferred = []
+                            self._warm_up = None
+                            return
+                    sorted_indexes = _updated_sorted(sorted_indexes, pending)
+                    by_canonical = _updated_canonical(by_canonical, pending)
+                    columns = _updated_columns(columns, pending)
+                    applied += len(pending)
         except Exception as e:
-            print(f"Beklenmeyen hata oluştu: {e}")
-            return False
+            print(f"İndeksler oluşturulurken hata oluştu: {e}")
+            with self._lock:
+                self._warm_up = None
+    
+    def index_status(self) -> dict:
+        """
+        İkincil yapıların hazır olma durumunu ve oluşturulma sürelerini döndürür.
+        
+        Sıralı indeksler bir kez oluşturulduktan sonra yazmalarla artımlı
+        güncellenir. Kanonik ISBN indeksi ve analitik sütunları güncel
+        snapshot için henüz oluşturulmadıysa ilk istekte oluşturulur; ready
+        yalnızca arka planda bekleyen bir oluşturma olup olmadığını gösterir.
+        
+        Returns:
+            dict: ready, kitap sayısı ve yapı başına {"ready", "seconds"}
+        """
+        snapshot = self._snapshot
+        built = {
+            "sorted": snapshot.indexes is not None,
+            "canonical": snapshot.by_canonical is not None,
+            "columns": snapshot.columns is not None,
+        }
+        return {
+            "ready": self._warm_up is None and built["sorted"],
+            "books": len(snapshot.books),
+            "indexes": {name: {"ready": built[name], "seconds": self._index_seconds.get(name)}
+                        for name in SECONDARY_INDEXES},
+        }
+    
+    def wait_for_indexes(self, timeout: Optional[float] = None) -> bool:
+        """
+        Arka planda oluşturulan ikincil yapıları bekler.
+        
+        Args:
+            timeout (Optional[float]): En fazla bekleme süresi (saniye)
+        
+        Returns:
+            bool: Yapılar hazırsa True
+        """
+        warm_up = self._warm_up
+        if warm_up is not None:
+            warm_up.join(timeout)
+        return self.index_status()["ready"]
+    
+    def _updated_indexes(self, changes: List[tuple]) -> Optional[Dict[str, "indexes.SortedIndex"]]:
+        """
+        Güncel snapshot'ın sıralı indekslerine değişiklikleri uygular. Aynı
+        işlemde eklenip silinen kitaplar indekse hiç girmez.
+        
+        Args:
+            changes (List[tuple]): Sırayla ("add" | "remove", Book) çiftleri
+        
+        Returns:
+            Optional[Dict[str, SortedIndex]]: Yeni indeksler; indeksler arka
+                planda oluşturuluyorsa None
+        """
+        if self._snapshot.indexes is None:
+            return None
+        return _updated_sorted(self._snapshot.indexes, changes)
+    
+    def _check_writable(self) -> None:
+        """
+        Raises:
+            ReadOnlyError: Kütüphane salt okunursa
+        """
+        if self.read_only:
+            raise ReadOnlyError("Bu kütüphane salt okunur bir takipçidir; değişiklikler "
+                                "birincil sunucuya gönderilmelidir.")
+    
+    def _append(self, book: Book) -> None:
+        """Kitabı ekleyen yeni bir snapshot yayınlar (kilit altında çağrılır)."""
+        snapshot = self._snapshot
+        by_isbn = snapshot.by_isbn.copy()
+        by_isbn[book.isbn] = book
+        self._publish(chain(snapshot.books, (book,)), by_isbn, [("add", book)])
     
     def add_book_manual(self, book: Book) -> bool:
         """
@@ -101,16 +510,205 @@ class Library:
         Returns:
             bool: İşlem başarılıysa True, başarısızsa False
         """
-        # Kitabın zaten var olup olmadığını kontrol et
-        if self.find_book(book.isbn):
-            print(f"ISBN {book.isbn} numaralı kitap zaten mevcut.")
-            return False
-        
-        self.books.append(book)
-        self.save_books()
+        self._check_writable()
+        with self._lock:
+            # Kitabın zaten var olup olmadığını kontrol et
+            if self.find_book(book.isbn):
+                print(f"ISBN {book.isbn} numaralı kitap zaten mevcut.")
+                return False
+            
+            self._append(book)
+            self.save_books()
         print(f"Kitap başarıyla eklendi: {book}")
         return True
     
+    def add_books(self, books: Iterable[Book]) -> int:
+        """
+        Birden çok kitabı tek seferde ekler ve dosyayı yalnızca bir kez kaydeder.
+        Kütüphanede zaten bulunan ISBN'ler atlanır.
+        
+        Args:
+            books (Iterable[Book]): Eklenecek Book nesneleri
+        
+        Returns:
+            int: Eklenen kitap sayısı
+        """
+        self._check_writable()
+        with self._lock:
+            snapshot = self._snapshot
+            by_isbn = snapshot.by_isbn.copy()
+            added: List[Book] = []
+            for book in books:
+                if book.isbn in by_isbn:
+                    continue
+                by_isbn[book.isbn] = book
+                added.append(book)
+            if added:
+                self._publish(chain(snapshot.books, added), by_isbn,
+                              [("add", book) for book in added])
+                self.save_books()
+        return len(added)
+    
+    def apply_batch(self, operations: List[dict]) -> List[dict]:
+        """
+        Ekleme ve silme işlemlerini tek kilit altında sırayla uygular,
+        sonucu tek bir snapshot olarak yayınlar ve kataloğu yalnızca bir kez
+        kaydeder. Okuyucular toplu işlemin yarısını hiçbir zaman görmez.
+        
+        Her işlem {"op": "add" | "remove", "isbn": ...} biçimindedir. Ekleme
+        işleminde "title" ve "author" verilirse Open Library'ye gidilmez
+        (isteğe bağlı alanlar da işlemden alınır); verilmezse bilgiler kilit
+        alınmadan önce eşzamanlı olarak çekilir.
+        
+        Eklenecek tüm ISBN'ler (bilgisi verilmiş olanlar dahil) önce toplu
+        olarak doğrulanır (bkz. isbn.validate_isbns); geçersizler "invalid"
+        olur. Kanonik ISBN-13'ü aynı olan yazımlar (tireli, ISBN-10) bir kez
+        çekilir; katalogda ya da aynı işlemde başka bir yazımla eklenmiş
+        kitaplar "exists" olur.
+        
+        Args:
+            operations (List[dict]): Uygulanacak işlemler
+        
+        Returns:
+            List[dict]: Her işlem için sırayla {"index", "op", "isbn", "success",
+                "status", "detail"} ve başarılı eklemelerde "book"
+        """
+        self._check_writable()
+        with tracing.span("library.apply_batch", operations=len(operations)):
+            results: List[dict] = []
+            for index, operation in enumerate(operations):
+                op = operation.get("op")
+                isbn = str(operation.get("isbn") or "").strip()
+                result = {"index": index, "op": op, "isbn": isbn,
+                          "success": False, "status": "invalid", "detail": None}
+                if op not in BATCH_OPERATIONS:
+                    result["detail"] = f"Bilinmeyen işlem: {op}"
+                elif not isbn:
+                    result["detail"] = "ISBN numarası boş olamaz."
+                else:
+                    result["status"] = "pending"
+                results.append(result)
+            
+            # Kilit dışında: eklenecek ISBN'leri doğrulayıp eksik bilgileri eşzamanlı çek
+            adds = [result for result in results
+                    if result["status"] == "pending" and result["op"] == "add"]
+            # İşlem sırası -> kanonik ISBN; kanonik ISBN -> çekilecek ilk yazım
+            canonical: Dict[int, str] = {}
+            to_fetch: Dict[str, str] = {}
+            manual: Dict[int, Book] = {}
+            if adds:
+                snapshot = self._snapshot
+                catalog = _canonical_index(snapshot)
+                # Aynı işlemde önce silinip yeniden eklenen kitaplar da çekilmeli
+                removed_at: Dict[str, int] = {}
+                for result in results:
+                    if result["status"] == "pending" and result["op"] == "remove":
+                        book = snapshot.by_isbn.get(result["isbn"])
+                        if book is not None:
+                            removed_at.setdefault(canonical_isbn(book.isbn), result["index"])
+                for result, key in zip(adds, validate_isbns([r["isbn"] for r in adds])):
+                    if key is None:
+                        result["detail"] = (f"Geçersiz ISBN: {result['isbn']} "
+                                            f"(uzunluk ya da kontrol hanesi hatalı).")
+                        result["status"] = "invalid"
+                        continue
+                    index = result["index"]
+                    canonical[index] = key
+                    operation = operations[index]
+                    if operation.get("title") and operation.get("author"):
+                        manual[index] = Book.from_dict(dict(operation, isbn=result["isbn"]))
+                    elif key not in catalog or removed_at.get(key, len(results)) < index:
+                        to_fetch.setdefault(key, result["isbn"])
+            fetched = self._fetch_books(sorted(to_fetch.values())) if to_fetch else {}
+            
+            with self._lock:
+                snapshot = self._snapshot
+                by_isbn = snapshot.by_isbn.copy()
+                catalog = _canonical_index(snapshot) if canonical else {}
+                added_by_key: Dict[str, Book] = {}
+                added: List[Book] = []
+                removed = set()
+                changes: List[tuple] = []
+                for result in results:
+                    if result["status"] != "pending":
+                        continue
+                    isbn = result["isbn"]
+                    existing = by_isbn.get(isbn)
+                    if result["op"] == "remove":
+                        if existing is None:
+                            result.update(status="not_found",
+                                          detail=f"ISBN {isbn} numaralı kitap bulunamadı.")
+                            continue
+                        del by_isbn[isbn]
+                        removed.add(id(existing))
+                        changes.append(("remove", existing))
+                        result.update(success=True, status="removed")
+                        continue
+                    
+                    key = canonical.get(result["index"])
+                    if existing is None and key is not None:
+                        # Aynı kitap başka bir yazımla katalogda ya da bu işlemde eklenmiş olabilir
+                        candidate = added_by_key.get(key) or catalog.get(key)
+                        if candidate is not None and by_isbn.get(candidate.isbn) is candidate:
+                            existing = candidate
+                    if existing is not None:
+                        result.update(status="exists",
+                                      detail=f"ISBN {isbn} numaralı kitap zaten kütüphanede mevcut.")
+                        continue
+                    book = manual.get(result["index"])
+                    if book is None:
+                        spelling = to_fetch.setdefault(key, isbn)
+                        if spelling not in fetched:
+                            # Çekim öncesi katalogdaydı, kilit alınana kadar silinmiş
+                            fetched.update(self._fetch_books([spelling]))
+                        book, error = fetched[spelling]
+                        if book is None:
+                            result.update(status="error" if error else "not_found",
+                                          detail=error or f"ISBN {isbn} ile kitap bulunamadı.")
+                            continue
+                    by_isbn[isbn] = book
+                    added_by_key[key] = book
+                    added.append(book)
+                    changes.append(("add", book))
+                    result.update(success=True, status="added", book=book.to_dict())
+                
+                if added or removed:
+                    # Tüm silmeler için listeyi tek geçişte yeniden oluştur
+                    books = chain(snapshot.books, added)
+                    if removed:
+                        books = [book for book in books if id(book) not in removed]
+                    self._publish(books, by_isbn, changes)
+                    self.save_books()
+            
+            applied = sum(1 for result in results if result["success"])
+            print(f"Toplu işlem tamamlandı: {applied}/{len(results)} işlem uygulandı.")
+            return results
+    
+    def _fetch_books(self, isbns: List[str]) -> Dict[str, tuple]:
+        """
+        Birden çok kitabın bilgilerini sağlayıcı zincirinden eşzamanlı çeker.
+        Open Library istekleri tek bir HTTP istemcisini paylaşır ve paylaşılan
+        hız sınırlayıcı ile devre kesiciden geçer.
+        
+        Args:
+            isbns (List[str]): Bilgileri çekilecek ISBN'ler
+        
+        Returns:
+            Dict[str, tuple]: ISBN -> (Book ya da None, hata mesajı ya da None)
+        """
+        def fetch(sessions: dict, isbn: str) -> tuple:
+            try:
+                return self.providers.lookup(isbn, sessions), None
+            except UpstreamUnavailable as e:
+                return None, f"Open Library şu anda kullanılamıyor: {e}"
+            except httpx.HTTPError as e:
+                return None, f"API isteğinde hata oluştu: {e}"
+        
+        with self.providers.session() as sessions, \
+                ThreadPoolExecutor(min(BATCH_FETCH_WORKERS, len(isbns))) as pool:
+            outcomes = pool.map(lambda isbn: fetch(sessions, isbn), isbns)
+            return dict(zip(isbns, outcomes))
+    
     def remove_book(self, isbn: str) -> bool:
         """
         ISBN numarasına göre kitabı kütüphaneden siler.
@@ -121,10 +719,17 @@ class Library:
         Returns:
             bool: İşlem başarılıysa True, başarısızsa False
         """
-        book = self.find_book(isbn)
+        self._check_writable()
+        with self._lock:
+            book = self.find_book(isbn)
+            if book:
+                snapshot = self._snapshot
+                by_isbn = snapshot.by_isbn.copy()
+                del by_isbn[isbn]
+                self._publish((b for b in snapshot.books if b is not book), by_isbn,
+                              [("remove", book)])
+                self.save_books()
         if book:
-            self.books.remove(book)
-            self.save_books()
             print(f"Kitap başarıyla silindi: {book}")
             return True
         else:
@@ -138,15 +743,16 @@ class Library:
         Returns:
             List[Book]: Kütüphanedeki tüm kitapların listesi
         """
-        if not self.books:
+        books = self._snapshot.books
+        if not books:
             print("Kütüphanede hiç kitap bulunmuyor.")
             return []
         
         print("\n=== KÜTÜPHANE KİTAP LİSTESİ ===")
-        for i, book in enumerate(self.books, 1):
+        for i, book in enumerate(books, 1):
             print(f"{i}. {book}")
         print("=" * 35)
-        return self.books
+        return books
     
     def find_book(self, isbn: str) -> Optional[Book]:
         """
@@ -158,37 +764,298 @@ class Library:
         Returns:
             Optional[Book]: Kitap bulunursa Book nesnesi, bulunamazsa None
         """
-        for book in self.books:
-            if book.isbn == isbn:
-                return book
-        return None
+        with tracing.span("library.find_book", isbn=isbn) as span:
+            book = self._snapshot.by_isbn.get(isbn)
+            span.set_attribute("found", book is not None)
+            return book
+    
+    def find_equivalent(self, isbn: str,
+                        snapshot: Optional[CatalogSnapshot] = None) -> Optional[Book]:
+        """
+        ISBN'i önce katalogdaki yazımıyla, bulunamazsa kanonik biçimiyle
+        (tiresiz ISBN-13) arar; "0-451-52493-4" katalogdaki "978-0451524935"
+        kaydını bulur. Yazma yollarının tekrar denetimi için kullanılır.
+        
+        Args:
+            isbn (str): Aranacak ISBN
+            snapshot (Optional[CatalogSnapshot]): Okunacak snapshot (varsayılan: güncel)
+        
+        Returns:
+            Optional[Book]: Aynı kitap katalogdaysa Book nesnesi, değilse None
+        """
+        snapshot = snapshot or self._snapshot
+        isbn = isbn.strip()
+        book = snapshot.by_isbn.get(isbn)
+        if book is None:
+            candidate = _canonical_index(snapshot).get(canonical_isbn(isbn))
+            if candidate is not None and snapshot.by_isbn.get(candidate.isbn) is candidate:
+                book = candidate
+        return book
+    
+    def get_many(self, isbns: Iterable[str],
+                 snapshot: Optional[CatalogSnapshot] = None) -> Tuple[Dict[str, Book], List[str]]:
+        """
+        Birden çok ISBN'i tek geçişte ve tek snapshot üzerinden çözer.
+        
+        ISBN'ler boşluklardan arındırılır, boş değerler atlanır, tekrarlar bir
+        kez sorulur. Önce katalogdaki yazımıyla aranır; bulunamayanlar kanonik
+        biçimle (tiresiz ISBN-13, bkz. isbn.canonical_isbn) eşlenir; böylece
+        "9780451524935" ya da "0-451-52493-4" katalogdaki "978-0451524935"
+        kaydını bulur.
+        
+        Args:
+            isbns (Iterable[str]): Aranacak ISBN'ler
+            snapshot (Optional[CatalogSnapshot]): Okunacak snapshot (varsayılan: güncel)
+        
+        Returns:
+            Tuple[Dict[str, Book], List[str]]: İstek sırasıyla istenen ISBN -> kitap
+                ve bulunamayan ISBN'ler
+        
+        Raises:
+            IndexNotReady: Kanonik eşleme gerekirken indeks arka planda
+                oluşturuluyorsa ve katalog INDEX_FALLBACK_LIMIT'ten büyükse
+        """
+        snapshot = snapshot or self._snapshot
+        requested = [isbn for isbn in dict.fromkeys(isbn.strip() for isbn in isbns) if isbn]
+        with tracing.span("library.get_many", requested=len(requested)) as span:
+            by_isbn = snapshot.by_isbn
+            found = {isbn: by_isbn.get(isbn) for isbn in requested}
+            unresolved = [isbn for isbn, book in found.items() if book is None]
+            if unresolved:
+                by_canonical = self._secondary(snapshot, "canonical", snapshot.by_canonical,
+                                               _canonical_index, snapshot)
+                for isbn in unresolved:
+                    found[isbn] = by_canonical.get(canonical_isbn(isbn))
+            missing = [isbn for isbn in requested if found.get(isbn) is None]
+            found = {isbn: book for isbn, book in found.items() if book is not None}
+            span.set_attribute("found", len(found))
+            return found, missing
+    
+    def query_books(self, author: Optional[str] = None, title_prefix: Optional[str] = None,
+                    sort: Optional[str] = None, descending: bool = False,
+                    start: Any = None, end: Any = None, offset: int = 0,
+                    limit: Optional[int] = None,
+                    snapshot: Optional[CatalogSnapshot] = None) -> Tuple[int, List[Book]]:
+        """
+        Kitapları sıralı indekslerle filtreler, sıralar ve sayfalar. Katalog
+        istek başına sıralanmaz; aralıklar bisect ile bulunur.
+        
+        Args:
+            author (Optional[str]): Yazar (büyük/küçük harf duyarsız tam eşleşme)
+            title_prefix (Optional[str]): Başlığın başlangıcı (büyük/küçük harf duyarsız)
+            sort (Optional[str]): Sıralama alanı (indexes.INDEXED_FIELDS); verilmezse
+                filtre yoksa katalog sırası, varsa filtrelenen alanın sırası kullanılır
+            descending (bool): Azalan sıralama
+            start (Any): Sıralama alanının alt sınırı (dahil)
+            end (Any): Sıralama alanının üst sınırı (dahil)
+            offset (int): Atlanacak kayıt sayısı
+            limit (Optional[int]): Sayfadaki en fazla kayıt sayısı
+            snapshot (Optional[CatalogSnapshot]): Sorgulanacak snapshot (varsayılan: güncel)
+        
+        Returns:
+            Tuple[int, List[Book]]: Eşleşen toplam kitap sayısı ve sayfadaki kitaplar
+        
+        Raises:
+            ValueError: Sıralama alanı desteklenmiyorsa ya da aralık sıralama alanı
+                olmadan veya aynı alandaki bir filtreyle birlikte verilirse
+            IndexNotReady: Sıralı indeksler arka planda oluşturulurken katalog
+                INDEX_FALLBACK_LIMIT'ten büyükse
+        """
+        if sort is not None and sort not in indexes.INDEXED_FIELDS:
+            raise ValueError(f"Desteklenmeyen sıralama alanı: {sort}")
+        conditions: Dict[str, Tuple[Any, Any]] = {}
+        if author is not None:
+            conditions["author"] = (author, author)
+        if title_prefix is not None:
+            conditions["title"] = indexes.prefix_bounds(title_prefix)
+        if start is not None or end is not None:
+            if sort is None or sort in conditions:
+                raise ValueError("Aralık yalnızca filtrelenmeyen bir sıralama alanında kullanılabilir.")
+            conditions[sort] = (start, end)
+        snapshot = snapshot or self._snapshot
+        with tracing.span("library.query_books", sort=sort or "", filters=len(conditions)) as span:
+            sorted_indexes = snapshot.indexes
+            fields = set(conditions) | ({sort} if sort else set())
+            if fields and sorted_indexes is None:
+                # Yalnızca sorgunun alanları geçici olarak indekslenir
+                sorted_indexes = self._secondary(
+                    snapshot, "sorted", None,
+                    lambda: {field: indexes.SortedIndex.build(field, snapshot.books)
+                             for field in fields})
+            total, books = indexes.query(snapshot.books, sorted_indexes, conditions, sort,
+                                         descending, offset, limit)
+            span.set_attribute("total", total)
+            return total, books
+    
+    def _secondary(self, snapshot: CatalogSnapshot, name: str, built: Any, build, *args) -> Any:
+        """
+        Hazırsa ikincil yapıyı, değilse build(*args) sonucunu döndürür.
+        Yapı arka planda oluşturulurken büyük kataloglar istek içinde
+        taranmaz; IndexNotReady fırlatılır.
+        """
+        if built is not None:
+            return built
+        if self._warm_up is not None and len(snapshot.books) > INDEX_FALLBACK_LIMIT:
+            raise IndexNotReady(name)
+        return build(*args)
+    
+    def diff(self, other: Union[str, "Library"]) -> Iterator[dict]:
+        """
+        Kataloğu başka bir katalogla kanonik ISBN'lere göre karşılaştırır.
+        Diğer katalog bir dosya yolu olarak verilirse Library nesnesi
+        oluşturulmadan akış halinde okunur.
+    
+        Args:
+            other (Union[str, Library]): Diğer katalog dosyası ya da Library
+    
+        Returns:
+            Iterator[dict]: {"isbn", "status": "left_only" | "right_only" | "changed",
+                "left", "right"} farkları; bu katalog sol taraftır
+        """
+        left = (book.to_dict() for book in self._snapshot.books)
+        if isinstance(other, Library):
+            right = (book.to_dict() for book in other.snapshot().books)
+            return catalog_diff.diff_records(left, right)
+        return catalog_diff.diff_records(left, catalog_diff.read_catalog(other),
+                                         catalog_diff.partitions_for(other))
+    
+    def merge(self, other: Union[str, "Library"], policy: str = "ours") -> List[dict]:
+        """
+        Diğer katalogda olup bu katalogda olmayan kitapları ekler. Başlığı
+        ya da yazarı farklı kitaplarda ours politikası yerel kaydı korur,
+        theirs diğer katalogdaki kaydı alır. Değişiklikler apply_batch ile
+        tek snapshot ve tek kayıtla uygulanır; Open Library'ye gidilmez.
+    
+        Args:
+            other (Union[str, Library]): Diğer katalog dosyası ya da Library
+            policy (str): "ours" ya da "theirs"
+    
+        Returns:
+            List[dict]: apply_batch sonuçları
+    
+        Raises:
+            ValueError: Politika desteklenmiyorsa
+            ReadOnlyError: Kütüphane salt okunursa
+        """
+        self._check_writable()
+        operations = catalog_diff.merge_operations(self.diff(other), policy)
+        return self.apply_batch(operations) if operations else []
     
     def load_books(self) -> None:
         """
-        JSON dosyasından kitapları yükler.
+        JSON dosyasından kitapları yükler ve yeni bir snapshot olarak yayınlar.
         Dosya yoksa boş liste ile başlar.
         """
+        books = self._read_books()
+        with self._lock, self._changed:
+            # Katalog bütünüyle değişti; eski olaylardan devam edilemez. Sıra
+            # numarası zamandan türetilir ki önceki süreçten kalan imleçler
+            # de pencerenin gerisinde kalsın
+            self._changes.clear()
+            self._seq = max(self._seq + 1, int(time.time() * 1000))
+            self._publish(books, {book.isbn: book for book in books}, rebuild=True)
+            if self._journal is not None:
+                self._journal.reset(self._seq)
+    
+    def _read_books(self) -> List[Book]:
+        """JSON dosyasındaki kitapları okur; dosya yoksa ya da okunamazsa boş liste döner."""
+        books: List[Book] = []
         try:
             if os.path.exists(self.filename):
-                with open(self.filename, 'r', encoding='utf-8') as file:
-                    data = json.load(file)
-                    self.books = [Book.from_dict(book_data) for book_data in data]
-                print(f"{len(self.books)} kitap yüklendi.")
+                with metrics.STORAGE_DURATION.time("load"):
+                    with open(self.filename, 'r', encoding='utf-8') as file:
+                        data = json.load(file)
+                        books = [Book.from_dict(book_data) for book_data in data]
+                        metrics.STORAGE_BYTES.labels("load").inc(file.tell())
+                print(f"{len(books)} kitap yüklendi.")
             else:
-                self.books = []
                 print("Yeni kütüphane oluşturuldu.")
         except Exception as e:
             print(f"Kitaplar yüklenirken hata oluştu: {e}")
-            self.books = []
+            books = []
+        return books
+    
+    def reset_replica(self, seq: int, reload: bool = True) -> None:
+        """
+        Takipçi kataloğunu birincil sürecin seq sıra numarasına eşitler;
+        reload ise katalog dosyası yeniden okunur. Eski imleçler geçersizleşir.
+        
+        Args:
+            seq (int): Katalog dosyasının içerdiği son olayın sıra numarası
+            reload (bool): Katalog dosyası yeniden okunsun mu
+        """
+        books = self._read_books() if reload else None
+        with self._lock, self._changed:
+            self._changes.clear()
+            self._seq = seq
+            if books is None:
+                snapshot = self._snapshot
+                sorted_indexes = None if snapshot.indexes is None else dict(snapshot.indexes)
+                self._snapshot = CatalogSnapshot(snapshot.books, snapshot.by_isbn.copy(), seq,
+                                                 sorted_indexes,
+                                                 defer_indexes=sorted_indexes is None)
+            else:
+                sorted_indexes = self._fresh_indexes(books)
+                self._snapshot = CatalogSnapshot(books, None, seq, sorted_indexes,
+                                                 defer_indexes=sorted_indexes is None)
+            self._changed.notify_all()
+            if sorted_indexes is None:
+                self._start_warm_up()
+    
+    def apply_replicated(self, events: List[dict]) -> None:
+        """
+        Birincil süreçten gelen olayları sırayla uygular ve tek bir snapshot
+        olarak yayınlar. Olaylar kendi sıra numaralarıyla kaydedilir, böylece
+        takipçinin GET /changes imleçleri birincil süreçle aynıdır.
+        
+        Args:
+            events (List[dict]): {"seq", "op", "isbn", "time", "book"} olayları
+        """
+        with self._lock:
+            by_isbn = self._snapshot.by_isbn.copy()
+            changes: List[tuple] = []
+            for event in events:
+                existing = by_isbn.get(event["isbn"])
+                if existing is not None:
+                    changes.append(("remove", existing))
+                if event["op"] == "add":
+                    # Var olan kayıt yerinde değiştirilir; sıra birincil süreçle aynı kalır
+                    book = Book.from_dict(event["book"])
+                    by_isbn[event["isbn"]] = book
+                    changes.append(("add", book))
+                elif existing is not None:
+                    del by_isbn[event["isbn"]]
+            sorted_indexes = self._updated_indexes(changes)
+            with self._changed:
+                self._changes.extend(events)
+                self._seq = events[-1]["seq"]
+                # Sözlük ekleme sırasını korur; liste indeksle aynı sırada kurulur
+                self._snapshot = CatalogSnapshot(by_isbn.values(), by_isbn, self._seq,
+                                                 sorted_indexes,
+                                                 defer_indexes=sorted_indexes is None)
+                self._changed.notify_all()
     
     def save_books(self) -> None:
         """
-        Kütüphanedeki kitapları JSON dosyasına kaydeder.
+        Kütüphanedeki kitapları JSON dosyasına kaydeder. Dosya geçici bir
+        dosyaya yazılıp atomik olarak değiştirilir; takipçiler hiçbir zaman
+        yarım yazılmış bir dosya okumaz. Salt okunur kütüphanede bir şey yapmaz.
         """
+        if self.read_only:
+            return
         try:
-            with open(self.filename, 'w', encoding='utf-8') as file:
-                book_dicts = [book.to_dict() for book in self.books]
-                json.dump(book_dicts, file, ensure_ascii=False, indent=2)
+            with self._lock, \
+                    tracing.span("library.save_books", books=len(self.books)), \
+                    metrics.STORAGE_DURATION.time("save"):
+                snapshot = self._snapshot
+                tmp = f"{self.filename}.tmp"
+                with open(tmp, 'w', encoding='utf-8') as file:
+                    book_dicts = [book.to_dict() for book in snapshot.books]
+                    json.dump(book_dicts, file, ensure_ascii=False, indent=2)
+                    metrics.STORAGE_BYTES.labels("save").inc(file.tell())
+                os.replace(tmp, self.filename)
+                if self._journal is not None and self._journal.needs_compaction():
+                    self._journal.reset(snapshot.seq)
         except Exception as e:
             print(f"Kitaplar kaydedilirken hata oluştu: {e}")
     
@@ -199,4 +1066,48 @@ class Library:
         Returns:
             int: Toplam kitap sayısı
         """
-        return len(self.books)
\ No newline at end of file
+        return len(self._snapshot.books)
+    
+    @property
+    def last_seq(self) -> int:
+        """Kaydedilen son değişiklik olayının sıra numarası."""
+        return self._seq
+    
+    def changes(self, since: int, limit: int = 1000) -> dict:
+        """
+        since sıra numarasından sonraki ekleme/silme olaylarını döndürür.
+        
+        Olaylar bellekte sınırlı sayıda (CHANGE_LOG_SIZE) tutulur. since
+        saklanan pencereden eskiyse (ya da süreç yeniden başladığı için
+        son olaydan büyükse) tüketici kataloğu baştan indirmelidir.
+        
+        Args:
+            since (int): Tüketicinin uyguladığı son olayın sıra numarası
+            limit (int): Döndürülecek en fazla olay sayısı
+        
+        Returns:
+            dict: {"resync_required", "last_seq", "next", "changes"}; next bir
+                sonraki istekte since olarak kullanılır
+        """
+        with self._changed:
+            last_seq = self._seq
+            floor = self._changes[0]["seq"] - 1 if self._changes else last_seq
+            if since < floor or since > last_seq:
+                return {"resync_required": True, "last_seq": last_seq,
+                        "next": last_seq, "changes": []}
+            # Olay sıra numaraları ardışık olduğundan başlangıç doğrudan hesaplanır
+            start = since - floor
+            events = list(islice(self._changes, start, start + limit))
+        return {"resync_required": False, "last_seq": last_seq,
+                "next": events[-1]["seq"] if events else since, "changes": events}
+    
+    def wait_for_changes(self, since: int, timeout: float) -> bool:
+        """
+        since'ten sonra yeni bir olay kaydedilene kadar en fazla timeout
+        saniye bekler (long-poll).
+        
+        Returns:
+            bool: Yeni olay varsa True, süre dolduysa False
+        """
+        with self._changed:
+            return self._changed.wait_for(lambda: self._seq != since, timeout)
\ No newline at end of file
@@ -5,9 +5,30 @@ Python 202 Bootcamp Bitirme Projesi
 
 Bu modül kütüphane yönetim sisteminin komut satırı arayüzünü sağlar.
 Kullanıcılar kitap ekleme, silme, listeleme ve arama işlemlerini yapabilir.
+
+Argümansız çalıştırıldığında etkileşimli menü açılır. Betiklerde kullanım
+için add, remove, find, list, import, export ve stats alt komutları ISBN'leri
+argümanlardan, dosyadan ya da standart girdiden okur ve sonuçları satır
+başına bir JSON nesnesi olarak yazar. diff ve merge alt komutları kataloğu
+başka bir katalog dosyasıyla karşılaştırır ve birleştirir.
 """
 
+import argparse
+import contextlib
+import json
+import sys
+import time
+from collections import Counter
+from typing import Iterable, List, Optional
+
 from library import Library
+from openlibrary import OPENLIBRARY_URL, client_from_settings
+from settings import Settings
+import profiling
+import memory_debug
+import dump_import
+import export
+import catalog_diff
 
 
 def display_menu():
@@ -93,13 +114,8 @@ def get_user_choice() -> str:
         return "5"
 
 
-def main():
-    """Ana program döngüsü."""
-    print("Kütüphane Yönetim Sistemi başlatılıyor...")
-    
-    # Library nesnesini oluştur
-    library = Library("library.json")
-    
+def run_interactive(library: Library):
+    """Etkileşimli menü döngüsünü çalıştırır."""
     print(f"Sistem hazır! Mevcut kitap sayısı: {library.get_book_count()}")
     
     while True:
@@ -126,10 +142,399 @@ def main():
             print(f"\nBeklenmeyen bir hata oluştu: {e}")
             print("Program devam ediyor...")
         
-        # Kullanıcının devam etmek için bir tuşa basmasını bekle
-        if choice != "5":
+        # Kullanıcının devam etmek için bir tuşa basmasını bekle (girdi
+        # terminal değilse, örn. bir dosyadan yönlendirildiyse beklenmez)
+        if choice != "5" and sys.stdin.isatty():
             input("\nDevam etmek için Enter tuşuna basın...")
 
 
+def build_parser() -> argparse.ArgumentParser:
+    """Komut satırı argüman ayrıştırıcısını oluşturur."""
+    parser = argparse.ArgumentParser(description="Kütüphane Yönetim Sistemi")
+    parser.add_argument("--file", default="library.json",
+                        help="Kitapların saklandığı JSON dosyası")
+    parser.add_argument("--openlibrary-url", default=OPENLIBRARY_URL,
+                        help="Open Library API'sinin (veya yerel taklidinin) adresi")
+    parser.add_argument("--profile", action="store_true",
+                        help="Komutu cProfile ile çalıştırıp sonucu profil dizinine kaydet")
+    parser.add_argument("--profiles-dir", default="profiles",
+                        help="Profil dosyalarının yazılacağı dizin")
+    parser.add_argument("--profile-top", type=int, default=30,
+                        help="Profil özetinde listelenecek fonksiyon sayısı")
+    
+    subparsers = parser.add_subparsers(dest="command")
+    for name, help_text in (("add", "ISBN'leri Open Library'den eşzamanlı çekip tek kayıtla ekle"),
+                            ("remove", "ISBN'leri tek kayıtla sil"),
+                            ("find", "ISBN'leri katalogda ara")):
+        isbn_parser = subparsers.add_parser(name, help=help_text)
+        isbn_parser.add_argument("isbns", nargs="*", metavar="ISBN",
+                                 help="ISBN numaraları; verilmezse --input ya da standart girdi okunur")
+        isbn_parser.add_argument("--input", "-i",
+                                 help="Her satırda bir ISBN bulunan dosya ('-': standart girdi)")
+    
+    list_parser = subparsers.add_parser("list", help="Kataloğu standart çıktıya yaz")
+    list_parser.add_argument("--format", choices=export.FORMATS, default="ndjson",
+                             help="Çıktı biçimi")
+    
+    records_parser = subparsers.add_parser(
+        "import", help="Dışa aktarılmış CSV/NDJSON dosyasındaki kitapları Open Library'ye gitmeden ekle")
+    records_parser.add_argument("path", help="Okunacak dosya ('-': standart girdiden NDJSON; .gz olabilir)")
+    records_parser.add_argument("--format", choices=export.FORMATS,
+                                help="Dosya biçimi (varsayılan: uzantıdan)")
+    
+    subparsers.add_parser("stats", help="Katalog istatistiklerini JSON olarak yaz")
+    
+    diff_parser = subparsers.add_parser(
+        "diff", help="Kataloğu başka bir katalog dosyasıyla kanonik ISBN'lere göre karşılaştır")
+    diff_parser.add_argument("other", help="Karşılaştırılacak katalog dosyası")
+    
+    merge_parser = subparsers.add_parser(
+        "merge", help="Başka bir katalog dosyasındaki eksik kitapları tek kayıtla ekle")
+    merge_parser.add_argument("other", help="Birleştirilecek katalog dosyası")
+    merge_parser.add_argument("--policy", choices=catalog_diff.MERGE_POLICIES, default="ours",
+                              help="Başlığı/yazarı farklı kitaplarda hangi kaydın tutulacağı")
+    
+    memory_parser = subparsers.add_parser(
+        "memory", help="Kataloğu tracemalloc altında yükleyip bellek kullanımını raporla")
+    memory_parser.add_argument("--limit", type=int, default=20,
+                               help="Listelenecek tahsis yeri sayısı")
+    memory_parser.add_argument("--group-by", choices=memory_debug.GROUP_BY_CHOICES,
+                               default="lineno", help="Tahsis yerlerinin gruplanma biçimi")
+    
+    import_parser = subparsers.add_parser(
+        "import-dump", help="Open Library döküm dosyalarından API'ye gitmeden toplu kitap aktar")
+    import_parser.add_argument("--editions", required=True,
+                               help="Editions dökümü (TSV veya JSONL, gzip'li olabilir)")
+    import_parser.add_argument("--authors",
+                               help="Authors dökümü; verilmezse yazarlar 'Bilinmeyen Yazar' olur")
+    import_parser.add_argument("--isbn", action="append", default=[],
+                               help="Yalnızca bu ISBN'i aktar (birden çok kez verilebilir)")
+    import_parser.add_argument("--isbn-file",
+                               help="Her satırda bir ISBN bulunan filtre dosyası")
+    import_parser.add_argument("--workers", type=int, default=None,
+                               help="Ayrıştırma süreci sayısı (varsayılan: CPU sayısı)")
+    import_parser.add_argument("--chunk-size", type=int, default=dump_import.DEFAULT_CHUNK_SIZE,
+                               help="Süreçlere gönderilen parça başına satır sayısı")
+    
+    export_parser = subparsers.add_parser(
+        "export", help="Kataloğu CSV veya NDJSON olarak dışa aktar")
+    export_parser.add_argument("--format", choices=export.FORMATS, default="ndjson",
+                               help="Çıktı biçimi")
+    export_parser.add_argument("--output", default="-",
+                               help="Çıktı dosyası (varsayılan '-': standart çıktı)")
+    export_parser.add_argument("--gzip", action="store_true",
+                               help="Çıktıyı gzip ile sıkıştır")
+    return parser
+
+
+def load_library(filename: str, base_url: str = OPENLIBRARY_URL) -> Library:
+    """
+    Kataloğu yükler. Library'nin durum mesajları standart çıktıya yazılan
+    veriyle karışmasın diye stderr'e yönlendirilir.
+    
+    Open Library istemcisi API ile aynı ayarlardan (LIBRARY_UPSTREAM_* ortam
+    değişkenleri) kurulur; eşzamanlı çekimler paylaşılan hız sınırlayıcıdan geçer.
+    """
+    settings = Settings.from_env().model_copy(
+        update={"library_file": filename, "openlibrary_url": base_url})
+    with contextlib.redirect_stdout(sys.stderr):
+        return Library(filename, upstream=client_from_settings(settings))
+
+
+def emit(record: dict):
+    """Kaydı standart çıktıya tek satırlık JSON olarak yazar."""
+    sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def read_isbns(values: List[str], input_path: Optional[str] = None) -> List[str]:
+    """
+    ISBN'leri argümanlardan ve dosyadan (ya da standart girdiden) okur.
+    
+    Argüman ve dosya verilmezse ve standart girdi bir terminal değilse
+    standart girdi okunur. Boş satırlar ve # ile başlayanlar atlanır;
+    tekrar eden ISBN'lerin yalnızca ilki tutulur.
+    
+    Args:
+        values (List[str]): Komut satırında verilen ISBN'ler
+        input_path (Optional[str]): ISBN dosyası ('-': standart girdi)
+        
+    Returns:
+        List[str]: Sırası korunmuş, tekrarsız ISBN listesi
+    """
+    lines: Iterable[str] = list(values)
+    if input_path is None and not values and not sys.stdin.isatty():
+        input_path = "-"
+    if input_path == "-":
+        lines = [*lines, *sys.stdin]
+    elif input_path is not None:
+        with open(input_path, 'r', encoding='utf-8') as file:
+            lines = [*lines, *file]
+    isbns = (line.strip() for line in lines)
+    return list(dict.fromkeys(isbn for isbn in isbns if isbn and not isbn.startswith("#")))
+
+
+def run_batch(library: Library, command: str, operations: List[dict]) -> int:
+    """
+    İşlemleri Library.apply_batch ile tek seferde uygular (eksik kitap
+    bilgileri eşzamanlı çekilir, katalog bir kez kaydedilir). Her işlemin
+    sonucu standart çıktıya, süre ve hız özeti standart hataya JSON olarak
+    yazılır.
+    
+    Returns:
+        int: Çıkış kodu; zaten mevcut olanlar dışında başarısız işlem varsa 1
+    """
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(sys.stderr):
+        results = library.apply_batch(operations) if operations else []
+    return report_batch(command, results, time.perf_counter() - started)
+
+
+def report_batch(command: str, results: List[dict], elapsed: float) -> int:
+    """
+    Toplu işlem sonuçlarını standart çıktıya, süre ve hız özetini standart
+    hataya JSON olarak yazar.
+    
+    Returns:
+        int: Çıkış kodu; zaten mevcut olanlar dışında başarısız işlem varsa 1
+    """
+    for result in results:
+        emit(result)
+    applied = sum(1 for result in results if result["success"])
+    failed = [result for result in results if not result["success"] and result["status"] != "exists"]
+    summary = {
+        "command": command,
+        "operations": len(results),
+        "applied": applied,
+        "skipped": len(results) - applied - len(failed),
+        "failed": len(failed),
+        "elapsed_seconds": round(elapsed, 6),
+        "ops_per_second": round(len(results) / elapsed, 1) if elapsed > 0 else None,
+    }
+    print(json.dumps(summary, ensure_ascii=False), file=sys.stderr)
+    return 1 if failed else 0
+
+
+def modify_books(args: argparse.Namespace) -> int:
+    """add ve remove alt komutları: ISBN'leri tek bir toplu işlemle uygular."""
+    isbns = read_isbns(args.isbns, args.input)
+    library = load_library(args.file, args.openlibrary_url)
+    return run_batch(library, args.command, [{"op": args.command, "isbn": isbn} for isbn in isbns])
+
+
+def find_books(args: argparse.Namespace) -> int:
+    """
+    find alt komutu: her ISBN için bulunup bulunmadığını yazar. ISBN'ler
+    tek geçişte çözülür ve kanonik biçimle de eşlenir (tiresiz, ISBN-10).
+    """
+    isbns = read_isbns(args.isbns, args.input)
+    library = load_library(args.file, args.openlibrary_url)
+    found, missing = library.get_many(isbns)
+    for isbn in isbns:
+        book = found.get(isbn)
+        emit({"isbn": isbn, "found": book is not None, "book": book.to_dict() if book else None})
+    return 1 if missing else 0
+
+
+def list_catalog(args: argparse.Namespace) -> int:
+    """list alt komutu: kataloğu CSV ya da NDJSON olarak standart çıktıya yazar."""
+    library = load_library(args.file, args.openlibrary_url)
+    sys.stdout.flush()
+    for chunk in export.export_catalog(library, args.format):
+        sys.stdout.buffer.write(chunk)
+    sys.stdout.buffer.flush()
+    return 0
+
+
+def import_records(args: argparse.Namespace) -> int:
+    """import alt komutu: dışa aktarılmış kayıtları Open Library'ye gitmeden ekler."""
+    if args.path == "-":
+        records = (json.loads(line) for line in sys.stdin if line.strip())
+    else:
+        records = export.read_records(args.path, args.format)
+    operations = [dict(record, op="add") for record in records]
+    library = load_library(args.file, args.openlibrary_url)
+    return run_batch(library, "import", operations)
+
+
+def catalog_stats(args: argparse.Namespace) -> int:
+    """stats alt komutu: kitap ve yazar sayılarını JSON olarak yazar."""
+    library = load_library(args.file, args.openlibrary_url)
+    snapshot = library.snapshot()
+    authors = Counter(book.author for book in snapshot.books)
+    emit({
+        "file": args.file,
+        "total_books": len(snapshot.books),
+        "total_authors": len(authors),
+        "most_common_authors": [{"author": author, "books": count}
+                                for author, count in authors.most_common(10)],
+        "last_seq": snapshot.seq,
+    })
+    return 0
+
+
+def diff_catalogs(args: argparse.Namespace) -> int:
+    """
+    diff alt komutu: iki katalog dosyasını yüklemeden akış halinde
+    karşılaştırır, her farkı bir satır olarak ve özeti standart hataya yazar.
+    
+    Returns:
+        int: Çıkış kodu; fark varsa 1
+    """
+    started = time.perf_counter()
+    counts = Counter()
+    for difference in catalog_diff.diff_files(args.file, args.other):
+        counts[difference["status"]] += 1
+        emit(difference)
+    summary = {
+        "command": "diff",
+        "left": args.file,
+        "right": args.other,
+        **{status: counts[status] for status in ("left_only", "right_only", "changed")},
+        "elapsed_seconds": round(time.perf_counter() - started, 6),
+    }
+    print(json.dumps(summary, ensure_ascii=False), file=sys.stderr)
+    return 1 if counts else 0
+
+
+def merge_catalogs(args: argparse.Namespace) -> int:
+    """merge alt komutu: diğer katalogdaki eksik kitapları tek toplu işlemle ekler."""
+    library = load_library(args.file, args.openlibrary_url)
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(sys.stderr):
+        results = library.merge(args.other, args.policy)
+    return report_batch("merge", results, time.perf_counter() - started)
+
+
+CATALOG_COMMANDS = {
+    "add": modify_books,
+    "remove": modify_books,
+    "find": find_books,
+    "list": list_catalog,
+    "import": import_records,
+    "stats": catalog_stats,
+    "diff": diff_catalogs,
+    "merge": merge_catalogs,
+}
+
+
+def memory_report(args: argparse.Namespace):
+    """Kataloğu tracemalloc altında yükleyip tahsis yerlerini ve nesne sayılarını yazdırır."""
+    inspector = memory_debug.MemoryInspector()
+    inspector.start()
+    inspector.snapshot()
+    
+    library = load_library(args.file, args.openlibrary_url)
+    
+    diff = inspector.diff(args.limit, args.group_by)
+    status = inspector.status()
+    inspector.stop()
+    
+    print(memory_debug.format_report(
+        f"{library.get_book_count()} kitabın yüklenmesiyle oluşan tahsisler", diff["top"], diff=True))
+    print(f"\nToplam değişim: {diff['total_diff_bytes'] / 1024 / 1024:.2f} MiB "
+          f"(tepe: {status['peak_bytes'] / 1024 / 1024:.2f} MiB)")
+    
+    counts = memory_debug.object_counts()
+    print("\n=== Nesne Sayıları ===")
+    for name, count in counts["tracked"].items():
+        print(f"{name:<28} {count:>10}")
+    print("\n=== En Çok Örneği Olan Türler ===")
+    for row in counts["top"]:
+        print(f"{row['type']:<28} {row['count']:>10}")
+
+
+def import_from_dump(args: argparse.Namespace):
+    """Döküm dosyalarını içe aktarır; ilerleme stderr'e, özet stdout'a yazılır."""
+    isbns = list(args.isbn)
+    if args.isbn_file:
+        with open(args.isbn_file, 'r', encoding='utf-8') as file:
+            isbns.extend(line.strip() for line in file if line.strip())
+    
+    library = load_library(args.file, args.openlibrary_url)
+    result = dump_import.import_dump(
+        library, args.editions, args.authors,
+        isbns=isbns or None, workers=args.workers,
+        chunk_size=args.chunk_size, progress_stream=sys.stderr)
+    
+    print("\n=== İçe Aktarım Özeti ===")
+    print(f"Okunan satır (editions/authors): {result['edition_lines']:,} / {result['author_lines']:,}")
+    print(f"Eşleşen kitap: {result['matched']:,} (çözülen yazar: {result['authors_resolved']:,})")
+    print(f"Eklenen kitap: {result['added']:,} (zaten mevcut: {result['skipped_existing']:,})")
+    if result["invalid_lines"]:
+        print(f"Okunamayan satır: {result['invalid_lines']:,}")
+    if result["skipped_invalid_isbn"]:
+        print(f"Geçerli ISBN'i olmayan edition: {result['skipped_invalid_isbn']:,}")
+    if result["missing"]:
+        print(f"Dökümde bulunamayan ISBN: {len(result['missing']):,}")
+    print(f"Süre: {result['elapsed_seconds']:.2f} sn ({result['lines_per_second']:,} satır/sn)")
+
+
+def export_catalog(args: argparse.Namespace):
+    """Kataloğu dosyaya veya standart çıktıya akış halinde yazar; özet stderr'e yazılır."""
+    library = load_library(args.file, args.openlibrary_url)
+    started = time.perf_counter()
+    written = 0
+    
+    if args.output == "-":
+        output = contextlib.nullcontext(sys.stdout.buffer)
+    else:
+        output = open(args.output, 'wb')
+    with output as file:
+        for chunk in export.export_catalog(library, args.format, compress=args.gzip):
+            file.write(chunk)
+            written += len(chunk)
+        file.flush()
+    
+    elapsed = time.perf_counter() - started
+    print(f"{library.get_book_count():,} kitap dışa aktarıldı ({written / 1024 / 1024:.2f} MiB, "
+          f"{elapsed:.2f} sn)", file=sys.stderr)
+
+
+def run(args: argparse.Namespace) -> int:
+    """
+    Ayrıştırılmış argümanlara göre uygulamayı çalıştırır.
+    
+    Returns:
+        int: Süreç çıkış kodu
+    """
+    if args.command in CATALOG_COMMANDS:
+        return CATALOG_COMMANDS[args.command](args)
+    if args.command == "memory":
+        memory_report(args)
+        return 0
+    if args.command == "import-dump":
+        import_from_dump(args)
+        return 0
+    if args.command == "export":
+        export_catalog(args)
+        return 0
+    
+    # Library nesnesini oluştur
+    library = load_library(args.file, args.openlibrary_url)
+    run_interactive(library)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Ana program giriş noktası.
+    
+    Returns:
+        int: Süreç çıkış kodu
+    """
+    args = build_parser().parse_args(argv)
+    if args.command is None:
+        print("Kütüphane Yönetim Sistemi başlatılıyor...")
+    
+    if not args.profile:
+        return run(args)
+    
+    label = f"cli-{args.command or 'interactive'}"
+    with profiling.profile(args.profiles_dir, label, args.profile_top) as result:
+        code = run(args)
+    print(f"Profil kaydedildi: {result.stats_path} (özet: {result.summary_path})", file=sys.stderr)
+    return code
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,189 @@
+"""
+Kütüphane Yönetim Sistemi - Bellek İnceleme
+
+Bu modül tracemalloc ile bellek anlık görüntüleri (snapshot) alıp
+karşılaştırmayı ve Book gibi uygulama türlerinin canlı nesne sayılarını
+raporlamayı sağlar. API'deki /debug/memory endpoint'i ve `main.py memory`
+komutu tarafından kullanılır.
+"""
+
+import gc
+import threading
+import tracemalloc
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+
+# Nesne sayıları raporlanacak uygulama türleri (sınıf adına göre)
+TRACKED_TYPES = ("Book", "Library", "BookResponse", "ISBNRequest", "MessageResponse")
+
+GROUP_BY_CHOICES = ("lineno", "filename", "traceback")
+
+
+def object_counts(type_names: Iterable[str] = TRACKED_TYPES, top_n: int = 10) -> dict:
+    """
+    Çöp toplayıcının izlediği nesneleri türlerine göre sayar.
+
+    Args:
+        type_names (Iterable[str]): Ayrıca raporlanacak tür adları
+        top_n (int): En çok örneği olan kaç türün listeleneceği
+
+    Returns:
+        dict: {"tracked": {tür: adet}, "top": [{"type", "count"}]}
+    """
+    counts = Counter(type(obj).__name__ for obj in gc.get_objects())
+    return {
+        "tracked": {name: counts.get(name, 0) for name in type_names},
+        "top": [{"type": name, "count": count} for name, count in counts.most_common(top_n)],
+    }
+
+
+def _stat_to_dict(stat) -> dict:
+    """tracemalloc.Statistic nesnesini dictionary'ye dönüştürür."""
+    frame = stat.traceback[0]
+    return {
+        "file": frame.filename,
+        "line": frame.lineno,
+        "size_bytes": stat.size,
+        "count": stat.count,
+    }
+
+
+def _diff_to_dict(stat) -> dict:
+    """tracemalloc.StatisticDiff nesnesini dictionary'ye dönüştürür."""
+    result = _stat_to_dict(stat)
+    result["size_diff_bytes"] = stat.size_diff
+    result["count_diff"] = stat.count_diff
+    return result
+
+
+class MemoryInspector:
+    """
+    tracemalloc oturumunu yöneten sınıf.
+    Son alınan snapshot, sonraki diff işleminin temelini oluşturur.
+    """
+
+    def __init__(self, frames: int = 1):
+        """
+        MemoryInspector sınıfının constructor'ı.
+
+        Args:
+            frames (int): Her tahsis için saklanacak çağrı yığını derinliği
+        """
+        self.frames = frames
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._lock = threading.Lock()
+
+    @property
+    def tracing(self) -> bool:
+        """tracemalloc'un açık olup olmadığı."""
+        return tracemalloc.is_tracing()
+
+    def start(self) -> dict:
+        """tracemalloc'u başlatır ve temel snapshot'ı sıfırlar."""
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self.frames)
+            self._baseline = None
+            return self.status()
+
+    def stop(self) -> dict:
+        """tracemalloc'u durdurur; alınmış snapshot'lar silinir."""
+        with self._lock:
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+            self._baseline = None
+            return self.status()
+
+    def status(self) -> dict:
+        """İzleme durumunu ve izlenen bellek miktarını döndürür."""
+        if not tracemalloc.is_tracing():
+            return {"tracing": False}
+        current, peak = tracemalloc.get_traced_memory()
+        return {
+            "tracing": True,
+            "traced_bytes": current,
+            "peak_bytes": peak,
+            "has_baseline": self._baseline is not None,
+        }
+
+    def _take(self) -> tracemalloc.Snapshot:
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("tracemalloc başlatılmamış.")
+        snapshot = tracemalloc.take_snapshot()
+        return snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+
+    def snapshot(self, limit: int = 20, group_by: str = "lineno") -> dict:
+        """
+        Snapshot alır, sonraki diff için temel olarak saklar ve en çok bellek
+        tahsis eden yerleri döndürür.
+
+        Args:
+            limit (int): Listelenecek tahsis yeri sayısı
+            group_by (str): "lineno", "filename" ya da "traceback"
+
+        Returns:
+            dict: Toplam boyut ve en büyük tahsis yerleri
+
+        Raises:
+            RuntimeError: tracemalloc başlatılmamışsa
+        """
+        with self._lock:
+            snapshot = self._take()
+            self._baseline = snapshot
+        stats = snapshot.statistics(group_by)
+        return {
+            "total_bytes": sum(stat.size for stat in stats),
+            "top": [_stat_to_dict(stat) for stat in stats[:limit]],
+        }
+
+    def diff(self, limit: int = 20, group_by: str = "lineno") -> dict:
+        """
+        Yeni bir snapshot alıp önceki snapshot ile karşılaştırır; yeni snapshot
+        bir sonraki karşılaştırmanın temeli olur.
+
+        Args:
+            limit (int): Listelenecek tahsis yeri sayısı
+            group_by (str): "lineno", "filename" ya da "traceback"
+
+        Returns:
+            dict: Toplam değişim ve en çok büyüyen tahsis yerleri
+
+        Raises:
+            RuntimeError: tracemalloc başlatılmamışsa ya da temel snapshot yoksa
+        """
+        with self._lock:
+            if self._baseline is None:
+                raise RuntimeError("Karşılaştırma için önce snapshot alınmalı.")
+            snapshot = self._take()
+            stats = snapshot.compare_to(self._baseline, group_by)
+            self._baseline = snapshot
+        return {
+            "total_diff_bytes": sum(stat.size_diff for stat in stats),
+            "top": [_diff_to_dict(stat) for stat in stats[:limit]],
+        }
+
+
+def format_report(title: str, rows: List[Dict], diff: bool = False) -> str:
+    """
+    Tahsis yeri listesini terminal için tablo olarak biçimlendirir.
+
+    Args:
+        title (str): Başlık
+        rows (List[Dict]): snapshot() ya da diff() çıktısındaki "top" listesi
+        diff (bool): Değişim sütunları gösterilsin mi
+
+    Returns:
+        str: Biçimlendirilmiş metin
+    """
+    lines = [f"\n=== {title} ==="]
+    for row in rows:
+        size = row["size_diff_bytes"] if diff else row["size_bytes"]
+        count = row["count_diff"] if diff else row["count"]
+        sign = "+" if diff and size >= 0 else ""
+        lines.append(f"{sign}{size / 1024:>10.1f} KiB {sign}{count:>8} blok  "
+                     f"{row['file']}:{row['line']}")
+    return "\n".join(lines)
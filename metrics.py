@@ -0,0 +1,410 @@
+"""
+Kütüphane Yönetim Sistemi - Metrikler
+
+Bu modül Prometheus metin biçiminde (text exposition format 0.0.4) dışa
+aktarılan küçük bir metrik kütüphanesi sağlar. Harici bağımlılık yoktur;
+sayaç (Counter), gösterge (Gauge) ve histogram (Histogram) türleri
+etiketlerle birlikte desteklenir.
+
+Sıcak yoldaki maliyeti düşük tutmak için her etiket kombinasyonu bir kez
+oluşturulup önbelleğe alınır; gözlem işlemi tek bir kilit altında sabit
+sayıda toplama yapar.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_value(value: float) -> str:
+    """Sayısal değeri Prometheus biçiminde yazar."""
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Etiket adlarını ve değerlerini {ad="değer",...} biçiminde yazar."""
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        escaped = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+class _Metric:
+    """Tüm metrik türlerinin ortak temel sınıfı."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """
+        Metrik constructor'ı.
+
+        Args:
+            name (str): Metrik adı
+            documentation (str): HELP satırında gösterilecek açıklama
+            labelnames (Sequence[str]): Etiket adları
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: str):
+        """
+        Verilen etiket değerlerine ait alt metriği döndürür.
+
+        Args:
+            *values (str): Etiket değerleri (labelnames sırasıyla)
+
+        Returns:
+            Etiket kombinasyonuna ait alt metrik
+        """
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} için {len(self.labelnames)} etiket bekleniyor")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def collect(self) -> List[str]:
+        """Metriği Prometheus metin satırları olarak döndürür."""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for values, child in sorted(self._children.items()):
+            lines.extend(child.render(self.name, self.labelnames, values))
+        return lines
+
+
+class _ValueChild:
+    """Tek bir sayısal değer tutan alt metrik (Counter ve Gauge için)."""
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+    def render(self, name: str, labelnames: Sequence[str], values: Sequence[str]) -> List[str]:
+        return [f"{name}{_format_labels(labelnames, values)} {_format_value(self.value)}"]
+
+
+class Counter(_Metric):
+    """Yalnızca artan sayaç."""
+
+    kind = "counter"
+
+    def _new_child(self) -> _ValueChild:
+        return _ValueChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Etiketsiz sayacı artırır."""
+        self.labels().inc(amount)
+
+
+class Gauge(_Metric):
+    """Artıp azalabilen anlık değer."""
+
+    kind = "gauge"
+
+    def _new_child(self) -> _ValueChild:
+        return _ValueChild()
+
+    def set(self, value: float) -> None:
+        """Etiketsiz göstergenin değerini ayarlar."""
+        self.labels().set(value)
+
+
+class _HistogramChild:
+    """Tek bir etiket kombinasyonunun kova sayaçları."""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    def render(self, name: str, labelnames: Sequence[str], values: Sequence[str]) -> List[str]:
+        with self._lock:
+            counts = list(self.counts)
+            total_sum = self.sum
+        lines = []
+        cumulative = 0
+        bucket_labels = tuple(labelnames) + ("le",)
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += count
+            labels = _format_labels(bucket_labels, tuple(values) + (_format_value(bound),))
+            lines.append(f"{name}_bucket{labels} {cumulative}")
+        labels = _format_labels(labelnames, values)
+        lines.append(f"{name}_sum{labels} {_format_value(total_sum)}")
+        lines.append(f"{name}_count{labels} {cumulative}")
+        return lines
+
+
+class Histogram(_Metric):
+    """Gözlemleri sabit kovalara dağıtan histogram."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Histogram constructor'ı.
+
+        Args:
+            name (str): Metrik adı
+            documentation (str): HELP satırında gösterilecek açıklama
+            labelnames (Sequence[str]): Etiket adları
+            buckets (Sequence[float]): Artan sırada kova üst sınırları
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Etiketsiz histograma bir gözlem ekler."""
+        self.labels().observe(value)
+
+    def time(self, *values: str) -> '_Timer':
+        """
+        Bloğun süresini ölçüp histograma ekleyen context manager döndürür.
+
+        Args:
+            *values (str): Etiket değerleri
+
+        Returns:
+            _Timer: Süre ölçen context manager
+        """
+        return _Timer(self.labels(*values))
+
+
+class _Timer:
+    """with bloğunun süresini bir histogram alt metriğine yazan yardımcı."""
+
+    def __init__(self, child: _HistogramChild):
+        self._child = child
+        self._start = 0.0
+
+    def __enter__(self) -> '_Timer':
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._child.observe(time.perf_counter() - self._start)
+
+
+class Registry:
+    """Metrikleri toplayıp tek bir metin çıktısı üreten kayıt defteri."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """
+        Metriği kayıt defterine ekler.
+
+        Args:
+            metric (_Metric): Eklenecek metrik
+
+        Returns:
+            _Metric: Eklenen metrik (zincirleme kullanım için)
+        """
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"{metric.name} zaten kayıtlı")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """Adı verilen metriği döndürür."""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Tüm metrikleri Prometheus metin biçiminde döndürür."""
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+# HTTP katmanı
+HTTP_REQUEST_DURATION = REGISTRY.register(Histogram(
+    "http_request_duration_seconds",
+    "API isteklerinin işlenme süresi",
+    ("method", "route", "status"),
+))
+
+# Open Library çağrıları (lookup: book | author)
+UPSTREAM_REQUEST_DURATION = REGISTRY.register(Histogram(
+    "openlibrary_request_duration_seconds",
+    "Open Library isteklerinin süresi",
+    ("lookup",),
+))
+PROVIDER_DURATION = REGISTRY.register(Histogram(
+    "library_metadata_provider_duration_seconds",
+    "Kitap bilgisi sağlayıcılarına yapılan sorguların süresi (hedge dahil)",
+    ("provider", "outcome"),
+))
+UPSTREAM_REQUESTS = REGISTRY.register(Counter(
+    "openlibrary_requests_total",
+    "Open Library isteklerinin HTTP durum koduna göre sayısı",
+    ("lookup", "status"),
+))
+UPSTREAM_ERRORS = REGISTRY.register(Counter(
+    "openlibrary_errors_total",
+    "Başarısız Open Library istekleri (bağlantı hatası veya 5xx)",
+    ("lookup", "reason"),
+))
+
+UPSTREAM_RETRIES = REGISTRY.register(Counter(
+    "openlibrary_retries_total",
+    "Tekrar denenen Open Library istekleri",
+    ("lookup",),
+))
+UPSTREAM_CIRCUIT_STATE = REGISTRY.register(Gauge(
+    "openlibrary_circuit_state",
+    "Devre kesici durumu (0: kapalı, 1: yarı açık, 2: açık)",
+))
+
+# Kalıcılık
+STORAGE_DURATION = REGISTRY.register(Histogram(
+    "library_storage_duration_seconds",
+    "Katalog dosyası okuma/yazma süresi",
+    ("operation",),
+))
+STORAGE_BYTES = REGISTRY.register(Counter(
+    "library_storage_bytes_total",
+    "Katalog dosyasından okunan/yazılan toplam byte",
+    ("operation",),
+))
+
+# Katalog ve önbellekler
+CATALOG_BOOKS = REGISTRY.register(Gauge(
+    "library_books",
+    "Katalogdaki kitap sayısı",
+))
+INDEX_BUILD_DURATION = REGISTRY.register(Histogram(
+    "library_index_build_duration_seconds",
+    "İkincil yapıların (sıralı indeksler, kanonik ISBN, analitik sütunları) baştan oluşturulma süresi",
+    ("index",),
+))
+JOBS = REGISTRY.register(Gauge(
+    "library_jobs",
+    "Zenginleştirme kuyruğundaki işlerin duruma göre sayısı",
+    ("status",),
+))
+CACHE_REQUESTS = REGISTRY.register(Counter(
+    "library_cache_requests_total",
+    "Önbellek isteklerinin isabet/ıskalama sayısı",
+    ("cache", "result"),
+))
+CACHE_HIT_RATIO = REGISTRY.register(Gauge(
+    "library_cache_hit_ratio",
+    "Önbellek isabet oranı (son okumada hesaplanır)",
+    ("cache",),
+))
+
+# Çok şubeli barındırma
+TENANTS_RESIDENT = REGISTRY.register(Gauge(
+    "library_tenants_resident",
+    "Bellekte tutulan şube kataloğu sayısı",
+))
+TENANT_EVICTIONS = REGISTRY.register(Counter(
+    "library_tenant_evictions_total",
+    "LRU ile bellekten çıkarılan şube kataloğu sayısı",
+))
+TENANT_LOAD_DURATION = REGISTRY.register(Histogram(
+    "library_tenant_load_duration_seconds",
+    "Şube kataloğunun diskten yüklenme süresi",
+))
+
+# Takipçi çoğaltma
+REPLICATION_LAG = REGISTRY.register(Gauge(
+    "library_replication_lag_seconds",
+    "Takipçinin birincil sürecin günlüğünün gerisinde kaldığı süre",
+))
+REPLICATION_SEQ = REGISTRY.register(Gauge(
+    "library_replication_applied_seq",
+    "Takipçinin uyguladığı son olayın sıra numarası",
+))
+
+
+def update_cache_ratios() -> None:
+    """CACHE_REQUESTS sayaçlarından CACHE_HIT_RATIO göstergelerini hesaplar."""
+    totals: Dict[str, List[float]] = {}
+    for (cache, result), child in list(CACHE_REQUESTS._children.items()):
+        hits_and_total = totals.setdefault(cache, [0.0, 0.0])
+        if result == "hit":
+            hits_and_total[0] += child.value
+        hits_and_total[1] += child.value
+    for cache, (hits, total) in totals.items():
+        CACHE_HIT_RATIO.labels(cache).set(hits / total if total else 0.0)
+
+
+class MetricsMiddleware:
+    """
+    Her HTTP isteğinin süresini route şablonu ve durum koduna göre ölçen
+    saf ASGI middleware'i. BaseHTTPMiddleware'e göre istek başına çok daha
+    az ek yük getirir.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_holder = {"status": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status_holder["status"] = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            template = getattr(route, "path", None) or "unmatched"
+            HTTP_REQUEST_DURATION.labels(
+                scope["method"], template, str(status_holder["status"])
+            ).observe(time.perf_counter() - start)
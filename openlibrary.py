@@ -0,0 +1,211 @@
+"""
+Kütüphane Yönetim Sistemi - Open Library İstemcisi
+
+Bu modül Open Library'ye yapılan tüm GET isteklerini tek bir yoldan geçirir:
+her istek önce devre kesiciden ve paylaşılan hız sınırlayıcıdan izin alır,
+tekrar denenebilir hatalarda jitter'lı üstel geri çekilmeyle yeniden denenir
+ve süre/durum/hata metrikleri ile tracing span'leri bu katmanda kaydedilir.
+"""
+
+import re
+import time
+from typing import Callable, Optional
+
+import httpx
+
+import metrics
+import tracing
+from resilience import (
+    CircuitBreaker, CircuitOpenError, RateLimitTimeout, RetryPolicy, TokenBucket,
+    UpstreamUnavailable,
+)
+
+
+OPENLIBRARY_URL = "https://openlibrary.org"
+
+# publish_date serbest metindir ("1950", "June 1950", "c1949"); ilk dört haneli yıl alınır
+_YEAR = re.compile(r"(?<!\d)(\d{4})(?!\d)")
+
+
+def edition_metadata(edition: dict) -> dict:
+    """
+    Open Library edition kaydından Book'un isteğe bağlı alanlarını ayıklar.
+
+    Args:
+        edition (dict): /isbn/<isbn>.json yanıtı ya da döküm kaydı
+
+    Returns:
+        dict: publish_year, pages, publishers, subjects ve author_keys
+    """
+    match = _YEAR.search(str(edition.get("publish_date") or ""))
+    pages = edition.get("number_of_pages")
+    return {
+        "publish_year": int(match.group(1)) if match else None,
+        "pages": pages if isinstance(pages, int) and pages > 0 else None,
+        "publishers": [name for name in edition.get("publishers") or [] if isinstance(name, str)],
+        "subjects": [subject for subject in edition.get("subjects") or [] if isinstance(subject, str)],
+        "author_keys": [author["key"] for author in edition.get("authors") or []
+                        if isinstance(author, dict) and author.get("key")],
+    }
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """429/503 yanıtlarındaki Retry-After başlığını saniyeye çevirir."""
+    if response.status_code not in (429, 503):
+        return None
+    try:
+        return float(response.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+class OpenLibraryClient:
+    """
+    Open Library isteklerini hız sınırı, tekrar deneme ve devre kesici ile
+    gönderen sınıf. Aynı instance birden çok Library tarafından paylaşılabilir.
+    """
+
+    def __init__(self, base_url: str = OPENLIBRARY_URL, timeout: float = 10.0,
+                 rate_limiter: Optional[TokenBucket] = None,
+                 retry: Optional[RetryPolicy] = None,
+                 breaker: Optional[CircuitBreaker] = None,
+                 max_wait: float = 30.0,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        OpenLibraryClient sınıfının constructor'ı.
+
+        Args:
+            base_url (str): Open Library API'sinin (veya yerel taklidinin) kök adresi
+            timeout (float): Tek bir isteğin zaman aşımı (saniye)
+            rate_limiter (Optional[TokenBucket]): Paylaşılan hız sınırlayıcı (None: sınırsız)
+            retry (Optional[RetryPolicy]): Tekrar deneme politikası
+            breaker (Optional[CircuitBreaker]): Devre kesici
+            max_wait (float): Hız sınırlayıcıdan izin için en fazla bekleme (saniye)
+            sleep (Callable): Geri çekilme beklemesi için kullanılacak fonksiyon
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self.max_wait = max_wait
+        self._sleep = sleep
+
+    def http_client(self) -> httpx.Client:
+        """Bu istemcinin ayarlarıyla yeni bir httpx.Client oluşturur."""
+        return httpx.Client(timeout=self.timeout)
+
+    def get(self, client: httpx.Client, path: str, lookup: str) -> httpx.Response:
+        """
+        Open Library'ye GET isteği gönderir.
+
+        Tekrar denenebilir hatalarda (bağlantı hatası, 429, 5xx) en fazla
+        retry.max_retries kez yeniden dener. Denemeler tükendiğinde son
+        yanıt döndürülür ya da son bağlantı hatası fırlatılır.
+
+        Args:
+            client (httpx.Client): Kullanılacak HTTP istemcisi
+            path (str): Kök adrese göre yol (örn. /isbn/9780451524935.json)
+            lookup (str): Metrik etiketi ("book" veya "author")
+
+        Returns:
+            httpx.Response: Sunucunun yanıtı
+
+        Raises:
+            UpstreamUnavailable: Devre açıksa ya da hız sınırı beklemesi aşıldıysa
+            httpx.RequestError: Denemeler bağlantı hatasıyla tükendiyse
+        """
+        url = f"{self.base_url}{path}"
+        attempt = 0
+        while True:
+            # Devre açıksa hız sınırı için beklemeden hemen reddet
+            retry_after = self.breaker.retry_after()
+            if retry_after > 0:
+                raise CircuitOpenError(retry_after)
+            if self.rate_limiter is not None and not self.rate_limiter.acquire(self.max_wait):
+                raise RateLimitTimeout("Open Library hız sınırı için bekleme süresi aşıldı.")
+            self.breaker.before_call()
+
+            try:
+                response = self._send(client, url, lookup)
+            except httpx.RequestError:
+                self.breaker.record_failure()
+                if attempt >= self.retry.max_retries:
+                    raise
+                delay = self.retry.backoff(attempt)
+            except Exception:
+                self.breaker.record_failure()
+                raise
+            else:
+                if not self.retry.is_retryable_status(response.status_code):
+                    self.breaker.record_success()
+                    return response
+                # 429 servis çöküşü değil, yalnızca yavaşlama isteğidir
+                if response.status_code == 429:
+                    self.breaker.record_success()
+                else:
+                    self.breaker.record_failure()
+                if attempt >= self.retry.max_retries:
+                    return response
+                delay = self.retry.backoff(attempt, _retry_after_seconds(response))
+
+            metrics.UPSTREAM_RETRIES.labels(lookup).inc()
+            self._sleep(delay)
+            attempt += 1
+
+    def _send(self, client: httpx.Client, url: str, lookup: str) -> httpx.Response:
+        """Tek bir isteği gönderir; süre, durum kodu ve hataları metriklere yazar."""
+        with tracing.span(f"openlibrary.fetch_{lookup}", tracing.KIND_CLIENT, url=url) as span:
+            start = time.perf_counter()
+            try:
+                response = client.get(url)
+            except httpx.RequestError:
+                metrics.UPSTREAM_ERRORS.labels(lookup, "connection").inc()
+                raise
+            finally:
+                metrics.UPSTREAM_REQUEST_DURATION.labels(lookup).observe(time.perf_counter() - start)
+            span.set_attribute("http.status_code", response.status_code)
+
+        metrics.UPSTREAM_REQUESTS.labels(lookup, str(response.status_code)).inc()
+        if response.status_code >= 500:
+            metrics.UPSTREAM_ERRORS.labels(lookup, "server_error").inc()
+        return response
+
+    def state(self) -> dict:
+        """Devre kesici, hız sınırlayıcı ve tekrar deneme ayarlarının anlık durumu."""
+        return {
+            "base_url": self.base_url,
+            "timeout": self.timeout,
+            "circuit_breaker": self.breaker.snapshot(),
+            "rate_limiter": self.rate_limiter.state() if self.rate_limiter else None,
+            "retry": {
+                "max_retries": self.retry.max_retries,
+                "base_delay": self.retry.base_delay,
+                "max_delay": self.retry.max_delay,
+            },
+        }
+
+
+def client_from_settings(settings, base_url: Optional[str] = None) -> OpenLibraryClient:
+    """
+    Uygulama ayarlarından paylaşılan bir OpenLibraryClient oluşturur.
+
+    Args:
+        settings (Settings): Uygulama ayarları
+        base_url (Optional[str]): Kök adres (varsayılan: settings.openlibrary_url);
+            kapak sunucusu gibi başka bir adres için kullanılır
+
+    Returns:
+        OpenLibraryClient: Yapılandırılmış istemci
+    """
+    rate_limiter = None
+    if settings.upstream_rate_limit > 0:
+        rate_limiter = TokenBucket(settings.upstream_rate_limit, settings.upstream_burst)
+    return OpenLibraryClient(
+        base_url=base_url or settings.openlibrary_url,
+        timeout=settings.upstream_timeout,
+        rate_limiter=rate_limiter,
+        retry=RetryPolicy(settings.upstream_max_retries, settings.upstream_backoff_base,
+                          settings.upstream_backoff_max),
+        breaker=CircuitBreaker(settings.breaker_failure_threshold, settings.breaker_reset_timeout),
+    )
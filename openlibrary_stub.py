@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Kütüphane Yönetim Sistemi - Yerel Open Library Taklidi
+
+Bu modül yük testleri ve entegrasyon testleri için Open Library API'sinin
+kullandığımız kısmını (/isbn/*.json, /authors/*.json ve kapak sunucusunun
+/b/isbn/*.jpg yolu) bir fixture korpusundan sunan küçük bir HTTP sunucusu
+sağlar. Gecikme, hata (5xx) ve 404 enjeksiyonu yapılandırılabilir.
+
+Kullanım:
+    python openlibrary_stub.py --corpus fixtures/openlibrary_corpus.json --latency-ms 50
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+
+DEFAULT_CORPUS = "fixtures/openlibrary_corpus.json"
+
+ISBN_PATH = re.compile(r"^/isbn/([^/]+)\.json$")
+AUTHOR_PATH = re.compile(r"^/authors/([^/]+)\.json$")
+COVER_PATH = re.compile(r"^/b/isbn/([^/]+-[SML])\.jpg$")
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    """Taklit sunucunun HTTP istek işleyicisi."""
+
+    server_version = "OpenLibraryStub/1.0"
+
+    def do_GET(self):
+        stub = self.server.stub
+        path = self.path.split("?", 1)[0]
+        status, body = stub.handle(path)
+        if isinstance(body, bytes):
+            payload, content_type = body, "image/jpeg"
+        else:
+            payload, content_type = json.dumps(body, ensure_ascii=False).encode("utf-8"), "application/json"
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        # Yük testlerinde konsolu doldurmamak için erişim logu kapalı
+        pass
+
+
+class OpenLibraryStub:
+    """
+    Open Library API'sini fixture korpusundan taklit eden HTTP sunucusu.
+    Context manager olarak kullanılabilir; başlatıldığında kök adresi döndürür.
+    """
+
+    def __init__(self, corpus: Optional[dict] = None, latency_ms: float = 0.0,
+                 jitter_ms: float = 0.0, error_rate: float = 0.0,
+                 not_found_rate: float = 0.0, seed: Optional[int] = None,
+                 host: str = "127.0.0.1", port: int = 0, fail_first: int = 0,
+                 error_status: int = 503, covers: Optional[Dict[str, bytes]] = None):
+        """
+        OpenLibraryStub sınıfının constructor'ı.
+
+        Args:
+            corpus (Optional[dict]): {"editions": {isbn: {...}}, "authors": {key: {...}}}
+            latency_ms (float): Her yanıta eklenecek sabit gecikme (ms)
+            jitter_ms (float): Gecikmeye eklenecek rastgele sapmanın üst sınırı (ms)
+            error_rate (float): Hata döndürülecek isteklerin oranı (0-1)
+            not_found_rate (float): Korpusta olsa bile 404 döndürülecek isteklerin oranı (0-1)
+            seed (Optional[int]): Tekrarlanabilir enjeksiyon için rastgele tohum
+            host (str): Dinlenecek adres
+            port (int): Dinlenecek port (0 ise boş bir port seçilir)
+            fail_first (int): İlk kaç isteğin hata ile yanıtlanacağı (geçici arıza taklidi)
+            error_status (int): Enjekte edilen hatalarda döndürülecek durum kodu
+            covers (Optional[Dict[str, bytes]]): "isbn-boyut" -> görsel (örn. "978-0451524935-M")
+        """
+        corpus = corpus or {}
+        self.editions: Dict[str, dict] = dict(corpus.get("editions", {}))
+        self.authors: Dict[str, dict] = dict(corpus.get("authors", {}))
+        self.covers: Dict[str, bytes] = dict(covers or {})
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.not_found_rate = not_found_rate
+        self.fail_first = fail_first
+        self.error_status = error_status
+        self.host = host
+        self.port = port
+        self.request_counts: Dict[str, int] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_file(cls, filename: str = DEFAULT_CORPUS, **options) -> 'OpenLibraryStub':
+        """
+        Korpusu JSON dosyasından yükleyerek taklit sunucu oluşturur.
+
+        Args:
+            filename (str): Korpus dosyası
+            **options: OpenLibraryStub constructor'ına iletilecek ayarlar
+
+        Returns:
+            OpenLibraryStub: Oluşturulan taklit sunucu
+        """
+        with open(filename, 'r', encoding='utf-8') as file:
+            corpus = json.load(file)
+        return cls(corpus, **options)
+
+    @property
+    def base_url(self) -> str:
+        """Sunucunun kök adresi (Library'nin base_url parametresine verilir)."""
+        return f"http://{self.host}:{self.port}"
+
+    def handle(self, path: str) -> tuple:
+        """
+        Bir isteğin yanıtını üretir; gecikme ve hata enjeksiyonunu uygular.
+
+        Args:
+            path (str): İstek yolu
+
+        Returns:
+            tuple: (HTTP durum kodu, JSON gövdesi ya da görsel byte'ları)
+        """
+        with self._lock:
+            kind = ("isbn" if path.startswith("/isbn/") else "author" if path.startswith("/authors/")
+                    else "cover" if path.startswith("/b/") else "other")
+            self.request_counts[kind] = self.request_counts.get(kind, 0) + 1
+            delay = self.latency_ms + self._random.uniform(0, self.jitter_ms)
+            inject_error = self._random.random() < self.error_rate
+            if self.fail_first > 0:
+                self.fail_first -= 1
+                inject_error = True
+            inject_not_found = self._random.random() < self.not_found_rate
+
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+        if inject_error:
+            return self.error_status, {"error": "injected failure"}
+        if inject_not_found:
+            return 404, {"error": "notfound"}
+
+        match = ISBN_PATH.match(path)
+        if match and match.group(1) in self.editions:
+            return 200, self.editions[match.group(1)]
+        match = AUTHOR_PATH.match(path)
+        if match and match.group(1) in self.authors:
+            return 200, self.authors[match.group(1)]
+        match = COVER_PATH.match(path)
+        if match and match.group(1) in self.covers:
+            return 200, self.covers[match.group(1)]
+        return 404, {"error": "notfound", "key": path}
+
+    def start(self) -> str:
+        """
+        Sunucuyu arka plan thread'inde başlatır.
+
+        Returns:
+            str: Sunucunun kök adresi
+        """
+        self._server = ThreadingHTTPServer((self.host, self.port), _StubRequestHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        kwargs={"poll_interval": 0.05}, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self) -> None:
+        """Sunucuyu durdurur."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> 'OpenLibraryStub':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+
+def main() -> None:
+    """Taklit sunucuyu komut satırından başlatır."""
+    parser = argparse.ArgumentParser(description="Yerel Open Library taklidi")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="Korpus JSON dosyası")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--not-found-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    stub = OpenLibraryStub.from_file(
+        args.corpus, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate, not_found_rate=args.not_found_rate,
+        seed=args.seed, host=args.host, port=args.port, error_status=args.error_status,
+    )
+    print(f"Open Library taklidi çalışıyor: {stub.start()}")
+    print("LIBRARY_OPENLIBRARY_URL ayarını bu adrese yönlendirin. Çıkmak için Ctrl+C.")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
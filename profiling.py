@@ -0,0 +1,232 @@
+"""
+Kütüphane Yönetim Sistemi - İsteğe Bağlı Profilleme
+
+Bu modül tek bir API isteğini ya da CLI komutunu cProfile ile sarmalayıp
+sonuçları profil dizinine `.pstats` dosyası ve en pahalı N fonksiyonu
+listeleyen bir `.txt` özeti olarak kaydeder. Üretime benzer bir katalogda
+yavaş `GET /stats` veya toplu içe aktarma gibi işlemleri yeniden dağıtım
+yapmadan incelemek için kullanılır.
+
+Not: cProfile yalnızca etkinleştirildiği thread'i izler. Asenkron
+handler'lar event loop thread'inde çalışır; işi thread havuzuna devreden
+handler'lar (kitap ekleme/silme, toplu işlemler, analitik) bunun için bu
+modüldeki run_in_threadpool'u kullanır: profilli bir istekte worker
+thread'deki çalışma ayrı bir cProfile ile ölçülüp isteğin profiline eklenir.
+Başka yollarla başlatılan thread'ler (örn. Open Library çekimleri) profile
+girmez. Profil süresince aynı loop'ta çalışan profilsiz istekler de sonuca
+karışabilir; profilli istekler ise birbirini bekler, profilleri iç içe geçmez.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import cProfile
+import io
+import os
+import pstats
+import re
+import time
+from typing import Any, Callable, Iterator, List, Optional
+
+from starlette import concurrency
+
+
+PROFILE_HEADER = "x-profile"
+PROFILE_PATH_HEADER = "x-profile-path"
+
+# İşlenmekte olan profilli isteğin oturumu; worker thread'lere de kopyalanır
+_current_session: contextvars.ContextVar[Optional["ProfileSession"]] = \
+    contextvars.ContextVar("profile_session", default=None)
+
+
+class ProfileResult:
+    """Tamamlanmış bir profillemenin dosya yolları ve süresi."""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.stats_path: Optional[str] = None
+        self.summary_path: Optional[str] = None
+        self.elapsed = 0.0
+
+
+def _safe_label(label: str) -> str:
+    """Etiketi dosya adında kullanılabilir hale getirir."""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", label).strip("_") or "profile"
+
+
+class ProfileSession:
+    """
+    Başlatılıp durdurulabilen tek bir cProfile oturumu. Dosya yolları
+    oturum oluşturulurken belirlenir; dosyalar stop() ile yazılır.
+    """
+
+    def __init__(self, directory: str, label: str, top_n: int = 30,
+                 sort_by: str = "cumulative"):
+        """
+        ProfileSession sınıfının constructor'ı.
+
+        Args:
+            directory (str): Profil dosyalarının yazılacağı dizin
+            label (str): Dosya adında kullanılacak etiket (örn. "GET_stats")
+            top_n (int): Özette listelenecek fonksiyon sayısı
+            sort_by (str): Özetin sıralama ölçütü (pstats sort key)
+        """
+        self.directory = directory
+        self.top_n = top_n
+        self.sort_by = sort_by
+        self.result = ProfileResult(label)
+        stamp = time.strftime("%Y%m%d-%H%M%S") + f"-{time.time_ns() % 1_000_000:06d}"
+        base = os.path.join(directory, f"{stamp}-{_safe_label(label)}")
+        self.result.stats_path = base + ".pstats"
+        self.result.summary_path = base + ".txt"
+        self._profiler = cProfile.Profile()
+        # Worker thread'lerde toplanan profiller; stop() ile birleştirilir
+        self._workers: List[cProfile.Profile] = []
+        self._start: Optional[float] = None
+        self.running = False
+
+    def start(self) -> None:
+        """Profillemeyi başlatır."""
+        self.running = True
+        self._start = time.perf_counter()
+        self._profiler.enable()
+
+    def stop(self) -> ProfileResult:
+        """Profillemeyi durdurup dosyaları yazar; ikinci çağrı bir şey yapmaz."""
+        if not self.running:
+            return self.result
+        self._profiler.disable()
+        self.running = False
+        result = self.result
+        result.elapsed = time.perf_counter() - self._start
+        os.makedirs(self.directory, exist_ok=True)
+        summary = io.StringIO()
+        stats = pstats.Stats(self._profiler, *self._workers, stream=summary)
+        stats.dump_stats(result.stats_path)
+
+        summary.write(f"{result.label} - {result.elapsed * 1000:.1f} ms\n\n")
+        stats.sort_stats(self.sort_by).print_stats(self.top_n)
+        with open(result.summary_path, 'w', encoding='utf-8') as file:
+            file.write(summary.getvalue())
+        return result
+
+    def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        func'ı çağıran thread'de ayrı bir cProfile ile çalıştırır; ölçüm
+        oturum hâlâ sürüyorsa stop() sırasında oturumun profiline eklenir.
+        """
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Python 3.12+: etkin profil zaten tüm thread'leri izliyor
+            return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.disable()
+            if self.running:
+                self._workers.append(profiler)
+
+
+@contextlib.contextmanager
+def profile(directory: str, label: str, top_n: int = 30,
+            sort_by: str = "cumulative") -> Iterator[ProfileResult]:
+    """
+    Bloğu cProfile ile çalıştırıp sonuçları profil dizinine kaydeder.
+
+    Args:
+        directory (str): Profil dosyalarının yazılacağı dizin
+        label (str): Dosya adında kullanılacak etiket (örn. "GET_stats")
+        top_n (int): Özette listelenecek fonksiyon sayısı
+        sort_by (str): Özetin sıralama ölçütü (pstats sort key)
+
+    Yields:
+        ProfileResult: Blok bittiğinde dosya yolları doldurulan sonuç nesnesi
+    """
+    session = ProfileSession(directory, label, top_n, sort_by)
+    session.start()
+    try:
+        yield session.result
+    finally:
+        session.stop()
+
+
+async def run_in_threadpool(func: Callable, *args, **kwargs) -> Any:
+    """
+    starlette.concurrency.run_in_threadpool'un profilli isteklerde worker
+    thread'deki çalışmayı da profile ekleyen karşılığı.
+
+    Args:
+        func (Callable): Thread havuzunda çalıştırılacak fonksiyon
+
+    Returns:
+        Any: func'ın dönüş değeri
+    """
+    session = _current_session.get()
+    if session is None or not session.running:
+        return await concurrency.run_in_threadpool(func, *args, **kwargs)
+    return await concurrency.run_in_threadpool(session.run, func, *args, **kwargs)
+
+
+class ProfilingMiddleware:
+    """
+    `X-Profile: 1` başlığı taşıyan istekleri cProfile ile sarmalayan saf
+    ASGI middleware'i. Yalnızca ayarlarda profilleme açıkken eklenir.
+
+    Profil handler yanıt başlıklarını gönderene kadar sürer; gövde
+    bekletilmeden iletilir, böylece SSE ve akışlı dışa aktarım gibi yanıtlar
+    da profillenebilir (akış sırasında üretilen gövde profile girmez).
+    Profil dosyasının yolu `X-Profile-Path` başlığıyla eklenir. Aynı anda
+    yalnızca bir profil alınır; profilli istekler birbirini sırayla bekler.
+    Handler'ların run_in_threadpool ile thread havuzunda yaptığı iş de
+    profile girer.
+    """
+
+    def __init__(self, app, directory: str, top_n: int = 30):
+        self.app = app
+        self.directory = directory
+        self.top_n = top_n
+        self._lock = asyncio.Lock()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        session = ProfileSession(self.directory, f"{scope['method']} {scope['path']}", self.top_n)
+        await self._lock.acquire()
+        held = True
+
+        def finish():
+            nonlocal held
+            if held:
+                held = False
+                try:
+                    session.stop()
+                finally:
+                    self._lock.release()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and held:
+                finish()
+                headers = list(message.get("headers", []))
+                headers.append((PROFILE_PATH_HEADER.encode(), session.result.stats_path.encode()))
+                message = dict(message, headers=headers)
+            await send(message)
+
+        # Kilit, başlatma da dahil her durumda bırakılır
+        token = _current_session.set(session)
+        try:
+            session.start()
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_session.reset(token)
+            finish()
+
+    @staticmethod
+    def _requested(scope) -> bool:
+        for key, value in scope.get("headers", []):
+            if key == PROFILE_HEADER.encode():
+                return value.strip().lower() in (b"1", b"true", b"yes")
+        return False
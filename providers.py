@@ -0,0 +1,604 @@
+"""
+Kütüphane Yönetim Sistemi - Kitap Bilgisi Sağlayıcı Zinciri
+
+Bu modül bir ISBN'in başlık, yazar ve edition bilgilerini sırayla birden
+çok kaynağa soran sağlayıcı zincirini sağlar. Varsayılan sıra: bellekteki
+önbellek, yerel döküm dosyası, Open Library ve yapılandırılan diğer
+(Open Library uyumlu) kaynaklar. İlk bulan kazanır; bulunamayan ya da hata
+veren sağlayıcıdan sonra bir sonrakine geçilir. Uzak bir kaynaktan gelen
+sonuç, zincirde ondan önce gelen önbelleklere de yazılır.
+
+Her sağlayıcının kendi zaman aşımı olabilir. Hedge süresi ayarlandıysa ve
+sağlayıcı bu süre içinde yanıt vermezse aynı istek ikinci kez gönderilir
+(hedged request); hangisi önce yanıt verirse o kullanılır. Böylece
+sağlayıcının kuyruk gecikmesi (p99) yalnızca iki istek birden yavaş
+kaldığında hissedilir. Sağlayıcı başına çağrı sayıları, hedge'ler ve
+gecikme yüzdelikleri stats() ile raporlanır.
+"""
+
+import contextlib
+import contextvars
+import gzip
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Union
+
+import httpx
+
+from book import Book
+import catalog_diff
+from isbn import canonical_isbn
+from openlibrary import OpenLibraryClient, client_from_settings, edition_metadata
+from resilience import UpstreamUnavailable
+import metrics
+import tracing
+
+
+# Yazar adı önbelleğinde tutulacak en fazla kayıt sayısı
+AUTHOR_CACHE_SIZE = 10_000
+
+# Bellek önbelleği sağlayıcısında tutulacak varsayılan kitap sayısı
+CACHE_SIZE = 50_000
+
+# Gecikme yüzdelikleri için sağlayıcı başına tutulan son ölçüm sayısı
+STATS_WINDOW = 1024
+
+# Aynı anda çalışan zaman aşımlı ve hedge'li çağrı sayısı; zaman aşımına
+# uğrayan ya da yarışı kaybeden çağrılar bu sınırdan düşülür
+CALL_WORKERS = 16
+
+# close() çağrısında süren çağrıların bitmesi için beklenecek en uzun süre (saniye)
+CLOSE_TIMEOUT = 5.0
+
+UNKNOWN_AUTHOR = "Bilinmeyen Yazar"
+UNKNOWN_TITLE = "Bilinmeyen Başlık"
+
+
+class ProviderTimeout(UpstreamUnavailable):
+    """Sağlayıcı zaman aşımı içinde yanıt vermediğinde fırlatılır."""
+
+    def __init__(self, provider: str, timeout: float):
+        super().__init__(f"{provider} {timeout:g} saniye içinde yanıt vermedi.")
+        self.provider = provider
+
+
+class MetadataProvider:
+    """
+    Kitap bilgisi sağlayıcılarının temel sınıfı.
+
+    Attributes:
+        name (str): Metrik ve istatistiklerde kullanılan ad
+        timeout (Optional[float]): Tek bir sorgunun zaman aşımı (None: yok)
+        hedge (bool): Yavaş yanıtta ikinci istek gönderilebilir mi
+            (yalnızca yan etkisiz, uzak sağlayıcılar için anlamlıdır)
+    """
+
+    name = "provider"
+    timeout: Optional[float] = None
+    hedge = False
+
+    def lookup(self, isbn: str, session=None) -> Optional[Book]:
+        """
+        ISBN'in bilgilerini döndürür.
+
+        Args:
+            isbn (str): Aranan ISBN
+            session: session() ile açılmış, toplu sorgularda paylaşılan kaynak
+
+        Returns:
+            Optional[Book]: Bulunursa ISBN'i isbn olan Book, bulunamazsa None
+
+        Raises:
+            Exception: Kaynak şu anda yanıt veremiyorsa
+        """
+        raise NotImplementedError
+
+    def remember(self, book: Book) -> None:
+        """Zincirde sonraki bir sağlayıcının bulduğu kitabı saklar (önbellekler için)."""
+
+    def session(self):
+        """Toplu sorgularda paylaşılacak kaynağı açan context manager (örn. HTTP istemcisi)."""
+        return contextlib.nullcontext()
+
+
+def _with_isbn(book: Book, isbn: str) -> Book:
+    """Kitabı istenen ISBN yazımıyla döndürür (önbellekler kanonik ISBN'le eşler)."""
+    return book if book.isbn == isbn else Book.from_dict(dict(book.to_dict(), isbn=isbn))
+
+
+class MemoryCacheProvider(MetadataProvider):
+    """
+    Daha önce çözülmüş kitapları kanonik ISBN'e göre tutan LRU önbellek.
+    """
+
+    name = "cache"
+
+    def __init__(self, max_size: int = CACHE_SIZE):
+        """
+        MemoryCacheProvider sınıfının constructor'ı.
+
+        Args:
+            max_size (int): Tutulacak en fazla kitap sayısı
+        """
+        self.max_size = max_size
+        self._books: "OrderedDict[str, Book]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, isbn: str, session=None) -> Optional[Book]:
+        key = canonical_isbn(isbn)
+        with self._lock:
+            book = self._books.get(key)
+            if book is not None:
+                self._books.move_to_end(key)
+        return None if book is None else _with_isbn(book, isbn)
+
+    def remember(self, book: Book) -> None:
+        key = canonical_isbn(book.isbn)
+        with self._lock:
+            self._books[key] = book
+            self._books.move_to_end(key)
+            if len(self._books) > self.max_size:
+                self._books.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._books)
+
+
+class DumpProvider(MetadataProvider):
+    """
+    Yerel bir kitap dosyasından (Library JSON kataloğu ya da dışa aktarılmış
+    NDJSON, gzip'li olabilir) bilgi veren sağlayıcı. Dosya ilk sorguda bir
+    kez okunup kanonik ISBN'e göre indekslenir.
+    """
+
+    name = "dump"
+
+    def __init__(self, path: str):
+        """
+        DumpProvider sınıfının constructor'ı.
+
+        Args:
+            path (str): Kitap dosyası (.json katalog, .ndjson/.jsonl; .gz olabilir)
+        """
+        self.path = path
+        self._records: Optional[Dict[str, dict]] = None
+        self._lock = threading.Lock()
+
+    def _read(self) -> Iterator[dict]:
+        if self.path.endswith(".json"):
+            yield from catalog_diff.read_catalog(self.path)
+            return
+        opener = gzip.open if self.path.endswith(".gz") else open
+        with opener(self.path, 'rt', encoding='utf-8') as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+    def _index(self) -> Dict[str, dict]:
+        with self._lock:
+            if self._records is None:
+                records: Dict[str, dict] = {}
+                for record in self._read():
+                    if record.get("isbn") and record.get("title"):
+                        records.setdefault(canonical_isbn(str(record["isbn"])), record)
+                self._records = records
+            return self._records
+
+    def lookup(self, isbn: str, session=None) -> Optional[Book]:
+        record = self._index().get(canonical_isbn(isbn))
+        if record is None:
+            return None
+        return Book.from_dict(dict(record, isbn=isbn, author=record.get("author") or UNKNOWN_AUTHOR))
+
+
+class OpenLibraryProvider(MetadataProvider):
+    """
+    Open Library (ya da uyumlu bir ayna/taklit) API'sinden edition ve yazar
+    bilgilerini çeken sağlayıcı. İstekler istemcinin hız sınırlayıcı, tekrar
+    deneme ve devre kesicisinden geçer; yazar adları sınırlı bir önbellekte tutulur.
+    """
+
+    hedge = True
+
+    def __init__(self, upstream: OpenLibraryClient, name: str = "openlibrary",
+                 timeout: Optional[float] = None):
+        """
+        OpenLibraryProvider sınıfının constructor'ı.
+
+        Args:
+            upstream (OpenLibraryClient): Kullanılacak istemci
+            name (str): Sağlayıcının adı
+            timeout (Optional[float]): Tek bir sorgunun (edition + yazar) zaman aşımı
+        """
+        self.upstream = upstream
+        self.name = name
+        self.timeout = timeout
+        self._author_names: "OrderedDict[str, str]" = OrderedDict()
+        self._author_lock = threading.Lock()
+
+    def session(self):
+        return self.upstream.http_client()
+
+    def lookup(self, isbn: str, session=None) -> Optional[Book]:
+        if session is None:
+            with self.upstream.http_client() as client:
+                return self._fetch_book(client, isbn)
+        return self._fetch_book(session, isbn)
+
+    def _fetch_book(self, client: httpx.Client, isbn: str) -> Optional[Book]:
+        """
+        Kitap ve yazar bilgilerini çekip Book nesnesi oluşturur.
+
+        Raises:
+            UpstreamUnavailable, httpx.RequestError, httpx.HTTPStatusError: İstek başarısızsa
+        """
+        response = self.upstream.get(client, f"/isbn/{isbn}.json", "book")
+        if response.status_code == 404:
+            return None
+
+        response.raise_for_status()
+        book_data = response.json()
+
+        title = book_data.get("title", UNKNOWN_TITLE)
+        # İlk yazarın tam adını al
+        authors = book_data.get("authors", [])
+        author_key = authors[0].get("key", "") if authors else ""
+        author = self._author_name(client, author_key) if author_key else UNKNOWN_AUTHOR
+        return Book(title=title, author=author, isbn=isbn, **edition_metadata(book_data))
+
+    def _author_name(self, client: httpx.Client, author_key: str) -> str:
+        """
+        Yazar anahtarını tam ada çevirir. Aynı yazarın diğer kitapları için
+        tekrar istek atmamak amacıyla sonuçlar sınırlı bir önbellekte tutulur.
+
+        Args:
+            client (httpx.Client): Kullanılacak HTTP istemcisi
+            author_key (str): Open Library yazar anahtarı (örn. /authors/OL23919A)
+
+        Returns:
+            str: Yazarın adı, alınamazsa "Bilinmeyen Yazar"
+        """
+        with self._author_lock:
+            name = self._author_names.get(author_key)
+            if name is not None:
+                self._author_names.move_to_end(author_key)
+        if name is not None:
+            metrics.CACHE_REQUESTS.labels("author", "hit").inc()
+            return name
+        metrics.CACHE_REQUESTS.labels("author", "miss").inc()
+
+        author_response = self.upstream.get(client, f"{author_key}.json", "author")
+        if author_response.status_code != 200:
+            return UNKNOWN_AUTHOR
+
+        name = author_response.json().get("name", UNKNOWN_AUTHOR)
+        with self._author_lock:
+            self._author_names[author_key] = name
+            if len(self._author_names) > AUTHOR_CACHE_SIZE:
+                self._author_names.popitem(last=False)
+        return name
+
+
+class StubProvider(MetadataProvider):
+    """
+    Testler için bellekteki kayıtlardan yanıt veren sağlayıcı. Gecikme ve
+    hata enjekte edilebilir; gecikme her çağrıda değiştirilebilir.
+    """
+
+    def __init__(self, records: Mapping[str, dict], name: str = "stub",
+                 latency: Union[float, Callable[[], float]] = 0.0, error: Optional[Exception] = None,
+                 timeout: Optional[float] = None, hedge: bool = False):
+        """
+        StubProvider sınıfının constructor'ı.
+
+        Args:
+            records (Mapping[str, dict]): ISBN -> {"title", "author", ...}
+            name (str): Sağlayıcının adı
+            latency (Union[float, Callable[[], float]]): Her sorgudan önce beklenecek
+                süre (saniye); fonksiyon verilirse her çağrıda yeniden hesaplanır
+            error (Optional[Exception]): Verilirse her sorguda fırlatılır
+            timeout (Optional[float]): Sorgu zaman aşımı
+            hedge (bool): Yavaş yanıtta ikinci istek gönderilebilir mi
+        """
+        self.records = {canonical_isbn(isbn): record for isbn, record in records.items()}
+        self.name = name
+        self.latency = latency
+        self.error = error
+        self.timeout = timeout
+        self.hedge = hedge
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def lookup(self, isbn: str, session=None) -> Optional[Book]:
+        with self._lock:
+            self.calls += 1
+            latency = self.latency() if callable(self.latency) else self.latency
+        if latency:
+            time.sleep(latency)
+        if self.error is not None:
+            raise self.error
+        record = self.records.get(canonical_isbn(isbn))
+        return None if record is None else Book.from_dict(dict(record, isbn=isbn))
+
+
+class ProviderStats:
+    """Bir sağlayıcının çağrı sayıları ve son çağrılarının gecikmeleri."""
+
+    OUTCOMES = ("found", "not_found", "error", "timeout")
+
+    def __init__(self):
+        self.counts = dict.fromkeys(self.OUTCOMES, 0)
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._latencies: deque = deque(maxlen=STATS_WINDOW)
+        self._lock = threading.Lock()
+
+    def record(self, provider: str, outcome: str, seconds: float) -> None:
+        with self._lock:
+            self.counts[outcome] += 1
+            self._latencies.append(seconds)
+        metrics.PROVIDER_DURATION.labels(provider, outcome).observe(seconds)
+
+    def count_hedge(self, won: bool = False) -> None:
+        """Gönderilen (won=False) ya da yarışı kazanan (won=True) hedge isteğini sayar."""
+        with self._lock:
+            if won:
+                self.hedge_wins += 1
+            else:
+                self.hedged += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            result = {"calls": sum(self.counts.values()), **self.counts,
+                      "hedged": self.hedged, "hedge_wins": self.hedge_wins}
+        if latencies:
+            def percentile(p: float) -> float:
+                return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000, 3)
+            result["latency_ms"] = {"p50": percentile(0.50), "p95": percentile(0.95),
+                                    "p99": percentile(0.99), "max": round(latencies[-1] * 1000, 3)}
+        return result
+
+
+class ProviderChain:
+    """
+    Sağlayıcıları sırayla deneyen, ilk bulan sağlayıcının sonucunu döndüren zincir.
+    """
+
+    def __init__(self, providers: Iterable[MetadataProvider], hedge_after: Optional[float] = None,
+                 workers: int = CALL_WORKERS):
+        """
+        ProviderChain sınıfının constructor'ı.
+
+        Args:
+            providers (Iterable[MetadataProvider]): Sırasıyla denenecek sağlayıcılar
+            hedge_after (Optional[float]): hedge destekleyen sağlayıcı bu süre (saniye)
+                içinde yanıt vermezse ikinci istek gönderilir (None: kapalı)
+            workers (int): Aynı anda çalışan zaman aşımlı ve hedge'li çağrı sayısı
+        """
+        self.providers: List[MetadataProvider] = list(providers)
+        self.hedge_after = hedge_after or None
+        self._stats = {provider.name: ProviderStats() for provider in self.providers}
+        # Her çağrı kendi thread'inde çalışır ve bir yuva tutar. Bırakılan (zaman
+        # aşımı, kaybeden hedge) çağrılar yuvasını hemen geri verir; iptal
+        # edilemeseler de yeni sorguların önünü tıkamazlar.
+        self._slots = threading.BoundedSemaphore(workers)
+        self._slotted: set = set()
+        self._threads: set = set()
+        self._calls_lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def session(self):
+        """
+        Toplu sorgular için sağlayıcıların paylaşılan kaynaklarını açar.
+
+        Yields:
+            dict: Sağlayıcı adı -> oturum; lookup'a sessions olarak verilir
+        """
+        with contextlib.ExitStack() as stack:
+            yield {provider.name: stack.enter_context(provider.session())
+                   for provider in self.providers}
+
+    def lookup(self, isbn: str, sessions: Optional[dict] = None) -> Optional[Book]:
+        """
+        Sağlayıcıları sırayla dener; ilk bulunan kitabı döndürür ve önceki
+        sağlayıcılara (önbelleklere) yazar.
+
+        Args:
+            isbn (str): Aranan ISBN
+            sessions (Optional[dict]): session() ile açılmış oturumlar
+
+        Returns:
+            Optional[Book]: Kitap; hiçbir sağlayıcıda yoksa None
+
+        Raises:
+            Exception: Hiçbir sağlayıcı bulamadıysa ve en az biri hata verdiyse ilk hata
+        """
+        errors: List[Exception] = []
+        for position, provider in enumerate(self.providers):
+            session = sessions.get(provider.name) if sessions else None
+            try:
+                book = self._call(provider, isbn, session)
+            except Exception as e:
+                errors.append(e)
+                continue
+            if book is not None:
+                for earlier in self.providers[:position]:
+                    earlier.remember(book)
+                return book
+        if errors:
+            raise errors[0]
+        return None
+
+    def _submit(self, provider: MetadataProvider, isbn: str, session) -> Future:
+        """Sorguyu kendi thread'inde başlatır; çağıran bir yuva almış olmalıdır."""
+        future: Future = Future()
+        # İzleme bağlamı (trace) çağrı thread'inde de geçerli olsun
+        context = contextvars.copy_context()
+
+        def run():
+            future.set_running_or_notify_cancel()
+            try:
+                result = context.run(provider.lookup, isbn, session)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+            finally:
+                with self._calls_lock:
+                    self._threads.discard(thread)
+
+        thread = threading.Thread(target=run, name=f"provider-{provider.name}", daemon=True)
+        with self._calls_lock:
+            self._slotted.add(future)
+            self._threads.add(thread)
+        future.add_done_callback(self._release)
+        thread.start()
+        return future
+
+    def _release(self, future: Future) -> None:
+        """Çağrının yuvasını (bitince ya da bırakılınca, bir kez) geri verir."""
+        with self._calls_lock:
+            if future not in self._slotted:
+                return
+            self._slotted.discard(future)
+        self._slots.release()
+
+    def _call(self, provider: MetadataProvider, isbn: str, session) -> Optional[Book]:
+        """Tek bir sağlayıcıyı zaman aşımı ve hedge ile çağırır; sonucu istatistiğe yazar."""
+        stats = self._stats[provider.name]
+        hedge_after = self.hedge_after if provider.hedge else None
+        start = time.perf_counter()
+        with tracing.span("metadata.lookup", provider=provider.name, isbn=isbn) as span:
+            try:
+                if provider.timeout is None and hedge_after is None:
+                    book = provider.lookup(isbn, session)
+                else:
+                    book = self._race(provider, isbn, session, stats, hedge_after)
+            except ProviderTimeout:
+                stats.record(provider.name, "timeout", time.perf_counter() - start)
+                span.set_attribute("outcome", "timeout")
+                raise
+            except Exception:
+                stats.record(provider.name, "error", time.perf_counter() - start)
+                span.set_attribute("outcome", "error")
+                raise
+            outcome = "not_found" if book is None else "found"
+            stats.record(provider.name, outcome, time.perf_counter() - start)
+            span.set_attribute("outcome", outcome)
+            return book
+
+    def _race(self, provider: MetadataProvider, isbn: str, session, stats: ProviderStats,
+              hedge_after: Optional[float]) -> Optional[Book]:
+        """
+        Sorguyu ayrı bir thread'de çalıştırır; hedge_after dolunca ikinci
+        isteği gönderir ve ilk başarılı yanıtı döndürür. Zaman aşımı ve hedge
+        süresi istek gerçekten başladığında (yuva alındığında) işlemeye başlar.
+        Zaman aşımında kalan ya da kaybeden istekler iptal edilemez; yuvalarını
+        bırakıp arka planda tamamlanır ve sonuçları atılır. Boş yuva yoksa
+        hedge isteği gönderilmez.
+        """
+        self._slots.acquire()
+        start = time.perf_counter()
+        deadline = start + provider.timeout if provider.timeout is not None else None
+        hedge_at = start + hedge_after if hedge_after is not None else None
+        primary = self._submit(provider, isbn, session)
+        pending = {primary}
+        error: Optional[BaseException] = None
+        try:
+            while True:
+                until = [moment for moment in (deadline, hedge_at) if moment is not None]
+                timeout = max(0.0, min(until) - time.perf_counter()) if until else None
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None:
+                        if future is not primary:
+                            stats.count_hedge(won=True)
+                        return future.result()
+                    error = future.exception()
+                # Hedge gecikmeye karşıdır, tekrar deneme değildir; tüm istekler
+                # hata verdiyse (tekrarlar istemcide zaten yapıldı) hata döner
+                if not pending:
+                    raise error
+                now = time.perf_counter()
+                if deadline is not None and now >= deadline:
+                    raise ProviderTimeout(provider.name, provider.timeout)
+                if hedge_at is not None and now >= hedge_at:
+                    hedge_at = None
+                    if self._slots.acquire(blocking=False):
+                        stats.count_hedge()
+                        pending.add(self._submit(provider, isbn, session))
+        finally:
+            for future in pending:
+                self._release(future)
+
+    def stats(self) -> dict:
+        """
+        Sağlayıcı başına çağrı sayıları, hedge'ler ve gecikme yüzdelikleri.
+
+        Returns:
+            dict: {"hedge_after", "providers": [{"name", "timeout", "calls", ...}]}
+        """
+        return {
+            "hedge_after": self.hedge_after,
+            "providers": [{"name": provider.name, "timeout": provider.timeout,
+                           **self._stats[provider.name].snapshot()}
+                          for provider in self.providers],
+        }
+
+    def close(self, timeout: float = CLOSE_TIMEOUT) -> None:
+        """
+        Süren çağrıların (bırakılmış olanlar dahil) bitmesini bekler.
+
+        Args:
+            timeout (float): En fazla bekleme süresi (saniye)
+        """
+        deadline = time.perf_counter() + timeout
+        with self._calls_lock:
+            threads = list(self._threads)
+        for thread in threads:
+            thread.join(max(0.0, deadline - time.perf_counter()))
+
+
+def chain_from_settings(settings, upstream: OpenLibraryClient) -> ProviderChain:
+    """
+    Uygulama ayarlarındaki sağlayıcı listesinden zinciri oluşturur.
+
+    metadata_providers virgülle ayrılmış bir listedir: "cache", "dump"
+    (metadata_dump dosyası), "openlibrary" (paylaşılan upstream istemcisi)
+    ya da Open Library uyumlu başka bir kaynağın kök adresi (http...).
+    Uzak sağlayıcılar provider_timeout zaman aşımını kullanır.
+
+    Args:
+        settings (Settings): Uygulama ayarları
+        upstream (OpenLibraryClient): Paylaşılan Open Library istemcisi
+
+    Returns:
+        ProviderChain: Yapılandırılmış zincir
+
+    Raises:
+        ValueError: Liste bilinmeyen bir sağlayıcı içeriyorsa ya da dump
+            için dosya verilmemişse
+    """
+    timeout = settings.provider_timeout or None
+    providers: List[MetadataProvider] = []
+    for entry in (part.strip() for part in settings.metadata_providers.split(",")):
+        if not entry:
+            continue
+        if entry == "cache":
+            providers.append(MemoryCacheProvider(settings.metadata_cache_size))
+        elif entry == "dump":
+            if not settings.metadata_dump:
+                raise ValueError("dump sağlayıcısı için metadata_dump dosyası verilmeli.")
+            providers.append(DumpProvider(settings.metadata_dump))
+        elif entry == "openlibrary":
+            providers.append(OpenLibraryProvider(upstream, timeout=timeout))
+        elif entry.startswith(("http://", "https://")):
+            providers.append(OpenLibraryProvider(client_from_settings(settings, base_url=entry),
+                                                 name=entry, timeout=timeout))
+        else:
+            raise ValueError(f"Bilinmeyen kitap bilgisi sağlayıcısı: {entry}")
+    return ProviderChain(providers, hedge_after=settings.hedge_after)
@@ -0,0 +1,239 @@
+"""
+Kütüphane Yönetim Sistemi - Takipçi (Follower) Çoğaltma
+
+Okuma trafiğini ölçeklemek için aynı makinede ya da paylaşılan bir diskte
+çalışan ek API süreçleri, birincil sürecin depolamasını salt okunur olarak
+izleyebilir.
+
+Birincil süreç her ekleme/silme olayını `<katalog>.journal` dosyasına
+satır satır (NDJSON) ekler. Dosyanın ilk satırı bir "reset" kaydıdır: o
+sıra numarasına kadarki durum katalog dosyasındadır. Günlük büyüdüğünde
+katalog kaydedildikten sonra yalnızca yeni bir reset kaydı içeren dosyayla
+atomik olarak değiştirilir.
+
+Takipçi günlüğü sondan izler ve olayları kendi kataloğuna sırayla uygular;
+reset kaydında katalog dosyasını yeniden okur. Olaylar tekrar
+uygulanabilir (add ISBN'in kaydını yazar, remove siler), bu yüzden katalog
+dosyası günlükten daha yeni olsa da sonuç birincil süreçle aynı olur.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:
+    from library import Library
+
+
+# Günlük bu boyutu aşınca katalog kaydından sonra sıkıştırılır
+JOURNAL_MAX_BYTES = 16 * 1024 * 1024
+
+RESET = "reset"
+
+
+def journal_filename(filename: str) -> str:
+    """Katalog dosyasına ait değişiklik günlüğünün yolunu döndürür."""
+    return f"{filename}.journal"
+
+
+class ChangeJournal:
+    """
+    Birincil sürecin değişiklik günlüğü. Çağıranın kilidi altında kullanılır.
+    """
+
+    def __init__(self, filename: str, max_bytes: int = JOURNAL_MAX_BYTES):
+        """
+        ChangeJournal sınıfının constructor'ı.
+
+        Args:
+            filename (str): Günlük dosyası
+            max_bytes (int): Sıkıştırma eşiği (byte)
+        """
+        self.filename = filename
+        self.max_bytes = max_bytes
+        self._file = None
+
+    def append(self, events: List[dict]) -> None:
+        """Olayları günlüğe tek yazımda ekler."""
+        if not events:
+            return
+        if self._file is None:
+            self._file = open(self.filename, 'a', encoding='utf-8')
+        self._file.write("".join(json.dumps(event, ensure_ascii=False) + "\n" for event in events))
+        self._file.flush()
+
+    def reset(self, seq: int) -> None:
+        """
+        Günlüğü yalnızca bir reset kaydı içeren yeni bir dosyayla değiştirir.
+        Katalog dosyası seq'e kadarki durumu içerdikten sonra çağrılmalıdır.
+        """
+        self.close()
+        tmp = f"{self.filename}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as file:
+            file.write(json.dumps({"seq": seq, "op": RESET, "time": time.time()}) + "\n")
+        os.replace(tmp, self.filename)
+
+    def needs_compaction(self) -> bool:
+        """Günlük sıkıştırma eşiğini aştıysa True döndürür."""
+        return self._file is not None and self._file.tell() > self.max_bytes
+
+    def close(self) -> None:
+        """Açık dosyayı kapatır."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class Follower:
+    """
+    Birincil sürecin değişiklik günlüğünü izleyip salt okunur bir kataloğa
+    uygulayan sınıf.
+    """
+
+    def __init__(self, library: "Library", filename: Optional[str] = None,
+                 interval: float = 0.5):
+        """
+        Follower sınıfının constructor'ı.
+
+        Args:
+            library (Library): Güncellenecek salt okunur kütüphane
+            filename (Optional[str]): İzlenecek günlük (varsayılan: <katalog>.journal)
+            interval (float): Günlüğün kontrol aralığı (saniye)
+        """
+        self.library = library
+        self.filename = filename or journal_filename(library.filename)
+        self.interval = interval
+        self.applied_events = 0
+        self.last_poll: Optional[float] = None
+        self.last_apply_delay = 0.0
+        self.caught_up_at: Optional[float] = None
+        self.error: Optional[str] = None
+        self._file = None
+        self._inode = None
+        self._buffer = b""
+        # Başlangıçta katalog zaten yüklüdür; ilk reset kaydında tekrar okunmaz
+        self._loaded = True
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._poll_lock = threading.Lock()
+
+    def poll(self) -> int:
+        """
+        Günlükteki yeni olayları okuyup kataloğa uygular.
+
+        Returns:
+            int: Uygulanan olay sayısı
+        """
+        with self._poll_lock:
+            try:
+                applied = self._poll()
+                self.error = None
+            except (OSError, ValueError) as e:
+                self.error = str(e)
+                applied = 0
+            self.last_poll = time.time()
+            if self.error is None and self.pending_bytes() == 0:
+                self.caught_up_at = self.last_poll
+            return applied
+
+    def _poll(self) -> int:
+        inode = os.stat(self.filename).st_ino
+        if inode != self._inode or self._file_shrank():
+            # Günlük sıkıştırıldı ya da ilk kez açılıyor
+            if self._file is not None:
+                self._file.close()
+            self._file = open(self.filename, 'rb')
+            self._inode = os.fstat(self._file.fileno()).st_ino
+            self._buffer = b""
+
+        self._buffer += self._file.read()
+        lines = self._buffer.split(b"\n")
+        # Son satır henüz tamamlanmamış olabilir
+        self._buffer = lines.pop()
+        events = [json.loads(line) for line in lines if line]
+
+        applied = 0
+        batch: List[dict] = []
+        for event in events:
+            if event["op"] == RESET:
+                applied += self._apply(batch)
+                batch = []
+                # İlk reset'te yalnızca sıra numarası alınır. Sonrakilerde
+                # (sıkıştırma ya da birincil sürecin yeniden başlaması)
+                # tam olarak o noktada değilsek katalog yeniden okunur
+                if self._loaded or event["seq"] != self.library.last_seq:
+                    self.library.reset_replica(event["seq"], reload=not self._loaded)
+                self._loaded = False
+            elif event["seq"] > self.library.last_seq:
+                batch.append(event)
+        return applied + self._apply(batch)
+
+    def _file_shrank(self) -> bool:
+        return self._file is not None and os.fstat(self._file.fileno()).st_size < self._file.tell()
+
+    def _apply(self, events: List[dict]) -> int:
+        if not events:
+            return 0
+        self.library.apply_replicated(events)
+        self.applied_events += len(events)
+        self.last_apply_delay = max(0.0, time.time() - events[-1]["time"])
+        return len(events)
+
+    def pending_bytes(self) -> int:
+        """Günlükte henüz okunmamış byte sayısı."""
+        try:
+            stat = os.stat(self.filename)
+        except FileNotFoundError:
+            return 0
+        if self._file is None or stat.st_ino != self._inode:
+            return stat.st_size
+        return max(0, stat.st_size - self._file.tell()) + len(self._buffer)
+
+    def status(self) -> dict:
+        """
+        Çoğaltma durumunu döndürür.
+
+        Returns:
+            dict: Uygulanan son sıra numarası, okunmamış byte, gecikme
+                (lag_seconds: en son ne zamandan beri geride) ve son hata
+        """
+        now = time.time()
+        pending = self.pending_bytes()
+        if pending == 0 and self.caught_up_at is not None:
+            lag = 0.0
+        else:
+            lag = now - (self.caught_up_at or now)
+        return {
+            "role": "follower",
+            "journal": self.filename,
+            "applied_seq": self.library.last_seq,
+            "applied_events": self.applied_events,
+            "pending_bytes": pending,
+            "lag_seconds": round(lag, 6),
+            "last_apply_delay_seconds": round(self.last_apply_delay, 6),
+            "last_poll": self.last_poll,
+            "error": self.error,
+        }
+
+    def start(self) -> None:
+        """Günlüğü arka planda izleyen thread'i başlatır."""
+        self._stop.clear()
+        self.poll()
+        self._thread = threading.Thread(target=self._run, name="follower", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.poll()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """İzlemeyi durdurur."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,253 @@
+"""
+Kütüphane Yönetim Sistemi - Dış Servis Dayanıklılığı
+
+Bu modül Open Library çağrılarında kullanılan üç yapı taşını sağlar:
+
+- TokenBucket: tüm çağrı yollarının paylaştığı hız sınırlayıcı
+- RetryPolicy: tekrar denenebilir hatalar için jitter'lı üstel geri çekilme
+- CircuitBreaker: dış servis çöktüğünde istekleri beklemeden reddeden devre kesici
+
+Saat ve uyku fonksiyonları constructor'dan verilebilir; böylece testler
+gerçek zamanı beklemeden çalışabilir.
+"""
+
+import random
+import threading
+import time
+from typing import Callable, Optional
+
+
+class TokenBucket:
+    """
+    Token bucket hız sınırlayıcı.
+    Saniyede `rate` token üretir ve en fazla `capacity` token biriktirir.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        TokenBucket sınıfının constructor'ı.
+
+        Args:
+            rate (float): Saniyede üretilen token sayısı
+            capacity (Optional[float]): Biriktirilebilecek en fazla token (varsayılan: rate)
+            clock (Callable): Monoton saat fonksiyonu
+            sleep (Callable): Bekleme fonksiyonu
+        """
+        if rate <= 0:
+            raise ValueError("rate pozitif olmalı")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> float:
+        """
+        Token almaya çalışır; bekleme yapmaz.
+
+        Returns:
+            float: Token alındıysa 0, alınamadıysa gereken bekleme süresi (saniye)
+        """
+        with self._lock:
+            self._refill(self._clock())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self, max_wait: Optional[float] = None) -> bool:
+        """
+        Token alınana kadar bekler.
+
+        Args:
+            max_wait (Optional[float]): En fazla bekleme süresi (None: sınırsız)
+
+        Returns:
+            bool: Token alındıysa True, süre dolduysa False
+        """
+        deadline = None if max_wait is None else self._clock() + max_wait
+        while True:
+            wait = self.try_acquire()
+            if wait == 0:
+                return True
+            if deadline is not None and self._clock() + wait > deadline:
+                return False
+            self._sleep(wait)
+
+    def state(self) -> dict:
+        """Anlık token sayısı ve ayarları döndürür."""
+        with self._lock:
+            self._refill(self._clock())
+            return {"rate": self.rate, "capacity": self.capacity, "tokens": round(self._tokens, 3)}
+
+
+class RetryPolicy:
+    """
+    Tekrar deneme politikası: deneme n için bekleme süresi
+    uniform(0, min(max_delay, base_delay * 2**n)) ("full jitter") olur.
+    """
+
+    RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(self, max_retries: int = 3, base_delay: float = 0.25,
+                 max_delay: float = 8.0, rng: Optional[random.Random] = None):
+        """
+        RetryPolicy sınıfının constructor'ı.
+
+        Args:
+            max_retries (int): İlk denemeden sonra en fazla tekrar sayısı
+            base_delay (float): İlk tekrar için bekleme üst sınırı (saniye)
+            max_delay (float): Bekleme süresinin üst sınırı (saniye)
+            rng (Optional[random.Random]): Jitter için rastgele sayı üreteci
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._rng = rng or random.Random()
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        """HTTP durum kodunun tekrar denenebilir olup olmadığını döndürür."""
+        return status_code in self.RETRYABLE_STATUS
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Verilen tekrar numarası için bekleme süresini hesaplar.
+
+        Args:
+            attempt (int): 0'dan başlayan tekrar numarası
+            retry_after (Optional[float]): Sunucunun Retry-After ile istediği süre
+
+        Returns:
+            float: Bekleme süresi (saniye)
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        delay = self._rng.uniform(0, ceiling)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+
+class UpstreamUnavailable(Exception):
+    """Dış servise şu anda istek gönderilemediğinde fırlatılır."""
+
+
+class RateLimitTimeout(UpstreamUnavailable):
+    """Hız sınırlayıcıdan izin beklerken süre dolduğunda fırlatılır."""
+
+
+class CircuitOpenError(UpstreamUnavailable):
+    """Devre kesici açıkken yapılan çağrılarda fırlatılır."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Open Library geçici olarak devre dışı ({retry_after:.1f} sn sonra tekrar denenecek).")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Üç durumlu devre kesici (closed → open → half_open).
+
+    Art arda `failure_threshold` hata olduğunda devre açılır ve
+    `reset_timeout` boyunca çağrılar beklemeden reddedilir. Süre dolunca
+    tek bir deneme çağrısına izin verilir; başarılı olursa devre kapanır,
+    başarısız olursa yeniden açılır.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        CircuitBreaker sınıfının constructor'ı.
+
+        Args:
+            failure_threshold (int): Devreyi açacak art arda hata sayısı
+            reset_timeout (float): Devrenin açık kalacağı süre (saniye)
+            clock (Callable): Monoton saat fonksiyonu
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.times_opened = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Devrenin anlık durumu."""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def before_call(self) -> None:
+        """
+        Çağrıdan önce izin ister.
+
+        Raises:
+            CircuitOpenError: Devre açıksa ya da yarı açık devrede deneme sürüyorsa
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == self.OPEN:
+                raise CircuitOpenError(self.reset_timeout - (self._clock() - self._opened_at))
+            if state == self.HALF_OPEN:
+                if self._trial_in_flight:
+                    raise CircuitOpenError(0.0)
+                self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        """Başarılı çağrıyı kaydeder; devre kapanır."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Başarısız çağrıyı kaydeder; eşik aşılırsa devre açılır."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self.times_opened += 1
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self._trial_in_flight = False
+
+    def retry_after(self) -> float:
+        """Devre açıksa kapanmaya aday olana kadar kalan süre."""
+        with self._lock:
+            if self._current_state() != self.OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (self._clock() - self._opened_at))
+
+    def snapshot(self) -> dict:
+        """Devrenin durumunu döndürür."""
+        with self._lock:
+            state = self._current_state()
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "failure_threshold": self.failure_threshold,
+                "reset_timeout": self.reset_timeout,
+                "times_opened": self.times_opened,
+                "retry_after": (max(0.0, self.reset_timeout - (self._clock() - self._opened_at))
+                                if state == self.OPEN else 0.0),
+            }
@@ -0,0 +1,111 @@
+"""
+Kütüphane Yönetim Sistemi - Uygulama Ayarları
+
+Bu modül API uygulamasının yapılandırmasını tek bir yerde toplar.
+Ayarlar doğrudan oluşturulabilir ya da ortam değişkenlerinden okunabilir.
+"""
+
+import os
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+ENV_PREFIX = "LIBRARY_"
+
+
+class Settings(BaseModel):
+    """API uygulamasının yapılandırma modeli."""
+    library_file: str = Field("library.json",
+                              description="Kitapların saklandığı JSON dosyası")
+    openlibrary_url: str = Field("https://openlibrary.org",
+                                 description="Open Library API'sinin (veya yerel taklidinin) kök adresi")
+    covers_url: str = Field("https://covers.openlibrary.org",
+                            description="Kapak sunucusunun (veya yerel taklidinin) kök adresi")
+    covers_dir: str = Field("covers",
+                            description="Kapak görsellerinin önbelleklendiği dizin")
+    covers_max_mb: float = Field(256.0,
+                                 description="Kapak önbelleğinin disk boyutu sınırı (MB)")
+    prefetch_covers: bool = Field(False,
+                                  description="POST /books ile eklenen kitabın kapağı arka planda önbelleğe çekilsin mi")
+    metadata_providers: str = Field("cache,openlibrary",
+                                    description="Kitap bilgisi sağlayıcılarının sırası: cache, dump, openlibrary "
+                                                "ya da Open Library uyumlu bir kaynağın adresi (virgülle ayrılmış)")
+    metadata_dump: Optional[str] = Field(None,
+                                         description="dump sağlayıcısının okuyacağı kitap dosyası (.json katalog ya da .ndjson[.gz])")
+    metadata_cache_size: int = Field(50_000,
+                                     description="cache sağlayıcısında tutulacak en fazla kitap sayısı")
+    provider_timeout: Optional[float] = Field(None,
+                                              description="Uzak sağlayıcılarda tek bir sorgunun zaman aşımı (saniye; boşsa yok)")
+    hedge_after: Optional[float] = Field(None,
+                                         description="Uzak sağlayıcı bu sürede (saniye) yanıt vermezse ikinci istek gönderilir (boşsa kapalı)")
+    upstream_timeout: float = Field(10.0,
+                                    description="Tek bir Open Library isteğinin zaman aşımı (saniye)")
+    upstream_rate_limit: float = Field(10.0,
+                                       description="Open Library'ye saniyede en fazla istek (0: sınırsız)")
+    upstream_burst: float = Field(10.0,
+                                  description="Hız sınırlayıcının biriktirebileceği en fazla istek hakkı")
+    upstream_max_retries: int = Field(3,
+                                      description="Bağlantı hatası, 429 ve 5xx için en fazla tekrar sayısı")
+    upstream_backoff_base: float = Field(0.25,
+                                         description="İlk tekrar öncesi bekleme üst sınırı (saniye)")
+    upstream_backoff_max: float = Field(8.0,
+                                        description="Tekrarlar arası bekleme üst sınırı (saniye)")
+    breaker_failure_threshold: int = Field(5,
+                                           description="Devre kesiciyi açacak art arda hata sayısı")
+    breaker_reset_timeout: float = Field(30.0,
+                                         description="Devre kesicinin açık kalacağı süre (saniye)")
+    async_enrichment: bool = Field(False,
+                                   description="POST /books varsayılan olarak 202 ile iş kuyruğuna mı eklesin")
+    job_workers: int = Field(2,
+                             description="Arka plan zenginleştirme worker'ı sayısı")
+    jobs_file: Optional[str] = Field(None,
+                                     description="İş kuyruğunun saklandığı dosya (boşsa <library_file>.jobs.json)")
+    libraries_dir: str = Field("libraries",
+                               description="Şube kataloglarının (/libraries/{id}/...) saklandığı dizin")
+    max_libraries: int = Field(16,
+                               description="Bellekte tutulacak en fazla şube kataloğu sayısı")
+    max_libraries_mb: Optional[float] = Field(None,
+                                              description="Bellekteki şube kataloglarının tahmini toplam boyut sınırı (MB)")
+    journal: bool = Field(False,
+                          description="Değişiklikler takipçiler için <library_file>.journal dosyasına yazılsın mı")
+    follower: bool = Field(False,
+                           description="Salt okunur takipçi modu: katalog birincil sürecin günlüğünden güncellenir")
+    follow_interval: float = Field(0.5,
+                                   description="Takipçi modunda günlüğün kontrol aralığı (saniye)")
+    max_change_waiters: int = Field(100,
+                                    description="GET /changes'te aynı anda bekleyebilecek long-poll/SSE isteği sayısı")
+    preload: bool = Field(False,
+                          description="Katalog worker'lar fork edilmeden önce ana süreçte yüklensin mi")
+    background_indexes: bool = Field(True,
+                                     description="İkincil indeksler açılışta arka planda oluşturulsun mu "
+                                                 "(preload açıkken indeksler yükleme sırasında oluşturulur)")
+    metrics_enabled: bool = Field(True,
+                                  description="İstek süreleri metrik olarak toplansın mı")
+    tracing_exporter: Optional[str] = Field(None,
+                                            description="Span exporter'ı: jsonl, otlp-stdout ya da boş (kapalı)")
+    tracing_file: str = Field("traces.jsonl",
+                              description="jsonl exporter'ının yazacağı dosya")
+    profiling_enabled: bool = Field(False,
+                                    description="X-Profile başlığı taşıyan istekler cProfile ile profillensin mi")
+    profiles_dir: str = Field("profiles",
+                              description="Profil dosyalarının (.pstats ve özet) yazılacağı dizin")
+    profile_top_n: int = Field(30,
+                               description="Profil özetinde listelenecek fonksiyon sayısı")
+    admin_token: Optional[str] = Field(None,
+                                       description="Yönetici endpoint'leri için X-Admin-Token değeri (boşsa kapalı)")
+
+    @classmethod
+    def from_env(cls) -> 'Settings':
+        """
+        Ayarları LIBRARY_ önekli ortam değişkenlerinden okur.
+        Örn: LIBRARY_LIBRARY_FILE, LIBRARY_PRELOAD
+
+        Returns:
+            Settings: Ortam değişkenleriyle doldurulmuş ayarlar
+        """
+        values = {}
+        for name in cls.model_fields:
+            env_name = f"{ENV_PREFIX}{name.upper()}"
+            if env_name in os.environ:
+                values[name] = os.environ[env_name]
+        return cls(**values)
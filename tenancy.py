@@ -0,0 +1,361 @@
+"""
+Kütüphane Yönetim Sistemi - Çok Şubeli (Multi-Tenant) Barındırma
+
+Bu modül tek bir API sürecinin birden çok şube kütüphanesini sunabilmesi
+için bir kayıt defteri sağlar. Her şubenin kataloğu `<dizin>/<kimlik>.json`
+dosyasında tutulur ve ilk istekte yüklenir.
+
+Bellekte en fazla `max_libraries` katalog ya da tahmini toplam
+`max_bytes` byte tutulur. Sınır aşıldığında en uzun süredir kullanılmayan
+katalog diske yazılıp bellekten çıkarılır (LRU). İstek işleyen (acquire
+ile sabitlenmiş) kataloglar çıkarılmaz. Kataloglar genel kilit dışında,
+şubeye ait kilit altında yüklenir ve yazılır.
+
+Takipçi modunda şube katalogları salt okunur açılır ve her biri bellekte
+kaldığı sürece birincil sürecin değişiklik günlüğünü izler.
+"""
+
+import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from book import Book
+from library import Library
+from openlibrary import OpenLibraryClient
+from providers import ProviderChain
+from replication import Follower
+import metrics
+
+
+LIBRARY_ID_PATTERN = r"^[A-Za-z0-9_-]{1,64}$"
+_LIBRARY_ID = re.compile(LIBRARY_ID_PATTERN)
+
+# Bellek tahmininde örneklenecek en fazla kitap sayısı
+SIZE_SAMPLE = 1000
+
+# Sıkıştırılmış (kopyalanmış) bir sözlükte kayıt başına düşen byte; bir kez ölçülür
+_DICT_ENTRY_BYTES = (sys.getsizeof(dict.fromkeys(map(str, range(SIZE_SAMPLE))).copy())
+                     - sys.getsizeof({})) / SIZE_SAMPLE
+
+
+def _book_size(book: Book) -> int:
+    """Bir Book nesnesinin ve alanlarının yaklaşık bellek kullanımı (byte)."""
+    size = (sys.getsizeof(book) + sys.getsizeof(book.__dict__)
+            + sys.getsizeof(book.title) + sys.getsizeof(book.author) + sys.getsizeof(book.isbn))
+    for values in (book.publishers, book.subjects, book.author_keys):
+        if values:
+            size += sys.getsizeof(values) + sum(sys.getsizeof(value) for value in values)
+    return size
+
+
+def estimate_library_bytes(library: Library) -> int:
+    """
+    Bir kataloğun bellekte kapladığı alanı örnekleyerek tahmin eder.
+    En fazla SIZE_SAMPLE kitap ölçülür ve sonuç tüm kataloğa ölçeklenir.
+
+    Args:
+        library (Library): Ölçülecek kütüphane
+
+    Returns:
+        int: Tahmini bellek kullanımı (byte)
+    """
+    snapshot = library.snapshot()
+    books = snapshot.books
+    count = len(books)
+    # ISBN sözlüğü kopyalanmadan (salt okunur görünümdür) kayıt sayısından tahmin edilir
+    total = (sys.getsizeof(books) + sys.getsizeof({})
+             + int(_DICT_ENTRY_BYTES * len(snapshot.by_isbn)))
+    if count:
+        sample = books[::max(1, count // SIZE_SAMPLE)]
+        total += int(sum(_book_size(book) for book in sample) / len(sample) * count)
+    for index in (snapshot.indexes or {}).values():
+        # Sıralı indeks kayıtları: üçlü ve büyük/küçük harf duyarsız anahtar
+        entries = index.entries
+        total += sys.getsizeof(entries)
+        if entries:
+            sample = entries[::max(1, len(entries) // SIZE_SAMPLE)]
+            per_entry = sum(sys.getsizeof(entry) + sys.getsizeof(entry[0]) for entry in sample)
+            total += int(per_entry / len(sample) * len(entries))
+    return total
+
+
+class _Entry:
+    """Bellekteki bir şube kataloğu ve istatistikleri."""
+
+    __slots__ = ("library", "follower", "load_seconds", "loaded_at", "last_access", "hits",
+                 "pins", "estimated_bytes", "estimated_count")
+
+    def __init__(self, library: Library, load_seconds: float,
+                 follower: Optional[Follower] = None):
+        self.library = library
+        self.follower = follower
+        self.load_seconds = load_seconds
+        self.loaded_at = time.time()
+        self.last_access = self.loaded_at
+        self.hits = 0
+        # Kataloğu o an kullanan istek sayısı; sabitli kataloglar bellekten çıkarılmaz
+        self.pins = 0
+        self.estimated_bytes = 0
+        self.estimated_count = -1
+
+    def refresh_size(self) -> None:
+        """Kitap sayısı değiştiyse bellek tahminini yeniler."""
+        count = self.library.get_book_count()
+        if count != self.estimated_count:
+            self.estimated_bytes = estimate_library_bytes(self.library)
+            self.estimated_count = count
+
+
+class LibraryRegistry:
+    """
+    Şube kütüphanelerini gerektiğinde yükleyen ve LRU ile bellekten
+    çıkaran kayıt defteri.
+    """
+
+    def __init__(self, directory: str, upstream: Optional[OpenLibraryClient] = None,
+                 max_libraries: int = 16, max_bytes: Optional[int] = None,
+                 read_only: bool = False, journal: bool = False,
+                 follow_interval: float = 0.5,
+                 providers: Optional[ProviderChain] = None):
+        """
+        LibraryRegistry sınıfının constructor'ı.
+
+        Args:
+            directory (str): Şube kataloglarının bulunduğu dizin
+            upstream (Optional[OpenLibraryClient]): Tüm şubelerin paylaştığı Open Library istemcisi
+            max_libraries (int): Bellekte tutulacak en fazla katalog sayısı
+            max_bytes (Optional[int]): Bellekteki katalogların tahmini toplam boyut sınırı
+            read_only (bool): Takipçi modu; kataloglar salt okunur açılıp günlükten güncellenir
+            journal (bool): Birincil modda kataloglar değişiklik günlüğü yazsın mı
+            follow_interval (float): Takipçi modunda günlüğün kontrol aralığı (saniye)
+            providers (Optional[ProviderChain]): Tüm şubelerin paylaştığı kitap bilgisi
+                sağlayıcı zinciri (önbellek de paylaşılır)
+        """
+        self.directory = directory
+        self.upstream = upstream or OpenLibraryClient()
+        self.providers = providers
+        self.max_libraries = max_libraries
+        self.max_bytes = max_bytes
+        self.read_only = read_only
+        self.journal = journal
+        self.follow_interval = follow_interval
+        self.evictions = 0
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Şube başına yükleme/yazma kilidi; aynı şube aynı anda iki kez yüklenmez
+        self._load_locks: Dict[str, threading.Lock] = {}
+
+    def filename(self, library_id: str) -> str:
+        """
+        Şube kimliğine ait katalog dosyasının yolunu döndürür.
+
+        Raises:
+            ValueError: Kimlik geçersizse (dizin dışına çıkmayı önler)
+        """
+        if not _LIBRARY_ID.match(library_id):
+            raise ValueError(f"Geçersiz kütüphane kimliği: {library_id}")
+        return os.path.join(self.directory, f"{library_id}.json")
+
+    def get(self, library_id: str) -> Library:
+        """
+        Şubenin Library instance'ını döndürür; bellekte değilse yükler.
+        Dönen katalog sabitlenmez; istek boyunca kullanılacaksa acquire tercih edilmeli.
+
+        Args:
+            library_id (str): Şube kimliği
+
+        Returns:
+            Library: Şubenin kütüphanesi
+
+        Raises:
+            ValueError: Kimlik geçersizse
+        """
+        return self._checkout(library_id, pin=False).library
+
+    @contextmanager
+    def acquire(self, library_id: str) -> Iterator[Library]:
+        """
+        Şubenin kataloğunu blok boyunca sabitler: sabitli katalog LRU ile
+        bellekten çıkarılmaz, böylece süren isteklerin yazmaları kaybolmaz.
+
+        Args:
+            library_id (str): Şube kimliği
+
+        Yields:
+            Library: Şubenin kütüphanesi
+
+        Raises:
+            ValueError: Kimlik geçersizse
+        """
+        entry = self._checkout(library_id, pin=True)
+        try:
+            yield entry.library
+        finally:
+            with self._lock:
+                entry.pins -= 1
+                evicted = self._enforce_limits() if self._entries.get(library_id) is entry else []
+            self._flush_evicted(evicted)
+
+    def _checkout(self, library_id: str, pin: bool) -> _Entry:
+        """
+        Şubenin kaydını bulur ya da diskten yükler. Yükleme genel kilit
+        dışında, yalnızca şubeye ait kilit altında yapılır; böylece bir
+        şubenin yüklenmesi diğer şubelerin isteklerini bekletmez.
+        """
+        filename = self.filename(library_id)
+        with self._lock:
+            entry = self._entries.get(library_id)
+            if entry is not None:
+                evicted = self._use(library_id, entry, pin)
+            else:
+                load_lock = self._load_locks.setdefault(library_id, threading.Lock())
+        if entry is None:
+            with load_lock:
+                with self._lock:
+                    entry = self._entries.get(library_id)
+                if entry is None:
+                    entry = self._load(filename)
+                with self._lock:
+                    self._entries[library_id] = entry
+                    evicted = self._use(library_id, entry, pin)
+        self._flush_evicted(evicted)
+        return entry
+
+    def _load(self, filename: str) -> _Entry:
+        """Kataloğu diskten yükler; takipçi modunda günlük izlemesini başlatır."""
+        os.makedirs(self.directory, exist_ok=True)
+        start = time.perf_counter()
+        library = Library(filename, upstream=self.upstream,
+                          read_only=self.read_only, journal=self.journal,
+                          providers=self.providers)
+        follower = None
+        if self.read_only:
+            follower = Follower(library, interval=self.follow_interval)
+            follower.start()
+        entry = _Entry(library, time.perf_counter() - start, follower)
+        metrics.TENANT_LOAD_DURATION.observe(entry.load_seconds)
+        return entry
+
+    def _use(self, library_id: str, entry: _Entry, pin: bool) -> List[tuple]:
+        """Kaydı en yeni kullanılan olarak işaretler ve sınırları uygular (kilit altında)."""
+        self._entries.move_to_end(library_id)
+        entry.hits += 1
+        entry.last_access = time.time()
+        if pin:
+            entry.pins += 1
+        entry.refresh_size()
+        return self._enforce_limits()
+
+    def _enforce_limits(self) -> List[tuple]:
+        """
+        Sınırlar aşıldıkça en eski katalogları çıkarır (kilit altında). En
+        yenisine, sabitli kataloglara ve o an yüklenen şubelere dokunulmaz.
+
+        Returns:
+            List[tuple]: Kilit dışında diske yazılacak (kayıt, şube kilidi) çiftleri
+        """
+        evicted: List[tuple] = []
+        for library_id in list(self._entries)[:-1]:
+            over_count = len(self._entries) > self.max_libraries
+            over_bytes = (self.max_bytes is not None
+                          and self._total_bytes() > self.max_bytes)
+            if not (over_count or over_bytes):
+                break
+            entry = self._entries[library_id]
+            load_lock = self._load_locks[library_id]
+            # Şube kilidi yazma bitene kadar tutulur; yeniden yükleme güncel dosyayı okur
+            if entry.pins or not load_lock.acquire(blocking=False):
+                continue
+            del self._entries[library_id]
+            evicted.append((entry, load_lock))
+            self.evictions += 1
+            metrics.TENANT_EVICTIONS.inc()
+        metrics.TENANTS_RESIDENT.set(len(self._entries))
+        return evicted
+
+    def _flush_evicted(self, evicted: List[tuple]) -> None:
+        """Çıkarılan katalogları genel kilit dışında diske yazar ve şube kilitlerini bırakır."""
+        for entry, load_lock in evicted:
+            try:
+                self._flush(entry)
+            finally:
+                load_lock.release()
+
+    def _total_bytes(self) -> int:
+        return sum(entry.estimated_bytes for entry in self._entries.values())
+
+    @staticmethod
+    def _flush(entry: _Entry) -> None:
+        """
+        Kataloğu diske yazar; süren bir değişiklik varsa bitmesini bekler.
+        Takipçi modunda yalnızca günlük izlemesi durdurulur.
+        """
+        if entry.follower is not None:
+            entry.follower.stop()
+        entry.library.save_books()
+
+    def evict(self, library_id: str) -> bool:
+        """
+        Şubeyi diske yazıp bellekten çıkarır. Sabitli şubeler çıkarılmaz.
+
+        Returns:
+            bool: Şube bellekteyse ve çıkarıldıysa True
+        """
+        with self._lock:
+            load_lock = self._load_locks.get(library_id)
+        if load_lock is None:
+            return False
+        with load_lock:
+            with self._lock:
+                entry = self._entries.get(library_id)
+                if entry is None or entry.pins:
+                    return False
+                del self._entries[library_id]
+                metrics.TENANTS_RESIDENT.set(len(self._entries))
+            self._flush(entry)
+            return True
+
+    def close(self) -> None:
+        """Bellekteki tüm katalogları diske yazıp kayıt defterini boşaltır."""
+        with self._lock:
+            for entry in self._entries.values():
+                self._flush(entry)
+            self._entries.clear()
+            metrics.TENANTS_RESIDENT.set(0)
+
+    def stats(self) -> dict:
+        """
+        Bellekteki şubelerin kitap sayısı, tahmini bellek kullanımı ve
+        yükleme sürelerini döndürür (en son kullanılan en sonda).
+
+        Returns:
+            dict: Şube bazında istatistikler, toplamlar ve sınırlar
+        """
+        with self._lock:
+            libraries: List[dict] = []
+            for library_id, entry in self._entries.items():
+                entry.refresh_size()
+                libraries.append({
+                    "id": library_id,
+                    "books": entry.library.get_book_count(),
+                    "estimated_bytes": entry.estimated_bytes,
+                    "load_seconds": round(entry.load_seconds, 6),
+                    "loaded_at": entry.loaded_at,
+                    "last_access": entry.last_access,
+                    "hits": entry.hits,
+                })
+                if entry.follower is not None:
+                    libraries[-1]["replication"] = entry.follower.status()
+            return {
+                "resident": len(libraries),
+                "estimated_bytes": self._total_bytes(),
+                "max_libraries": self.max_libraries,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+                "libraries": libraries,
+            }
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Sütunsal katalog analitiği (analytics) ve GET /stats/analytics için testler.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import analytics
+from api import create_app
+from book import Book
+from library import Library
+from openlibrary import edition_metadata
+from openlibrary_stub import OpenLibraryStub
+from settings import Settings
+
+
+CORPUS = {
+    "editions": {
+        "978-0451524935": {
+            "title": "1984",
+            "authors": [{"key": "/authors/OL118077A"}],
+            "publish_date": "July 1, 1950",
+            "number_of_pages": 328,
+            "publishers": ["Signet Classic"],
+            "subjects": ["Dystopias", "Totalitarianism"],
+        },
+    },
+    "authors": {
+        "OL118077A": {"name": "George Orwell"},
+    },
+}
+
+BOOKS = [
+    Book("1984", "George Orwell", "978-0451524935", publish_year=1950, pages=328,
+         subjects=["Dystopias", "Totalitarianism", "Dystopias"]),
+    Book("Animal Farm", "George Orwell", "978-0451526342", publish_year=1945, pages=140,
+         subjects=["Satire", "Totalitarianism"]),
+    Book("Dune", "Frank Herbert", "978-0441172719", publish_year=1965, pages=412,
+         subjects=["Science fiction"]),
+    Book("Bilinmeyen", "Anonim", "978-0000000000"),
+]
+
+
+class TestColumnStore:
+    """ColumnStore ve analyze test sınıfı."""
+
+    @pytest.fixture
+    def library(self, tmp_path):
+        """Metadata içeren kitaplarla geçici kütüphane."""
+        library = Library(str(tmp_path / "library.json"))
+        library.add_books(BOOKS)
+        return library
+
+    def test_distributions(self, library):
+        """On yıl, sayfa ve konu dağılımlarının hesaplanması testı."""
+        result = analytics.analyze(library.snapshot(), top_subjects=2)
+
+        assert result["total_books"] == 4 and result["books_with_year"] == 3
+        assert result["books_per_decade"] == [{"decade": 1940, "books": 1},
+                                              {"decade": 1950, "books": 1},
+                                              {"decade": 1960, "books": 1}]
+        assert result["pages"]["books"] == 3
+        assert result["pages"]["percentiles"]["p50"] == 328
+        assert result["pages"]["mean"] == round((328 + 140 + 412) / 3, 2)
+        # Kitap içinde tekrar eden konu bir kez sayılır
+        assert result["top_subjects"] == [{"subject": "Totalitarianism", "books": 2},
+                                          {"subject": "Dystopias", "books": 1}]
+
+    def test_store_cached_per_snapshot(self, library):
+        """Deponun snapshot başına bir kez kurulup yazmadan sonra yenilenmesi testı."""
+        snapshot = library.snapshot()
+        store = analytics.column_store(snapshot)
+
+        assert analytics.column_store(snapshot) is store
+        library.remove_book("978-0441172719")
+        assert analytics.analyze(library.snapshot())["total_books"] == 3
+        assert store.size == 4
+
+    def test_store_follows_writes(self, library):
+        """Yazmalardan sonra deponun baştan kurulmadan güncellenmesi testı."""
+        analytics.column_store(library.snapshot())
+        library.remove_book("978-0451524935")
+        library.add_book_manual(Book("Solaris", "Stanisław Lem", "978-0156027601",
+                                     publish_year=1961, pages=204,
+                                     subjects=["Science fiction", "Space"]))
+
+        snapshot = library.snapshot()
+        assert snapshot.columns is not None
+        result = analytics.analyze(snapshot, top_subjects=5)
+        snapshot.columns = None
+        rebuilt = analytics.analyze(snapshot, top_subjects=5)
+        # Eşit sayılı konuların sırası konu kodlarına bağlıdır
+        for report in (result, rebuilt):
+            report["top_subjects"].sort(key=lambda entry: (-entry["books"], entry["subject"]))
+        assert result == rebuilt
+        # Artık hiçbir kitapta geçmeyen konu raporlanmaz
+        assert "Dystopias" not in [entry["subject"] for entry in result["top_subjects"]]
+        assert result["top_subjects"][0] == {"subject": "Science fiction", "books": 2}
+
+    def test_empty_catalog(self, tmp_path):
+        """Boş katalogda analitiğin boş dağılımlar döndürmesi testı."""
+        result = analytics.analyze(Library(str(tmp_path / "library.json")).snapshot())
+
+        assert result["total_books"] == 0
+        assert result["books_per_decade"] == [] and result["top_subjects"] == []
+        assert result["pages"] == {"books": 0, "mean": None, "percentiles": {}}
+
+    def test_edition_metadata_from_openlibrary(self, tmp_path):
+        """Open Library'den eklenen kitabın edition alanlarını saklaması testı."""
+        library = Library(str(tmp_path / "library.json"))
+        with OpenLibraryStub(CORPUS) as stub:
+            library.base_url = stub.base_url
+            assert library.add_book("978-0451524935")
+
+        book = Library(library.filename).find_book("978-0451524935")
+        assert book.publish_year == 1950 and book.pages == 328
+        assert book.subjects == ("Dystopias", "Totalitarianism")
+        assert book.author_keys == ("/authors/OL118077A",)
+        assert edition_metadata({"publish_date": "tarihsiz", "number_of_pages": "çok"}) == {
+            "publish_year": None, "pages": None, "publishers": [], "subjects": [],
+            "author_keys": []}
+
+
+class TestAnalyticsAPI:
+    """GET /stats/analytics endpoint'i test sınıfı."""
+
+    @pytest.fixture
+    def client(self, tmp_path):
+        """Geçici kataloglu test client'ı oluşturur."""
+        settings = Settings(library_file=str(tmp_path / "library.json"),
+                            libraries_dir=str(tmp_path / "libraries"))
+        with TestClient(create_app(settings)) as client:
+            yield client
+
+    def test_analytics_endpoint(self, client):
+        """Toplu işlemle eklenen metadata'nın analitiğe yansıması testı."""
+        client.post("/books/batch", json={"operations": [
+            {"op": "add", "isbn": "978-0451524935", "title": "1984", "author": "George Orwell",
+             "publish_year": 1950, "pages": 328, "subjects": ["Dystopias"]},
+            {"op": "add", "isbn": "978-0441172719", "title": "Dune", "author": "Frank Herbert",
+             "publish_year": 1965, "subjects": ["Science fiction", "Dystopias"]},
+        ]})
+
+        response = client.get("/stats/analytics", params={"top": 1})
+        book = client.get("/books/978-0441172719").json()
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total_books"] == 2
+        assert [row["decade"] for row in body["books_per_decade"]] == [1950, 1960]
+        assert body["top_subjects"] == [{"subject": "Dystopias", "books": 2}]
+        assert book["publish_year"] == 1965 and "pages" not in book
+
+    def test_invalid_top(self, client):
+        """Geçersiz top parametresi için 422 testı."""
+        assert client.get("/stats/analytics", params={"top": 0}).status_code == 422
@@ -3,14 +3,21 @@
 FastAPI uygulaması için integration testler.
 """
 
+import asyncio
 import pytest
 import tempfile
 import os
+import json
+import threading
 from fastapi.testclient import TestClient
 from unittest.mock import patch, Mock
 
-from api import app, library
+from api import create_app
 from book import Book
+import indexes
+import library as library_module
+from library import Library
+from settings import Settings
 
 
 class TestAPI:
@@ -22,21 +29,21 @@ class TestAPI:
         # Geçici dosya ile test
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
             temp_filename = f.name
+        os.unlink(temp_filename)
         
-        # Library instance'ını geçici dosya ile değiştir
-        original_filename = library.filename
-        library.filename = temp_filename
-        library.books = []
-        library.save_books()
-        
-        client = TestClient(app)
-        yield client
+        app = create_app(Settings(library_file=temp_filename))
+        with TestClient(app) as client:
+            yield client
         
         # Cleanup
-        library.filename = original_filename
         if os.path.exists(temp_filename):
             os.unlink(temp_filename)
     
+    @pytest.fixture(scope="function")
+    def library(self, client):
+        """Test uygulamasının lifespan içinde oluşturduğu Library instance'ı."""
+        return client.app.state.library
+    
     def test_root_endpoint(self, client):
         """Ana endpoint testı."""
         response = client.get("/")
@@ -55,7 +62,7 @@ class TestAPI:
         data = response.json()
         assert data == []
     
-    def test_get_books_with_data(self, client):
+    def test_get_books_with_data(self, client, library):
         """Kitapları listeleme testı."""
         # Manual olarak kitap ekle
         book = Book("1984", "George Orwell", "978-0451524935")
@@ -105,7 +112,7 @@ class TestAPI:
         
         assert response.status_code == 422  # Validation error
     
-    def test_post_book_duplicate(self, client):
+    def test_post_book_duplicate(self, client, library):
         """Aynı kitabı iki kez ekleme testı."""
         # İlk kitabı ekle
         book = Book("1984", "George Orwell", "978-0451524935")
@@ -127,13 +134,49 @@ class TestAPI:
         mock_client_instance.get.return_value = response_mock
         mock_client.return_value.__enter__.return_value = mock_client_instance
         
-        response = client.post("/books", json={"isbn": "978-0000000000"})
+        response = client.post("/books", json={"isbn": "978-0000000002"})
         
         assert response.status_code == 404
         data = response.json()
         assert "bulunamadı" in data["detail"]
     
-    def test_get_book_success(self, client):
+    def test_add_and_delete_run_off_event_loop(self, client, library):
+        """Bloklayan ekleme/silme çağrılarının event loop dışında çalıştığı testı."""
+        def assert_off_loop(*args):
+            with pytest.raises(RuntimeError):
+                asyncio.get_running_loop()
+            return True
+        
+        with patch.object(library, "add_book", side_effect=assert_off_loop) as add_book, \
+                patch.object(library, "find_book", return_value=Book("1984", "George Orwell", "978-0451524935")):
+            response = client.post("/books", json={"isbn": "978-0451524935"})
+        assert response.status_code == 201
+        add_book.assert_called_once_with("978-0451524935")
+        
+        library.add_book_manual(Book("1984", "George Orwell", "978-0451524935"))
+        with patch.object(library, "remove_book", side_effect=assert_off_loop) as remove_book:
+            response = client.delete("/books/978-0451524935")
+        assert response.status_code == 200
+        remove_book.assert_called_once_with("978-0451524935")
+    
+    @patch('library.httpx.Client')
+    def test_post_book_other_spelling_is_duplicate(self, mock_client, client, library):
+        """Tiresiz ve ISBN-10 yazımlarının mevcut kitabın tekrarı sayılması testı."""
+        library.add_book_manual(Book("1984", "George Orwell", "978-0451524935"))
+        
+        for isbn in ("9780451524935", "0-451-52493-4", " 978-0451524935 "):
+            response = client.post("/books", json={"isbn": isbn})
+            assert response.status_code == 400
+            assert "zaten kütüphanede mevcut" in response.json()["detail"]
+            response = client.post("/books", json={"isbn": isbn},
+                                   headers={"Prefer": "respond-async"})
+            assert response.status_code == 400
+        
+        mock_client.assert_not_called()
+        assert library.get_book_count() == 1
+        assert not library.add_book("0451524934")
+    
+    def test_get_book_success(self, client, library):
         """Belirli kitap getirme testı."""
         # Kitap ekle
         book = Book("1984", "George Orwell", "978-0451524935")
@@ -155,7 +198,7 @@ class TestAPI:
         data = response.json()
         assert "bulunamadı" in data["detail"]
     
-    def test_delete_book_success(self, client):
+    def test_delete_book_success(self, client, library):
         """Başarılı kitap silme testı."""
         # Kitap ekle
         book = Book("1984", "George Orwell", "978-0451524935")
@@ -189,7 +232,7 @@ class TestAPI:
         assert data["total_authors"] == 0
         assert data["most_common_authors"] == []
     
-    def test_get_stats_with_books(self, client):
+    def test_get_stats_with_books(self, client, library):
         """Kitaplar ile istatistikler testı."""
         # Kitaplar ekle
         book1 = Book("1984", "George Orwell", "978-0451524935")
@@ -219,4 +262,226 @@ class TestAPI:
         """ISBN eksik POST isteği testı."""
         response = client.post("/books", json={"title": "Some Book"})
         
-        assert response.status_code == 422  # Validation error
\ No newline at end of file
+        assert response.status_code == 422  # Validation error
+
+class TestAppFactory:
+    """create_app fabrikası test sınıfı."""
+    
+    def test_preloaded_library_is_used(self, tmp_path):
+        """Önceden yüklenmiş Library'nin lifespan tarafından korunması testı."""
+        filename = str(tmp_path / "library.json")
+        preloaded = Library(filename)
+        preloaded.add_book_manual(Book("1984", "George Orwell", "978-0451524935"))
+        
+        app = create_app(Settings(library_file=filename), library=preloaded)
+        with TestClient(app) as client:
+            assert client.app.state.library is preloaded
+            response = client.get("/books/978-0451524935")
+            assert response.status_code == 200
+        
+        # Uygulama kapandıktan sonra da paylaşılan instance yerinde kalmalı
+        assert app.state.library is preloaded
+    
+    def test_library_loaded_in_lifespan(self, tmp_path):
+        """Library'nin ilk istekten önce lifespan içinde yüklenmesi testı."""
+        filename = str(tmp_path / "library.json")
+        app = create_app(Settings(library_file=filename))
+        
+        assert app.state.library is None
+        with TestClient(app) as client:
+            assert client.app.state.library.filename == filename
+        assert app.state.library is None
+    
+    def test_settings_from_env(self, monkeypatch):
+        """Ayarların ortam değişkenlerinden okunması testı."""
+        monkeypatch.setenv("LIBRARY_LIBRARY_FILE", "branch.json")
+        monkeypatch.setenv("LIBRARY_PRELOAD", "true")
+        
+        settings = Settings.from_env()
+        
+        assert settings.library_file == "branch.json"
+        assert settings.preload is True
+
+
+class TestBatchAPI:
+    """POST /books/batch test sınıfı."""
+    
+    @pytest.fixture
+    def client(self, tmp_path):
+        """Test client'ı oluşturur."""
+        app = create_app(Settings(library_file=str(tmp_path / "library.json")))
+        with TestClient(app) as client:
+            yield client
+    
+    def test_batch_add_and_remove(self, client):
+        """Toplu ekleme ve silme testı."""
+        library = client.app.state.library
+        library.add_book_manual(Book("Dune", "Frank Herbert", "978-0441172719"))
+        
+        response = client.post("/books/batch", json={"operations": [
+            {"op": "add", "isbn": "978-0451524935", "title": "1984", "author": "George Orwell"},
+            {"op": "remove", "isbn": "978-0441172719"},
+            {"op": "remove", "isbn": "978-0000000000"},
+        ]})
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["applied"] == 2
+        assert data["failed"] == 1
+        assert [r["status"] for r in data["results"]] == ["added", "removed", "not_found"]
+        assert data["results"][0]["book"]["title"] == "1984"
+        assert client.get("/books/978-0441172719").status_code == 404
+        assert client.get("/books/978-0451524935").status_code == 200
+    
+    def test_batch_invalid_operation(self, client):
+        """Bilinmeyen işlem türü için 422 testı."""
+        response = client.post("/books/batch", json={"operations": [{"op": "move", "isbn": "1"}]})
+        
+        assert response.status_code == 422
+    
+    @patch('library.httpx.Client')
+    def test_add_invalid_isbn(self, mock_client, client):
+        """Kontrol hanesi hatalı ISBN için Open Library'ye gitmeden 422 testı."""
+        response = client.post("/books", json={"isbn": "978-0451524936"})
+        
+        assert response.status_code == 422
+        assert "kontrol hanesi" in response.text
+        mock_client.assert_not_called()
+    
+    def test_batch_empty(self, client):
+        """Boş işlem listesi için 422 testı."""
+        response = client.post("/books/batch", json={"operations": []})
+        
+        assert response.status_code == 422
+
+
+
+class TestBookQueryAPI:
+    """GET /books filtreleme, sıralama ve sayfalama test sınıfı."""
+    
+    @pytest.fixture
+    def client(self, tmp_path):
+        """Birkaç kitaplık test client'ı oluşturur."""
+        app = create_app(Settings(library_file=str(tmp_path / "library.json"),
+                                  libraries_dir=str(tmp_path / "libraries")))
+        with TestClient(app) as client:
+            client.post("/books/batch", json={"operations": [
+                {"op": "add", "isbn": "978-0441172719", "title": "Dune", "author": "Frank Herbert"},
+                {"op": "add", "isbn": "978-0451524935", "title": "1984", "author": "George Orwell"},
+                {"op": "add", "isbn": "978-0451526342", "title": "Animal Farm", "author": "George Orwell"},
+            ]})
+            yield client
+    
+    def test_filter_sort_paginate(self, client):
+        """author, sort, order ve limit parametreleri testı."""
+        response = client.get("/books", params={"author": "george orwell", "sort": "title",
+                                                "order": "desc", "limit": 1})
+        
+        assert response.status_code == 200
+        assert [book["title"] for book in response.json()] == ["Animal Farm"]
+        assert response.headers["X-Total-Count"] == "2"
+        assert "X-Change-Seq" in response.headers
+    
+    def test_range(self, client):
+        """from/to ile sıralama alanında aralık testı."""
+        response = client.get("/books", params={"sort": "title", "from": "a", "to": "e"})
+        
+        assert [book["title"] for book in response.json()] == ["Animal Farm", "Dune"]
+    
+    def test_invalid_parameters(self, client):
+        """Geçersiz sıralama ve sıralamasız aralık için hata testı."""
+        assert client.get("/books", params={"sort": "isbn"}).status_code == 422
+        assert client.get("/books", params={"from": "a"}).status_code == 400
+
+
+class TestLookupAPI:
+    """POST /books/lookup endpoint'i test sınıfı."""
+    
+    @pytest.fixture
+    def client(self, tmp_path):
+        """İki kitaplı test client'ı oluşturur."""
+        app = create_app(Settings(library_file=str(tmp_path / "library.json"),
+                                  libraries_dir=str(tmp_path / "libraries")))
+        with TestClient(app) as client:
+            client.post("/books/batch", json={"operations": [
+                {"op": "add", "isbn": "978-0441172719", "title": "Dune", "author": "Frank Herbert"},
+                {"op": "add", "isbn": "978-0451524935", "title": "1984", "author": "George Orwell"},
+            ]})
+            yield client
+    
+    def test_lookup(self, client):
+        """Bulunan kitapların istenen ISBN'e göre, bulunamayanların listede dönmesi testı."""
+        response = client.post("/books/lookup", json={"isbns": [
+            "0-451-52493-4", "978-0441172719", "978-0000000000", " 978-0441172719 "]})
+        
+        assert response.status_code == 200
+        body = response.json()
+        assert list(body["books"]) == ["0-451-52493-4", "978-0441172719"]
+        assert body["books"]["0-451-52493-4"]["title"] == "1984"
+        assert body["missing"] == ["978-0000000000"]
+        assert "X-Change-Seq" in response.headers
+    
+    def test_lookup_limits(self, client):
+        """Boş ve çok uzun ISBN listesi için 422 testı."""
+        assert client.post("/books/lookup", json={"isbns": []}).status_code == 422
+        too_many = [f"978-{i:010d}" for i in range(1001)]
+        assert client.post("/books/lookup", json={"isbns": too_many}).status_code == 422
+    
+    def test_branch_lookup(self, client):
+        """Şube kataloğunda ayrı çözümleme testı."""
+        response = client.post("/libraries/kadikoy/books/lookup", json={"isbns": ["978-0441172719"]})
+        
+        assert response.json() == {"books": {}, "missing": ["978-0441172719"]}
+
+
+class TestReadyAPI:
+    """GET /ready ve indeksler hazır değilken yanıtlar test sınıfı."""
+    
+    @pytest.fixture
+    def settings(self, tmp_path):
+        """İki kitaplık katalog dosyasıyla ayarları oluşturur."""
+        path = tmp_path / "library.json"
+        books = [Book("Dune", "Frank Herbert", "978-0441172719"),
+                 Book("1984", "George Orwell", "978-0451524935")]
+        path.write_text(json.dumps([book.to_dict() for book in books]), encoding="utf-8")
+        return Settings(library_file=str(path), libraries_dir=str(tmp_path / "libraries"))
+    
+    def test_ready(self, settings):
+        """İndeksler oluşunca hazır durumunun ve sürelerin dönmesi testı."""
+        with TestClient(create_app(settings)) as client:
+            assert client.app.state.library.wait_for_indexes(5)
+            response = client.get("/ready", params={"full": True})
+        
+        assert response.status_code == 200
+        body = response.json()
+        assert body["ready"] and body["books"] == 2
+        assert set(body["indexes"]) == {"sorted", "canonical", "columns"}
+        assert body["indexes"]["sorted"]["seconds"] is not None
+    
+    def test_not_ready(self, settings, monkeypatch):
+        """İndeksler oluşturulurken ISBN aramasının çalışması, sıralı listenin 503 dönmesi testı."""
+        release = threading.Event()
+        build = indexes.build_indexes
+        
+        def blocked(books):
+            if books:
+                release.wait(5)
+            return build(books)
+        
+        monkeypatch.setattr(indexes, "build_indexes", blocked)
+        monkeypatch.setattr(library_module, "INDEX_FALLBACK_LIMIT", 1)
+        try:
+            with TestClient(create_app(settings)) as client:
+                assert client.get("/ready").status_code == 200
+                assert client.get("/ready", params={"full": True}).status_code == 503
+                assert client.get("/books/978-0441172719").status_code == 200
+                response = client.get("/books", params={"sort": "title"})
+                assert response.status_code == 503
+                assert response.headers["Retry-After"] == "1"
+                assert response.json()["index"] == "sorted"
+                
+                release.set()
+                assert client.app.state.library.wait_for_indexes(5)
+                assert client.get("/books", params={"sort": "title"}).status_code == 200
+        finally:
+            release.set()
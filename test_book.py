@@ -111,4 +111,27 @@ class TestBook:
         
         assert book.title == long_title
         assert book.author == long_author
-        assert book.isbn == isbn
\ No newline at end of file
+        assert book.isbn == isbn
+    
+    def test_optional_metadata_round_trip(self):
+        """İsteğe bağlı edition alanlarının to_dict/from_dict ile korunması testı."""
+        book = Book("1984", "George Orwell", "978-0451524935", publish_year=1950, pages=328,
+                    publishers=["Signet Classic"], subjects=["Dystopias", "Totalitarianism"],
+                    author_keys=["/authors/OL118077A"])
+        
+        data = book.to_dict()
+        restored = Book.from_dict(data)
+        
+        assert data["subjects"] == ["Dystopias", "Totalitarianism"]
+        assert restored.publish_year == 1950 and restored.pages == 328
+        assert restored.publishers == ("Signet Classic",)
+        assert restored.to_dict() == data
+    
+    def test_to_dict_omits_missing_metadata(self):
+        """Bilinmeyen isteğe bağlı alanların sözlüğe yazılmaması testı."""
+        book = Book.from_dict({"title": "Dune", "author": "Frank Herbert",
+                               "isbn": "978-0441172719", "subjects": None})
+        
+        assert book.to_dict() == {"title": "Dune", "author": "Frank Herbert",
+                                  "isbn": "978-0441172719"}
+        assert book.subjects == () and book.publish_year is None
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Katalog karşılaştırma ve birleştirme (catalog_diff, Library.diff/merge) için testler.
+"""
+
+import json
+
+import pytest
+
+import catalog_diff
+import main
+from book import Book
+from isbn import canonical_isbn
+from library import Library
+
+
+LEFT = [
+    Book("1984", "George Orwell", "978-0451524935"),
+    Book("Dune", "Frank Herbert", "978-0441172719"),
+    Book("Hayvan Çiftliği", "George Orwell", "978-0451526342"),
+]
+
+RIGHT = [
+    # Aynı kitap ISBN-10 yazımıyla
+    Book("1984", "George Orwell", "0-451-52493-4"),
+    Book("Dune", "F. Herbert", "9780441172719"),
+    Book("Fahrenheit 451", "Ray Bradbury", "978-1451673319"),
+]
+
+
+def write_catalog(path, books):
+    """Kitapları Library dosya biçiminde yazar."""
+    path.write_text(json.dumps([book.to_dict() for book in books], ensure_ascii=False, indent=2),
+                    encoding="utf-8")
+    return str(path)
+
+
+def by_status(differences):
+    """Farkları (durum, kanonik ISBN) kümesine çevirir."""
+    return {(difference["status"], difference["isbn"]) for difference in differences}
+
+
+EXPECTED = {
+    ("changed", "9780441172719"),
+    ("left_only", "9780451526342"),
+    ("right_only", "9781451673319"),
+}
+
+
+class TestCatalogDiff:
+    """catalog_diff modülü test sınıfı."""
+
+    def test_canonical_isbn(self):
+        """ISBN-10 ve tireli yazımların aynı ISBN-13'e çevrilmesi testı."""
+        assert canonical_isbn("0-451-52493-4") == "9780451524935"
+        assert canonical_isbn("978-0451524935") == "9780451524935"
+        assert canonical_isbn("080442957x") == "9780804429573"
+
+    def test_read_catalog_streams_records(self, tmp_path, monkeypatch):
+        """Kayıtların parça sınırlarında bölünse de doğru okunması testı."""
+        monkeypatch.setattr(catalog_diff, "READ_CHUNK", 7)
+        path = write_catalog(tmp_path / "left.json", LEFT)
+
+        records = list(catalog_diff.read_catalog(path))
+
+        assert records == [book.to_dict() for book in LEFT]
+
+    def test_read_catalog_rejects_truncated_file(self, tmp_path):
+        """Yarım kalmış katalog dosyası için ValueError testı."""
+        path = tmp_path / "broken.json"
+        path.write_text('[{"title": "1984", "author": "George Orwell", "isbn": "1"}, {"ti',
+                        encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            list(catalog_diff.read_catalog(str(path)))
+
+    def test_diff_files(self, tmp_path):
+        """Yalnızca bir tarafta olan ve farklı kitapların bulunması testı."""
+        left = write_catalog(tmp_path / "left.json", LEFT)
+        right = write_catalog(tmp_path / "right.json", RIGHT)
+
+        differences = list(catalog_diff.diff_files(left, right))
+
+        assert by_status(differences) == EXPECTED
+        changed = next(d for d in differences if d["status"] == "changed")
+        assert changed["fields"] == ["author"]
+        assert changed["right"]["author"] == "F. Herbert"
+
+    def test_edition_fields_are_compared(self):
+        """Edition alanı farkları ve eksik/boş değerlerin eşit sayılması testı."""
+        left = [{"title": "1984", "author": "George Orwell", "isbn": "978-0451524935",
+                 "pages": 328, "subjects": ["Dystopias"]},
+                {"title": "Dune", "author": "Frank Herbert", "isbn": "978-0441172719"}]
+        right = [{"title": "1984", "author": "George Orwell", "isbn": "978-0451524935",
+                  "pages": 326, "subjects": ["Dystopias"], "publish_year": 1950},
+                 {"title": "Dune", "author": "Frank Herbert", "isbn": "978-0441172719",
+                  "subjects": []}]
+
+        differences = list(catalog_diff.diff_records(left, right))
+
+        assert [(d["isbn"], d["fields"]) for d in differences] == [
+            ("9780451524935", ["publish_year", "pages"])]
+        operations = catalog_diff.merge_operations(differences, "theirs")
+        assert operations[1]["publish_year"] == 1950 and operations[1]["pages"] == 326
+
+    def test_partitioned_diff_matches(self, tmp_path):
+        """Geçici dosyalara bölünmüş karşılaştırmanın aynı sonucu vermesi testı."""
+        left = write_catalog(tmp_path / "left.json", LEFT)
+        right = write_catalog(tmp_path / "right.json", RIGHT)
+
+        assert by_status(catalog_diff.diff_files(left, right, partitions=4)) == EXPECTED
+
+    def test_unknown_policy(self):
+        """Desteklenmeyen birleştirme politikası için ValueError testı."""
+        with pytest.raises(ValueError):
+            catalog_diff.merge_operations([], "both")
+
+
+class TestLibraryMerge:
+    """Library.diff ve Library.merge test sınıfı."""
+
+    @pytest.fixture
+    def library(self, tmp_path):
+        """Sol katalogla geçici kütüphane."""
+        library = Library(str(tmp_path / "library.json"))
+        library.add_books(LEFT)
+        return library
+
+    def test_diff_against_library(self, library, tmp_path):
+        """Başka bir Library nesnesiyle karşılaştırma testı."""
+        other = Library(str(tmp_path / "other.json"))
+        other.add_books(RIGHT)
+
+        assert by_status(library.diff(other)) == EXPECTED
+
+    def test_merge_ours(self, library, tmp_path):
+        """ours politikasında yalnızca eksik kitapların eklenmesi testı."""
+        right = write_catalog(tmp_path / "right.json", RIGHT)
+
+        results = library.merge(right)
+
+        assert [(r["op"], r["status"]) for r in results] == [("add", "added")]
+        assert library.find_book("978-1451673319").title == "Fahrenheit 451"
+        assert library.find_book("978-0441172719").author == "Frank Herbert"
+        assert Library(library.filename).get_book_count() == 4
+
+    def test_merge_theirs(self, library, tmp_path):
+        """theirs politikasında farklı kayıtların diğer katalogdan alınması testı."""
+        right = write_catalog(tmp_path / "right.json", RIGHT)
+
+        library.merge(right, "theirs")
+
+        assert library.find_book("978-0441172719") is None
+        assert library.find_book("9780441172719").author == "F. Herbert"
+        assert library.find_book("978-0451526342") is not None
+        assert list(library.diff(right)) == [
+            {"isbn": "9780451526342", "status": "left_only",
+             "left": LEFT[2].to_dict(), "right": None}]
+
+
+class TestDiffCommands:
+    """diff ve merge alt komutları test sınıfı."""
+
+    def test_diff_and_merge_commands(self, tmp_path, capsys):
+        """diff komutunun farkları, merge komutunun sonuçları yazması testı."""
+        left = write_catalog(tmp_path / "left.json", LEFT)
+        right = write_catalog(tmp_path / "right.json", RIGHT)
+
+        code = main.main(["--file", left, "diff", right])
+        captured = capsys.readouterr()
+        summary = json.loads(captured.err.strip().splitlines()[-1])
+        assert code == 1
+        assert len(captured.out.splitlines()) == 3
+        assert summary["left_only"] == summary["right_only"] == summary["changed"] == 1
+
+        code = main.main(["--file", left, "merge", right, "--policy", "theirs"])
+        results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert code == 0
+        assert [r["status"] for r in results] == ["removed", "added", "added"]
+        assert main.main(["--file", right, "diff", right]) == 0
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Değişiklik akışı (Library.changes ve GET /changes) için testler.
+"""
+
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api import create_app
+from book import Book
+from library import Library
+from settings import Settings
+
+
+@pytest.fixture
+def library(tmp_path):
+    """Boş Library instance'ı oluşturur."""
+    return Library(str(tmp_path / "library.json"))
+
+
+class TestChangeLog:
+    """Library değişiklik kaydı test sınıfı."""
+
+    def test_events_in_order(self, library):
+        """Ekleme ve silmelerin sıra numaralarıyla kaydedilmesi testı."""
+        start = library.last_seq
+        library.add_book_manual(Book("1984", "George Orwell", "978-0451524935"))
+        library.add_books([Book("Dune", "Frank Herbert", "978-0441172719")])
+        library.apply_batch([
+            {"op": "remove", "isbn": "978-0451524935"},
+            {"op": "add", "isbn": "978-0451524935", "title": "1984 (2. baskı)", "author": "George Orwell"},
+            {"op": "remove", "isbn": "978-0000000000"},
+        ])
+        library.remove_book("978-0441172719")
+
+        result = library.changes(start)
+
+        assert result["resync_required"] is False
+        assert [(e["seq"] - start, e["op"]) for e in result["changes"]] == [
+            (1, "add"), (2, "add"), (3, "remove"), (4, "add"), (5, "remove")]
+        assert result["changes"][3]["book"]["title"] == "1984 (2. baskı)"
+        assert "book" not in result["changes"][2]
+        assert result["next"] == result["last_seq"] == library.last_seq == start + 5
+        assert library.snapshot().seq == library.last_seq
+
+    def test_since_and_limit(self, library):
+        """since ve limit ile sayfalama testı."""
+        start = library.last_seq
+        library.add_books(Book(f"Kitap {i}", "Yazar", f"isbn-{i}") for i in range(5))
+
+        first = library.changes(start, limit=2)
+        second = library.changes(first["next"], limit=2)
+        empty = library.changes(library.last_seq)
+
+        assert [e["isbn"] for e in first["changes"]] == ["isbn-0", "isbn-1"]
+        assert [e["isbn"] for e in second["changes"]] == ["isbn-2", "isbn-3"]
+        assert empty["changes"] == [] and empty["next"] == library.last_seq
+
+    def test_resync_when_outside_window(self, library):
+        """Saklanan pencere dışındaki since için resync sinyali testı."""
+        start = library.last_seq
+        with patch.object(library, "_changes", library._changes.__class__(maxlen=3)):
+            library.add_books(Book(f"Kitap {i}", "Yazar", f"isbn-{i}") for i in range(5))
+
+            assert library.changes(start)["resync_required"] is True
+            assert library.changes(start + 1)["resync_required"] is True
+            assert [e["isbn"] for e in library.changes(start + 2)["changes"]] == [
+                "isbn-2", "isbn-3", "isbn-4"]
+        assert library.changes(library.last_seq + 1)["resync_required"] is True
+
+    def test_reload_requires_resync(self, library):
+        """Katalog yeniden yüklendiğinde eski imleçlerin geçersiz olması testı."""
+        library.add_book_manual(Book("1984", "George Orwell", "978-0451524935"))
+        cursor = library.last_seq
+
+        library.load_books()
+
+        assert library.last_seq > cursor
+        assert library.changes(cursor)["resync_required"] is True
+        assert library.changes(library.last_seq)["resync_required"] is False
+
+    def test_new_process_invalidates_cursors(self, tmp_path):
+        """Yeni süreçte önceki sürecin imleçleriyle devam edilememesi testı."""
+        filename = str(tmp_path / "library.json")
+        old = Library(filename)
+        old.add_books(Book(f"Kitap {i}", "Yazar", f"isbn-{i}") for i in range(3))
+
+        new = Library(filename)
+        new.add_book_manual(Book("1984", "George Orwell", "978-0451524935"))
+
+        assert new.changes(old.last_seq)["resync_required"] is True
+
+    def test_wait_for_changes(self, library):
+        """wait_for_changes'in yeni olayda uyanması testı."""
+        since = library.last_seq
+        timer = threading.Timer(0.05, library.add_book_manual,
+                                args=(Book("1984", "George Orwell", "978-0451524935"),))
+        timer.start()
+
+        start = time.perf_counter()
+        assert library.wait_for_changes(since, 5) is True
+        assert time.perf_counter() - start < 5
+        assert library.wait_for_changes(library.last_seq, 0.01) is False
+
+
+class TestChangesAPI:
+    """GET /changes endpoint'i test sınıfı."""
+
+    @pytest.fixture
+    def client(self, tmp_path):
+        """Geçici dosyalı test client'ı oluşturur."""
+        settings = Settings(library_file=str(tmp_path / "library.json"),
+                            libraries_dir=str(tmp_path / "libraries"))
+        with TestClient(create_app(settings)) as client:
+            yield client
+
+    def add(self, client, *isbns):
+        """Open Library'ye gitmeden kitap ekler."""
+        client.post("/books/batch", json={"operations": [
+            {"op": "add", "isbn": isbn, "title": f"Kitap {isbn}", "author": "Yazar"}
+            for isbn in isbns]})
+
+    def test_sync_from_books_header(self, client):
+        """GET /books başlığındaki sıra numarasından artımlı devam testı."""
+        self.add(client, "9780306406157")
+        listing = client.get("/books")
+        seq = int(listing.headers["X-Change-Seq"])
+        self.add(client, "9780140449136")
+        client.delete("/books/9780306406157")
+
+        response = client.get("/changes", params={"since": seq})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [(e["op"], e["isbn"]) for e in data["changes"]] == [
+            ("add", "9780140449136"), ("remove", "9780306406157")]
+        assert data["changes"][0]["book"]["isbn"] == "9780140449136"
+        assert data["next"] == data["last_seq"] == seq + 2
+
+    def test_export_header(self, client):
+        """Dışa aktarımın sıra numarası başlığı testı."""
+        self.add(client, "9780306406157")
+
+        response = client.get("/export")
+
+        assert int(response.headers["X-Change-Seq"]) == client.app.state.library.last_seq
+
+    def test_resync_required(self, client):
+        """Pencere dışındaki since için 410 testı."""
+        response = client.get("/changes", params={"since": 0})
+
+        assert response.status_code == 410
+        assert response.json()["resync_required"] is True
+
+    def test_long_poll(self, client):
+        """wait ile yeni olayın beklenmesi testı."""
+        seq = int(client.get("/books").headers["X-Change-Seq"])
+        library = client.app.state.library
+        timer = threading.Timer(0.1, library.add_book_manual,
+                                args=(Book("1984", "George Orwell", "978-0451524935"),))
+        timer.start()
+
+        response = client.get("/changes", params={"since": seq, "wait": 5})
+
+        assert [e["isbn"] for e in response.json()["changes"]] == ["978-0451524935"]
+
+    def test_long_poll_timeout(self, client):
+        """Olay gelmezse wait sonunda boş yanıt testı."""
+        seq = int(client.get("/books").headers["X-Change-Seq"])
+
+        response = client.get("/changes", params={"since": seq, "wait": 0.05})
+
+        assert response.status_code == 200
+        assert response.json()["changes"] == []
+
+    def test_server_sent_events(self, client):
+        """SSE akışı ve Last-Event-ID testı."""
+        seq = int(client.get("/books").headers["X-Change-Seq"])
+        self.add(client, "9780306406157", "9780140449136")
+
+        response = client.get("/changes", params={"since": 0, "wait": 0.1},
+                              headers={"Accept": "text/event-stream", "Last-Event-ID": str(seq + 1)})
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        frames = [frame for frame in response.text.split("\n\n") if frame.startswith("id:")]
+        assert len(frames) == 1
+        lines = dict(line.split(": ", 1) for line in frames[0].splitlines())
+        assert lines["id"] == str(seq + 2)
+        assert lines["event"] == "add"
+        assert json.loads(lines["data"])["isbn"] == "9780140449136"
+
+    def test_server_sent_events_resync(self, client):
+        """SSE akışında resync olayı testı."""
+        response = client.get("/changes", params={"since": 0, "wait": 1},
+                              headers={"Accept": "text/event-stream"})
+
+        assert response.text.startswith("event: resync\n")
+
+    def test_tenant_changes(self, client):
+        """Şube kataloglarının kendi değişiklik akışı testı."""
+        seq = int(client.get("/libraries/kadikoy/books").headers["X-Change-Seq"])
+        client.post("/libraries/kadikoy/books/batch", json={"operations": [
+            {"op": "add", "isbn": "9780306406157", "title": "Kitap", "author": "Yazar"}]})
+
+        response = client.get("/libraries/kadikoy/changes", params={"since": seq})
+
+        assert [e["isbn"] for e in response.json()["changes"]] == ["9780306406157"]
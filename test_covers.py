@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Kapak önbelleği (CoverCache) ve GET /books/{isbn}/cover için testler.
+"""
+
+import hashlib
+import os
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api import create_app
+from covers import CoverCache, CoverNotFound
+from library import Library
+from openlibrary import OpenLibraryClient
+from openlibrary_stub import OpenLibraryStub
+from settings import Settings
+
+
+CORPUS = {
+    "editions": {
+        "978-0451524935": {"title": "1984", "authors": [{"key": "/authors/OL118077A"}]},
+    },
+    "authors": {
+        "OL118077A": {"name": "George Orwell"},
+    },
+}
+
+JPEG = b"\xff\xd8\xff\xe0" + b"1984" * 256
+COVERS = {
+    "978-0451524935-M": JPEG,
+    "978-0451524935-L": JPEG,
+    "978-0441172719-M": b"\xff\xd8\xff\xe0" + b"dune" * 256,
+}
+
+
+@pytest.fixture
+def stub():
+    """Kapakları da sunan yerel Open Library taklidini başlatır."""
+    with OpenLibraryStub(CORPUS, covers=COVERS) as stub:
+        yield stub
+
+
+@pytest.fixture
+def cache(tmp_path, stub):
+    """Taklit sunucuya bağlı geçici kapak önbelleği."""
+    cache = CoverCache(str(tmp_path / "covers"), OpenLibraryClient(stub.base_url))
+    yield cache
+    cache.close()
+
+
+class TestCoverCache:
+    """CoverCache test sınıfı."""
+
+    def test_fetch_once(self, cache, stub):
+        """Kapağın bir kez çekilip sonra diskten sunulması testı."""
+        first = cache.get("978-0451524935", "M")
+        second = cache.get("978-0451524935", "M")
+
+        assert first.digest == second.digest == hashlib.sha256(JPEG).hexdigest()
+        assert first.content_type == "image/jpeg" and first.size == len(JPEG)
+        with open(cache.path(first.digest), "rb") as file:
+            assert file.read() == JPEG
+        assert stub.request_counts["cover"] == 1
+
+    def test_same_image_stored_once(self, cache):
+        """Aynı görseli paylaşan boyutların tek dosya tutması testı."""
+        medium = cache.get("978-0451524935", "M")
+        large = cache.get("978-0451524935", "L")
+
+        assert medium.digest == large.digest
+        assert cache.stats()["covers"] == 2
+        assert cache.stats()["bytes"] == len(JPEG)
+
+    def test_missing_cover_remembered(self, cache, stub):
+        """Kapağı olmayan kitabın tekrar sorulmaması testı."""
+        with pytest.raises(CoverNotFound):
+            cache.get("978-0000000000", "M")
+        with pytest.raises(CoverNotFound):
+            cache.get("978-0000000000", "M")
+
+        assert stub.request_counts["cover"] == 1
+        assert cache.stats()["missing"] == 1
+
+    def test_invalid_request(self, cache):
+        """Geçersiz ISBN ya da boyutun reddedilmesi testı."""
+        with pytest.raises(ValueError):
+            cache.get("../etc/passwd", "M")
+        with pytest.raises(ValueError):
+            cache.get("978-0451524935", "XL")
+
+    def test_lru_eviction(self, tmp_path, stub):
+        """Boyut sınırı aşılınca en uzun süredir istenmeyen kapağın silinmesi testı."""
+        cache = CoverCache(str(tmp_path / "covers"), OpenLibraryClient(stub.base_url),
+                           max_bytes=len(JPEG) + 100)
+        orwell = cache.get("978-0451524935", "M")
+        dune = cache.get("978-0441172719", "M")
+
+        assert not os.path.exists(cache.path(orwell.digest))
+        assert os.path.exists(cache.path(dune.digest))
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] <= cache.max_bytes
+
+    def test_index_persisted(self, tmp_path, stub):
+        """Önbelleğin yeniden açıldığında diskteki görselleri kullanması testı."""
+        directory = str(tmp_path / "covers")
+        CoverCache(directory, OpenLibraryClient(stub.base_url)).get("978-0451524935", "M")
+
+        reopened = CoverCache(directory, OpenLibraryClient(stub.base_url))
+        reopened.get("978-0451524935", "M")
+
+        assert stub.request_counts["cover"] == 1
+
+    def test_prefetch_on_add(self, tmp_path, stub, cache):
+        """add_book sonrası kapağın arka planda önbelleğe çekilmesi testı."""
+        library = Library(str(tmp_path / "library.json"), base_url=stub.base_url, covers=cache)
+
+        assert library.add_book("978-0451524935")
+        deadline = time.monotonic() + 5
+        while cache.stats()["covers"] == 0:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+        assert stub.request_counts["cover"] == 1
+
+
+class TestCoverAPI:
+    """GET /books/{isbn}/cover endpoint'i test sınıfı."""
+
+    @pytest.fixture
+    def client(self, tmp_path, stub):
+        """Kapak sunucusu taklide yönlendirilmiş test client'ı oluşturur."""
+        settings = Settings(library_file=str(tmp_path / "library.json"),
+                            libraries_dir=str(tmp_path / "libraries"),
+                            covers_dir=str(tmp_path / "covers"),
+                            covers_url=stub.base_url)
+        with TestClient(create_app(settings)) as client:
+            client.post("/books/batch", json={"operations": [
+                {"op": "add", "isbn": "978-0451524935", "title": "1984", "author": "George Orwell"},
+                {"op": "add", "isbn": "978-0000000000", "title": "Kapaksız", "author": "Yazar"},
+            ]})
+            yield client
+
+    def test_serves_cover(self, client):
+        """Kapağın önbellek başlıklarıyla sunulması testı."""
+        response = client.get("/books/978-0451524935/cover")
+
+        assert response.status_code == 200
+        assert response.content == JPEG
+        assert response.headers["content-type"] == "image/jpeg"
+        assert response.headers["etag"] == f'"{hashlib.sha256(JPEG).hexdigest()}"'
+        assert "max-age=" in response.headers["cache-control"]
+
+    def test_not_modified(self, client, stub):
+        """If-None-Match eşleşince 304 testı."""
+        etag = client.get("/books/978-0451524935/cover").headers["etag"]
+
+        response = client.get("/books/978-0451524935/cover", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert stub.request_counts["cover"] == 1
+
+    def test_not_found(self, client):
+        """Katalogda olmayan kitap ya da kapaksız kitap için 404 testı."""
+        assert client.get("/books/978-0441172719/cover").status_code == 404
+        assert client.get("/books/978-0000000000/cover").status_code == 404
+        assert client.get("/books/978-0451524935/cover", params={"size": "XL"}).status_code == 422
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Open Library döküm dosyası içe aktarımı için testler.
+"""
+
+import gzip
+import json
+
+import pytest
+
+import dump_import
+import main
+from book import Book
+from dump_import import import_dump, parse_editions
+from library import Library
+
+
+EDITIONS = [
+    {"key": "/books/OL1M", "title": "1984", "isbn_13": ["9780451524935"],
+     "authors": [{"key": "/authors/OL118077A"}]},
+    {"key": "/books/OL2M", "title": "Animal Farm", "isbn_10": ["0451526341"],
+     "authors": [{"key": "/authors/OL118077A"}]},
+    {"key": "/books/OL3M", "title": "Brave New World", "isbn_13": ["9780060850524"],
+     "authors": [{"key": "/authors/OL27349A"}]},
+    {"key": "/books/OL4M", "title": "ISBN'siz Kitap"},
+    {"key": "/books/OL5M", "title": "Yazarsız Kitap", "isbn_13": ["9780000000002"]},
+]
+
+AUTHORS = [
+    {"key": "/authors/OL118077A", "name": "George Orwell"},
+    {"key": "/authors/OL27349A", "name": "Aldous Huxley"},
+    {"key": "/authors/OL1A", "name": "İlgisiz Yazar"},
+]
+
+
+def write_tsv_gz(path, record_type, records):
+    """Kayıtları Open Library TSV döküm biçiminde gzip'li yazar."""
+    with gzip.open(path, 'wt', encoding='utf-8') as file:
+        for record in records:
+            file.write(f"{record_type}\t{record['key']}\t1\t2020-01-01T00:00:00\t{json.dumps(record)}\n")
+
+
+def write_jsonl(path, records):
+    """Kayıtları düz JSONL olarak yazar."""
+    with open(path, 'w', encoding='utf-8') as file:
+        for record in records:
+            file.write(json.dumps(record) + "\n")
+
+
+class TestDumpImport:
+    """import_dump test sınıfı."""
+
+    @pytest.fixture
+    def dumps(self, tmp_path):
+        """gzip'li TSV editions ve düz JSONL authors dökümleri oluşturur."""
+        editions = tmp_path / "editions.txt.gz"
+        authors = tmp_path / "authors.jsonl"
+        write_tsv_gz(editions, "/type/edition", EDITIONS)
+        write_jsonl(authors, AUTHORS)
+        return str(editions), str(authors)
+
+    @pytest.fixture
+    def library(self, tmp_path):
+        """Geçici dosya ile Library instance'ı oluşturur."""
+        return Library(str(tmp_path / "library.json"))
+
+    def test_import_everything(self, dumps, library):
+        """Filtresiz aktarımda ISBN'i olan tüm edition'ların eklenmesi testı."""
+        result = import_dump(library, *dumps, workers=1, progress_stream=None)
+
+        assert result["edition_lines"] == 5
+        assert result["matched"] == 4
+        assert result["added"] == 4
+        assert result["authors_resolved"] == 2
+        assert library.find_book("9780451524935").author == "George Orwell"
+        # ISBN-10'lu edition kanonik ISBN-13 ile eklenir
+        assert library.find_book("9780451526342").title == "Animal Farm"
+        assert library.find_book("9780000000002").author == "Bilinmeyen Yazar"
+
+    def test_import_filtered_keeps_requested_format(self, dumps, library):
+        """ISBN filtresi ve kullanıcının verdiği ISBN biçiminin korunması testı."""
+        result = import_dump(library, *dumps, isbns=["978-0451524935", "978-1111111111"],
+                             workers=1, progress_stream=None)
+
+        assert result["matched"] == 1
+        assert result["missing"] == ["978-1111111111"]
+        assert result["authors_resolved"] == 1
+        assert library.get_book_count() == 1
+        book = library.find_book("978-0451524935")
+        assert book.title == "1984"
+        assert book.author == "George Orwell"
+
+    def test_import_with_process_pool(self, dumps, library):
+        """Süreç havuzuyla parçalı ayrıştırmanın aynı sonucu vermesi testı."""
+        result = import_dump(library, *dumps, workers=2, chunk_size=2, progress_stream=None)
+
+        assert result["added"] == 4
+        assert library.find_book("9780060850524").author == "Aldous Huxley"
+
+    def test_full_import_spills_to_partitions(self, tmp_path, library, monkeypatch):
+        """Tam döküm aktarımının bölüm dosyaları üzerinden aynı sonucu vermesi testı."""
+        editions = tmp_path / "editions.jsonl"
+        write_jsonl(editions, EDITIONS + [
+            {"key": "/books/OL9M", "title": "1984 (yeni baskı)", "isbn_10": ["0451524934"]}])
+        authors = tmp_path / "authors.jsonl"
+        write_jsonl(authors, AUTHORS)
+        monkeypatch.setattr(dump_import, "PARTITION_BYTES", 64)
+        monkeypatch.setattr(dump_import, "SPILL_BATCH", 2)
+
+        result = import_dump(library, str(editions), str(authors), workers=1, progress_stream=None)
+
+        assert result["matched"] == 4 and result["added"] == 4
+        assert result["skipped_existing"] == 0
+        assert library.get_book_count() == 4
+        # Aynı ISBN'in döküm sırasındaki ilk kaydı kullanılır
+        assert library.find_book("9780451524935").title == "1984"
+        assert library.find_book("9780060850524").author == "Aldous Huxley"
+
+    def test_existing_books_are_skipped(self, dumps, library):
+        """Kütüphanede zaten bulunan kitapların atlanması testı."""
+        library.add_book_manual(Book("1984", "George Orwell", "9780451524935"))
+
+        result = import_dump(library, *dumps, workers=1, progress_stream=None)
+
+        assert result["added"] == 3
+        assert result["skipped_existing"] == 1
+        assert library.get_book_count() == 4
+
+    def test_invalid_lines_are_counted(self, tmp_path, library):
+        """Okunamayan satırların sayılıp atlanması testı."""
+        editions = tmp_path / "editions.jsonl"
+        editions.write_text(json.dumps(EDITIONS[0]) + "\nbozuk satır\n", encoding="utf-8")
+
+        result = import_dump(library, str(editions), workers=1, progress_stream=None)
+
+        assert result["invalid_lines"] == 1
+        assert library.find_book("9780451524935").author == "Bilinmeyen Yazar"
+
+    def test_parse_editions_without_filter(self):
+        """parse_editions'ın ISBN-13'ü tercih etmesi testı."""
+        line = json.dumps({"title": "X", "isbn_10": ["0-306-40615-2"],
+                           "isbn_13": ["978-0-306-40615-7"]}).encode()
+
+        records, errors, skipped = parse_editions([line])
+
+        assert records == [("9780306406157", "X", "")]
+        assert errors == 0 and skipped == 0
+
+    def test_null_and_invalid_isbns_are_skipped(self, tmp_path, library):
+        """ISBN alanı null ya da geçersiz olan edition'ların atlanıp sayılması testı."""
+        editions = tmp_path / "editions.jsonl"
+        write_jsonl(editions, [
+            {"key": "/books/OL6M", "title": "Null", "isbn_13": None, "isbn_10": None},
+            {"key": "/books/OL7M", "title": "Hatalı", "isbn_13": ["9780451524936"]},
+            {"key": "/books/OL8M", "title": "Karışık", "isbn_13": [None, "978-0-306-40615-7"]},
+        ])
+
+        result = import_dump(library, str(editions), workers=1, progress_stream=None)
+
+        assert result["skipped_invalid_isbn"] == 2
+        assert result["invalid_lines"] == 0
+        assert result["added"] == 1
+        assert library.find_book("9780306406157").title == "Karışık"
+
+    def test_isbn10_matches_existing_isbn13(self, dumps, library):
+        """ISBN-10'lu döküm kaydının katalogdaki tireli ISBN-13 ile eşlenmesi testı."""
+        library.add_book_manual(Book("Animal Farm", "George Orwell", "978-0451526342"))
+        library.add_book_manual(Book("1984", "George Orwell", "978-0451524935"))
+
+        result = import_dump(library, *dumps, workers=1, progress_stream=None)
+
+        assert result["added"] == 2
+        assert result["skipped_existing"] == 2
+        assert library.get_book_count() == 4
+        assert library.find_book("9780451526342") is None
+
+    def test_cli_subcommand(self, dumps, tmp_path, capsys):
+        """main.py import-dump alt komutu testı."""
+        library_file = tmp_path / "cli.json"
+        isbn_file = tmp_path / "isbns.txt"
+        isbn_file.write_text("9780451524935\n9780060850524\n", encoding="utf-8")
+
+        main.main(["--file", str(library_file), "import-dump",
+                   "--editions", dumps[0], "--authors", dumps[1],
+                   "--isbn-file", str(isbn_file), "--workers", "1"])
+
+        output = capsys.readouterr()
+        assert "Eklenen kitap: 2" in output.out
+        assert "[editions] tamamlandı" in output.err
+        saved = json.loads(library_file.read_text(encoding="utf-8"))
+        assert {book["isbn"] for book in saved} == {"9780451524935", "9780060850524"}
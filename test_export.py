@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Katalog dışa aktarımı için testler.
+"""
+
+import csv
+import gzip
+import io
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from api import create_app
+from book import Book
+from export import export_books, export_catalog, gzip_chunks, read_records
+from library import Library
+from settings import Settings
+
+
+BOOKS = [
+    Book("1984", "George Orwell", "978-0451524935"),
+    Book("Suç ve Ceza, Cilt 1", "Fyodor \"Dostoyevski\"", "978-0140449136"),
+    Book("Brave New World", "Aldous Huxley", "978-0060850524"),
+]
+
+
+class TestExport:
+    """export modülü test sınıfı."""
+
+    @pytest.fixture
+    def library(self, tmp_path):
+        """Örnek kitaplarla dolu geçici Library instance'ı."""
+        library = Library(str(tmp_path / "library.json"))
+        library.add_books(BOOKS)
+        return library
+
+    def test_csv_round_trip(self, library):
+        """CSV çıktısının tırnak ve virgülleri koruması testı."""
+        data = b"".join(export_catalog(library, "csv")).decode("utf-8")
+
+        rows = list(csv.DictReader(io.StringIO(data)))
+        assert [row["isbn"] for row in rows] == [book.isbn for book in BOOKS]
+        assert rows[1]["title"] == "Suç ve Ceza, Cilt 1"
+        assert rows[1]["author"] == "Fyodor \"Dostoyevski\""
+
+    def test_csv_edition_fields_round_trip(self, tmp_path):
+        """Edition alanlarının CSV'ye yazılıp geri okunması testı."""
+        books = [Book("1984", "George Orwell", "978-0451524935", publish_year=1950, pages=328,
+                      publishers=["Signet Classic"], subjects=["Dystopias", "Totalitarianism"],
+                      author_keys=["/authors/OL118077A"]),
+                 BOOKS[2]]
+        path = tmp_path / "catalog.csv"
+        path.write_bytes(b"".join(export_books(books, "csv")))
+
+        records = list(read_records(str(path)))
+
+        assert records == [book.to_dict() for book in books]
+        assert Book.from_dict(records[0]).subjects == ("Dystopias", "Totalitarianism")
+
+    def test_ndjson_lines(self, library):
+        """NDJSON çıktısında her satırın bir kitap olması testı."""
+        data = b"".join(export_catalog(library, "ndjson")).decode("utf-8")
+
+        lines = data.splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[0]) == BOOKS[0].to_dict()
+
+    def test_output_is_chunked(self):
+        """Çıktının batch_size kitaplık parçalar halinde üretilmesi testı."""
+        books = [Book(f"Kitap {i}", "Yazar", f"isbn-{i}") for i in range(10)]
+
+        chunks = list(export_books(books, "ndjson", batch_size=4))
+
+        assert [chunk.count(b"\n") for chunk in chunks] == [4, 4, 2]
+
+    def test_export_is_lazy(self):
+        """Kitapların ancak çıktı okundukça tüketilmesi testı."""
+        consumed = []
+
+        def books():
+            for i in range(5):
+                consumed.append(i)
+                yield Book(f"Kitap {i}", "Yazar", f"isbn-{i}")
+
+        stream = export_books(books(), "csv", batch_size=2)
+        next(stream)
+
+        assert consumed == [0, 1]
+
+    def test_gzip_output(self, library):
+        """Sıkıştırılmış çıktının geçerli bir gzip olması testı."""
+        plain = b"".join(export_catalog(library, "csv"))
+        compressed = b"".join(export_catalog(library, "csv", compress=True))
+
+        assert gzip.decompress(compressed) == plain
+
+    def test_gzip_chunks_empty_input(self):
+        """Boş girdide de geçerli bir gzip üretilmesi testı."""
+        assert gzip.decompress(b"".join(gzip_chunks([]))) == b""
+
+    def test_unknown_format(self):
+        """Desteklenmeyen biçimde hata fırlatılması testı."""
+        with pytest.raises(ValueError):
+            export_books([], "xml")
+
+    def test_cli_export(self, library, tmp_path, capsys):
+        """main.py export alt komutunun dosyaya yazması testı."""
+        output = tmp_path / "backup.ndjson.gz"
+
+        main.main(["--file", library.filename, "export", "--format", "ndjson",
+                   "--gzip", "--output", str(output)])
+
+        lines = gzip.decompress(output.read_bytes()).decode("utf-8").splitlines()
+        assert len(lines) == 3
+        assert "3 kitap dışa aktarıldı" in capsys.readouterr().err
+
+    def test_cli_export_stdout_is_clean(self, library, capsysbinary):
+        """Standart çıktıya yalnızca verinin yazılması testı."""
+        main.main(["--file", library.filename, "export", "--format", "csv"])
+
+        out = capsysbinary.readouterr().out.decode("utf-8")
+        assert out.splitlines()[0] == ",".join(("title", "author", "isbn", "publish_year", "pages",
+                                                "publishers", "subjects", "author_keys"))
+        assert len(out.splitlines()) == 4
+
+
+class TestExportAPI:
+    """GET /export test sınıfı."""
+
+    @pytest.fixture
+    def client(self, tmp_path):
+        """Örnek kitaplarla dolu test client'ı oluşturur."""
+        app = create_app(Settings(library_file=str(tmp_path / "library.json")))
+        with TestClient(app) as client:
+            client.app.state.library.add_books(BOOKS)
+            yield client
+
+    def test_export_csv(self, client):
+        """CSV dışa aktarım endpoint'i testı."""
+        response = client.get("/export?format=csv")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert 'filename="library.csv"' in response.headers["content-disposition"]
+        assert len(response.text.splitlines()) == 4
+
+    def test_export_ndjson_gzip(self, client):
+        """Sıkıştırılmış NDJSON dışa aktarım endpoint'i testı."""
+        response = client.get("/export?format=ndjson&gzip=true")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        lines = gzip.decompress(response.content).decode("utf-8").splitlines()
+        assert [json.loads(line)["isbn"] for line in lines] == [book.isbn for book in BOOKS]
+
+    def test_export_invalid_format(self, client):
+        """Geçersiz biçim için 422 testı."""
+        response = client.get("/export?format=xml")
+
+        assert response.status_code == 422
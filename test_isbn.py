@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+ISBN doğrulama ve toplu normalleştirme (isbn modülü) için testler.
+"""
+
+import random
+
+import pytest
+
+import isbn
+from isbn import isbn13_check_digit, normalize_isbns, validate_isbn, validate_isbns
+
+
+VALID = {
+    "978-0451524935": "9780451524935",
+    " 978 0 451 52493 5\n": "9780451524935",
+    "0-451-52493-4": "9780451524935",
+    "080442957x": "9780804429573",
+    "979-10-90636-07-1": "9791090636071",
+}
+
+INVALID = [
+    "978-0451524936",     # ISBN-13 kontrol hanesi
+    "0-451-52493-5",      # ISBN-10 kontrol hanesi
+    "977-0451524930",     # 978/979 öneki yok
+    "X451524934",         # X yalnızca son hane olabilir
+    "978-04515",
+    "９７８０４５１５２４９３５",  # ASCII olmayan rakamlar
+    "",
+    "978-0451524935-978-0451524935",
+]
+
+
+def mixed_inputs(count, seed=7):
+    """Geçerli, tireli, ISBN-10, hatalı ve rastgele ISBN'lerden oluşan liste."""
+    rng = random.Random(seed)
+    values = []
+    for _ in range(count):
+        first12 = f"978{rng.randrange(10 ** 9):09d}"
+        full = first12 + isbn13_check_digit(first12)
+        total = sum((10 - position) * int(digit) for position, digit in enumerate(full[3:12]))
+        check10 = -total % 11
+        isbn10 = full[3:12] + ("X" if check10 == 10 else str(check10))
+        values.append(rng.choice([
+            full, f"{full[:3]}-{full[3:]}", isbn10, isbn10.lower(), f" {isbn10[:1]}-{isbn10[1:]}",
+            full[:12] + str((int(full[12]) + 1) % 10),
+            "".join(rng.choice("0123456789Xx- ") for _ in range(rng.randrange(20))),
+        ]))
+    return values
+
+
+class TestValidateIsbn:
+    """validate_isbn ve validate_isbns test sınıfı."""
+
+    @pytest.mark.parametrize("raw, expected", VALID.items())
+    def test_valid(self, raw, expected):
+        """Geçerli yazımların kanonik ISBN-13'e çevrilmesi testı."""
+        assert validate_isbn(raw) == expected
+
+    @pytest.mark.parametrize("raw", INVALID)
+    def test_invalid(self, raw):
+        """Uzunluğu, öneki ya da kontrol hanesi hatalı yazımların reddedilmesi testı."""
+        assert validate_isbn(raw) is None
+
+    def test_vectorized_matches_scalar(self):
+        """Vektörel doğrulamanın tek tek doğrulamayla aynı sonucu vermesi testı."""
+        values = mixed_inputs(5_000) + list(VALID) + INVALID
+
+        assert len(values) > isbn.VECTOR_MIN
+        assert validate_isbns(values) == [validate_isbn(value) for value in values]
+
+    def test_normalize_dedupes(self, monkeypatch):
+        """Kanonik ISBN'e göre tekrarların atılıp ilk yazımın tutulması testı."""
+        monkeypatch.setattr(isbn, "VECTOR_MIN", 1)
+
+        unique, invalid = normalize_isbns(["0-451-52493-4", "978-0441172719", "9780451524935",
+                                           "978-0451524936"])
+
+        assert unique == {"9780451524935": "0-451-52493-4", "9780441172719": "978-0441172719"}
+        assert invalid == ["978-0451524936"]
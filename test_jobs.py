@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Arka plan zenginleştirme kuyruğu için testler.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api import create_app
+from book import Book
+import jobs
+from jobs import FAILED, PENDING, RUNNING, SUCCEEDED, JobQueue
+from library import Library
+from openlibrary_stub import OpenLibraryStub
+from settings import Settings
+
+
+CORPUS = {
+    "editions": {
+        "978-0451524935": {"title": "1984", "authors": [{"key": "/authors/OL118077A"}]},
+    },
+    "authors": {
+        "OL118077A": {"name": "George Orwell"},
+    },
+}
+
+
+class TestJobQueue:
+    """JobQueue test sınıfı."""
+
+    @pytest.fixture
+    def stub(self):
+        """Yerel Open Library taklidini başlatır."""
+        with OpenLibraryStub(CORPUS) as stub:
+            yield stub
+
+    @pytest.fixture
+    def library(self, tmp_path, stub):
+        """Taklit sunucuya bağlı geçici Library instance'ı."""
+        library = Library(str(tmp_path / "library.json"))
+        library.base_url = stub.base_url
+        return library
+
+    def test_job_adds_book(self, library, tmp_path):
+        """Worker'ın işi alıp kitabı eklemesi testı."""
+        queue = JobQueue(library, str(tmp_path / "jobs.json"), workers=1)
+        queue.start()
+        try:
+            job = queue.submit("978-0451524935")
+            finished = queue.wait(job.id, timeout=5)
+        finally:
+            queue.stop()
+
+        assert finished.status == SUCCEEDED
+        assert finished.attempts == 1
+        assert finished.book["title"] == "1984"
+        assert finished.book["author"] == "George Orwell"
+        assert library.find_book("978-0451524935") is not None
+
+    def test_job_not_found_fails(self, library, tmp_path):
+        """Bulunamayan ISBN için işin başarısız olması testı."""
+        queue = JobQueue(library, str(tmp_path / "jobs.json"), workers=1)
+        queue.start()
+        try:
+            job = queue.submit("978-0000000002")
+            finished = queue.wait(job.id, timeout=5)
+        finally:
+            queue.stop()
+
+        assert finished.status == FAILED
+        assert "bulunamadı" in finished.error
+
+    def test_duplicate_submit_returns_pending_job(self, library, tmp_path):
+        """Aynı ISBN için bekleyen iş varken yeni iş açılmaması testı."""
+        queue = JobQueue(library, str(tmp_path / "jobs.json"))
+
+        first = queue.submit("978-0451524935")
+        second = queue.submit("978-0451524935")
+
+        assert first.id == second.id
+        assert queue.stats()[PENDING] == 1
+
+    def test_other_spelling_returns_pending_job(self, library, tmp_path):
+        """Aynı kitabın başka yazımı için bekleyen işin döndürülmesi testı."""
+        queue = JobQueue(library, str(tmp_path / "jobs.json"))
+
+        first = queue.submit("978-0451524935")
+
+        assert queue.submit("0-451-52493-4").id == first.id
+        assert queue.submit("9780451524935").id == first.id
+        assert queue.stats()[PENDING] == 1
+
+    def test_pending_jobs_survive_restart(self, library, tmp_path):
+        """Bekleyen ve yarıda kalan işlerin yeniden başlatmada işlenmesi testı."""
+        jobs_file = tmp_path / "jobs.json"
+        queue = JobQueue(library, str(jobs_file))
+        job = queue.submit("978-0451524935")
+
+        # Süreç iş çalışırken ölmüş gibi dosyaya running kaydı ekle
+        record = dict(job.to_dict(), status=RUNNING, attempts=1)
+        with open(jobs_file, "a", encoding="utf-8") as file:
+            file.write(json.dumps(record) + "\n")
+
+        restarted = JobQueue(library, str(jobs_file), workers=1)
+        assert restarted.get(job.id).status == PENDING
+        restarted.start()
+        try:
+            finished = restarted.wait(job.id, timeout=5)
+        finally:
+            restarted.stop()
+
+        assert finished.status == SUCCEEDED
+        assert finished.attempts == 2
+        saved = [json.loads(line) for line in jobs_file.read_text(encoding="utf-8").splitlines()]
+        assert saved[-1]["id"] == job.id and saved[-1]["status"] == SUCCEEDED
+
+    def test_legacy_array_file_is_loaded(self, library, tmp_path):
+        """Eski JSON dizisi biçimindeki kuyruk dosyasının yüklenmesi testı."""
+        jobs_file = tmp_path / "jobs.json"
+        jobs_file.write_text(json.dumps([{"id": "a", "isbn": "978-0451524935",
+                                          "status": RUNNING}]), encoding="utf-8")
+
+        queue = JobQueue(library, str(jobs_file))
+
+        assert queue.get("a").status == PENDING
+        assert json.loads(jobs_file.read_text(encoding="utf-8").splitlines()[0])["id"] == "a"
+
+    def test_log_is_compacted(self, library, tmp_path, monkeypatch):
+        """Durum kayıtlarının eklenmesi ve günlüğün canlı işlere göre sıkıştırılması testı."""
+        monkeypatch.setattr(jobs, "COMPACT_MIN_RECORDS", 2)
+        jobs_file = tmp_path / "jobs.json"
+        queue = JobQueue(library, str(jobs_file), retention=1)
+        first = queue.submit("978-0451524935")
+        for status in (RUNNING, FAILED):
+            queue._update(first, status=status)
+        second = queue.submit("978-0451526342")
+        # Dört kayıt yazıldı; ilk işin üç kaydı tek satıra sıkıştırıldı
+        lines = jobs_file.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["status"] for line in lines] == [FAILED, PENDING]
+
+        queue._update(second, status=RUNNING)
+        queue._update(second, status=SUCCEEDED)
+
+        # Sıkıştırmada retention dışında kalan ilk iş dosyadan düşer
+        saved = [json.loads(line) for line in jobs_file.read_text(encoding="utf-8").splitlines()]
+        assert [(record["id"], record["status"]) for record in saved] == [(second.id, SUCCEEDED)]
+        assert queue.get(first.id) is None
+
+    def test_second_process_refused(self, library, tmp_path):
+        """Aynı dosyayı kullanan ikinci sürecin kuyruğunun reddedilmesi testı."""
+        import subprocess
+        import sys
+
+        jobs_file = str(tmp_path / "jobs.json")
+        queue = JobQueue(library, jobs_file)
+        code = ("import sys; from jobs import JobQueue, JobQueueBusy\n"
+                "try:\n    JobQueue(None, sys.argv[1])\nexcept JobQueueBusy:\n    sys.exit(3)\n")
+        try:
+            busy = subprocess.run([sys.executable, "-c", code, jobs_file])
+        finally:
+            queue.stop()
+        free = subprocess.run([sys.executable, "-c", code, jobs_file])
+
+        assert busy.returncode == 3
+        assert free.returncode == 0
+
+    def test_retry_timers_are_released(self, library, tmp_path):
+        """Yeniden deneme zamanlayıcısının çalışınca bırakılması testı."""
+        queue = JobQueue(library, str(tmp_path / "jobs.json"))
+        queue._timers["a"] = object()
+
+        queue._retry("a")
+
+        assert queue._timers == {}
+        assert queue._queue.get_nowait() == "a"
+
+    def test_finished_jobs_are_trimmed(self, library, tmp_path):
+        """Tamamlanmış işlerin retention sınırında tutulması testı."""
+        queue = JobQueue(library, str(tmp_path / "jobs.json"), workers=1, retention=2)
+        queue.start()
+        try:
+            ids = [queue.submit(f"978-000000000{i}").id for i in range(4)]
+            for job_id in ids:
+                queue.wait(job_id, timeout=5)
+        finally:
+            queue.stop()
+
+        assert queue.get(ids[0]) is None
+        assert queue.get(ids[-1]).status == FAILED
+        assert queue.stats()[FAILED] == 2
+
+
+class TestAsyncAPI:
+    """Asenkron POST /books ve GET /jobs/{id} test sınıfı."""
+
+    @pytest.fixture
+    def client(self, tmp_path):
+        """Taklit sunucuya bağlı test client'ı oluşturur."""
+        with OpenLibraryStub(CORPUS) as stub:
+            settings = Settings(library_file=str(tmp_path / "library.json"),
+                                openlibrary_url=stub.base_url)
+            with TestClient(create_app(settings)) as client:
+                yield client
+
+    def test_prefer_respond_async_returns_202(self, client):
+        """Prefer: respond-async ile 202 ve iş kimliği dönmesi testı."""
+        response = client.post("/books", json={"isbn": "978-0451524935"},
+                               headers={"Prefer": "respond-async"})
+
+        assert response.status_code == 202
+        job = response.json()
+        assert job["isbn"] == "978-0451524935"
+        assert job["status"] in (PENDING, RUNNING, SUCCEEDED)
+        assert response.headers["location"] == f"/jobs/{job['id']}"
+        assert response.headers["preference-applied"] == "respond-async"
+
+        client.app.state.jobs.wait(job["id"], timeout=5)
+        status_response = client.get(f"/jobs/{job['id']}")
+        assert status_response.status_code == 200
+        assert status_response.json()["status"] == SUCCEEDED
+        assert status_response.json()["book"]["author"] == "George Orwell"
+        assert client.get("/books/978-0451524935").status_code == 200
+
+    def test_async_duplicate_rejected_before_enqueue(self, client):
+        """Zaten var olan kitabın kuyruğa alınmadan reddedilmesi testı."""
+        client.app.state.library.add_book_manual(Book("1984", "George Orwell", "978-0451524935"))
+
+        response = client.post("/books", json={"isbn": "978-0451524935"},
+                               headers={"Prefer": "respond-async"})
+
+        assert response.status_code == 400
+        assert client.app.state.jobs.jobs == {}
+
+    def test_async_invalid_isbn_rejected(self, client):
+        """Geçersiz ISBN'in asenkron modda da 422 dönmesi testı."""
+        response = client.post("/books", json={"isbn": "123"},
+                               headers={"Prefer": "respond-async"})
+
+        assert response.status_code == 422
+
+    def test_unknown_job_returns_404(self, client):
+        """Bilinmeyen iş kimliği için 404 testı."""
+        response = client.get("/jobs/yok")
+
+        assert response.status_code == 404
+
+    def test_async_enrichment_setting(self, tmp_path):
+        """LIBRARY_ASYNC_ENRICHMENT ayarıyla varsayılan modun asenkron olması testı."""
+        with OpenLibraryStub(CORPUS) as stub:
+            settings = Settings(library_file=str(tmp_path / "library.json"),
+                                openlibrary_url=stub.base_url,
+                                async_enrichment=True)
+            with TestClient(create_app(settings)) as client:
+                response = client.post("/books", json={"isbn": "978-0451524935"})
+                client.app.state.jobs.wait(response.json()["id"], timeout=5)
+
+        assert response.status_code == 202
+        assert (tmp_path / "library.json.jobs.json").exists()
+
+    def test_busy_queue_falls_back_to_sync(self, tmp_path):
+        """Kuyruk dosyası başka süreçteyken isteklerin eşzamanlı işlenmesi testı."""
+        with OpenLibraryStub(CORPUS) as stub, \
+                patch("api.JobQueue", side_effect=jobs.JobQueueBusy("meşgul")):
+            settings = Settings(library_file=str(tmp_path / "library.json"),
+                                openlibrary_url=stub.base_url,
+                                async_enrichment=True)
+            with TestClient(create_app(settings)) as client:
+                response = client.post("/books", json={"isbn": "978-0451524935"})
+                assert client.app.state.jobs is None
+
+        assert response.status_code == 201
+        assert response.json()["author"] == "George Orwell"
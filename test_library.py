@@ -8,10 +8,15 @@ import os
 import json
 import tempfile
 from unittest.mock import patch, Mock
+import threading
+import time
 import httpx
 
-from library import Library
+import indexes
+import library as library_module
+from library import IndexNotReady, Library
 from book import Book
+from isbn import isbn13_check_digit
 
 
 class TestLibrary:
@@ -167,11 +172,19 @@ class TestLibrary:
         mock_client_instance.get.return_value = response
         mock_client.return_value.__enter__.return_value = mock_client_instance
         
-        result = temp_library.add_book("978-0000000000")
+        result = temp_library.add_book("978-0000000002")
         
         assert result is False
         assert len(temp_library.books) == 0
     
+    @patch('httpx.Client')
+    def test_add_book_invalid_checksum(self, mock_client, temp_library):
+        """Kontrol hanesi hatalı ISBN için API'ye gidilmemesi testı."""
+        result = temp_library.add_book("978-0451524936")
+        
+        assert result is False
+        mock_client.assert_not_called()
+    
     @patch('httpx.Client')
     def test_add_book_api_connection_error(self, mock_client, temp_library):
         """API bağlantı hatası testı."""
@@ -211,4 +224,505 @@ class TestLibrary:
         book = Book("1984", "George Orwell", "978-0451524935")
         temp_library.add_book_manual(book)
         
-        assert temp_library.get_book_count() == 1
\ No newline at end of file
+        assert temp_library.get_book_count() == 1
+
+
+class TestApplyBatch:
+    """Library.apply_batch test sınıfı."""
+    
+    CORPUS = {
+        "editions": {
+            "978-0451524935": {"title": "1984", "authors": [{"key": "/authors/OL118077A"}]},
+            "978-0451526342": {"title": "Animal Farm", "authors": [{"key": "/authors/OL118077A"}]},
+            "9780451524935": {"title": "1984", "authors": [{"key": "/authors/OL118077A"}]},
+        },
+        "authors": {"OL118077A": {"name": "George Orwell"}},
+    }
+    
+    @pytest.fixture
+    def library(self, tmp_path):
+        """İki kitaplı geçici Library instance'ı oluşturur."""
+        library = Library(str(tmp_path / "library.json"))
+        library.add_books([
+            Book("Brave New World", "Aldous Huxley", "978-0060850524"),
+            Book("Dune", "Frank Herbert", "978-0441172719"),
+        ])
+        return library
+    
+    def test_removes_with_single_save(self, library):
+        """Silmelerin tek kayıtla uygulanması ve sonuç sırası testı."""
+        with patch.object(library, "save_books", wraps=library.save_books) as save:
+            results = library.apply_batch([
+                {"op": "remove", "isbn": "978-0060850524"},
+                {"op": "remove", "isbn": "978-0000000000"},
+                {"op": "remove", "isbn": "978-0441172719"},
+            ])
+        
+        assert save.call_count == 1
+        assert [r["status"] for r in results] == ["removed", "not_found", "removed"]
+        assert [r["index"] for r in results] == [0, 1, 2]
+        assert library.books == []
+        assert library.find_book("978-0060850524") is None
+        assert json.loads(open(library.filename, encoding="utf-8").read()) == []
+    
+    def test_manual_add_and_duplicates(self, library):
+        """title/author verilen eklemelerin API'ye gitmeden uygulanması testı."""
+        with patch('httpx.Client') as mock_client:
+            results = library.apply_batch([
+                {"op": "add", "isbn": "978-0-306-40615-7", "title": "Yeni", "author": "Yazar"},
+                {"op": "add", "isbn": "978-0-306-40615-7", "title": "Yeni", "author": "Yazar"},
+                {"op": "add", "isbn": "978-0441172719", "title": "Dune", "author": "Frank Herbert"},
+                {"op": "delete", "isbn": "978-0441172719"},
+                {"op": "remove", "isbn": " "},
+            ])
+        
+        mock_client.assert_not_called()
+        assert [r["status"] for r in results] == ["added", "exists", "exists", "invalid", "invalid"]
+        assert results[0]["book"] == {"title": "Yeni", "author": "Yazar", "isbn": "978-0-306-40615-7"}
+        assert library.get_book_count() == 3
+    
+    def test_manual_adds_are_validated_and_deduped(self, library, tmp_path):
+        """title/author verilen eklemelerin doğrulanıp kanonik ISBN ile tekilleştirilmesi testı."""
+        with patch('httpx.Client') as mock_client:
+            results = library.apply_batch([
+                {"op": "add", "isbn": "111", "title": "Yeni", "author": "Yazar"},
+                {"op": "add", "isbn": "0441172717", "title": "Dune", "author": "Frank Herbert"},
+                {"op": "add", "isbn": "9780306406157", "title": "Yeni", "author": "Yazar"},
+                {"op": "add", "isbn": "0-306-40615-2", "title": "Yeni", "author": "Yazar"},
+            ])
+        
+        mock_client.assert_not_called()
+        assert [r["status"] for r in results] == ["invalid", "exists", "added", "exists"]
+        assert results[0]["detail"].startswith("Geçersiz ISBN")
+        assert library.get_book_count() == 3
+        
+        # Birleştirme eklemeleri de aynı yoldan geçer
+        other = Library(str(tmp_path / "other.json"))
+        other.add_books([Book("Bozuk", "Yazar", "111"), Book("Animal Farm", "George Orwell", "978-0451526342")])
+        
+        merged = library.merge(other)
+        
+        assert [(r["isbn"], r["status"]) for r in merged] == [("111", "invalid"), ("978-0451526342", "added")]
+        assert library.find_book("111") is None
+    
+    def test_remove_then_add_same_isbn(self, library):
+        """Aynı toplu işlemde silinip yeniden eklenen kitabın korunması testı."""
+        results = library.apply_batch([
+            {"op": "remove", "isbn": "978-0441172719"},
+            {"op": "add", "isbn": "978-0441172719", "title": "Dune (2. baskı)", "author": "Frank Herbert"},
+        ])
+        
+        assert [r["status"] for r in results] == ["removed", "added"]
+        assert library.get_book_count() == 2
+        assert library.find_book("978-0441172719").title == "Dune (2. baskı)"
+        assert library.books[-1].title == "Dune (2. baskı)"
+    
+    def test_fetches_metadata_concurrently(self, library):
+        """Eksik bilgilerin Open Library'den çekilmesi testı."""
+        from openlibrary_stub import OpenLibraryStub
+        
+        with OpenLibraryStub(self.CORPUS) as stub:
+            library.base_url = stub.base_url
+            results = library.apply_batch([
+                {"op": "add", "isbn": "978-0451524935"},
+                {"op": "add", "isbn": "978-0451526342"},
+                {"op": "add", "isbn": "978-0000000002"},
+                {"op": "remove", "isbn": "978-0060850524"},
+            ])
+        
+        assert [r["status"] for r in results] == ["added", "added", "not_found", "removed"]
+        assert library.find_book("978-0451526342").author == "George Orwell"
+        assert stub.request_counts["isbn"] == 3
+    
+    def test_validates_and_dedupes_before_fetching(self, library):
+        """Geçersiz ISBN'lerin ve başka yazımla mevcut kitapların çekilmemesi testı."""
+        from openlibrary_stub import OpenLibraryStub
+        
+        with OpenLibraryStub(self.CORPUS) as stub:
+            library.base_url = stub.base_url
+            results = library.apply_batch([
+                {"op": "add", "isbn": "978-0451524935"},
+                {"op": "add", "isbn": "9780451524935"},
+                {"op": "add", "isbn": "0-441-17271-7"},
+                {"op": "add", "isbn": "978-0451524936"},
+                {"op": "add", "isbn": "978-04515"},
+            ])
+        
+        assert [r["status"] for r in results] == ["added", "exists", "exists", "invalid", "invalid"]
+        assert "kontrol hanesi" in results[3]["detail"]
+        assert stub.request_counts["isbn"] == 1
+        assert library.get_book_count() == 3
+    
+    def test_remove_then_add_other_spelling(self, library):
+        """Silinen kitabın aynı işlemde başka yazımla yeniden çekilip eklenmesi testı."""
+        from openlibrary_stub import OpenLibraryStub
+        
+        library.add_book_manual(Book("1984", "George Orwell", "978-0451524935"))
+        with OpenLibraryStub(self.CORPUS) as stub:
+            library.base_url = stub.base_url
+            results = library.apply_batch([
+                {"op": "remove", "isbn": "978-0451524935"},
+                {"op": "add", "isbn": "9780451524935"},
+            ])
+        
+        assert [r["status"] for r in results] == ["removed", "added"]
+        assert stub.request_counts["isbn"] == 1
+        assert library.find_book("978-0451524935") is None
+        assert library.find_book("9780451524935").author == "George Orwell"
+    
+    def test_fetches_when_removed_before_lock(self, library):
+        """Çekimden sonra, kilitten önce silinen kitabın kilit altında çekilmesi testı."""
+        from isbn import validate_isbns
+        from openlibrary_stub import OpenLibraryStub
+        
+        library.add_book_manual(Book("1984", "George Orwell", "978-0451524935"))
+        
+        def remove_concurrently(isbns):
+            library.remove_book("978-0451524935")
+            return validate_isbns(isbns)
+        
+        with OpenLibraryStub(self.CORPUS) as stub, \
+                patch("library.validate_isbns", side_effect=remove_concurrently):
+            library.base_url = stub.base_url
+            results = library.apply_batch([{"op": "add", "isbn": "9780451524935"}])
+        
+        assert results[0]["status"] == "added"
+        assert stub.request_counts["isbn"] == 1
+        assert library.find_book("9780451524935").title == "1984"
+    
+    @patch('httpx.Client')
+    def test_fetch_error_is_reported(self, mock_client, library):
+        """Bağlantı hatasının işlem sonucuna yazılması testı."""
+        mock_client_instance = Mock()
+        mock_client_instance.get.side_effect = httpx.RequestError("Connection failed")
+        mock_client.return_value.__enter__.return_value = mock_client_instance
+        library.upstream.retry.max_retries = 0
+        
+        results = library.apply_batch([{"op": "add", "isbn": "978-0451524935"}])
+        
+        assert results[0]["status"] == "error"
+        assert results[0]["success"] is False
+        assert "Connection failed" in results[0]["detail"]
+
+
+class TestSnapshots:
+    """Copy-on-write katalog snapshot'ları test sınıfı."""
+    
+    @pytest.fixture
+    def library(self, tmp_path):
+        """100 kitaplık Library instance'ı oluşturur."""
+        library = Library(str(tmp_path / "library.json"))
+        library.add_books(Book(f"Kitap {i}", "Yazar", f"isbn-{i}") for i in range(100))
+        return library
+    
+    def test_books_are_read_only(self, library):
+        """Snapshot listesinin dışarıdan değiştirilememesi testı."""
+        with pytest.raises(TypeError):
+            library.books.append(Book("1984", "George Orwell", "978-0451524935"))
+        with pytest.raises(TypeError):
+            del library.books[0]
+        with pytest.raises(TypeError):
+            library.snapshot().by_isbn["x"] = None
+        assert library.get_book_count() == 100
+    
+    def test_old_snapshot_unchanged(self, library):
+        """Değişikliklerin önceki snapshot'ı etkilememesi testı."""
+        before = library.snapshot()
+        
+        library.remove_book("isbn-0")
+        library.add_book_manual(Book("1984", "George Orwell", "978-0451524935"))
+        
+        after = library.snapshot()
+        assert len(before.books) == 100 and "isbn-0" in before.by_isbn
+        assert "978-0451524935" not in before.by_isbn
+        assert len(after.books) == 100 and "isbn-0" not in after.by_isbn
+        assert after.books[-1].isbn == "978-0451524935"
+        assert after.seq == before.seq + 2
+    
+    def test_concurrent_reads_and_writes(self, library):
+        """Eşzamanlı okuma ve yazmalarda yarım kalmış durumun görülmemesi testı."""
+        import threading
+        
+        stop = threading.Event()
+        errors = []
+        reads = [0] * 4
+        
+        def reader(slot):
+            while not stop.is_set():
+                snapshot = library.snapshot()
+                # Her toplu işlem bir kitap silip bir kitap ekler; sayı hep 100'dür
+                if len(snapshot.books) != 100 or len(snapshot.by_isbn) != 100:
+                    errors.append(len(snapshot.books))
+                if any(snapshot.by_isbn.get(book.isbn) is not book for book in snapshot.books):
+                    errors.append("index")
+                if library.find_book("isbn-99") is None:
+                    errors.append("isbn-99")
+                reads[slot] += 1
+        
+        def yeni(i):
+            first12 = f"978{i:09d}"
+            return first12 + isbn13_check_digit(first12)
+        
+        def writer():
+            for i in range(200):
+                library.apply_batch([
+                    {"op": "remove", "isbn": f"isbn-{i}" if i < 99 else yeni(i - 99)},
+                    {"op": "add", "isbn": yeni(i), "title": "Yeni", "author": "Yazar"},
+                ])
+        
+        with patch.object(library, "save_books"), patch("builtins.print"):
+            readers = [threading.Thread(target=reader, args=(slot,)) for slot in range(4)]
+            for thread in readers:
+                thread.start()
+            writer()
+            stop.set()
+            for thread in readers:
+                thread.join()
+        
+        assert errors == []
+        assert all(reads)
+        assert library.get_book_count() == 100
+
+
+class TestSortedIndexes:
+    """Sıralı ikincil indeksler ve query_books test sınıfı."""
+    
+    @pytest.fixture
+    def library(self, tmp_path):
+        """Farklı yazar ve başlıklarla Library instance'ı oluşturur."""
+        library = Library(str(tmp_path / "library.json"))
+        library.add_books([
+            Book("Dune", "Frank Herbert", "978-0441172719"),
+            Book("1984", "George Orwell", "978-0451524935"),
+            Book("animal Farm", "george orwell", "978-0451526342"),
+            Book("Brave New World", "Aldous Huxley", "978-0060850524"),
+            Book("Children of Dune", "Frank Herbert", "978-0593098240"),
+        ])
+        return library
+    
+    def titles(self, books):
+        return [book.title for book in books]
+    
+    def test_sort_and_paginate(self, library):
+        """Başlığa göre sıralı sayfalama testı."""
+        total, page = library.query_books(sort="title", offset=1, limit=2)
+        _, desc = library.query_books(sort="title", descending=True, limit=2)
+        
+        assert total == 5
+        assert self.titles(page) == ["animal Farm", "Brave New World"]
+        assert self.titles(desc) == ["Dune", "Children of Dune"]
+    
+    def test_filter_author_case_insensitive(self, library):
+        """Yazar filtresinin büyük/küçük harf duyarsız olması testı."""
+        total, books = library.query_books(author="GEORGE ORWELL", sort="title", descending=True)
+        
+        assert total == 2
+        assert self.titles(books) == ["animal Farm", "1984"]
+    
+    def test_prefix_and_range(self, library):
+        """Başlık öneki ve yazar aralığı testı."""
+        _, prefixed = library.query_books(title_prefix="d")
+        total, ranged = library.query_books(sort="author", start="b", end="g")
+        
+        assert self.titles(prefixed) == ["Dune"]
+        assert total == 2 and {book.author for book in ranged} == {"Frank Herbert"}
+        with pytest.raises(ValueError):
+            library.query_books(start="a")
+        with pytest.raises(ValueError):
+            library.query_books(sort="isbn")
+    
+    def test_default_is_catalog_order(self, library):
+        """Filtre ve sıralama yoksa katalog sırasının korunması testı."""
+        total, books = library.query_books(offset=3)
+        
+        assert total == 5
+        assert self.titles(books) == ["Brave New World", "Children of Dune"]
+    
+    def test_indexes_follow_changes(self, library):
+        """İndekslerin ekleme, silme ve yeniden yüklemeyle güncel kalması testı."""
+        library.remove_book("978-0441172719")
+        library.apply_batch([
+            {"op": "remove", "isbn": "978-0451524935"},
+            {"op": "add", "isbn": "978-0451524935", "title": "Nineteen Eighty-Four", "author": "George Orwell"},
+            {"op": "add", "isbn": "978-0000000000", "title": "Geçici", "author": "Yazar"},
+            {"op": "remove", "isbn": "978-0000000000"},
+        ])
+        
+        _, books = library.query_books(sort="title")
+        assert self.titles(books) == ["animal Farm", "Brave New World", "Children of Dune",
+                                      "Nineteen Eighty-Four"]
+        for field, index in library.snapshot().indexes.items():
+            assert [entry[2] for entry in index.entries] == sorted(
+                library.books, key=lambda book: (getattr(book, field).casefold(), book.isbn))
+        
+        library.load_books()
+        assert self.titles(library.query_books(sort="title")[1]) == self.titles(books)
+    
+    def test_bulk_changes_rebuild(self, library):
+        """Çok sayıda değişiklikte indeksin baştan sıralanması testı."""
+        library.add_books(Book(f"Kitap {i:03}", "Yazar", f"isbn-{i}") for i in range(200))
+        
+        total, books = library.query_books(author="yazar", sort="title", descending=True, limit=1)
+        
+        assert total == 200
+        assert self.titles(books) == ["Kitap 199"]
+
+
+class TestGetMany:
+    """Library.get_many test sınıfı."""
+    
+    @pytest.fixture
+    def library(self, tmp_path):
+        """Tireli ve tiresiz ISBN'li kitaplarla Library instance'ı oluşturur."""
+        library = Library(str(tmp_path / "library.json"))
+        library.add_books([
+            Book("Dune", "Frank Herbert", "978-0441172719"),
+            Book("1984", "George Orwell", "9780451524935"),
+        ])
+        return library
+    
+    def test_exact_and_canonical_matches(self, library):
+        """Katalog yazımıyla, tiresiz, tireli ve ISBN-10 ile eşleşme testı."""
+        found, missing = library.get_many(["978-0441172719", "9780441172719", "978-0451524935",
+                                           "0-451-52493-4", "978-0000000000", "", "978-0441172719"])
+        
+        assert list(found) == ["978-0441172719", "9780441172719", "978-0451524935", "0-451-52493-4"]
+        assert found["9780441172719"] is library.find_book("978-0441172719")
+        assert missing == ["978-0000000000"]
+    
+    def test_canonical_index_follows_writes(self, library):
+        """Kanonik indeksin ekleme ve silmelerle güncel kalması testı."""
+        library.get_many(["9780441172719"])
+        
+        library.remove_book("978-0441172719")
+        library.add_book_manual(Book("Animal Farm", "George Orwell", "978-0451526342"))
+        found, missing = library.get_many(["9780441172719", "0451526341"])
+        
+        assert missing == ["9780441172719"]
+        assert found["0451526341"].title == "Animal Farm"
+        assert library.snapshot().by_canonical is not None
+
+
+class TestBackgroundIndexes:
+    """İkincil indekslerin arka planda oluşturulması test sınıfı."""
+    
+    @pytest.fixture
+    def filename(self, tmp_path):
+        """Üç kitaplık katalog dosyası oluşturur."""
+        path = tmp_path / "library.json"
+        books = [Book("Dune", "Frank Herbert", "978-0441172719"),
+                 Book("1984", "George Orwell", "978-0451524935"),
+                 Book("Animal Farm", "George Orwell", "978-0451526342")]
+        path.write_text(json.dumps([book.to_dict() for book in books]), encoding="utf-8")
+        return str(path)
+    
+    @pytest.fixture
+    def release(self, monkeypatch):
+        """Boş olmayan kataloğun sıralı indekslerini event set edilene kadar bekletir."""
+        event = threading.Event()
+        build = indexes.build_indexes
+        
+        def blocked(books):
+            if books:
+                event.wait(5)
+            return build(books)
+        
+        monkeypatch.setattr(indexes, "build_indexes", blocked)
+        yield event
+        event.set()
+    
+    def test_warm_up_reports_build_times(self, filename):
+        """Yükleme sonrası indekslerin oluşturulup sürelerinin raporlanması testı."""
+        library = Library(filename, background_indexes=True)
+        
+        assert library.find_book("978-0441172719").title == "Dune"
+        assert library.wait_for_indexes(5)
+        status = library.index_status()
+        assert status["ready"] and status["books"] == 3
+        for name in library_module.SECONDARY_INDEXES:
+            assert status["indexes"][name]["ready"]
+            assert status["indexes"][name]["seconds"] >= 0
+    
+    def test_queries_while_warming_up(self, filename, release, monkeypatch):
+        """İndeksler hazır değilken ISBN aramaları, geçici indeks ve IndexNotReady testı."""
+        library = Library(filename, background_indexes=True)
+        
+        assert not library.index_status()["ready"]
+        assert library.find_book("978-0451524935").title == "1984"
+        total, books = library.query_books(author="george orwell", sort="title")
+        assert total == 2 and [book.title for book in books] == ["1984", "Animal Farm"]
+        
+        monkeypatch.setattr(library_module, "INDEX_FALLBACK_LIMIT", 1)
+        with pytest.raises(IndexNotReady):
+            library.query_books(sort="title")
+        with pytest.raises(IndexNotReady):
+            library.get_many(["9780441172719"])
+        assert library.get_many(["978-0441172719"])[1] == []
+        
+        # Oluşturma sırasındaki yazmalar da indekse girer
+        library.add_book_manual(Book("Brave New World", "Aldous Huxley", "978-0060850524"))
+        release.set()
+        assert library.wait_for_indexes(5)
+        _, books = library.query_books(sort="title", limit=1)
+        assert books[0].title == "1984" and len(library.snapshot().indexes["title"]) == 4
+    
+    def test_writes_during_warm_up_are_caught_up(self, filename, release, monkeypatch):
+        """Oluşturma sürerken gelen yazmaların işi baştan başlatmadan uygulanması testı."""
+        builds = []
+        started = threading.Event()
+        build = indexes.build_indexes
+        
+        def counted(books):
+            if books:
+                builds.append(len(books))
+                started.set()
+            return build(books)
+        
+        monkeypatch.setattr(indexes, "build_indexes", counted)
+        library = Library(filename, background_indexes=True)
+        assert started.wait(5)
+        
+        # Artımlı sınırı aşan bir toplu ekleme, tek tek yazmalar ve bir silme
+        many = [Book(f"Kitap {i:03d}", "Yazar", f"isbn-{i}")
+                for i in range(indexes.INCREMENTAL_LIMIT + 10)]
+        library.add_books(many)
+        library.add_book_manual(Book("Brave New World", "Aldous Huxley", "978-0060850524"))
+        library.remove_book("isbn-0")
+        library.remove_book("978-0441172719")
+        release.set()
+        
+        assert library.wait_for_indexes(5)
+        assert builds == [3]
+        snapshot = library.snapshot()
+        assert len(snapshot.indexes["title"]) == len(snapshot.books) == 3 + len(many) - 1
+        total, books = library.query_books(author="george orwell", sort="title")
+        assert total == 2 and [book.title for book in books] == ["1984", "Animal Farm"]
+        assert library.query_books(title_prefix="brave")[0] == 1
+        assert library.query_books(title_prefix="dune")[0] == 0
+        assert library.get_many(["9780060850524"])[0]["9780060850524"].title == "Brave New World"
+    
+    def test_ready_under_steady_writes(self, filename, release):
+        """Sürekli yazma altında oluşturmanın tamamlanması testı."""
+        library = Library(filename, background_indexes=True)
+        stop = threading.Event()
+        
+        def writer():
+            i = 0
+            while not stop.is_set():
+                library.add_book_manual(Book(f"Kitap {i}", "Yazar", f"isbn-{i}"))
+                i += 1
+                time.sleep(0.001)
+        
+        thread = threading.Thread(target=writer)
+        with patch.object(library, "save_books"), patch("builtins.print"):
+            thread.start()
+            try:
+                time.sleep(0.1)
+                release.set()
+                assert library.wait_for_indexes(5)
+            finally:
+                stop.set()
+                thread.join()
+        
+        snapshot = library.snapshot()
+        assert len(snapshot.indexes["title"]) == len(snapshot.books)
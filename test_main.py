@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Komut satırı alt komutları (add, remove, find, list, import, stats) için testler.
+"""
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+import main
+from book import Book
+from library import Library
+from openlibrary_stub import OpenLibraryStub
+
+
+CORPUS = {
+    "editions": {
+        "978-0451524935": {"title": "1984", "authors": [{"key": "/authors/OL118077A"}]},
+        "978-0451526342": {"title": "Animal Farm", "authors": [{"key": "/authors/OL118077A"}]},
+    },
+    "authors": {
+        "OL118077A": {"name": "George Orwell"},
+    },
+}
+
+
+def json_lines(text):
+    """Çıktıdaki JSON satırlarını ayrıştırır."""
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+@pytest.fixture
+def library_file(tmp_path):
+    """İki kitaplık geçici katalog dosyası."""
+    library = Library(str(tmp_path / "library.json"))
+    library.add_books([Book("1984", "George Orwell", "978-0451524935"),
+                       Book("Dune", "Frank Herbert", "978-0441172719")])
+    return library.filename
+
+
+class TestCatalogCommands:
+    """Katalog alt komutları test sınıfı."""
+
+    def test_add_single_batch(self, tmp_path, capsys):
+        """add komutunun ISBN'leri tek toplu işlemle ekleyip tek kez kaydetmesi testı."""
+        filename = str(tmp_path / "library.json")
+        with OpenLibraryStub(CORPUS) as stub, \
+                patch.object(Library, "save_books", autospec=True,
+                             side_effect=Library.save_books) as save:
+            code = main.main(["--file", filename, "--openlibrary-url", stub.base_url, "add",
+                              "978-0451524935", "978-0451526342", "978-0000000002"])
+
+        captured = capsys.readouterr()
+        results = json_lines(captured.out)
+        summary = json.loads(captured.err.strip().splitlines()[-1])
+        assert code == 1
+        assert [r["status"] for r in results] == ["added", "added", "not_found"]
+        assert results[1]["book"]["author"] == "George Orwell"
+        assert summary["applied"] == 2 and summary["failed"] == 1
+        assert summary["ops_per_second"] > 0
+        assert save.call_count == 1
+        assert Library(filename).get_book_count() == 2
+
+    def test_remove_from_stdin(self, library_file, capsys, monkeypatch):
+        """remove komutunun ISBN'leri standart girdiden okuması testı."""
+        monkeypatch.setattr("sys.stdin", io.StringIO("# yorum\n978-0451524935\n\n978-0451524935\n"))
+
+        code = main.main(["--file", library_file, "remove"])
+
+        results = json_lines(capsys.readouterr().out)
+        assert code == 0
+        assert [(r["isbn"], r["status"]) for r in results] == [("978-0451524935", "removed")]
+        assert Library(library_file).find_book("978-0451524935") is None
+
+    def test_add_existing_is_not_failure(self, library_file, tmp_path, capsys):
+        """Zaten mevcut kitapların çıkış kodunu etkilememesi testı."""
+        isbn_file = tmp_path / "isbns.txt"
+        isbn_file.write_text("978-0451524935\n", encoding="utf-8")
+
+        code = main.main(["--file", library_file, "add", "--input", str(isbn_file)])
+
+        assert code == 0
+        assert json_lines(capsys.readouterr().out)[0]["status"] == "exists"
+
+    def test_find(self, library_file, capsys):
+        """find komutunun bulunan ve bulunmayan ISBN'leri yazması testı."""
+        code = main.main(["--file", library_file, "find", "978-0441172719", "978-0000000000"])
+
+        results = json_lines(capsys.readouterr().out)
+        assert code == 1
+        assert results[0]["found"] is True and results[0]["book"]["title"] == "Dune"
+        assert results[1] == {"isbn": "978-0000000000", "found": False, "book": None}
+
+    def test_list_and_stats(self, library_file, capsys):
+        """list ve stats komutlarının yalnızca veri yazması testı."""
+        main.main(["--file", library_file, "list"])
+        books = json_lines(capsys.readouterr().out)
+        main.main(["--file", library_file, "stats"])
+        stats = json_lines(capsys.readouterr().out)
+
+        assert [book["isbn"] for book in books] == ["978-0451524935", "978-0441172719"]
+        assert stats[0]["total_books"] == 2 and stats[0]["total_authors"] == 2
+
+    def test_export_import_round_trip(self, library_file, tmp_path, capsys):
+        """Dışa aktarılan CSV'nin import komutuyla geri yüklenmesi testı."""
+        exported = str(tmp_path / "catalog.csv.gz")
+        main.main(["--file", library_file, "export", "--format", "csv", "--gzip",
+                   "--output", exported])
+        target = str(tmp_path / "copy.json")
+
+        code = main.main(["--file", target, "import", exported])
+
+        assert code == 0
+        assert [book.to_dict() for book in Library(target).books] == \
+            [book.to_dict() for book in Library(library_file).books]
+
+    def test_load_library_shares_rate_limiter(self, library_file, monkeypatch):
+        """CLI istemcisinin API ile aynı hız sınırı ayarlarını kullanması testı."""
+        monkeypatch.setenv("LIBRARY_UPSTREAM_RATE_LIMIT", "2.5")
+
+        library = main.load_library(library_file, "http://127.0.0.1:9")
+
+        assert library.upstream.rate_limiter is not None
+        assert library.upstream.rate_limiter.rate == 2.5
+        assert library.base_url == "http://127.0.0.1:9"
+        assert library.get_book_count() == 2
+
+    @pytest.mark.parametrize("command", [
+        [], ["find", "978-0451524935"], ["list"], ["memory"],
+        ["import-dump", "--editions", "editions.jsonl"]])
+    def test_commands_use_openlibrary_url(self, library_file, tmp_path, monkeypatch, command):
+        """Tüm komutların kataloğu --openlibrary-url ile yüklemesi testı."""
+        (tmp_path / "editions.jsonl").write_text("", encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(main, "run_interactive", lambda library: None)
+        loaded = []
+        load_library = main.load_library
+        monkeypatch.setattr(main, "load_library",
+                            lambda *args: loaded.append(load_library(*args)) or loaded[-1])
+
+        main.main(["--file", library_file, "--openlibrary-url", "http://127.0.0.1:9", *command])
+
+        assert [library.base_url for library in loaded] == ["http://127.0.0.1:9"]
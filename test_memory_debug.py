@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Bellek inceleme modülü ve /debug/memory endpoint'i için testler.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import memory_debug
+from api import create_app
+from book import Book
+from settings import Settings
+
+
+ADMIN = {"X-Admin-Token": "gizli"}
+
+
+class TestMemoryInspector:
+    """MemoryInspector test sınıfı."""
+    
+    @pytest.fixture
+    def inspector(self):
+        """Test sonunda tracemalloc'u durduran inspector."""
+        inspector = memory_debug.MemoryInspector()
+        yield inspector
+        inspector.stop()
+    
+    def test_snapshot_requires_start(self, inspector):
+        """tracemalloc başlatılmadan snapshot alınamaması testı."""
+        with pytest.raises(RuntimeError):
+            inspector.snapshot()
+    
+    def test_diff_reports_growth(self, inspector):
+        """İki snapshot arasındaki büyümenin raporlanması testı."""
+        inspector.start()
+        inspector.snapshot()
+        books = [Book(f"Kitap {i}", "Yazar", str(i)) for i in range(2000)]
+        
+        diff = inspector.diff(limit=5)
+        
+        assert diff["total_diff_bytes"] > 0
+        assert any(row["file"].endswith("test_memory_debug.py") for row in diff["top"])
+        assert len(books) == 2000
+    
+    def test_object_counts(self):
+        """Book nesnelerinin sayılması testı."""
+        books = [Book("1984", "George Orwell", str(i)) for i in range(10)]
+        
+        counts = memory_debug.object_counts()
+        
+        assert counts["tracked"]["Book"] >= len(books)
+
+
+class TestMemoryEndpoint:
+    """/debug/memory endpoint'i test sınıfı."""
+    
+    @pytest.fixture
+    def client(self, tmp_path):
+        """Yönetici token'ı tanımlı test client'ı oluşturur."""
+        settings = Settings(library_file=str(tmp_path / "library.json"), admin_token="gizli")
+        with TestClient(create_app(settings)) as client:
+            yield client
+            client.post("/debug/memory", params={"action": "stop"}, headers=ADMIN)
+    
+    def test_requires_admin_token(self, client):
+        """Token olmadan veya yanlış token ile erişimin reddedilmesi testı."""
+        assert client.get("/debug/memory").status_code == 403
+        assert client.get("/debug/memory", headers={"X-Admin-Token": "yanlis"}).status_code == 403
+    
+    def test_disabled_without_configured_token(self, tmp_path):
+        """Token yapılandırılmamışsa endpoint'in kapalı olması testı."""
+        with TestClient(create_app(Settings(library_file=str(tmp_path / "l.json")))) as client:
+            assert client.get("/debug/memory", headers=ADMIN).status_code == 403
+    
+    def test_start_snapshot_diff(self, client):
+        """start, snapshot ve diff akışı testı."""
+        assert client.post("/debug/memory", params={"action": "diff"}, headers=ADMIN).status_code == 409
+        
+        started = client.post("/debug/memory", params={"action": "start"}, headers=ADMIN).json()
+        snapshot = client.post("/debug/memory", params={"action": "snapshot", "group_by": "filename"},
+                               headers=ADMIN)
+        diff = client.post("/debug/memory", params={"action": "diff", "limit": 3}, headers=ADMIN)
+        
+        assert started["tracing"] is True
+        assert snapshot.status_code == 200
+        assert "Book" in snapshot.json()["objects"]["tracked"]
+        assert diff.status_code == 200
+        assert len(diff.json()["top"]) <= 3
+    
+    def test_status(self, client):
+        """Durum ve nesne sayılarının döndürülmesi testı."""
+        response = client.get("/debug/memory", headers=ADMIN)
+        
+        assert response.status_code == 200
+        assert response.json()["status"] == {"tracing": False}
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Metrik modülü ve /metrics endpoint'i için testler.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import patch, Mock
+
+import metrics
+from api import create_app
+from settings import Settings
+
+
+class TestMetrics:
+    """Metrik türleri test sınıfı."""
+    
+    def test_counter_render(self):
+        """Etiketli sayaç çıktısı testı."""
+        counter = metrics.Counter("test_total", "Test sayacı", ("kind",))
+        counter.labels("a").inc()
+        counter.labels("a").inc(2)
+        
+        lines = counter.collect()
+        
+        assert "# TYPE test_total counter" in lines
+        assert 'test_total{kind="a"} 3' in lines
+    
+    def test_histogram_buckets_are_cumulative(self):
+        """Histogram kovalarının kümülatif yazılması testı."""
+        histogram = metrics.Histogram("test_seconds", "Test", buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5)
+        
+        lines = histogram.collect()
+        
+        assert 'test_seconds_bucket{le="0.1"} 1' in lines
+        assert 'test_seconds_bucket{le="1"} 2' in lines
+        assert 'test_seconds_bucket{le="+Inf"} 3' in lines
+        assert "test_seconds_count 3" in lines
+        assert "test_seconds_sum 5.55" in lines
+    
+    def test_label_count_is_checked(self):
+        """Yanlış sayıda etiket verilmesi testı."""
+        counter = metrics.Counter("test_labels_total", "Test", ("a", "b"))
+        
+        with pytest.raises(ValueError):
+            counter.labels("only-one")
+    
+    def test_registry_rejects_duplicates(self):
+        """Aynı adla iki metrik kaydedilememesi testı."""
+        registry = metrics.Registry()
+        registry.register(metrics.Gauge("dup", "Test"))
+        
+        with pytest.raises(ValueError):
+            registry.register(metrics.Gauge("dup", "Test"))
+
+
+class TestMetricsEndpoint:
+    """/metrics endpoint'i test sınıfı."""
+    
+    @pytest.fixture
+    def client(self, tmp_path):
+        """Geçici kütüphane ile test client'ı oluşturur."""
+        app = create_app(Settings(library_file=str(tmp_path / "library.json")))
+        with TestClient(app) as client:
+            yield client
+    
+    def test_request_latency_is_recorded_per_route(self, client):
+        """İstek süresinin route şablonu ve durum koduna göre kaydedilmesi testı."""
+        client.get("/books/978-0000000000")
+        
+        body = client.get("/metrics").text
+        
+        assert 'http_request_duration_seconds_count{method="GET",route="/books/{isbn}",status="404"}' in body
+        assert "library_books 0" in body
+    
+    @patch('library.httpx.Client')
+    def test_upstream_metrics(self, mock_client, client):
+        """Open Library çağrılarının kitap/yazar ayrımıyla ölçülmesi testı."""
+        book_response = Mock()
+        book_response.status_code = 200
+        book_response.json.return_value = {"title": "1984", "authors": [{"key": "/authors/OL23919A"}]}
+        author_response = Mock()
+        author_response.status_code = 200
+        author_response.json.return_value = {"name": "George Orwell"}
+        mock_client_instance = Mock()
+        mock_client_instance.get.side_effect = [book_response, author_response]
+        mock_client.return_value.__enter__.return_value = mock_client_instance
+        
+        client.post("/books", json={"isbn": "978-0451524935"})
+        body = client.get("/metrics").text
+        
+        assert 'openlibrary_requests_total{lookup="book",status="200"}' in body
+        assert 'openlibrary_requests_total{lookup="author",status="200"}' in body
+        assert 'library_storage_bytes_total{operation="save"}' in body
+        assert 'library_cache_hit_ratio{cache="author"}' in body
+        assert "library_books 1" in body
+    
+    def test_author_cache_avoids_second_lookup(self, client):
+        """Aynı yazarın ikinci kitabında yazar isteği atılmaması testı."""
+        library = client.app.state.library
+        editions = {
+            "1": {"title": "1984", "authors": [{"key": "/authors/OL23919A"}]},
+            "2": {"title": "Animal Farm", "authors": [{"key": "/authors/OL23919A"}]},
+        }
+        
+        def fake_get(url):
+            response = Mock()
+            response.status_code = 200
+            if "/authors/" in url:
+                response.json.return_value = {"name": "George Orwell"}
+            else:
+                response.json.return_value = editions["1" if "0451524935" in url else "2"]
+            return response
+        
+        with patch('library.httpx.Client') as mock_client:
+            mock_client_instance = Mock()
+            mock_client_instance.get.side_effect = fake_get
+            mock_client.return_value.__enter__.return_value = mock_client_instance
+            library.add_book("978-0451524935")
+            library.add_book("978-0451526342")
+        
+        assert mock_client_instance.get.call_count == 3
+        assert library.find_book("978-0451526342").author == "George Orwell"
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Yerel Open Library taklidi için integration testler.
+"""
+
+import pytest
+import httpx
+
+from library import Library
+from openlibrary_stub import OpenLibraryStub
+
+
+CORPUS = {
+    "editions": {
+        "978-0451524935": {"title": "1984", "authors": [{"key": "/authors/OL118077A"}]},
+    },
+    "authors": {
+        "OL118077A": {"name": "George Orwell"},
+    },
+}
+
+
+class TestOpenLibraryStub:
+    """OpenLibraryStub test sınıfı."""
+    
+    @pytest.fixture
+    def temp_library(self, tmp_path):
+        """Geçici dosya ile Library instance'ı oluşturur."""
+        return Library(str(tmp_path / "library.json"))
+    
+    def test_serves_edition_and_author(self):
+        """Korpustaki edition ve yazarın sunulması testı."""
+        with OpenLibraryStub(CORPUS) as stub:
+            edition = httpx.get(f"{stub.base_url}/isbn/978-0451524935.json")
+            author = httpx.get(f"{stub.base_url}/authors/OL118077A.json")
+        
+        assert edition.status_code == 200
+        assert edition.json()["title"] == "1984"
+        assert author.json()["name"] == "George Orwell"
+        assert stub.request_counts == {"isbn": 1, "author": 1}
+    
+    def test_unknown_isbn_returns_404(self):
+        """Korpusta olmayan ISBN için 404 testı."""
+        with OpenLibraryStub(CORPUS) as stub:
+            response = httpx.get(f"{stub.base_url}/isbn/978-0000000000.json")
+        
+        assert response.status_code == 404
+    
+    def test_error_and_not_found_injection(self):
+        """Hata ve 404 enjeksiyonu testı."""
+        with OpenLibraryStub(CORPUS, error_rate=1.0) as stub:
+            assert httpx.get(f"{stub.base_url}/isbn/978-0451524935.json").status_code == 503
+        with OpenLibraryStub(CORPUS, not_found_rate=1.0) as stub:
+            assert httpx.get(f"{stub.base_url}/isbn/978-0451524935.json").status_code == 404
+    
+    def test_library_add_book_against_stub(self, temp_library):
+        """Library.add_book'un taklit sunucuya karşı çalışması testı."""
+        with OpenLibraryStub(CORPUS) as stub:
+            temp_library.base_url = stub.base_url
+            result = temp_library.add_book("978-0451524935")
+        
+        assert result is True
+        book = temp_library.find_book("978-0451524935")
+        assert book.title == "1984"
+        assert book.author == "George Orwell"
+    
+    def test_library_add_book_upstream_error(self, temp_library):
+        """Taklit sunucu hata döndürdüğünde kitabın eklenmemesi testı."""
+        with OpenLibraryStub(CORPUS, error_rate=1.0) as stub:
+            temp_library.base_url = stub.base_url
+            result = temp_library.add_book("978-0451524935")
+        
+        assert result is False
+        assert temp_library.get_book_count() == 0
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+İsteğe bağlı profilleme için testler.
+"""
+
+import asyncio
+import os
+import pstats
+import pytest
+from fastapi.testclient import TestClient
+
+import profiling
+from api import create_app
+from settings import Settings
+
+
+class TestProfiling:
+    """Profilleme test sınıfı."""
+    
+    def test_profile_writes_stats_and_summary(self, tmp_path):
+        """Profil ve özet dosyalarının yazılması testı."""
+        with profiling.profile(str(tmp_path), "GET /stats", top_n=5) as result:
+            sorted(range(10000), key=lambda x: -x)
+        
+        assert os.path.exists(result.stats_path)
+        assert result.stats_path.endswith("GET_stats.pstats")
+        assert pstats.Stats(result.stats_path).total_calls > 0
+        with open(result.summary_path, encoding='utf-8') as file:
+            assert file.readline().startswith("GET /stats")
+    
+    def _client(self, tmp_path, enabled: bool) -> TestClient:
+        settings = Settings(library_file=str(tmp_path / "library.json"),
+                            profiling_enabled=enabled,
+                            profiles_dir=str(tmp_path / "profiles"))
+        return TestClient(create_app(settings))
+    
+    def test_request_profiled_with_header(self, tmp_path):
+        """Ayar açıkken X-Profile başlıklı isteğin profillenmesi testı."""
+        with self._client(tmp_path, True) as client:
+            response = client.get("/stats", headers={"X-Profile": "1"})
+        
+        assert response.status_code == 200
+        assert os.path.exists(response.headers["x-profile-path"])
+    
+    def test_threadpool_work_is_profiled(self, tmp_path):
+        """Thread havuzunda çalışan handler işinin profile girmesi testı."""
+        with self._client(tmp_path, True) as client:
+            operation = {"op": "add", "isbn": "978-0451524935", "title": "1984",
+                         "author": "George Orwell"}
+            response = client.post("/books/batch", headers={"X-Profile": "1"},
+                                   json={"operations": [operation]})
+        
+        assert response.status_code == 200
+        functions = {(os.path.basename(path), name)
+                     for path, _, name in pstats.Stats(response.headers["x-profile-path"]).stats}
+        assert ("library.py", "apply_batch") in functions
+    
+    def test_request_without_header_not_profiled(self, tmp_path):
+        """Başlık olmadan profil alınmaması testı."""
+        with self._client(tmp_path, True) as client:
+            response = client.get("/stats")
+        
+        assert "x-profile-path" not in response.headers
+        assert not os.path.exists(tmp_path / "profiles")
+    
+    def test_header_ignored_when_disabled(self, tmp_path):
+        """Ayar kapalıyken başlığın yok sayılması testı."""
+        with self._client(tmp_path, False) as client:
+            response = client.get("/stats", headers={"X-Profile": "1"})
+        
+        assert "x-profile-path" not in response.headers
+        assert not os.path.exists(tmp_path / "profiles")
+    
+    def test_streaming_response_not_buffered(self, tmp_path):
+        """Profilli akışlı yanıtın başlıklarının gövde beklenmeden gönderilmesi testı."""
+        body_released = asyncio.Event()
+        sent = []
+        
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await asyncio.wait_for(body_released.wait(), 5)
+            await send({"type": "http.response.body", "body": b"son", "more_body": False})
+        
+        async def send(message):
+            sent.append(message)
+            if message["type"] == "http.response.start":
+                body_released.set()
+        
+        middleware = profiling.ProfilingMiddleware(app, str(tmp_path))
+        scope = {"type": "http", "method": "GET", "path": "/changes",
+                 "headers": [(b"x-profile", b"1")]}
+        asyncio.run(middleware(scope, None, send))
+        
+        assert [message["type"] for message in sent] == ["http.response.start", "http.response.body"]
+        headers = dict(sent[0]["headers"])
+        assert os.path.exists(headers[profiling.PROFILE_PATH_HEADER.encode()].decode())
+    
+    def test_concurrent_profiles_are_serialized(self, tmp_path):
+        """Eşzamanlı profilli isteklerin birbirini beklemesi testı."""
+        events = []
+        
+        async def app(scope, receive, send):
+            events.append(("start", scope["path"]))
+            await asyncio.sleep(0.01)
+            events.append(("end", scope["path"]))
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        
+        async def send(message):
+            pass
+        
+        middleware = profiling.ProfilingMiddleware(app, str(tmp_path))
+        
+        async def run_both():
+            await asyncio.gather(*(
+                middleware({"type": "http", "method": "GET", "path": path,
+                            "headers": [(b"x-profile", b"1")]}, None, send)
+                for path in ("/a", "/b")))
+        
+        asyncio.run(run_both())
+        
+        assert events == [("start", "/a"), ("end", "/a"), ("start", "/b"), ("end", "/b")]
+        assert len(list((tmp_path).glob("*.pstats"))) == 2
+    
+    def test_lock_released_when_profiling_fails(self, tmp_path, monkeypatch):
+        """Profil başlatılamadığında kilidin bırakılması testı."""
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        
+        async def send(message):
+            pass
+        
+        middleware = profiling.ProfilingMiddleware(app, str(tmp_path))
+        scope = {"type": "http", "method": "GET", "path": "/stats",
+                 "headers": [(b"x-profile", b"1")]}
+        
+        def broken(self, *args):
+            raise RuntimeError("profil başlatılamadı")
+        
+        async def run():
+            with monkeypatch.context() as patch:
+                patch.setattr(profiling.ProfileSession, "start", broken)
+                with pytest.raises(RuntimeError):
+                    await middleware(scope, None, send)
+            with monkeypatch.context() as patch:
+                patch.setattr(profiling.ProfileSession, "__init__", broken)
+                with pytest.raises(RuntimeError):
+                    await middleware(scope, None, send)
+            await asyncio.wait_for(middleware(scope, None, send), 5)
+        
+        asyncio.run(run())
+        
+        assert not middleware._lock.locked()
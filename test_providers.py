@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Kitap bilgisi sağlayıcı zinciri (providers) için testler.
+"""
+
+import gzip
+import json
+import time
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from api import create_app
+from library import Library
+from openlibrary import OpenLibraryClient
+from openlibrary_stub import OpenLibraryStub
+from providers import (DumpProvider, MemoryCacheProvider, OpenLibraryProvider, ProviderChain,
+                       ProviderTimeout, StubProvider, chain_from_settings)
+from settings import Settings
+
+
+RECORDS = {
+    "978-0451524935": {"title": "1984", "author": "George Orwell", "publish_year": 1950},
+}
+
+CORPUS = {
+    "editions": {
+        "978-0441172719": {"title": "Dune", "authors": [{"key": "/authors/OL79034A"}]},
+    },
+    "authors": {
+        "OL79034A": {"name": "Frank Herbert"},
+    },
+}
+
+
+class TestProviderChain:
+    """ProviderChain test sınıfı."""
+
+    def test_first_success_fills_cache(self):
+        """Uzak sağlayıcının sonucunun önbelleğe yazılıp sonra önbellekten sunulması testı."""
+        cache = MemoryCacheProvider()
+        remote = StubProvider(RECORDS, name="remote")
+        chain = ProviderChain([cache, remote])
+
+        first = chain.lookup("978-0451524935")
+        # Aynı kitap ISBN-10 yazımıyla
+        second = chain.lookup("0-451-52493-4")
+
+        assert first.title == second.title == "1984"
+        assert second.isbn == "0-451-52493-4" and second.publish_year == 1950
+        assert remote.calls == 1
+        stats = {provider["name"]: provider for provider in chain.stats()["providers"]}
+        assert stats["cache"]["found"] == 1 and stats["cache"]["not_found"] == 1
+        assert stats["remote"]["found"] == 1 and "p99" in stats["remote"]["latency_ms"]
+
+    def test_falls_through_errors_and_misses(self):
+        """Hata veren ve bulamayan sağlayıcılardan sonrakine geçilmesi testı."""
+        broken = StubProvider({}, name="broken", error=httpx.ConnectError("bağlantı yok"))
+        empty = StubProvider({}, name="empty")
+        chain = ProviderChain([broken, empty, StubProvider(RECORDS, name="last")])
+
+        assert chain.lookup("978-0451524935").author == "George Orwell"
+        assert chain.stats()["providers"][0]["error"] == 1
+
+    def test_error_reported_when_nothing_found(self):
+        """Hiçbir sağlayıcı bulamazsa: hata varsa hatanın, yoksa None'ın dönmesi testı."""
+        error = httpx.ConnectError("bağlantı yok")
+        chain = ProviderChain([StubProvider({}, error=error, name="broken"),
+                               StubProvider({}, name="empty")])
+
+        with pytest.raises(httpx.ConnectError):
+            chain.lookup("978-0451524935")
+        assert ProviderChain([StubProvider({})]).lookup("978-0451524935") is None
+
+    def test_timeout_moves_to_next_provider(self):
+        """Zaman aşımına uğrayan sağlayıcıyı beklemeden sonrakine geçilmesi testı."""
+        slow = StubProvider(RECORDS, name="slow", latency=1.0, timeout=0.05)
+        chain = ProviderChain([slow, StubProvider(RECORDS, name="fast")])
+
+        start = time.perf_counter()
+        book = chain.lookup("978-0451524935")
+
+        assert book.title == "1984"
+        assert time.perf_counter() - start < 0.5
+        assert chain.stats()["providers"][0]["timeout"] == 1
+        with pytest.raises(ProviderTimeout):
+            ProviderChain([slow]).lookup("978-0451524935")
+
+    def test_hedged_request_wins(self):
+        """Yavaş ilk istekte gönderilen ikinci isteğin sonucunun kullanılması testı."""
+        latencies = iter([1.0, 0.0])
+        remote = StubProvider(RECORDS, name="remote", latency=lambda: next(latencies), hedge=True)
+        chain = ProviderChain([remote], hedge_after=0.05)
+
+        start = time.perf_counter()
+        book = chain.lookup("978-0451524935")
+
+        assert book.title == "1984"
+        assert time.perf_counter() - start < 0.5
+        stats = chain.stats()["providers"][0]
+        assert stats["hedged"] == 1 and stats["hedge_wins"] == 1 and stats["found"] == 1
+
+    def test_fast_response_not_hedged(self):
+        """Hedge süresinden önce yanıt verilirse ikinci istek gönderilmemesi testı."""
+        remote = StubProvider(RECORDS, name="remote", hedge=True)
+        chain = ProviderChain([remote], hedge_after=0.5)
+
+        assert chain.lookup("978-0451524935") is not None
+        assert remote.calls == 1 and chain.stats()["providers"][0]["hedged"] == 0
+
+    def test_abandoned_calls_do_not_starve_new_lookups(self):
+        """Zaman aşımında bırakılan çağrıların yeni sorguları bekletmemesi testı."""
+        latencies = iter([0.5, 0.5, 0.0])
+        remote = StubProvider(RECORDS, name="remote", latency=lambda: next(latencies),
+                              timeout=0.05)
+        chain = ProviderChain([remote], workers=2)
+
+        for _ in range(2):
+            with pytest.raises(ProviderTimeout):
+                chain.lookup("978-0451524935")
+        # İki yavaş çağrı hâlâ sürüyor; yuvaları bırakıldığı için yeni sorgu hemen başlar
+        book = chain.lookup("978-0451524935")
+
+        assert book.title == "1984"
+        assert remote.calls == 3
+        chain.close()
+        assert chain._threads == set()
+
+    def test_dump_provider(self, tmp_path):
+        """Dışa aktarılmış NDJSON dosyasından bilgi verilmesi testı."""
+        path = tmp_path / "books.ndjson.gz"
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            file.write(json.dumps({"isbn": "9780451524935", "title": "1984",
+                                   "author": "George Orwell"}) + "\n")
+        provider = DumpProvider(str(path))
+
+        book = provider.lookup("978-0451524935")
+
+        assert book.isbn == "978-0451524935" and book.author == "George Orwell"
+        assert provider.lookup("978-0441172719") is None
+
+    def test_openlibrary_provider_against_stub(self):
+        """OpenLibraryProvider'ın taklit sunucudan edition ve yazar çekmesi testı."""
+        with OpenLibraryStub(CORPUS) as stub:
+            chain = ProviderChain([OpenLibraryProvider(OpenLibraryClient(stub.base_url))])
+            with chain.session() as sessions:
+                book = chain.lookup("978-0441172719", sessions)
+                missing = chain.lookup("978-0000000000", sessions)
+
+        assert book.author == "Frank Herbert"
+        assert missing is None
+
+
+class TestLibraryProviders:
+    """Library ve API'nin sağlayıcı zinciriyle çalışması test sınıfı."""
+
+    def test_library_uses_chain(self, tmp_path):
+        """add_book ve apply_batch'in Open Library'ye gitmeden zincirden beslenmesi testı."""
+        remote = StubProvider(dict(RECORDS, **{"978-0441172719": {"title": "Dune",
+                                                                  "author": "Frank Herbert"}}))
+        library = Library(str(tmp_path / "library.json"),
+                          providers=ProviderChain([MemoryCacheProvider(), remote]))
+
+        assert library.add_book("978-0451524935")
+        results = library.apply_batch([{"op": "add", "isbn": "978-0441172719"},
+                                       {"op": "add", "isbn": "978-0000000002"}])
+
+        assert library.find_book("978-0451524935").publish_year == 1950
+        assert [r["status"] for r in results] == ["added", "not_found"]
+
+    def test_chain_from_settings(self, tmp_path):
+        """Ayarlardaki sağlayıcı listesinden zincir oluşturulması testı."""
+        dump = tmp_path / "dump.ndjson"
+        dump.write_text("", encoding="utf-8")
+        settings = Settings(metadata_providers="cache, dump, openlibrary, http://mirror.local",
+                            metadata_dump=str(dump), provider_timeout=2.0, hedge_after=0.3)
+        upstream = OpenLibraryClient()
+
+        chain = chain_from_settings(settings, upstream)
+
+        assert [p.name for p in chain.providers] == ["cache", "dump", "openlibrary",
+                                                     "http://mirror.local"]
+        assert chain.providers[2].upstream is upstream and chain.providers[2].timeout == 2.0
+        assert chain.hedge_after == 0.3
+        with pytest.raises(ValueError):
+            chain_from_settings(Settings(metadata_providers="cache,ftp"), upstream)
+
+    def test_providers_endpoint(self, tmp_path):
+        """GET /providers'ın sağlayıcı istatistiklerini döndürmesi testı."""
+        with OpenLibraryStub(CORPUS) as stub:
+            settings = Settings(library_file=str(tmp_path / "library.json"),
+                                libraries_dir=str(tmp_path / "libraries"),
+                                openlibrary_url=stub.base_url)
+            with TestClient(create_app(settings)) as client:
+                client.post("/books", json={"isbn": "978-0441172719"})
+                client.delete("/books/978-0441172719")
+                client.post("/books", json={"isbn": "978-0441172719"})
+                body = client.get("/providers").json()
+
+        providers = {provider["name"]: provider for provider in body["providers"]}
+        assert list(providers) == ["cache", "openlibrary"]
+        assert providers["cache"]["found"] == 1
+        assert providers["openlibrary"]["found"] == 1
+        assert stub.request_counts["isbn"] == 1
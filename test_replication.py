@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Takipçi çoğaltma (ChangeJournal, Follower ve salt okunur Library) için testler.
+"""
+
+import json
+import os
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api import create_app
+from book import Book
+from library import Library, ReadOnlyError
+from replication import Follower, journal_filename
+from settings import Settings
+
+
+def add_ops(*isbns):
+    """Open Library'ye gitmeden kitap ekleyen toplu işlemler."""
+    return [{"op": "add", "isbn": isbn, "title": f"Kitap {isbn}", "author": "Yazar"}
+            for isbn in isbns]
+
+
+def isbns(library):
+    """Kataloğun ISBN'lerini sırasıyla döndürür."""
+    return [book.isbn for book in library.books]
+
+
+@pytest.fixture
+def filename(tmp_path):
+    """Geçici katalog dosyasının yolu."""
+    return str(tmp_path / "library.json")
+
+
+@pytest.fixture
+def primary(filename):
+    """Değişiklik günlüğü yazan birincil kütüphane."""
+    return Library(filename, journal=True)
+
+
+@pytest.fixture
+def follower(primary, filename):
+    """Birincil kütüphaneyi izleyen takipçi (thread'siz; poll elle çağrılır)."""
+    follower = Follower(Library(filename, read_only=True))
+    follower.poll()
+    yield follower
+    follower.stop()
+
+
+class TestReadOnlyLibrary:
+    """Salt okunur Library test sınıfı."""
+
+    def test_mutations_rejected(self, filename):
+        """Salt okunur kütüphanede değişikliklerin reddedilmesi testı."""
+        library = Library(filename, read_only=True)
+
+        with pytest.raises(ReadOnlyError):
+            library.add_book("978-0451524935")
+        with pytest.raises(ReadOnlyError):
+            library.add_book_manual(Book("1984", "George Orwell", "978-0451524935"))
+        with pytest.raises(ReadOnlyError):
+            library.add_books([Book("1984", "George Orwell", "978-0451524935")])
+        with pytest.raises(ReadOnlyError):
+            library.apply_batch(add_ops("9780306406157"))
+        with pytest.raises(ReadOnlyError):
+            library.remove_book("978-0451524935")
+
+    def test_never_writes(self, filename):
+        """Salt okunur kütüphanenin dosya oluşturmaması testı."""
+        library = Library(filename, read_only=True)
+
+        library.save_books()
+
+        assert not os.path.exists(filename)
+        assert not os.path.exists(journal_filename(filename))
+
+
+class TestChangeJournal:
+    """Birincil sürecin değişiklik günlüğü test sınıfı."""
+
+    def read_journal(self, filename):
+        with open(journal_filename(filename), encoding="utf-8") as file:
+            return [json.loads(line) for line in file]
+
+    def test_reset_then_events(self, primary, filename):
+        """Günlüğün reset kaydıyla başlayıp olayları sırayla içermesi testı."""
+        start = primary.last_seq
+        primary.apply_batch(add_ops("9780306406157", "9780140449136"))
+        primary.remove_book("9780306406157")
+
+        records = self.read_journal(filename)
+
+        assert records[0]["op"] == "reset" and records[0]["seq"] == start
+        assert [(r["seq"] - start, r["op"], r["isbn"]) for r in records[1:]] == [
+            (1, "add", "9780306406157"), (2, "add", "9780140449136"),
+            (3, "remove", "9780306406157")]
+
+    def test_compaction(self, primary, filename):
+        """Eşik aşılınca günlüğün tek bir reset kaydına indirilmesi testı."""
+        primary._journal.max_bytes = 1
+        primary.apply_batch(add_ops("9780306406157"))
+
+        records = self.read_journal(filename)
+
+        assert records == [{"seq": primary.last_seq, "op": "reset", "time": records[0]["time"]}]
+
+    def test_save_is_atomic(self, primary, filename):
+        """Kaydetmenin geçici dosya bırakmaması testı."""
+        primary.apply_batch(add_ops("9780306406157"))
+
+        assert not os.path.exists(f"{filename}.tmp")
+        assert json.load(open(filename, encoding="utf-8"))[0]["isbn"] == "9780306406157"
+
+    def test_disabled_by_default(self, filename):
+        """Günlüğün varsayılan olarak yazılmaması testı."""
+        Library(filename).apply_batch(add_ops("9780306406157"))
+
+        assert not os.path.exists(journal_filename(filename))
+
+
+class TestFollower:
+    """Follower test sınıfı."""
+
+    def test_applies_incrementally(self, primary, follower):
+        """Birincil süreçteki değişikliklerin takipçiye uygulanması testı."""
+        primary.apply_batch(add_ops("9780306406157", "9780140449136", "9780262033848"))
+        primary.remove_book("9780140449136")
+
+        assert follower.poll() == 4
+
+        library = follower.library
+        assert isbns(library) == isbns(primary) == ["9780306406157", "9780262033848"]
+        assert library.find_book("9780262033848").title == "Kitap 9780262033848"
+        assert library.last_seq == primary.last_seq
+        assert follower.poll() == 0
+
+    def test_same_change_cursors(self, primary, follower):
+        """Takipçinin değişiklik akışının birincil süreçle aynı imleçleri kullanması testı."""
+        cursor = primary.last_seq
+        primary.apply_batch(add_ops("9780306406157", "9780140449136"))
+        follower.poll()
+
+        assert follower.library.changes(cursor) == primary.changes(cursor)
+
+    def test_does_not_reload_catalog(self, primary, follower, monkeypatch):
+        """Olayların katalog dosyası yeniden okunmadan uygulanması testı."""
+        primary.apply_batch(add_ops("9780306406157"))
+        monkeypatch.setattr(follower.library, "_read_books", lambda: pytest.fail("yeniden yüklendi"))
+
+        follower.poll()
+
+        assert isbns(follower.library) == ["9780306406157"]
+
+    def test_catalog_newer_than_journal(self, primary, filename):
+        """Katalog dosyası günlükten yeniyken tekrar uygulamanın aynı sonucu vermesi testı."""
+        primary.apply_batch(add_ops("9780306406157", "9780140449136"))
+        primary.apply_batch([{"op": "remove", "isbn": "9780306406157"}])
+
+        follower = Follower(Library(filename, read_only=True))
+        follower.poll()
+
+        assert isbns(follower.library) == isbns(primary) == ["9780140449136"]
+
+    def test_follows_compaction(self, primary, follower):
+        """Sıkıştırılan günlüğün ardından takipçinin kataloğu yeniden okuması testı."""
+        primary.apply_batch(add_ops("9780306406157"))
+        primary._journal.max_bytes = 1
+        primary.apply_batch(add_ops("9780140449136"))
+        primary._journal.max_bytes = 1 << 20
+        primary.apply_batch(add_ops("9780262033848"))
+
+        follower.poll()
+
+        assert isbns(follower.library) == ["9780306406157", "9780140449136", "9780262033848"]
+        assert follower.library.last_seq == primary.last_seq
+
+    def test_follows_primary_restart(self, primary, follower, filename):
+        """Birincil süreç yeniden başladığında takipçinin yeni günlüğe geçmesi testı."""
+        primary.apply_batch(add_ops("9780306406157"))
+        follower.poll()
+
+        restarted = Library(filename, journal=True)
+        restarted.apply_batch(add_ops("9780140449136"))
+        follower.poll()
+
+        assert isbns(follower.library) == ["9780306406157", "9780140449136"]
+        assert follower.library.last_seq == restarted.last_seq
+
+    def test_partial_line(self, primary, follower, filename):
+        """Yarım yazılmış satırın tamamlanana kadar beklenmesi testı."""
+        seq = primary.last_seq + 1
+        line = json.dumps({"seq": seq, "op": "add", "isbn": "111", "time": time.time(),
+                           "book": {"title": "Kitap", "author": "Yazar", "isbn": "111"}}) + "\n"
+        with open(journal_filename(filename), "a", encoding="utf-8") as file:
+            file.write(line[:10])
+            file.flush()
+            assert follower.poll() == 0
+            assert follower.status()["pending_bytes"] == 10
+            file.write(line[10:])
+
+        assert follower.poll() == 1
+        assert follower.status()["pending_bytes"] == 0
+
+    def test_status_reports_lag(self, primary, follower):
+        """Gecikme bilgilerinin raporlanması testı."""
+        assert follower.status()["lag_seconds"] == 0.0
+
+        primary.apply_batch(add_ops("9780306406157"))
+        time.sleep(0.02)
+        behind = follower.status()
+        follower.poll()
+        caught_up = follower.status()
+
+        assert behind["pending_bytes"] > 0 and behind["lag_seconds"] > 0
+        assert caught_up["pending_bytes"] == 0 and caught_up["lag_seconds"] == 0.0
+        assert caught_up["applied_seq"] == primary.last_seq
+        assert caught_up["role"] == "follower" and caught_up["error"] is None
+
+    def test_missing_journal(self, filename):
+        """Günlük yoksa hatanın raporlanması testı."""
+        follower = Follower(Library(filename, read_only=True))
+
+        follower.poll()
+
+        assert follower.status()["error"]
+
+
+class TestFollowerAPI:
+    """Takipçi modundaki API test sınıfı."""
+
+    @pytest.fixture
+    def client(self, primary, tmp_path, filename):
+        """Takipçi modunda çalışan test client'ı oluşturur."""
+        settings = Settings(library_file=filename, follower=True, follow_interval=0.01,
+                            libraries_dir=str(tmp_path / "libraries"))
+        with TestClient(create_app(settings)) as client:
+            yield client
+
+    def wait_for(self, client, seq):
+        deadline = time.monotonic() + 5
+        while client.get("/replication").json()["applied_seq"] < seq:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+    def test_reads_follow_primary(self, client, primary):
+        """Okumaların birincil süreçteki değişiklikleri yansıtması testı."""
+        primary.apply_batch(add_ops("9780306406157"))
+        self.wait_for(client, primary.last_seq)
+
+        assert [book["isbn"] for book in client.get("/books").json()] == ["9780306406157"]
+        assert client.get("/books/9780306406157").status_code == 200
+
+    def test_mutations_rejected(self, client, primary):
+        """Takipçide değişiklik isteklerinin 403 ile reddedilmesi testı."""
+        primary.apply_batch(add_ops("9780306406157"))
+        self.wait_for(client, primary.last_seq)
+
+        batch = client.post("/books/batch", json={"operations": add_ops("9780140449136")})
+        delete = client.delete("/books/9780306406157")
+        add = client.post("/books", json={"isbn": "978-0451524935"},
+                          headers={"Prefer": "respond-async"})
+
+        assert batch.status_code == delete.status_code == add.status_code == 403
+        assert "salt okunur" in batch.json()["detail"]
+        assert client.get("/jobs/abc").status_code == 404
+
+    def test_replication_endpoint(self, client, primary):
+        """GET /replication ve metriklerin gecikmeyi raporlaması testı."""
+        data = client.get("/replication").json()
+
+        assert data["role"] == "follower"
+        assert {"applied_seq", "pending_bytes", "lag_seconds", "last_apply_delay_seconds"} <= data.keys()
+        assert "library_replication_lag_seconds" in client.get("/metrics").text
+
+    def test_primary_replication_endpoint(self, tmp_path):
+        """Birincil süreçte GET /replication testı."""
+        settings = Settings(library_file=str(tmp_path / "library.json"), journal=True,
+                            libraries_dir=str(tmp_path / "libraries"))
+        with TestClient(create_app(settings)) as client:
+            data = client.get("/replication").json()
+
+        assert data["role"] == "primary"
+        assert data["journal"].endswith("library.json.journal")
+
+    def test_tenant_followers(self, tmp_path):
+        """Şube kataloglarının takipçi modunda günlükten güncellenmesi testı."""
+        from tenancy import LibraryRegistry
+
+        primary = LibraryRegistry(str(tmp_path), journal=True)
+        replica = LibraryRegistry(str(tmp_path), read_only=True, follow_interval=0.01)
+        primary.get("kadikoy").apply_batch(add_ops("9780306406157"))
+
+        library = replica.get("kadikoy")
+        primary.get("kadikoy").apply_batch(add_ops("9780140449136"))
+        deadline = time.monotonic() + 5
+        while library.find_book("9780140449136") is None:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+        assert replica.stats()["libraries"][0]["replication"]["role"] == "follower"
+        with pytest.raises(ReadOnlyError):
+            library.remove_book("9780306406157")
+        replica.close()
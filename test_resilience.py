@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Hız sınırlayıcı, tekrar deneme ve devre kesici için testler.
+Open Library çağrıları yerel taklit sunucuya karşı çalıştırılır.
+"""
+
+import pytest
+import httpx
+from fastapi.testclient import TestClient
+
+from api import create_app
+from library import Library
+from openlibrary import OpenLibraryClient
+from openlibrary_stub import OpenLibraryStub
+from resilience import (
+    CircuitBreaker, CircuitOpenError, RetryPolicy, TokenBucket,
+)
+from settings import Settings
+
+
+CORPUS = {
+    "editions": {"978-0451524935": {"title": "1984", "authors": [{"key": "/authors/OL118077A"}]}},
+    "authors": {"OL118077A": {"name": "George Orwell"}},
+}
+
+
+class FakeClock:
+    """Testlerde elle ilerletilen saat."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+    
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class TestTokenBucket:
+    """TokenBucket test sınıfı."""
+    
+    def test_burst_then_wait(self):
+        """Kapasite kadar anında izin, sonrasında bekleme testı."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+        
+        assert bucket.try_acquire() == 0
+        assert bucket.try_acquire() == 0
+        assert bucket.try_acquire() == pytest.approx(0.5)
+        
+        assert bucket.acquire() is True
+        assert clock.now == pytest.approx(0.5)
+    
+    def test_acquire_respects_max_wait(self):
+        """En fazla bekleme süresinin aşılmaması testı."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=0.1, capacity=1, clock=clock, sleep=clock.sleep)
+        bucket.try_acquire()
+        
+        assert bucket.acquire(max_wait=1.0) is False
+        assert clock.now == 0
+
+
+class TestRetryPolicy:
+    """RetryPolicy test sınıfı."""
+    
+    def test_backoff_is_bounded(self):
+        """Bekleme süresinin üstel üst sınırı aşmaması testı."""
+        policy = RetryPolicy(base_delay=1.0, max_delay=4.0)
+        
+        for attempt in range(6):
+            assert 0 <= policy.backoff(attempt) <= min(4.0, 2 ** attempt)
+    
+    def test_retry_after_is_honoured(self):
+        """Retry-After başlığının dikkate alınması testı."""
+        policy = RetryPolicy(base_delay=0.01, max_delay=5.0)
+        
+        assert policy.backoff(0, retry_after=3.0) >= 3.0
+        assert policy.backoff(0, retry_after=60.0) == 5.0
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker test sınıfı."""
+    
+    def test_opens_after_threshold_and_recovers(self):
+        """Eşikte açılma, süre sonunda yarı açık ve başarıyla kapanma testı."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+        
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        
+        clock.now = 10
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()  # yarı açıkken tek deneme
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+    
+    def test_half_open_failure_reopens(self):
+        """Yarı açık durumdaki hatanın devreyi yeniden açması testı."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5, clock=clock)
+        breaker.record_failure()
+        clock.now = 5
+        breaker.before_call()
+        
+        breaker.record_failure()
+        
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.times_opened == 2
+
+
+class TestOpenLibraryClientAgainstStub:
+    """OpenLibraryClient'ın taklit sunucuya karşı davranışı."""
+    
+    def _client(self, base_url: str, **kwargs) -> OpenLibraryClient:
+        kwargs.setdefault("retry", RetryPolicy(max_retries=3, base_delay=0.001))
+        return OpenLibraryClient(base_url, timeout=2.0, **kwargs)
+    
+    def test_transient_errors_are_retried(self, tmp_path):
+        """Geçici 503 hatalarının tekrar denenerek aşılması testı."""
+        with OpenLibraryStub(CORPUS, fail_first=2) as stub:
+            library = Library(str(tmp_path / "library.json"), upstream=self._client(stub.base_url))
+            
+            assert library.add_book("978-0451524935") is True
+        
+        assert stub.request_counts["isbn"] == 3
+        assert library.find_book("978-0451524935").author == "George Orwell"
+    
+    def test_429_is_retried(self, tmp_path):
+        """429 yanıtının tekrar denenmesi testı."""
+        with OpenLibraryStub(CORPUS, fail_first=1, error_status=429) as stub:
+            upstream = self._client(stub.base_url)
+            with httpx.Client() as client:
+                response = upstream.get(client, "/isbn/978-0451524935.json", "book")
+        
+        assert response.status_code == 200
+        assert upstream.breaker.state == CircuitBreaker.CLOSED
+    
+    def test_breaker_fails_fast_during_outage(self, tmp_path):
+        """Kesinti sırasında devrenin açılıp isteklerin sunucuya gitmemesi testı."""
+        with OpenLibraryStub(CORPUS, error_rate=1.0) as stub:
+            upstream = self._client(stub.base_url,
+                                    retry=RetryPolicy(max_retries=1, base_delay=0.001),
+                                    breaker=CircuitBreaker(failure_threshold=4, reset_timeout=60))
+            library = Library(str(tmp_path / "library.json"), upstream=upstream)
+            
+            assert library.add_book("978-0451524935") is False
+            assert library.add_book("978-0451524935") is False
+            requests_before = stub.request_counts["isbn"]
+            assert library.add_book("978-0451524935") is False
+        
+        assert upstream.breaker.state == CircuitBreaker.OPEN
+        assert stub.request_counts["isbn"] == requests_before == 4
+    
+    def test_rate_limiter_is_shared(self, tmp_path):
+        """Aynı istemciyi kullanan Library'lerin hız sınırını paylaşması testı."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, capacity=1, clock=clock, sleep=clock.sleep)
+        with OpenLibraryStub(CORPUS) as stub:
+            upstream = self._client(stub.base_url, rate_limiter=bucket)
+            first = Library(str(tmp_path / "a.json"), upstream=upstream)
+            second = Library(str(tmp_path / "b.json"), upstream=upstream)
+            
+            first.add_book("978-0451524935")
+            second.add_book("978-0451524935")
+        
+        # 4 istek (2 kitap + 2 yazar), ilki kovadan; kalanlar 1'er saniye bekler
+        assert clock.now == pytest.approx(3.0)
+
+
+class TestUpstreamEndpoints:
+    """API'nin dış servis kesintisindeki davranışı."""
+    
+    def test_post_returns_503_when_circuit_open(self, tmp_path):
+        """Devre açıkken POST /books'un 503 döndürmesi testı."""
+        with OpenLibraryStub(CORPUS, error_rate=1.0) as stub:
+            settings = Settings(library_file=str(tmp_path / "library.json"),
+                                openlibrary_url=stub.base_url, upstream_max_retries=0,
+                                breaker_failure_threshold=1, breaker_reset_timeout=60)
+            with TestClient(create_app(settings)) as client:
+                response = client.post("/books", json={"isbn": "978-0451524935"})
+                state = client.get("/upstream").json()
+        
+        assert response.status_code == 503
+        assert int(response.headers["retry-after"]) > 0
+        assert state["circuit_breaker"]["state"] == "open"
+        assert state["rate_limiter"]["rate"] == 10.0
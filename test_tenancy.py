@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Çok şubeli barındırma (LibraryRegistry ve /libraries/{id}/... route'ları) için testler.
+"""
+
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api import create_app
+from book import Book
+from settings import Settings
+from tenancy import LibraryRegistry, estimate_library_bytes
+
+
+class TestLibraryRegistry:
+    """LibraryRegistry test sınıfı."""
+
+    def test_lazy_load_and_reuse(self, tmp_path):
+        """Şubenin ilk erişimde yüklenip sonra aynı nesnenin dönmesi testı."""
+        (tmp_path / "kadikoy.json").write_text(
+            json.dumps([Book("1984", "George Orwell", "978-0451524935").to_dict()]),
+            encoding="utf-8")
+        registry = LibraryRegistry(str(tmp_path))
+
+        first = registry.get("kadikoy")
+        second = registry.get("kadikoy")
+
+        assert first is second
+        assert first.get_book_count() == 1
+        stats = registry.stats()
+        assert stats["resident"] == 1
+        assert stats["libraries"][0]["hits"] == 2
+        assert stats["libraries"][0]["load_seconds"] >= 0
+        assert stats["libraries"][0]["estimated_bytes"] > 0
+
+    def test_invalid_id_rejected(self, tmp_path):
+        """Dizin dışına çıkabilecek kimliklerin reddedilmesi testı."""
+        registry = LibraryRegistry(str(tmp_path))
+
+        with pytest.raises(ValueError):
+            registry.get("../etc")
+
+    def test_lru_eviction_by_count(self, tmp_path):
+        """Sınır aşılınca en uzun süredir kullanılmayan şubenin çıkarılması testı."""
+        registry = LibraryRegistry(str(tmp_path), max_libraries=2)
+
+        registry.get("a")
+        registry.get("b")
+        registry.get("a")
+        registry.get("c")
+
+        assert [entry["id"] for entry in registry.stats()["libraries"]] == ["a", "c"]
+        assert registry.evictions == 1
+
+    def test_flush_on_evict(self, tmp_path):
+        """Çıkarılan şubenin diske yazılıp tekrar yüklenebilmesi testı."""
+        registry = LibraryRegistry(str(tmp_path), max_libraries=1)
+        library = registry.get("a")
+        library.add_books([Book("Dune", "Frank Herbert", "978-0441172719")])
+
+        with patch.object(library, "save_books", wraps=library.save_books) as save:
+            registry.get("b")
+
+        save.assert_called_once()
+
+        saved = json.loads((tmp_path / "a.json").read_text(encoding="utf-8"))
+        assert saved[0]["isbn"] == "978-0441172719"
+        reloaded = registry.get("a")
+        assert reloaded is not library
+        assert reloaded.get_book_count() == 1
+
+    def test_eviction_by_memory(self, tmp_path):
+        """Tahmini bellek sınırı aşılınca şubelerin çıkarılması testı."""
+        registry = LibraryRegistry(str(tmp_path), max_libraries=10, max_bytes=1)
+        big = registry.get("big")
+        big.add_books(Book(f"Kitap {i}", "Yazar", f"isbn-{i}") for i in range(100))
+
+        registry.get("small")
+
+        # Yeni açılan şube sınırı tek başına aşsa da bellekte kalır
+        assert [entry["id"] for entry in registry.stats()["libraries"]] == ["small"]
+
+    def test_estimate_grows_with_catalog(self, tmp_path):
+        """Bellek tahmininin kitap sayısıyla artması testı."""
+        registry = LibraryRegistry(str(tmp_path))
+        library = registry.get("a")
+        empty = estimate_library_bytes(library)
+
+        library.add_books(Book(f"Kitap {i}", "Yazar", f"isbn-{i}") for i in range(1000))
+
+        assert estimate_library_bytes(library) > empty + 1000 * 100
+
+    def test_pinned_library_not_evicted(self, tmp_path):
+        """Kullanımdaki şubenin çıkarılmayıp bırakılınca çıkarılması testı."""
+        registry = LibraryRegistry(str(tmp_path), max_libraries=1)
+
+        with registry.acquire("a") as library:
+            registry.get("b")
+            assert [entry["id"] for entry in registry.stats()["libraries"]] == ["a", "b"]
+            assert not registry.evict("a")
+            library.add_books([Book("Dune", "Frank Herbert", "978-0441172719")])
+            registry.get("b")
+
+        assert [entry["id"] for entry in registry.stats()["libraries"]] == ["b"]
+        assert registry.get("a").get_book_count() == 1
+
+    def test_slow_load_does_not_block_other_tenants(self, tmp_path):
+        """Bir şube yüklenirken diğer şubelere erişimin beklememesi testı."""
+        registry = LibraryRegistry(str(tmp_path))
+        registry.get("warm")
+        loading = threading.Event()
+        release = threading.Event()
+        load = registry._load
+
+        def slow_load(filename):
+            loading.set()
+            release.wait(5)
+            return load(filename)
+
+        with patch.object(registry, "_load", side_effect=slow_load):
+            results = []
+            threads = [threading.Thread(target=lambda: results.append(registry.get("cold")))
+                       for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            assert loading.wait(5)
+            assert registry.get("warm").get_book_count() == 0
+            release.set()
+            for thread in threads:
+                thread.join(5)
+
+        assert len(results) == 2 and results[0] is results[1]
+        assert registry.stats()["resident"] == 2
+
+    def test_close_flushes_all(self, tmp_path):
+        """close() çağrısının tüm şubeleri yazıp boşaltması testı."""
+        registry = LibraryRegistry(str(tmp_path))
+        library = registry.get("a")
+
+        with patch.object(library, "save_books") as save:
+            registry.close()
+
+        save.assert_called_once()
+
+        assert registry.stats()["resident"] == 0
+
+
+class TestTenantRoutes:
+    """/libraries/{id}/... route'ları test sınıfı."""
+
+    @pytest.fixture
+    def client(self, tmp_path):
+        """Şube dizini geçici olan test client'ı oluşturur."""
+        settings = Settings(library_file=str(tmp_path / "library.json"),
+                            libraries_dir=str(tmp_path / "libraries"))
+        with TestClient(create_app(settings)) as client:
+            yield client
+
+    def test_tenants_are_isolated(self, client):
+        """Şube kataloglarının birbirinden ve varsayılan katalogdan ayrı olması testı."""
+        response = client.post("/libraries/kadikoy/books/batch", json={"operations": [
+            {"op": "add", "isbn": "978-0451524935", "title": "1984", "author": "George Orwell"},
+        ]})
+        assert response.status_code == 200
+
+        assert len(client.get("/libraries/kadikoy/books").json()) == 1
+        assert client.get("/libraries/besiktas/books").json() == []
+        assert client.get("/books").json() == []
+        assert client.get("/libraries/kadikoy/books/978-0451524935").status_code == 200
+        assert client.get("/libraries/kadikoy/stats").json()["total_books"] == 1
+
+    def test_invalid_tenant_id(self, client):
+        """Geçersiz şube kimliği için 404 testı."""
+        response = client.get("/libraries/a.b/books")
+
+        assert response.status_code == 404
+
+    def test_tenant_delete(self, client):
+        """Şube route'unda kitap silme testı."""
+        client.app.state.libraries.get("kadikoy").add_book_manual(
+            Book("1984", "George Orwell", "978-0451524935"))
+
+        response = client.delete("/libraries/kadikoy/books/978-0451524935")
+
+        assert response.status_code == 200
+        assert client.get("/libraries/kadikoy/books").json() == []
+
+    def test_service_routes_not_tenant_scoped(self, client):
+        """Süreç düzeyindeki endpoint'lerin şube altında sunulmaması testı."""
+        assert client.get("/libraries/kadikoy/metrics").status_code == 404
+        assert client.get("/libraries/kadikoy/upstream").status_code == 404
+
+    def test_tenant_ignores_respond_async(self, client):
+        """Şube route'larında Prefer: respond-async'in yok sayılması testı."""
+        client.app.state.libraries.get("kadikoy").add_book_manual(
+            Book("1984", "George Orwell", "978-0451524935"))
+
+        response = client.post("/libraries/kadikoy/books", json={"isbn": "978-0451524935"},
+                               headers={"Prefer": "respond-async"})
+
+        assert response.status_code == 400
+
+    def test_libraries_report(self, client):
+        """GET /libraries'in şube bazında bellek ve yükleme süresi raporlaması testı."""
+        client.get("/libraries/kadikoy/books")
+        client.get("/libraries/besiktas/books")
+
+        data = client.get("/libraries").json()
+
+        assert data["resident"] == 2
+        assert [entry["id"] for entry in data["libraries"]] == ["kadikoy", "besiktas"]
+        assert all("load_seconds" in entry and "estimated_bytes" in entry
+                   for entry in data["libraries"])
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+İstek izleme (tracing) modülü için testler.
+"""
+
+import io
+import json
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import patch, Mock
+
+import tracing
+from api import create_app
+from settings import Settings
+
+
+@pytest.fixture
+def exporter():
+    """Testler süresince span'leri bellekte toplayan exporter."""
+    exporter = tracing.InMemoryExporter()
+    tracing.configure(exporter)
+    yield exporter
+    tracing.configure(None)
+
+
+class TestSpans:
+    """Span oluşturma test sınıfı."""
+    
+    def test_disabled_tracing_returns_noop(self):
+        """İzleme kapalıyken no-op span dönmesi testı."""
+        with tracing.span("noop") as span:
+            span.set_attribute("key", "value")
+        
+        assert span.trace_id is None
+    
+    def test_nested_spans_share_trace(self, exporter):
+        """İç içe span'lerin aynı trace'e bağlanması testı."""
+        with tracing.span("parent") as parent:
+            with tracing.span("child") as child:
+                pass
+        
+        assert child.trace_id == parent.trace_id
+        assert child.parent_id == parent.span_id
+        assert [span.name for span in exporter.spans] == ["child", "parent"]
+    
+    def test_error_is_recorded(self, exporter):
+        """Span içinde oluşan hatanın kaydedilmesi testı."""
+        with pytest.raises(ValueError):
+            with tracing.span("failing"):
+                raise ValueError("boom")
+        
+        assert exporter.spans[0].error == "ValueError: boom"
+    
+    def test_otlp_json_export(self):
+        """OTLP/JSON çıktısının biçimi testı."""
+        stream = io.StringIO()
+        tracing.configure(tracing.OtlpJsonExporter(stream))
+        try:
+            with tracing.span("otlp", isbn="978-0451524935"):
+                pass
+        finally:
+            tracing.configure(None)
+        
+        payload = json.loads(stream.getvalue())
+        span = payload["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+        assert span["name"] == "otlp"
+        assert len(span["traceId"]) == 32
+        assert {"key": "isbn", "value": {"stringValue": "978-0451524935"}} in span["attributes"]
+    
+    def test_jsonl_export(self, tmp_path):
+        """JSONL dosyasına span yazılması testı."""
+        filename = str(tmp_path / "traces.jsonl")
+        tracing.configure(tracing.JsonlExporter(filename))
+        try:
+            with tracing.span("jsonl"):
+                pass
+        finally:
+            tracing.configure(None)
+        
+        with open(filename, encoding='utf-8') as file:
+            record = json.loads(file.readline())
+        assert record["name"] == "jsonl"
+        assert record["duration_ms"] >= 0
+
+
+class TestRequestTracing:
+    """API isteklerinin izlenmesi test sınıfı."""
+    
+    @pytest.fixture
+    def client(self, tmp_path, exporter):
+        """İzleme açık test client'ı oluşturur."""
+        app = create_app(Settings(library_file=str(tmp_path / "library.json")))
+        app.add_middleware(tracing.TracingMiddleware)
+        with TestClient(app) as client:
+            yield client
+    
+    @patch('library.httpx.Client')
+    def test_post_book_trace(self, mock_client, client, exporter):
+        """POST /books isteğinin tüm alt işlemleriyle izlenmesi testı."""
+        book_response = Mock()
+        book_response.status_code = 200
+        book_response.json.return_value = {"title": "1984", "authors": [{"key": "/authors/OL23919A"}]}
+        author_response = Mock()
+        author_response.status_code = 200
+        author_response.json.return_value = {"name": "George Orwell"}
+        mock_client_instance = Mock()
+        mock_client_instance.get.side_effect = [book_response, author_response]
+        mock_client.return_value.__enter__.return_value = mock_client_instance
+        
+        trace_id = "0af7651916cd43dd8448eb211c80319c"
+        response = client.post("/books", json={"isbn": "978-0451524935"},
+                               headers={"traceparent": f"00-{trace_id}-b7ad6b7169203331-01"})
+        
+        assert response.status_code == 201
+        assert response.headers["x-trace-id"] == trace_id
+        names = {span.name for span in exporter.spans}
+        assert {"POST /books", "library.add_book", "openlibrary.fetch_book",
+                "openlibrary.fetch_author", "library.save_books"} <= names
+        assert all(span.trace_id == trace_id for span in exporter.spans)
+    
+    def test_new_trace_without_header(self, client, exporter):
+        """Başlık yokken yeni trace başlatılması testı."""
+        response = client.get("/books/978-0000000000")
+        
+        root = [span for span in exporter.spans if span.kind == tracing.KIND_SERVER][0]
+        assert response.headers["x-trace-id"] == root.trace_id
+        assert root.name == "GET /books/{isbn}"
+        assert root.attributes["http.status_code"] == 404
@@ -0,0 +1,338 @@
+"""
+Kütüphane Yönetim Sistemi - İstek İzleme (Tracing)
+
+Bu modül API isteklerini, Library işlemlerini ve Open Library çağrılarını
+aynı trace altında toplayan hafif bir span altyapısı sağlar. Harici bir
+collector gerekmez: span'ler yerel bir JSONL dosyasına ya da standart
+çıktıya OTLP uyumlu JSON olarak yazılır.
+
+Trace kimliği W3C `traceparent` başlığıyla alınır ve yanıtta aynı başlıkla
+(ayrıca `X-Trace-Id` olarak) geri döndürülür. İzleme kapalıyken span()
+paylaşılan bir no-op nesne döndürür; sıcak yoldaki maliyeti tek bir
+fonksiyon çağrısıdır.
+"""
+
+import json
+import random
+import re
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from typing import IO, List, Optional
+
+
+TRACEPARENT_HEADER = "traceparent"
+TRACE_ID_HEADER = "x-trace-id"
+
+TRACEPARENT_PATTERN = re.compile(r"^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+# OTLP span türleri
+KIND_INTERNAL = 1
+KIND_SERVER = 2
+KIND_CLIENT = 3
+
+
+def _new_id(bits: int) -> str:
+    """Belirtilen uzunlukta rastgele hex kimlik üretir."""
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+class Span:
+    """Zamanlanmış tek bir işlem; with bloğu olarak kullanılır."""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "kind", "attributes",
+                 "start_ns", "end_ns", "error", "_token")
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str] = None,
+                 kind: int = KIND_INTERNAL, attributes: Optional[dict] = None):
+        """
+        Span constructor'ı.
+
+        Args:
+            name (str): Span adı
+            trace_id (str): Ait olduğu trace'in kimliği (32 hex)
+            parent_id (Optional[str]): Üst span'in kimliği
+            kind (int): OTLP span türü
+            attributes (Optional[dict]): Span öznitelikleri
+        """
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = _new_id(64)
+        self.parent_id = parent_id
+        self.kind = kind
+        self.attributes = attributes or {}
+        self.start_ns = 0
+        self.end_ns = 0
+        self.error: Optional[str] = None
+        self._token = None
+
+    def set_attribute(self, key: str, value) -> None:
+        """Span'e öznitelik ekler."""
+        self.attributes[key] = value
+
+    @property
+    def traceparent(self) -> str:
+        """Span'i temsil eden W3C traceparent değeri."""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def __enter__(self) -> 'Span':
+        self.start_ns = time.time_ns()
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.end_ns = time.time_ns()
+        if exc is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        exporter = _exporter
+        if exporter is not None:
+            exporter.export(self)
+
+    def to_dict(self) -> dict:
+        """Span'i JSONL dışa aktarımı için düz bir dictionary'ye dönüştürür."""
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_ns": self.start_ns,
+            "duration_ms": (self.end_ns - self.start_ns) / 1e6,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+    def to_otlp(self) -> dict:
+        """Span'i OTLP/JSON span nesnesine dönüştürür."""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+def _otlp_attribute(key: str, value) -> dict:
+    """Bir özniteliği OTLP/JSON KeyValue biçimine dönüştürür."""
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+class _NoopSpan:
+    """İzleme kapalıyken kullanılan, hiçbir şey yapmayan span."""
+
+    trace_id = None
+
+    def set_attribute(self, key: str, value) -> None:
+        pass
+
+    def __enter__(self) -> '_NoopSpan':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class JsonlExporter:
+    """Span'leri her satırda bir span olacak şekilde yerel dosyaya yazar."""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self._lock = threading.Lock()
+        self._file: IO = open(filename, 'a', encoding='utf-8')
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class OtlpJsonExporter:
+    """Span'leri OTLP/JSON (ExportTraceServiceRequest) satırları olarak bir akışa yazar."""
+
+    def __init__(self, stream: Optional[IO] = None, service_name: str = "library-api"):
+        self.stream = stream or sys.stdout
+        self.service_name = service_name
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        payload = {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", self.service_name)]},
+                "scopeSpans": [{"scope": {"name": "library"}, "spans": [span.to_otlp()]}],
+            }]
+        }
+        line = json.dumps(payload, ensure_ascii=False)
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+    def close(self) -> None:
+        pass
+
+
+class InMemoryExporter:
+    """Span'leri listede biriktirir (testler için)."""
+
+    def __init__(self):
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def close(self) -> None:
+        pass
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+_exporter = None
+
+
+def configure(exporter) -> None:
+    """
+    İzlemeyi verilen exporter ile açar; None verilirse kapatır.
+
+    Args:
+        exporter: export(span) metodu olan nesne ya da None
+    """
+    global _exporter
+    previous, _exporter = _exporter, exporter
+    if previous is not None and previous is not exporter:
+        previous.close()
+
+
+def exporter_from_settings(kind: Optional[str], filename: str):
+    """
+    Ayar değerinden exporter oluşturur.
+
+    Args:
+        kind (Optional[str]): "jsonl", "otlp-stdout" ya da None
+        filename (str): JSONL exporter'ın yazacağı dosya
+
+    Returns:
+        Exporter nesnesi ya da None
+    """
+    if not kind:
+        return None
+    if kind == "jsonl":
+        return JsonlExporter(filename)
+    if kind == "otlp-stdout":
+        return OtlpJsonExporter()
+    raise ValueError(f"Bilinmeyen tracing exporter: {kind}")
+
+
+def enabled() -> bool:
+    """İzlemenin açık olup olmadığını döndürür."""
+    return _exporter is not None
+
+
+def current_span() -> Optional[Span]:
+    """Etkin span'i döndürür."""
+    return _current_span.get()
+
+
+def span(name: str, kind: int = KIND_INTERNAL, **attributes):
+    """
+    Etkin span'in altında yeni bir span oluşturur.
+    Etkin bir trace yoksa yeni bir trace başlatılır.
+
+    Args:
+        name (str): Span adı
+        kind (int): OTLP span türü
+        **attributes: Span öznitelikleri
+
+    Returns:
+        Span ya da izleme kapalıysa no-op span
+    """
+    if _exporter is None:
+        return _NOOP_SPAN
+    parent = _current_span.get()
+    if parent is None:
+        return Span(name, _new_id(128), None, kind, attributes)
+    return Span(name, parent.trace_id, parent.span_id, kind, attributes)
+
+
+def start_trace(name: str, traceparent: Optional[str] = None, **attributes):
+    """
+    Gelen istek için kök (server) span'i oluşturur.
+    Geçerli bir traceparent başlığı varsa trace ona bağlanır.
+
+    Args:
+        name (str): Span adı
+        traceparent (Optional[str]): Gelen W3C traceparent başlığı
+        **attributes: Span öznitelikleri
+
+    Returns:
+        Span ya da izleme kapalıysa no-op span
+    """
+    if _exporter is None:
+        return _NOOP_SPAN
+    match = TRACEPARENT_PATTERN.match(traceparent.strip().lower()) if traceparent else None
+    if match:
+        return Span(name, match.group(1), match.group(2), KIND_SERVER, attributes)
+    return Span(name, _new_id(128), None, KIND_SERVER, attributes)
+
+
+class TracingMiddleware:
+    """
+    Her HTTP isteği için kök span açan ve trace kimliğini yanıt başlıklarına
+    ekleyen saf ASGI middleware'i.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or _exporter is None:
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = None
+        for key, value in scope.get("headers", []):
+            if key == b"traceparent":
+                traceparent = value.decode("latin-1")
+                break
+
+        root = start_trace(f"{scope['method']} {scope['path']}", traceparent,
+                           **{"http.method": scope["method"], "http.target": scope["path"]})
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                root.set_attribute("http.status_code", message["status"])
+                headers = list(message.get("headers", []))
+                headers.append((TRACEPARENT_HEADER.encode(), root.traceparent.encode()))
+                headers.append((TRACE_ID_HEADER.encode(), root.trace_id.encode()))
+                message = dict(message, headers=headers)
+            await send(message)
+
+        with root:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = scope.get("route")
+                if route is not None:
+                    root.name = f"{scope['method']} {route.path}"
+                    root.set_attribute("http.route", route.path)